@@ -11,7 +11,7 @@ from ingenialink.enums.servo import (
     ServoUnitsVel,
 )
 from ingenialink.poller import Poller
-from ingenialink.servo import Servo
+from ingenialink.servo import Servo, StatusWaitConfig
 
 # Canopen
 from .canopen.dictionary import CanopenDictionary, CanopenDictionaryV2, CanopenDictionaryV3
@@ -33,7 +33,13 @@ from .drive_context_manager import (
 
 # Ethercat
 from .ethercat.dictionary import EthercatDictionary, EthercatDictionaryV2, EthercatDictionaryV3
-from .ethercat.network import EthercatNetwork, EthercatNetworkBase, GilReleaseConfig
+from .ethercat.network import (
+    EthercatNetwork,
+    EthercatNetworkBase,
+    GilReleaseConfig,
+    GilWorkloadProfile,
+    NetStatusListenerConfig,
+)
 from .ethercat.register import EthercatRegister
 from .ethercat.servo import EthercatServo
 
@@ -67,6 +73,7 @@ __all__ = [
     "Register",
     "Network",
     "Servo",
+    "StatusWaitConfig",
     "Dictionary",
     "DictionaryV2",
     "DictionaryV3",
@@ -81,6 +88,8 @@ __all__ = [
     "EthercatDictionaryV3",
     "EthercatRegister",
     "GilReleaseConfig",
+    "GilWorkloadProfile",
+    "NetStatusListenerConfig",
     "EthernetServo",
     "EthernetDictionary",
     "EthernetDictionaryV2",
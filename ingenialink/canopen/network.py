@@ -5,7 +5,7 @@ import platform
 import re
 import tempfile
 import warnings
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict
 from enum import Enum
 from threading import Thread
 from time import sleep
@@ -26,6 +26,7 @@ from ingenialink.exceptions import ILError, ILFirmwareLoadError
 from ingenialink.network import NetDevEvt, NetProt, NetState, Network, SlaveInfo
 from ingenialink.servo import Servo
 from ingenialink.utils._utils import DisableLogger, convert_bytes_to_dtype
+from ingenialink.utils.event import CallbackList
 from ingenialink.utils.mcb import MCB
 
 if platform.system() == "Windows":
@@ -268,7 +269,7 @@ class CanopenNetwork(CanopenNetworkBase):
         self.__baudrate = baudrate.value
         self._connection: Optional[NetworkLib] = None
         self.__listener_net_status: Optional[NetStatusListener] = None
-        self.__observers_net_state: dict[int, list[Callable[[NetDevEvt], Any]]] = defaultdict(list)
+        self.__observers_net_state: dict[int, CallbackList[Callable[[NetDevEvt], Any]]] = {}
 
         self.__connection_args = {
             "interface": self.__device,
@@ -1058,10 +1059,9 @@ class CanopenNetwork(CanopenNetworkBase):
             callback: Callback function.
 
         """
-        if callback in self.__observers_net_state[node_id]:
+        observers = self.__observers_net_state.setdefault(node_id, CallbackList())
+        if not observers.add(callback):
             logger.info("Callback already subscribed.")
-            return
-        self.__observers_net_state[node_id].append(callback)
 
     def unsubscribe_from_status(self, node_id: int, callback: Callable[[NetDevEvt], Any]) -> None:  # type: ignore [override]
         """Unsubscribe from network state changes.
@@ -1071,14 +1071,13 @@ class CanopenNetwork(CanopenNetworkBase):
             callback: Callback function.
 
         """
-        if callback not in self.__observers_net_state[node_id]:
+        observers = self.__observers_net_state.get(node_id)
+        if observers is None or not observers.discard(callback):
             logger.info("Callback not subscribed.")
-            return
-        self.__observers_net_state[node_id].remove(callback)
 
     def _notify_status(self, node_id: int, status: NetDevEvt) -> None:
         """Notify subscribers of a network state change."""
-        for callback in self.__observers_net_state[node_id]:
+        for callback in self.__observers_net_state.get(node_id, ()):
             callback(status)
 
     def is_listener_started(self) -> bool:
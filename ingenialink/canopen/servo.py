@@ -18,6 +18,7 @@ from ingenialink.exceptions import ILRegisterAccessError
 from ingenialink.register import Register
 from ingenialink.servo import Servo
 from ingenialink.utils._utils import convert_bytes_to_dtype, convert_dtype_to_bytes
+from ingenialink.utils.event import CallbackList
 
 logger = ingenialogger.get_logger(__name__)
 
@@ -71,7 +72,7 @@ class CanopenServo(CanopenServoBase):
         disconnect_callback: Optional[Callable[[Servo], None]] = None,
     ) -> None:
         self.__node = node
-        self.__emcy_observers: list[Callable[[EmergencyMessage], None]] = []
+        self.__emcy_observers: CallbackList[Callable[[EmergencyMessage], None]] = CallbackList()
         self.__node.emcy.add_callback(self._on_emcy)
         super().__init__(
             target, dictionary_path, servo_status_listener, disconnect_callback=disconnect_callback
@@ -164,6 +165,7 @@ class CanopenServo(CanopenServoBase):
         """
         emergency_message = CanopenEmergencyMessage(self, emergency_msg)
         logger.warning(f"Emergency message received from node {self.target}: {emergency_message}")
+        self._signal_status_event()
         for callback in self.__emcy_observers:
             callback(emergency_message)
 
@@ -120,8 +120,17 @@ class DriveRegistersValue:
             else servo.dictionary.registers(axis).values()
         )
 
-        for register in cls.filter_registers(registers_iter, ignore_registers, axis):
-            if register.access in [RegAccess.WO, RegAccess.RO]:
+        registers = [
+            register
+            for register in cls.filter_registers(registers_iter, ignore_registers, axis)
+            if register.access not in [RegAccess.WO, RegAccess.RO]
+        ]
+        # The registers that can not be read in bulk are read one by one, with retries
+        bulk_values = servo._read_in_bulk(registers)
+
+        for register in registers:
+            if register in bulk_values:
+                register_values[register] = bulk_values[register]
                 continue
 
             for attempt in range(1, read_max_attempts + 1):
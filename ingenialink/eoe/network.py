@@ -3,6 +3,8 @@ import ipaddress
 import socket
 import time
 from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import Enum
 from threading import Thread
 from typing import Callable, Optional
@@ -111,8 +113,66 @@ class EoENetwork(EthernetNetwork):
         Returns:
             EthernetServo: Instance of the servo connected.
         """
-        if ipaddress.ip_address(ip_address) not in self.ECAT_SERVICE_NETWORK:
+        return self.connect_to_slaves(
+            [(slave_id, ip_address, dictionary)],
+            port=port,
+            connection_timeout=connection_timeout,
+            servo_status_listener=servo_status_listener,
+            net_status_listener=net_status_listener,
+            disconnect_callback=disconnect_callback,
+        )[0]
+
+    def connect_to_slaves(
+        self,
+        slaves: Sequence[tuple[int, str, str]],
+        port: int = 1061,
+        connection_timeout: float = constants.DEFAULT_ETH_CONNECTION_TIMEOUT,
+        servo_status_listener: bool = False,
+        net_status_listener: bool = False,
+        disconnect_callback: Optional[Callable[[Servo], None]] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[EthernetServo]:
+        """Connects to several slaves configuring the EoE service only once.
+
+        The EoE service is stopped, configured with the IP addresses of all the slaves
+        and started again a single time, instead of once per slave. Then the Ethernet
+        connections to the slaves are opened in parallel.
+
+        Args:
+            slaves: EtherCAT slave ID, IP address to be assigned and path to the target
+                dictionary file of each slave.
+            port: Port to connect to the slaves.
+            connection_timeout: Time in seconds of the connection timeout.
+            servo_status_listener: Toggle the listener of the servos for
+                their status, errors, faults, etc.
+            net_status_listener: Toggle the listener of the network
+                status, connection and disconnection.
+            disconnect_callback: Callback function to be called when a servo is disconnected.
+                If not specified, no callback will be called.
+            max_workers: Maximum number of connections opened at the same time. If None,
+                all of them.
+
+        Raises:
+            ValueError: ip_address must be a subnetwork of 192.168.3.0/24.
+            ValueError: If an IP address is repeated or max_workers is lower than 1.
+            ILError: If some drives are not found. The servos of the drives that are found
+                are connected to the network.
+
+        Returns:
+            Instance of each servo connected, in the same order as the slaves.
+        """
+        ip_addresses = [ip_address for _, ip_address, _ in slaves]
+        if any(
+            ipaddress.ip_address(ip_address) not in self.ECAT_SERVICE_NETWORK
+            for ip_address in ip_addresses
+        ):
             raise ValueError("ip_address must be a subnetwork of 192.168.3.0/24")
+        if len(set(ip_addresses)) != len(ip_addresses):
+            raise ValueError("The IP address of each slave must be different.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than 0.")
+        if not slaves:
+            return []
         if not self._eoe_service_init:
             self._initialize_eoe_service()
         if self._eoe_service_started:
@@ -120,22 +180,52 @@ class EoENetwork(EthernetNetwork):
             self._erase_config_eoe_service()
         self.__reconfigure_drives()
         try:
-            self._configure_slave(slave_id, ip_address)
+            for slave_id, ip_address, _ in slaves:
+                self._configure_slave(slave_id, ip_address)
         finally:
             self._start_eoe_service()
         self.__wait_eoe_starts()
-        self._configured_slaves[ip_address] = slave_id
-        self.subscribe_to_status(ip_address, self._recover_from_power_cycle)
-        return super().connect_to_slave(
-            target=ip_address,
-            dictionary=dictionary,
-            port=port,
-            connection_timeout=connection_timeout,
-            servo_status_listener=servo_status_listener,
-            net_status_listener=net_status_listener,
-            is_eoe=True,
-            disconnect_callback=disconnect_callback,
-        )
+        for slave_id, ip_address, _ in slaves:
+            self._configured_slaves[ip_address] = slave_id
+            self.subscribe_to_status(ip_address, self._recover_from_power_cycle)
+
+        def open_servo(slave: tuple[int, str, str]) -> EthernetServo:
+            _, ip_address, dictionary = slave
+            return self._open_servo(
+                ip_address,
+                dictionary,
+                port,
+                connection_timeout,
+                servo_status_listener,
+                True,
+                disconnect_callback,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers or len(slaves), len(slaves)),
+            thread_name_prefix="EoEConnection",
+        ) as executor:
+            futures = [executor.submit(open_servo, slave) for slave in slaves]
+            wait(futures)
+        servos: list[EthernetServo] = []
+        errors: list[ILError] = []
+        for future in futures:
+            error = future.exception()
+            if error is None:
+                servo = future.result()
+                self._add_servo(servo, net_status_listener)
+                servos.append(servo)
+            elif isinstance(error, ILError):
+                errors.append(error)
+            else:
+                raise error
+        if len(errors) == 1:
+            raise errors[0]
+        if errors:
+            raise ILError(
+                f"{len(errors)} drives were not found: {'; '.join(str(e) for e in errors)}"
+            ) from errors[0]
+        return servos
 
     def __wait_eoe_starts(self) -> None:
         """Wait until the EoE service starts the EoE or the timeout was reached."""
@@ -3,18 +3,20 @@ import os
 import re
 import threading
 import time
-from collections import OrderedDict, defaultdict
-from collections.abc import Generator
+from collections import OrderedDict
+from collections.abc import Generator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from enum import Enum
 from threading import Thread
-from typing import TYPE_CHECKING, Callable, Optional, Union, cast
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar, Union, cast
 
 import ingenialogger
 from typing_extensions import override
 
 from ingenialink.pdo_network_manager import PDONetworkManager
 from ingenialink.servo import Servo
+from ingenialink.utils.event import CallbackList
 from ingenialink.utils.timeout import Timeout
 
 try:
@@ -26,10 +28,12 @@ except ImportError as ex:
 if TYPE_CHECKING:
     from pysoem import CdefSlave
 
-from dataclasses import dataclass, field
+    from ingenialink.register import Register
+
+from dataclasses import dataclass, field, replace
 
 from ingenialink.constants import ECAT_STATE_CHANGE_TIMEOUT_US
-from ingenialink.ethercat.servo import EthercatServo
+from ingenialink.ethercat.servo import EthercatServo, release_gil_in_sdo_transfers
 from ingenialink.exceptions import (
     ILError,
     ILFirmwareLoadError,
@@ -40,6 +44,8 @@ from ingenialink.network import NetDevEvt, NetProt, NetState, Network, SlaveInfo
 
 logger = ingenialogger.get_logger(__name__)
 
+_T = TypeVar("_T")
+
 # Holds a reference to the Ethercat network (used to handle no-GIL cases)
 ETHERCAT_NETWORK_REFERENCES: set["EthercatNetwork"] = set()
 
@@ -75,6 +81,41 @@ def release_network_reference(network: Optional["EthercatNetwork"] = None) -> No
         ETHERCAT_NETWORK_REFERENCES.remove(network)
 
 
+@dataclass(frozen=True)
+class GilWorkloadProfile:
+    """Threads that use the GIL while the EtherCAT network is used.
+
+    Attributes:
+        sdo_threads: Number of threads that do SDO transfers at the same time.
+        pdo_refresh_rate: Refresh rate of the PDO exchange in seconds. None if the PDOs
+            are not exchanged.
+        python_threads: Number of other threads that run Python code meanwhile, for
+            example a GUI or the processing of the acquired data.
+    """
+
+    sdo_threads: int = 1
+    pdo_refresh_rate: Optional[float] = None
+    python_threads: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the profile.
+
+        Raises:
+            ValueError: If a number of threads is negative.
+            ValueError: If the PDO refresh rate is not positive.
+        """
+        if self.sdo_threads < 0 or self.python_threads < 0:
+            raise ValueError("The number of threads cannot be negative.")
+        if self.pdo_refresh_rate is not None and self.pdo_refresh_rate <= 0:
+            raise ValueError("The PDO refresh rate must be positive.")
+
+    @property
+    def threads(self) -> int:
+        """Number of threads that use the GIL, including the PDO thread."""
+        pdo_threads = 0 if self.pdo_refresh_rate is None else 1
+        return self.sdo_threads + pdo_threads + self.python_threads
+
+
 @dataclass(frozen=True)
 class GilReleaseConfig:
     """Configuration of pysoem functions that have GIL release control."""
@@ -106,6 +147,69 @@ class GilReleaseConfig:
         object.__setattr__(instance, "_always_release", True)  # frozen instance
         return instance
 
+    @classmethod
+    def for_workload(cls, profile: GilWorkloadProfile) -> "GilReleaseConfig":
+        """Recommend the GIL release configuration for a workload.
+
+        A function that releases the GIL lets the other threads run while it waits for
+        the network, but it has to take the GIL back when the transfer is done. If another
+        thread is running Python code, that can take up to the switch interval of the
+        interpreter (see :func:`sys.getswitchinterval`).
+
+        The recommendation is based on the results of the GIL release benchmark
+        (``tests/benchmarks/test_gil_release.py``):
+
+        * The mailbox transfers (SDO, FoE) and the slave initialization release the GIL
+          if any other thread uses it. Otherwise, a transfer to one slave stops all the
+          other threads for its whole duration, including the PDO thread. The transfers
+          are slower if other threads run Python code continuously, but those threads
+          are not blocked anymore.
+        * The process data exchange keeps the GIL. Its frame round trip is short, and
+          taking the GIL back after every frame increases the jitter of the PDO cycles.
+        * If no other thread uses the GIL, the pysoem defaults are kept.
+
+        Args:
+            profile: Threads of the workload.
+
+        Returns:
+            GIL configuration.
+        """
+        if profile.threads <= 1:
+            return cls()
+        return cls(config_init=True, sdo_read_write=True, foe_read_write=True)
+
+
+@dataclass(frozen=True)
+class SlaveStateTransition:
+    """Result of the transition of a slave to an EtherCAT state.
+
+    Attributes:
+        slave_id: Slave ID.
+        target_state: Requested EtherCAT state.
+        state: EtherCAT state of the slave at the end of the transition.
+        time_to_state: Time the slave took to reach the target state, in seconds. None if
+            it did not reach it.
+        al_status: AL status code of the slave at the end of the transition.
+    """
+
+    slave_id: int
+    target_state: int
+    state: int
+    time_to_state: Optional[float]
+    al_status: int
+
+    @property
+    def reached(self) -> bool:
+        """True if the slave reached the target state."""
+        return self.time_to_state is not None
+
+    @property
+    def al_status_description(self) -> str:
+        """Description of the AL status code."""
+        if not pysoem:
+            return f"0x{self.al_status:04X}"
+        return str(pysoem.al_status_code_to_string(self.al_status))
+
 
 class SlaveState(Enum):
     """EtherCAT state enum."""
@@ -121,6 +225,128 @@ class SlaveState(Enum):
     SAFEOP_ERROR_STATE = SAFEOP_STATE + ERROR_STATE
 
 
+class FirmwareLoadStage(Enum):
+    """Stage of the firmware update of a slave."""
+
+    BOOT_STATE = "boot_state"
+    """The slave reached the Boot state."""
+    TRANSFERRING = "transferring"
+    """The firmware file is being transferred via FoE."""
+    TRANSFERRED = "transferred"
+    """The firmware file was transferred."""
+    RECOVERED = "recovered"
+    """The slave runs the new firmware and reached the PreOp state."""
+    FAILED = "failed"
+    """The firmware could not be loaded, or the slave did not reach the PreOp state."""
+
+
+@dataclass(frozen=True)
+class FirmwareLoadResult:
+    """Result of the firmware update of a slave.
+
+    Attributes:
+        slave_id: Slave ID.
+        fw_file: Path to the firmware file.
+        stage: Last stage reached by the update.
+        attempts: Number of attempts to transfer the firmware file.
+        transfer_time: Duration of the successful FoE transfer, in seconds. None if the
+            file was not transferred.
+        errors: Error of each failed attempt.
+    """
+
+    slave_id: int
+    fw_file: str
+    stage: FirmwareLoadStage
+    attempts: int
+    transfer_time: Optional[float]
+    errors: tuple[str, ...] = ()
+
+    @property
+    def success(self) -> bool:
+        """True if the firmware was loaded and the slave reached the PreOp state."""
+        return self.stage == FirmwareLoadStage.RECOVERED
+
+
+@dataclass(frozen=True)
+class NetStatusListenerConfig:
+    """Polling and recovery of the EtherCAT network status listener.
+
+    The network status is polled every ``refresh_time``. If ``max_refresh_time`` is set,
+    once the network has been stable for ``stable_time``, the polling period grows
+    exponentially up to ``max_refresh_time``, and it goes back to ``refresh_time`` after
+    a change.
+
+    Attributes:
+        refresh_time: Polling period (s).
+        max_refresh_time: Maximum polling period of a stable network (s). None to always
+            poll every ``refresh_time``.
+        stable_time: Time without changes before the polling slows down (s).
+        backoff_factor: Factor applied to the polling period after each poll of a stable
+            network.
+        incremental_recovery: True to recover only the disconnected slaves, if they are
+            still configured in the master, before trying a network-wide recovery.
+    """
+
+    refresh_time: float = 0.25
+    max_refresh_time: Optional[float] = None
+    stable_time: float = 5.0
+    backoff_factor: float = 2.0
+    incremental_recovery: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        Raises:
+            ValueError: If a period is not positive or the maximum is lower than the
+                refresh time.
+            ValueError: If the stable time is negative or the backoff factor is lower than 1.
+        """
+        if self.refresh_time <= 0 or (
+            self.max_refresh_time is not None and self.max_refresh_time < self.refresh_time
+        ):
+            raise ValueError(
+                "The polling periods must be positive and the maximum can not be lower than "
+                "the refresh time."
+            )
+        if self.stable_time < 0 or self.backoff_factor < 1:
+            raise ValueError(
+                "The stable time can not be negative and the backoff factor can not be lower "
+                "than 1."
+            )
+
+
+@dataclass(frozen=True)
+class NetStatusListenerMetrics:
+    """Detection and recovery metrics of the EtherCAT network status listener.
+
+    Attributes:
+        polls: Number of polls of the network status.
+        refresh_time: Current polling period (s).
+        detections: Number of disconnections detected.
+        last_detection_latency: Maximum time between the last disconnection and its
+            detection, the time since the previous poll (s). None if there were none.
+        max_detection_latency: Maximum detection latency (s).
+        recoveries: Number of recovery attempts.
+        failed_recoveries: Number of recovery attempts that failed.
+        incremental_recoveries: Number of recoveries that only re-initialized the
+            disconnected slaves.
+        last_recovery_time: Time spent in the last recovery attempt (s). None if there
+            were none.
+        total_recovery_time: Time spent in all the recovery attempts (s).
+    """
+
+    polls: int = 0
+    refresh_time: float = 0.0
+    detections: int = 0
+    last_detection_latency: Optional[float] = None
+    max_detection_latency: float = 0.0
+    recoveries: int = 0
+    failed_recoveries: int = 0
+    incremental_recoveries: int = 0
+    last_recovery_time: Optional[float] = None
+    total_recovery_time: float = 0.0
+
+
 class NetStatusListener(Thread):
     """Network status listener thread to check if the drive is alive.
 
@@ -129,17 +355,66 @@ class NetStatusListener(Thread):
     acts as the authoritative "is the bus alive" signal via WKC errors.  Having
     both active at the same time is redundant.
 
+    The polling period can adapt to the network activity as set in the configuration: it
+    is short right after a change and grows while the network is stable.
+
     Args:
         network: Network instance of the EtherCAT communication.
+        refresh_time: Polling period (s). Only used if no configuration is given.
+        config: Polling and recovery configuration. If None, the network is polled every
+            ``refresh_time``.
 
     """
 
-    def __init__(self, network: "EthercatNetwork", refresh_time: float = 0.25):
+    def __init__(
+        self,
+        network: "EthercatNetwork",
+        refresh_time: float = NetStatusListenerConfig.refresh_time,
+        config: Optional[NetStatusListenerConfig] = None,
+    ):
         super().__init__()
+        if config is None:
+            config = NetStatusListenerConfig(refresh_time=refresh_time)
         self.__network = network
-        self.__refresh_time = refresh_time
-        self.__stop = False
+        self.__config = config
+        self.__refresh_time = config.refresh_time
+        self.__stop = threading.Event()
         self._ecat_master = self.__network._ecat_master
+        self.__current_refresh_time = config.refresh_time
+        self.__last_change_time = time.monotonic()
+        self.__last_poll_time = self.__last_change_time
+        self.__metrics = NetStatusListenerMetrics(refresh_time=config.refresh_time)
+
+    @property
+    def config(self) -> NetStatusListenerConfig:
+        """Polling and recovery configuration."""
+        return self.__config
+
+    @property
+    def metrics(self) -> NetStatusListenerMetrics:
+        """Detection and recovery metrics."""
+        return self.__metrics
+
+    @property
+    def refresh_time(self) -> float:
+        """Current polling period, in seconds."""
+        return self.__current_refresh_time
+
+    def __update_refresh_time(self) -> None:
+        """Slow down the polling if the network is stable, speed it up otherwise."""
+        max_refresh_time = self.__config.max_refresh_time
+        if (
+            max_refresh_time is None
+            or time.monotonic() - self.__last_change_time < self.__config.stable_time
+        ):
+            refresh_time = self.__refresh_time
+        else:
+            refresh_time = min(
+                self.__current_refresh_time * self.__config.backoff_factor,
+                max(max_refresh_time, self.__refresh_time),
+            )
+        self.__current_refresh_time = refresh_time
+        self.__metrics = replace(self.__metrics, refresh_time=refresh_time)
 
     def process(self) -> None:
         """Process network status for all servos.
@@ -159,9 +434,12 @@ class NetStatusListener(Thread):
         (``slave_exists=False``), because the gate is ``servo_state==DISCONNECTED``
         rather than ``is_servo_alive``.
         """
+        poll_time = time.monotonic()
         self._ecat_master.read_state()
+        self.__metrics = replace(self.__metrics, polls=self.__metrics.polls + 1)
 
         # Phase 1: per-slave disconnection detection
+        detections = 0
         for servo in self.__network.servos:
             slave_id = servo.slave_id
             servo_state = self.__network.get_servo_state(slave_id)
@@ -169,16 +447,23 @@ class NetStatusListener(Thread):
             if not is_servo_alive and servo_state == NetState.CONNECTED:
                 self.__network._notify_status(slave_id, NetDevEvt.REMOVED)
                 self.__network._set_servo_state(slave_id, NetState.DISCONNECTED)
+                detections += 1
+        if detections:
+            self.__record_detections(detections, poll_time - self.__last_poll_time)
+        self.__last_poll_time = poll_time
 
         # Phase 2: skip recovery if every slave is already connected
-        if not any(
-            self.__network.get_servo_state(servo.slave_id) == NetState.DISCONNECTED
+        disconnected_servos = [
+            servo
             for servo in self.__network.servos
-        ):
+            if self.__network.get_servo_state(servo.slave_id) == NetState.DISCONNECTED
+        ]
+        if not disconnected_servos:
             return
+        self.__last_change_time = time.monotonic()
 
-        # Phase 3: network-wide recovery attempt
-        if not self.__network.recover_from_disconnection():
+        # Phase 3: recovery attempt, incremental if possible, network-wide otherwise
+        if not self.__recover(disconnected_servos):
             return
 
         # Phase 4: emit ADDED only for slaves that are actually alive after recovery
@@ -190,23 +475,76 @@ class NetStatusListener(Thread):
                 self.__network._notify_status(slave_id, NetDevEvt.ADDED)
                 self.__network._set_servo_state(slave_id, NetState.CONNECTED)
 
+    def __recover(self, disconnected_servos: list["EthercatServo"]) -> bool:
+        """Try to recover the communication with the disconnected servos.
+
+        Args:
+            disconnected_servos: servos that are disconnected.
+
+        Returns:
+            True if the communication was recovered.
+        """
+        start_time = time.monotonic()
+        incremental = self.__config.incremental_recovery and self.__network._recover_slaves(
+            disconnected_servos
+        )
+        recovered = incremental or self.__network.recover_from_disconnection()
+        recovery_time = time.monotonic() - start_time
+        metrics = self.__metrics
+        self.__metrics = replace(
+            metrics,
+            recoveries=metrics.recoveries + 1,
+            failed_recoveries=metrics.failed_recoveries + int(not recovered),
+            incremental_recoveries=metrics.incremental_recoveries + int(incremental),
+            last_recovery_time=recovery_time,
+            total_recovery_time=metrics.total_recovery_time + recovery_time,
+        )
+        logger.debug(
+            "Network recovery %s in %.3f s (%s)",
+            "succeeded" if recovered else "failed",
+            recovery_time,
+            "incremental" if incremental else "network-wide",
+        )
+        return recovered
+
+    def __record_detections(self, detections: int, detection_latency: float) -> None:
+        """Record the detection of disconnections.
+
+        Args:
+            detections: number of disconnections detected.
+            detection_latency: time since the previous poll, in seconds.
+        """
+        metrics = self.__metrics
+        self.__metrics = replace(
+            metrics,
+            detections=metrics.detections + detections,
+            last_detection_latency=detection_latency,
+            max_detection_latency=max(metrics.max_detection_latency, detection_latency),
+        )
+        logger.debug(
+            "%d disconnections detected, at most %.3f s after they happened",
+            detections,
+            detection_latency,
+        )
+
     def run(self) -> None:
         """Check the network status continuously.
 
         Skips :py:meth:`process` while ``pdo_manager.is_active`` is ``True``
         because the PDO thread already signals bus health via WKC errors.
         """
-        while not self.__stop:
+        while not self.__stop.is_set():
             try:
                 if not self.__network.pdo_manager.is_active:
                     self.process()
             except Exception as e:
                 logger.exception(f"Exception occurred while processing network status: {e}")
-            time.sleep(self.__refresh_time)
+            self.__update_refresh_time()
+            self.__stop.wait(self.__current_refresh_time)
 
     def stop(self) -> None:
         """Stop the network status listener."""
-        self.__stop = True
+        self.__stop.set()
 
 
 class EthercatNetworkBase(Network):
@@ -214,9 +552,9 @@ class EthercatNetworkBase(Network):
 
     def __init__(self) -> None:
         super().__init__()
-        self._observers_net_state: dict[Union[int, str], list[Callable[[NetDevEvt], None]]] = (
-            defaultdict(list)
-        )
+        self._observers_net_state: dict[
+            Union[int, str], CallbackList[Callable[[NetDevEvt], None]]
+        ] = {}
 
     def subscribe_to_status(
         self, target: Union[int, str], callback: Callable[[NetDevEvt], None]
@@ -228,10 +566,10 @@ class EthercatNetworkBase(Network):
             callback: Callback function to execute on state changes.
 
         """
-        if callback in self._observers_net_state[target]:
+        # setdefault is atomic, concurrent subscriptions to a new target share the list
+        observers = self._observers_net_state.setdefault(target, CallbackList())
+        if not observers.add(callback):
             logger.info("Callback already subscribed.")
-            return
-        self._observers_net_state[target].append(callback)
 
     def unsubscribe_from_status(
         self, target: Union[int, str], callback: Callable[[NetDevEvt], None]
@@ -243,10 +581,9 @@ class EthercatNetworkBase(Network):
             callback: Callback function previously subscribed.
 
         """
-        if callback not in self._observers_net_state[target]:
+        observers = self._observers_net_state.get(target)
+        if observers is None or not observers.discard(callback):
             logger.info("Callback not subscribed.")
-            return
-        self._observers_net_state[target].remove(callback)
 
     def get_servo_state(self, servo_id: Union[int, str]) -> NetState:
         """Get the state of a servo in the network.
@@ -272,7 +609,7 @@ class EthercatNetworkBase(Network):
 
     def _notify_status(self, target: Union[int, str], status: NetDevEvt) -> None:
         """Notify subscribers of a network state change."""
-        for callback in self._observers_net_state[target]:
+        for callback in self._observers_net_state.get(target, ()):
             callback(status)
 
     @property
@@ -299,6 +636,10 @@ class EthercatNetwork(EthercatNetworkBase):
 
     DEFAULT_ECAT_CONNECTION_TIMEOUT_S = 2
     ECAT_PROCESSDATA_TIMEOUT_S = 0.1
+    STATE_TRANSITION_POLLING_INTERVAL_S = 0.001
+    # SOEM has 16 frame buffers. Half of them are left for the process data exchange and the
+    # state reads while the mailbox transfers of different slaves run in parallel.
+    MAX_CONCURRENT_MAILBOX_TRANSFERS = 8
 
     EXPECTED_WKC_PROCESS_DATA = 3
 
@@ -329,6 +670,7 @@ class EthercatNetwork(EthercatNetworkBase):
         self.interface_name: str = interface_name
         self.servos: list[EthercatServo] = []
         self.__listener_net_status: Optional[NetStatusListener] = None
+        self.__restart_status_listener = False
         self._ecat_master: pysoem.CdefMaster = pysoem.Master()
         self.__gil_release_config = gil_release_config
         self._ecat_master.always_release_gil = self.__gil_release_config.always_release
@@ -338,6 +680,8 @@ class EthercatNetwork(EthercatNetworkBase):
         self._overlapping_io_map = overlapping_io_map
         self.__is_master_running = False
         self.__last_init_nodes: list[int] = []
+        self.__last_processdata_wkc: Optional[int] = None
+        self.__last_state_transitions: list[SlaveStateTransition] = []
 
         self._lock = threading.Lock()
         set_network_reference(network=self)
@@ -348,7 +692,7 @@ class EthercatNetwork(EthercatNetworkBase):
         self.__exceptions_in_thread: int = 0
         self._pdo_manager.subscribe_to_exceptions(self._pdo_thread_exception_handler)
         # List of subscribers to PDO thread status
-        self._pdo_thread_status_observers: list[Callable[[bool], None]] = []
+        self._pdo_thread_status_observers: CallbackList[Callable[[bool], None]] = CallbackList()
 
     @staticmethod
     def pysoem_available() -> bool:
@@ -389,15 +733,40 @@ class EthercatNetwork(EthercatNetworkBase):
         """Returns the PDO manager."""
         return self._pdo_manager
 
+    @property
+    def gil_release_config(self) -> GilReleaseConfig:
+        """Configuration of the pysoem functions that release the GIL.
+
+        It can be changed while the network is in use, for example with the
+        configuration recommended for a workload::
+
+            net.gil_release_config = GilReleaseConfig.for_workload(
+                GilWorkloadProfile(sdo_threads=1, pdo_refresh_rate=0.001)
+            )
+
+        The new configuration also applies to the connected servos.
+        """
+        return self.__gil_release_config
+
+    @gil_release_config.setter
+    def gil_release_config(self, gil_release_config: GilReleaseConfig) -> None:
+        self.__gil_release_config = gil_release_config
+        self._ecat_master.always_release_gil = gil_release_config.always_release
+        for servo in self.servos:
+            servo.sdo_read_write_release_gil = gil_release_config.sdo_read_write
+
+    @property
+    def last_processdata_wkc(self) -> Optional[int]:
+        """Working counter of the last process data exchange. None if there was none."""
+        return self.__last_processdata_wkc
+
     def subscribe_to_pdo_thread_status(self, callback: Callable[[bool], None]) -> None:
         """Subscribe be notified when the PDO process data thread status changes.
 
         Args:
             callback: Callback function.
         """
-        if callback in self._pdo_thread_status_observers:
-            return
-        self._pdo_thread_status_observers.append(callback)
+        self._pdo_thread_status_observers.add(callback)
 
     def unsubscribe_from_pdo_thread_status(self, callback: Callable[[bool], None]) -> None:
         """Unsubscribe from PDO thread status changes.
@@ -405,8 +774,7 @@ class EthercatNetwork(EthercatNetworkBase):
         Args:
             callback: Callback function.
         """
-        if callback in self._pdo_thread_status_observers:
-            self._pdo_thread_status_observers.remove(callback)
+        self._pdo_thread_status_observers.discard(callback)
 
     def activate_pdos(
         self, refresh_rate: Optional[float] = None, watchdog_timeout: Optional[float] = None
@@ -668,6 +1036,26 @@ class EthercatNetwork(EthercatNetworkBase):
         if release_reference:
             release_network_reference(network=self)
 
+    def _release_master(self) -> None:
+        """Close the EtherCAT master so that another process can use the interface.
+
+        The network status listener is stopped until the master is reclaimed.
+        """
+        self.__restart_status_listener = self.__listener_net_status is not None
+        self.stop_status_listener()
+        self.close_ecat_master(release_reference=False)
+
+    def _reclaim_master(self) -> None:
+        """Reopen the EtherCAT master after :meth:`_release_master`.
+
+        The slaves are initialized again and the connected servos are set to PreOp state.
+        """
+        self._start_master()
+        self.__init_nodes()
+        if self.__restart_status_listener:
+            self.start_status_listener()
+        self.__restart_status_listener = False
+
     def disconnect_from_slave(self, servo: EthercatServo) -> None:  # type: ignore [override]
         """Disconnects the slave from the network.
 
@@ -685,16 +1073,167 @@ class EthercatNetwork(EthercatNetworkBase):
         # Notify that disconnect_from_slave has been called
         servo._disconnect_event_publisher.notify(servo)
 
-    def config_pdo_maps(self) -> None:
+    def map_servos(
+        self,
+        fn: Callable[[EthercatServo], _T],
+        servos: Optional[list[EthercatServo]] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[_T]:
+        """Call a function for each servo, running the calls of different servos in parallel.
+
+        Each call runs in a worker thread that releases the GIL in its SDO transfers, so the
+        mailbox transactions of different slaves overlap on the bus while the transfers to
+        the same slave are still serialized by the servo lock. As long as the number of
+        servos does not exceed ``max_workers``, the calls take about as long as the call of
+        the slowest slave instead of the sum of all of them.
+
+        For example, to take a snapshot of the registers of all the servos:
+
+            snapshots = net.map_servos(DriveRegistersValue.from_hardware)
+
+        Args:
+            fn: function called with each servo.
+            servos: servos to call the function with. If None, all the connected servos.
+            max_workers: maximum number of servos accessed at the same time. If None,
+                `MAX_CONCURRENT_MAILBOX_TRANSFERS`, which keeps the number of frames in
+                flight within the frame budget of the master.
+
+        Returns:
+            Result of each call, in the same order as the servos.
+
+        Raises:
+            ValueError: If max_workers is lower than 1.
+        """
+        if max_workers is None:
+            max_workers = self.MAX_CONCURRENT_MAILBOX_TRANSFERS
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0.")
+        servo_list = self.servos if servos is None else servos
+        if len(servo_list) <= 1 or max_workers == 1:
+            return [fn(servo) for servo in servo_list]
+
+        def call_releasing_gil(servo: EthercatServo) -> _T:
+            with release_gil_in_sdo_transfers():
+                return fn(servo)
+
+        # Ensure network reference is set before releasing GIL
+        self.__ensure_network_reference()
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(servo_list)),
+            thread_name_prefix="MailboxTransfers",
+        ) as executor:
+            # Wait for all the servos before raising the first error
+            futures = [executor.submit(call_releasing_gil, servo) for servo in servo_list]
+            return [future.result() for future in futures]
+
+    def read_many(
+        self,
+        registers: Sequence[Union[str, "Register"]],
+        servos: Optional[list[EthercatServo]] = None,
+        subnode: int = 1,
+        max_workers: Optional[int] = None,
+    ) -> list[list[Union[int, float, str, bytes]]]:
+        """Read some registers of several servos, reading different servos in parallel.
+
+        Args:
+            registers: registers to read from each servo.
+            servos: servos to read. If None, all the connected servos.
+            subnode: target axis of the drives.
+            max_workers: maximum number of servos read at the same time. If None,
+                `MAX_CONCURRENT_MAILBOX_TRANSFERS`.
+
+        Returns:
+            Values of the registers of each servo, in the same order as the servos.
+        """
+        return self.map_servos(
+            lambda servo: [servo.read(register, subnode=subnode) for register in registers],
+            servos,
+            max_workers,
+        )
+
+    def config_pdo_maps(self, max_workers: Optional[int] = None) -> None:
         """Configure the PDO maps.
 
         It maps the PDO maps of each slave and sets its state to SafeOP.
 
+        The slaves are mapped concurrently, one thread per slave, before the process data
+        image is configured. The SDO transfers of different slaves only overlap if the servos
+        release the GIL during SDO read/writes.
+
+        Args:
+            max_workers: maximum number of slaves mapped at the same time. If None, all the
+                slaves are mapped at the same time.
+
+        Raises:
+            ValueError: If max_workers is lower than 1.
         """
-        if self._overlapping_io_map:
-            self._ecat_master.config_overlap_map()
-        else:
-            self._ecat_master.config_map()
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than 0.")
+        servos = [servo for servo in self.servos if servo._maps_pdos_on_config]
+        try:
+            if len(servos) > 1 and max_workers != 1:
+                self.__map_pdos_concurrently(
+                    lambda servo: servo._premap_pdos(), servos, max_workers
+                )
+            if self._overlapping_io_map:
+                self._ecat_master.config_overlap_map()
+            else:
+                self._ecat_master.config_map()
+        finally:
+            for servo in servos:
+                servo._clear_premapped_pdos()
+
+    def reset_pdo_mapping(
+        self, servos: Optional[list[EthercatServo]] = None, max_workers: Optional[int] = None
+    ) -> None:
+        """Reset the RPDO and TPDO mapping of several servos.
+
+        The slaves are reset concurrently, one thread per slave, as in
+        :meth:`config_pdo_maps`.
+
+        WARNING: This operation can not be done if the servos are not in pre-operational state.
+
+        Args:
+            servos: servos to reset. If None, all the connected servos.
+            max_workers: maximum number of slaves reset at the same time. If None, all the
+                slaves are reset at the same time.
+
+        Raises:
+            ValueError: If max_workers is lower than 1.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than 0.")
+        servo_list = self.servos if servos is None else servos
+        if len(servo_list) <= 1 or max_workers == 1:
+            for servo in servo_list:
+                servo.reset_pdo_mapping()
+            return
+        self.__map_pdos_concurrently(
+            lambda servo: servo.reset_pdo_mapping(), servo_list, max_workers
+        )
+
+    @staticmethod
+    def __map_pdos_concurrently(
+        fn: Callable[[EthercatServo], None],
+        servos: list[EthercatServo],
+        max_workers: Optional[int],
+    ) -> None:
+        """Call a PDO mapping function for each servo, one thread per servo.
+
+        Args:
+            fn: function called with each servo.
+            servos: servos to call the function with.
+            max_workers: maximum number of servos mapped at the same time. If None, all the
+                servos are mapped at the same time.
+        """
+        with ThreadPoolExecutor(
+            max_workers=max_workers or len(servos),
+            thread_name_prefix="PDOMapping",
+        ) as executor:
+            # Wait for all the slaves before raising the first error
+            futures = [executor.submit(fn, servo) for servo in servos]
+            for future in futures:
+                future.result()
 
     def start_pdos(self, timeout: float = 2.0) -> None:
         """Set all slaves with mapped PDOs to Operational State.
@@ -717,21 +1256,19 @@ class EthercatNetwork(EthercatNetworkBase):
 
         with Timeout(timeout) as t:
             # Set all slaves to SafeOp state
-            self._ecat_master.state = pysoem.SAFEOP_STATE
-            self._change_nodes_state(op_servo_list, pysoem.SAFEOP_STATE)
-            while not self._check_node_state(op_servo_list, pysoem.SAFEOP_STATE):
-                if t.has_expired:
-                    raise ILStateError("Drives can not reach SafeOp state")
-
-            # Set all slaves to Op state
-            self._change_nodes_state(op_servo_list, pysoem.OP_STATE)
-            while not self._check_node_state(op_servo_list, pysoem.OP_STATE):
-                self.send_receive_processdata()
-                if t.has_expired:
-                    raise ILStateError("Drives can not reach Op state")
+            self.__transition_or_raise(op_servo_list, pysoem.SAFEOP_STATE, t.remaining_time_s)
+            # Set all slaves to Op state, the process data must be exchanged meanwhile
+            self.__transition_or_raise(
+                op_servo_list,
+                pysoem.OP_STATE,
+                t.remaining_time_s,
+                exchange_processdata=True,
+            )
 
     def stop_pdos(self) -> None:
         """For all slaves not in PreOp state, set state to PreOp."""
+        for servo in self.servos:
+            servo._pdo_exchange_stopped()
         if not self.__is_master_running:
             logger.warning("EtherCAT master is not running, no PDOs to stop.")
             return
@@ -779,6 +1316,7 @@ class EthercatNetwork(EthercatNetworkBase):
             timeout=int(timeout * 1_000_000), release_gil=release_gil
         )
         self._lock.release()
+        self.__last_processdata_wkc = processdata_wkc
         if processdata_wkc != self.EXPECTED_WKC_PROCESS_DATA * (len(self.servos)):
             self._ecat_master.read_state()
             servos_state_msg = ""
@@ -798,6 +1336,11 @@ class EthercatNetwork(EthercatNetworkBase):
         for servo in self.servos:
             servo.process_pdo_inputs()
 
+    @property
+    def last_state_transitions(self) -> list[SlaveStateTransition]:
+        """Result of the last EtherCAT state transition of a group of slaves."""
+        return list(self.__last_state_transitions)
+
     def _change_nodes_state(
         self, nodes: Union["EthercatServo", list["EthercatServo"]], target_state: int
     ) -> bool:
@@ -811,12 +1354,150 @@ class EthercatNetwork(EthercatNetworkBase):
             True if all nodes reached the target state, else False.
         """
         node_list = nodes if isinstance(nodes, list) else [nodes]
-        for drive in node_list:
-            if not drive.slave_exists:
-                continue
-            drive.slave.state = target_state
-            drive.slave.write_state()
-        return self._check_node_state(nodes, target_state)
+        transitions = self._transition_nodes_state(
+            node_list, target_state, ECAT_STATE_CHANGE_TIMEOUT_US / 1_000_000
+        )
+        return bool(transitions) and all(transition.reached for transition in transitions)
+
+    def _transition_nodes_state(
+        self,
+        nodes: list["EthercatServo"],
+        target_state: int,
+        timeout: float,
+        *,
+        exchange_processdata: bool = False,
+    ) -> list[SlaveStateTransition]:
+        """Request an ECAT state to a group of nodes and wait until they reach it.
+
+        If the group contains all the slaves of the network, the state is requested
+        with a single broadcast frame. Otherwise, it is requested to each slave.
+        The states of all the slaves are read at once while waiting.
+
+        Args:
+            nodes: target nodes.
+            target_state: target ECAT state.
+            timeout: maximum time to wait for the nodes to reach the state, in seconds.
+            exchange_processdata: True to exchange the process data while waiting,
+                as required to reach the Op state.
+
+        Returns:
+            Transition of each node, in the same order.
+        """
+        return self._transition_slaves_state(
+            {drive.slave_id: drive.slave if drive.slave_exists else None for drive in nodes},
+            target_state,
+            timeout,
+            exchange_processdata=exchange_processdata,
+        )
+
+    def _transition_slaves_state(
+        self,
+        slaves: Mapping[int, Optional["CdefSlave"]],
+        target_state: int,
+        timeout: float,
+        *,
+        exchange_processdata: bool = False,
+    ) -> list[SlaveStateTransition]:
+        """Request an ECAT state to a group of slaves and wait until they reach it.
+
+        If the group contains all the slaves of the network, the state is requested
+        with a single broadcast frame. Otherwise, it is requested to each slave.
+        The states of all the slaves are read at once while waiting.
+
+        Args:
+            slaves: pysoem slave of each slave ID. None if the slave is not available.
+            target_state: target ECAT state.
+            timeout: maximum time to wait for the slaves to reach the state, in seconds.
+            exchange_processdata: True to exchange the process data while waiting,
+                as required to reach the Op state.
+
+        Returns:
+            Transition of each slave, in the same order.
+        """
+        available_slaves = {
+            slave_id: slave for slave_id, slave in slaves.items() if slave is not None
+        }
+        start_time = time.perf_counter()
+        all_slave_ids = set(range(1, len(self._ecat_master.slaves) + 1))
+        if available_slaves and available_slaves.keys() >= all_slave_ids:
+            self._ecat_master.state = target_state
+            self._ecat_master.write_state()
+        else:
+            for slave in available_slaves.values():
+                slave.state = target_state
+                slave.write_state()
+
+        time_to_state: dict[int, float] = {}
+        with Timeout(timeout) as t:
+            while available_slaves:
+                self._ecat_master.read_state()
+                elapsed_time = time.perf_counter() - start_time
+                for slave_id, slave in available_slaves.items():
+                    if slave_id not in time_to_state and slave.state == target_state:
+                        time_to_state[slave_id] = elapsed_time
+                if len(time_to_state) == len(available_slaves):
+                    break
+                if exchange_processdata:
+                    self.send_receive_processdata()
+                if t.has_expired:
+                    break
+                time.sleep(self.STATE_TRANSITION_POLLING_INTERVAL_S)
+
+        transitions = [
+            SlaveStateTransition(
+                slave_id=slave_id,
+                target_state=target_state,
+                state=slave.state if slave is not None else pysoem.NONE_STATE,
+                time_to_state=time_to_state.get(slave_id),
+                al_status=slave.al_status if slave is not None else 0,
+            )
+            for slave_id, slave in slaves.items()
+        ]
+        self.__last_state_transitions = transitions
+        for transition in transitions:
+            logger.debug(
+                "Slave %d: target state %d, state %d, time to state %s s, AL status %s",
+                transition.slave_id,
+                transition.target_state,
+                transition.state,
+                transition.time_to_state,
+                transition.al_status_description,
+            )
+        return transitions
+
+    def __transition_or_raise(
+        self,
+        nodes: list["EthercatServo"],
+        target_state: int,
+        timeout: float,
+        *,
+        exchange_processdata: bool = False,
+    ) -> None:
+        """Transition a group of nodes to an ECAT state.
+
+        Args:
+            nodes: target nodes.
+            target_state: target ECAT state.
+            timeout: maximum time to wait for the nodes to reach the state, in seconds.
+            exchange_processdata: True to exchange the process data while waiting.
+
+        Raises:
+            ILStateError: If any of the nodes does not reach the state.
+        """
+        transitions = self._transition_nodes_state(
+            nodes, target_state, timeout, exchange_processdata=exchange_processdata
+        )
+        failed_transitions = [transition for transition in transitions if not transition.reached]
+        if not failed_transitions:
+            return
+        slaves_state_msg = " ".join(
+            f"Slave {transition.slave_id}: state {transition.state}, "
+            f"AL status {transition.al_status_description}."
+            for transition in failed_transitions
+        )
+        raise ILStateError(
+            f"Drives can not reach {SlaveState(target_state).name} state. {slaves_state_msg}"
+        )
 
     def _check_node_state(
         self, nodes: Union["EthercatServo", list["EthercatServo"]], target_state: int
@@ -844,13 +1525,25 @@ class EthercatNetwork(EthercatNetworkBase):
             for drive in node_list
         )
 
-    def start_status_listener(self) -> None:
-        """Start monitoring network events (CONNECTION/DISCONNECTION)."""
+    def start_status_listener(self, config: Optional[NetStatusListenerConfig] = None) -> None:
+        """Start monitoring network events (CONNECTION/DISCONNECTION).
+
+        Args:
+            config: polling and recovery configuration of the listener. If None, the
+                default configuration is used.
+        """
         if self.__listener_net_status is None:
-            listener = NetStatusListener(self)
+            listener = NetStatusListener(self, config=config)
             listener.start()
             self.__listener_net_status = listener
 
+    @property
+    def status_listener_metrics(self) -> Optional[NetStatusListenerMetrics]:
+        """Detection and recovery metrics of the status listener. None if it is not running."""
+        if self.__listener_net_status is None:
+            return None
+        return self.__listener_net_status.metrics
+
     def stop_status_listener(self) -> None:
         """Stops the NetStatusListener from listening to the drive."""
         if self.__listener_net_status is not None:
@@ -941,6 +1634,248 @@ class EthercatNetwork(EthercatNetworkBase):
             else:
                 logger.info(f"The slave {slave_id} cannot reach the PreOp state.")
 
+    def load_firmware_many(
+        self,
+        fw_files: Mapping[int, str],
+        boot_in_app: bool,
+        password: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, FirmwareLoadStage], None]] = None,
+    ) -> dict[int, FirmwareLoadResult]:
+        """Loads firmware files to several slaves at the same time.
+
+        All the target slaves are switched to the Boot state together, the firmware files are
+        transferred via FoE to several slaves concurrently, releasing the GIL, and all of
+        them are recovered to the PreOp state in a single pass. The transfers that fail are
+        retried for the failed slaves only.
+
+        Args:
+            fw_files: Path to the firmware file of each slave ID.
+            boot_in_app: True if the application includes the bootloader (i.e, the firmware
+                file extension is .sfu), False otherwise.
+            password: Password to load the firmware files. If ``None`` the default password
+                will be used.
+            max_workers: maximum number of concurrent FoE transfers. If None,
+                `MAX_CONCURRENT_MAILBOX_TRANSFERS`.
+            progress_callback: called with the slave ID and the stage each time the update
+                of a slave moves on to another stage.
+
+        Returns:
+            Result of the update of each slave ID.
+
+        Raises:
+            AttributeError: If the boot_in_app argument is not a boolean.
+            FileNotFoundError: If a firmware file cannot be found.
+            ValueError: If a slave ID value is invalid or max_workers is lower than 1.
+            ILError: If no slaves could be found in the network.
+            ILError: If a slave ID couldn't be found in the network.
+        """  # noqa: DOC502
+        if not isinstance(boot_in_app, bool):
+            raise AttributeError("The boot_in_app argument should be a boolean.")
+        for slave_id, fw_file in fw_files.items():
+            if not isinstance(slave_id, int) or slave_id < 0:
+                raise ValueError("Invalid slave ID value")
+            if not os.path.isfile(fw_file):
+                raise FileNotFoundError(f"Could not find {fw_file}.")
+        if max_workers is None:
+            max_workers = self.MAX_CONCURRENT_MAILBOX_TRANSFERS
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0.")
+        if password is None:
+            password = self.DEFAULT_FOE_PASSWORD
+
+        def report(slave_id: int, stage: FirmwareLoadStage) -> None:
+            stages[slave_id] = stage
+            if progress_callback is not None:
+                progress_callback(slave_id, stage)
+
+        stages: dict[int, FirmwareLoadStage] = {}
+        attempts = dict.fromkeys(fw_files, 0)
+        errors: dict[int, list[str]] = {slave_id: [] for slave_id in fw_files}
+        transfer_times: dict[int, float] = {}
+        file_data: dict[str, bytes] = {}
+        for fw_file in fw_files.values():
+            if fw_file not in file_data:
+                with open(fw_file, "rb") as file:
+                    file_data[fw_file] = file.read()
+
+        with self.running():
+            self.__init_nodes()
+            if len(self.__last_init_nodes) == 0:
+                raise ILError("Could not find any slaves in the network.")
+            for slave_id in fw_files:
+                if slave_id not in self.__last_init_nodes:
+                    raise ILError(f"Slave {slave_id} was not found.")
+
+            pending = list(fw_files)
+            for iteration in range(self.__MAX_FOE_TRIES):
+                if iteration > 0:
+                    self.__init_nodes()
+                slaves = {slave_id: self._ecat_master.slaves[slave_id - 1] for slave_id in pending}
+                boot_mode_errors = self._force_boot_mode_many(slaves) if not boot_in_app else {}
+                in_boot = self._switch_to_boot_state_many({
+                    slave_id: slave
+                    for slave_id, slave in slaves.items()
+                    if slave_id not in boot_mode_errors
+                })
+                in_boot.update(dict.fromkeys(boot_mode_errors, False))
+                for slave_id in slaves:
+                    if slave_id in boot_mode_errors:
+                        errors[slave_id].append(
+                            f"Attempt {iteration + 1}: {boot_mode_errors[slave_id]}"
+                        )
+                    elif in_boot[slave_id]:
+                        report(slave_id, FirmwareLoadStage.BOOT_STATE)
+                    else:
+                        errors[slave_id].append(
+                            f"Attempt {iteration + 1}: The slave cannot reach the Boot state."
+                        )
+                foe_results = self.__write_foe_many(
+                    {
+                        slave_id: (slave, file_data[fw_files[slave_id]])
+                        for slave_id, slave in slaves.items()
+                        if in_boot[slave_id]
+                    },
+                    password,
+                    max_workers,
+                    report,
+                )
+                pending = []
+                for slave_id in slaves:
+                    if not in_boot[slave_id]:
+                        pending.append(slave_id)
+                        continue
+                    attempts[slave_id] += 1
+                    foe_write_result, transfer_time = foe_results[slave_id]
+                    if foe_write_result > 0:
+                        transfer_times[slave_id] = transfer_time
+                        report(slave_id, FirmwareLoadStage.TRANSFERRED)
+                        continue
+                    error_message = (
+                        f"Attempt {iteration + 1}: "
+                        f"{self.__get_foe_error_message(error_code=foe_write_result)}."
+                    )
+                    logger.info(f"FoE write to slave {slave_id} failed: {error_message}")
+                    errors[slave_id].append(error_message)
+                    pending.append(slave_id)
+                if not pending:
+                    break
+            for slave_id in pending:
+                report(slave_id, FirmwareLoadStage.FAILED)
+
+            transferred = [slave_id for slave_id in fw_files if slave_id in transfer_times]
+            for slave_id in self.__recover_from_firmware_load(transferred):
+                report(slave_id, FirmwareLoadStage.RECOVERED)
+            for slave_id in transferred:
+                if stages[slave_id] != FirmwareLoadStage.RECOVERED:
+                    logger.info(f"The slave {slave_id} cannot reach the PreOp state.")
+                    report(slave_id, FirmwareLoadStage.FAILED)
+
+        return {
+            slave_id: FirmwareLoadResult(
+                slave_id=slave_id,
+                fw_file=fw_file,
+                stage=stages.get(slave_id, FirmwareLoadStage.FAILED),
+                attempts=attempts[slave_id],
+                transfer_time=transfer_times.get(slave_id),
+                errors=tuple(errors[slave_id]),
+            )
+            for slave_id, fw_file in fw_files.items()
+        }
+
+    def __write_foe_many(
+        self,
+        transfers: dict[int, tuple["CdefSlave", bytes]],
+        password: int,
+        max_workers: int,
+        report: Callable[[int, FirmwareLoadStage], None],
+    ) -> dict[int, tuple[int, float]]:
+        """Write firmware files via FoE to several slaves concurrently.
+
+        The network lock is held during all the transfers, which release the GIL.
+
+        Args:
+            transfers: slave and firmware file data of each slave ID.
+            password: The firmware password.
+            max_workers: maximum number of concurrent transfers.
+            report: called when the transfer to a slave starts.
+
+        Returns:
+            FoE operation result and transfer duration of each slave ID.
+        """
+
+        def write_foe(slave_id: int) -> tuple[int, float]:
+            slave, data = transfers[slave_id]
+            report(slave_id, FirmwareLoadStage.TRANSFERRING)
+            start_time = time.perf_counter()
+            result: int = slave.foe_write(
+                self.__DEFAULT_FOE_FILE_NAME,
+                password,
+                data,
+                self.__FOE_WRITE_TIMEOUT_US,
+                release_gil=True,
+            )
+            return result, time.perf_counter() - start_time
+
+        if not transfers:
+            return {}
+        # Ensure network reference is set before releasing GIL
+        self.__ensure_network_reference()
+        with (
+            self._lock,
+            ThreadPoolExecutor(
+                max_workers=min(max_workers, len(transfers)), thread_name_prefix="FoE"
+            ) as executor,
+        ):
+            futures = {slave_id: executor.submit(write_foe, slave_id) for slave_id in transfers}
+            return {slave_id: future.result() for slave_id, future in futures.items()}
+
+    def __recover_from_firmware_load(self, slave_ids: list[int]) -> list[int]:
+        """Wait until the slaves run the new firmware and set them to the PreOp state.
+
+        Args:
+            slave_ids: IDs of the slaves whose firmware was loaded.
+
+        Returns:
+            IDs of the slaves that reached the PreOp state.
+        """
+        recovered: list[int] = []
+        pending = list(slave_ids)
+        start_time = time.time()
+        while pending and time.time() < (start_time + self.__FOE_RECOVERY_TIMEOUT_S):
+            self.__init_nodes()
+            slaves = {
+                slave_id: self._ecat_master.slaves[slave_id - 1]
+                for slave_id in pending
+                if slave_id in self.__last_init_nodes
+            }
+            transitions = self._transition_slaves_state(
+                slaves, pysoem.PREOP_STATE, ECAT_STATE_CHANGE_TIMEOUT_US / 1_000_000
+            )
+            for transition in transitions:
+                if transition.reached:
+                    recovered.append(transition.slave_id)
+                    pending.remove(transition.slave_id)
+            if pending:
+                time.sleep(self.__FOE_RECOVERY_SLEEP_S)
+        if recovered:
+            logger.info(f"Firmware of slaves {recovered} updated successfully")
+        return recovered
+
+    def _switch_to_boot_state_many(self, slaves: Mapping[int, "CdefSlave"]) -> dict[int, bool]:
+        """Transitions several slaves to the boot state together.
+
+        Args:
+            slaves: pysoem slave of each slave ID.
+
+        Returns:
+            True for each slave ID that reached the boot state, False otherwise.
+        """
+        transitions = self._transition_slaves_state(
+            slaves, pysoem.BOOT_STATE, ECAT_STATE_CHANGE_TIMEOUT_US / 1_000_000
+        )
+        return {transition.slave_id: transition.reached for transition in transitions}
+
     def _switch_to_boot_state(self, slave: "CdefSlave") -> bool:
         """Transitions the slave to the boot state.
 
@@ -965,14 +1900,7 @@ class EthercatNetwork(EthercatNetworkBase):
             slave.state_check(pysoem.PREOP_STATE, ECAT_STATE_CHANGE_TIMEOUT_US)
             == pysoem.PREOP_STATE
         ):
-            try:
-                slave.sdo_write(
-                    self.__FORCE_COCO_BOOT_IDX,
-                    self.__FORCE_COCO_BOOT_SUBIDX,
-                    self.__FORCE_BOOT_PASSWORD.to_bytes(4, "little"),
-                )
-            except pysoem.WkcError as e:
-                raise ILFirmwareLoadError("Error writing to the Boot mode register.") from e
+            self.__write_force_boot_register(slave)
         slave.state = pysoem.INIT_STATE
         slave.write_state()
         slave.state = pysoem.BOOT_STATE
@@ -980,6 +1908,56 @@ class EthercatNetwork(EthercatNetworkBase):
         time.sleep(self.__FORCE_BOOT_SLEEP_TIME_S)
         self.__init_nodes()
 
+    def _force_boot_mode_many(self, slaves: Mapping[int, "CdefSlave"]) -> dict[int, str]:
+        """Force several COMOCO drives to boot mode together.
+
+        A slave whose Boot mode register can not be written does not stop the others.
+
+        Args:
+            slaves: pysoem slave of each slave ID.
+
+        Returns:
+            Error of each slave ID that could not be forced to boot mode.
+        """
+        errors: dict[int, str] = {}
+        transitions = self._transition_slaves_state(
+            slaves, pysoem.PREOP_STATE, ECAT_STATE_CHANGE_TIMEOUT_US / 1_000_000
+        )
+        for transition in transitions:
+            if not transition.reached:
+                continue
+            try:
+                self.__write_force_boot_register(slaves[transition.slave_id])
+            except ILFirmwareLoadError as e:
+                logger.info(f"Slave {transition.slave_id}: {e}")
+                errors[transition.slave_id] = str(e)
+        for slave in slaves.values():
+            slave.state = pysoem.INIT_STATE
+            slave.write_state()
+            slave.state = pysoem.BOOT_STATE
+            slave.write_state()
+        time.sleep(self.__FORCE_BOOT_SLEEP_TIME_S)
+        self.__init_nodes()
+        return errors
+
+    def __write_force_boot_register(self, slave: "CdefSlave") -> None:
+        """Write the password of the Boot mode register of a COMOCO drive.
+
+        Args:
+            slave: pysoem slave.
+
+        Raises:
+            ILFirmwareLoadError: If there is an error writing to the Boot mode register.
+        """
+        try:
+            slave.sdo_write(
+                self.__FORCE_COCO_BOOT_IDX,
+                self.__FORCE_COCO_BOOT_SUBIDX,
+                self.__FORCE_BOOT_PASSWORD.to_bytes(4, "little"),
+            )
+        except pysoem.WkcError as e:
+            raise ILFirmwareLoadError("Error writing to the Boot mode register.") from e
+
     def _write_foe(
         self,
         slave: "CdefSlave",
@@ -1081,6 +2059,39 @@ class EthercatNetwork(EthercatNetworkBase):
             if exception is not None:
                 raise exception
 
+    def _recover_slaves(self, servos: list[EthercatServo]) -> bool:
+        """Recover the CoE communication of some slaves without initializing the network.
+
+        Each slave is recovered and configured again by the master, if it is still
+        configured in it, and set to the PreOp state. The rest of the slaves are not
+        affected.
+
+        Args:
+            servos: servos of the slaves to recover.
+
+        Returns:
+            True if all the slaves reach the PreOp state. False if any of them can not be
+            recovered, then the network must be initialized again.
+        """
+        if not servos or not all(servo.slave_exists for servo in servos):
+            return False
+        for servo in servos:
+            servo._lock.acquire()
+        try:
+            for servo in servos:
+                if servo.slave.recover(ECAT_STATE_CHANGE_TIMEOUT_US) <= 0:
+                    return False
+                servo.slave.reconfig(ECAT_STATE_CHANGE_TIMEOUT_US)
+        finally:
+            for servo in servos:
+                servo._lock.release()
+        recovered = self._change_nodes_state(servos, pysoem.PREOP_STATE)
+        if recovered:
+            logger.warning(
+                f"CoE communication of slaves {[servo.slave_id for servo in servos]} recovered."
+            )
+        return recovered
+
     @override
     def recover_from_disconnection(self, servo: Optional[Servo] = None) -> bool:
         """Recover the CoE communication after a disconnection.
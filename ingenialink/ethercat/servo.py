@@ -1,7 +1,11 @@
 import os
+import struct
+import threading
 from abc import ABC
+from collections.abc import Generator, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Optional, Union, cast
+from typing import TYPE_CHECKING, Callable, ClassVar, Optional, Union, cast
 
 import ingenialogger
 from typing_extensions import override
@@ -28,11 +32,35 @@ from ingenialink.constants import (
 )
 from ingenialink.dictionary import CanOpenObject, Interface
 from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.ethercat.snapshot import ObjectSnapshotEngine
 from ingenialink.exceptions import ILEcatStateError, ILError, ILIOError, ILRegisterAccessError
 from ingenialink.pdo import PDOMap, PDOServo, RPDOMap, TPDOMap
+from ingenialink.register import Register
+from ingenialink.utils.event import CallbackList
 
 logger = ingenialogger.get_logger(__name__)
 
+# GIL release setting of the SDO transfers done by the current thread
+_sdo_thread_settings = threading.local()
+
+
+@contextmanager
+def release_gil_in_sdo_transfers() -> Generator[None, None, None]:
+    """Release the GIL in the SDO transfers done by the current thread.
+
+    It overrides the GIL release configuration of the servos, so that the mailbox
+    transfers of different slaves can run in parallel threads.
+
+    Yields:
+        None.
+    """
+    previous_setting = getattr(_sdo_thread_settings, "release_gil", None)
+    _sdo_thread_settings.release_gil = True
+    try:
+        yield
+    finally:
+        _sdo_thread_settings.release_gil = previous_setting
+
 
 class SdoOperationMsg(Enum):
     """Message for exceptions depending on the operation type."""
@@ -99,6 +127,18 @@ class EthercatServo(EthercatServoBase):
 
     DEFAULT_EEPROM_OPERATION_TIMEOUT_uS = 200_000
     DEFAULT_EEPROM_READ_BYTES_LENGTH = 2
+    # pysoem reads 2 words per EEPROM read operation and writes 1 word per write operation
+    ESC_EEPROM_READ_BLOCK_BYTES = 4
+    ESC_EEPROM_WORD_BYTES = 2
+    # SII layout (ETG.1000.6): word addresses of the fields and of the first category
+    ESC_EEPROM_SERIAL_NUMBER_ADDRESS = 0x0E
+    ESC_EEPROM_SIZE_ADDRESS = 0x3E
+    ESC_EEPROM_CATEGORIES_ADDRESS = 0x40
+    ESC_EEPROM_END_CATEGORY = 0xFFFF
+
+    # SII images by (vendor ID, product code, revision number, serial number)
+    __esc_eeprom_images: ClassVar[dict[tuple[int, int, int, int], bytes]] = {}
+    __esc_eeprom_images_lock: ClassVar[threading.Lock] = threading.Lock()
 
     # Default PDO maps to assign if not specified
     DEFAULT_RPDO_MAP = "ETG_COMMS_RPDO_MAP1"
@@ -117,9 +157,12 @@ class EthercatServo(EthercatServoBase):
             raise pysoem_import_error
         self.__slave: Optional[CdefSlave] = slave
         self.slave_id = slave_id
-        self.__emcy_observers: list[Callable[[EmergencyMessage], None]] = []
+        self.__emcy_observers: CallbackList[Callable[[EmergencyMessage], None]] = CallbackList()
         self.__slave.add_emergency_callback(self._on_emcy)
         self.__sdo_read_write_release_gil = sdo_read_write_release_gil
+        self.__map_pdos_on_config = False
+        self.__pdos_premapped = False
+        self.__snapshot_engine = ObjectSnapshotEngine(self)
         super().__init__(
             slave_id,
             dictionary_path,
@@ -181,6 +224,29 @@ class EthercatServo(EthercatServoBase):
         self.write(reg=self.RESTORE_COCO_ALL, data=PASSWORD_RESTORE_SAFETY_REGS, subnode=0)
         logger.info("Restore safety registers successful.")
 
+    @property
+    def sdo_read_write_release_gil(self) -> Optional[bool]:
+        """True to release the GIL in the SDO transfers, False otherwise.
+
+        None to use the pysoem default.
+        """
+        return self.__sdo_read_write_release_gil
+
+    @sdo_read_write_release_gil.setter
+    def sdo_read_write_release_gil(self, release_gil: Optional[bool]) -> None:
+        self.__sdo_read_write_release_gil = release_gil
+
+    def __sdo_release_gil(self) -> Optional[bool]:
+        """GIL release setting of the SDO transfers done by the current thread.
+
+        Returns:
+            True to release the GIL, False otherwise. None to use the pysoem default.
+        """
+        thread_setting: Optional[bool] = getattr(_sdo_thread_settings, "release_gil", None)
+        if thread_setting is not None:
+            return thread_setting
+        return self.__sdo_read_write_release_gil
+
     def _read_raw(  # type: ignore [override]
         self,
         reg: EthercatRegister,
@@ -190,7 +256,7 @@ class EthercatServo(EthercatServoBase):
         release_gil: Optional[bool] = None,
     ) -> bytes:
         if release_gil is None:
-            release_gil = self.__sdo_read_write_release_gil
+            release_gil = self.__sdo_release_gil()
         self._lock.acquire()
         try:
             value: bytes = self.slave.sdo_read(
@@ -221,7 +287,7 @@ class EthercatServo(EthercatServoBase):
         release_gil: Optional[bool] = None,
     ) -> None:
         if release_gil is None:
-            release_gil = self.__sdo_read_write_release_gil
+            release_gil = self.__sdo_release_gil()
         self._lock.acquire()
         try:
             self.slave.sdo_write(
@@ -242,6 +308,16 @@ class EthercatServo(EthercatServoBase):
         finally:
             self._lock.release()
 
+    @override
+    def _read_raw_in_bulk(self, registers: Iterable[Register]) -> dict[Register, bytes]:
+        return self.__snapshot_engine.read(registers)
+
+    @override
+    def _write_raw_in_bulk(
+        self, values: Mapping[Register, bytes]
+    ) -> Iterator[tuple[Register, Optional[ILError]]]:
+        return self.__snapshot_engine.write(values)
+
     def _handle_sdo_exception(
         self, reg: EthercatRegister, operation_msg: SdoOperationMsg, exception: Exception
     ) -> None:
@@ -348,6 +424,7 @@ class EthercatServo(EthercatServoBase):
         """
         emergency_message = EthercatEmergencyMessage(self, emergency_msg)
         logger.warning(f"Emergency message received from slave {self.target}: {emergency_message}")
+        self._signal_status_event()
         for callback in self.__emcy_observers:
             callback(emergency_message)
 
@@ -402,7 +479,37 @@ class EthercatServo(EthercatServoBase):
                 tpdo_map.slave = self
                 map_obj = self.__resolve_missing_pdo_map_info(tpdo_map)
                 self._tpdo_maps[map_obj.idx] = tpdo_map
-        self.slave.config_func = self.map_pdos
+        self.__map_pdos_on_config = True
+        self.slave.config_func = self.__config_func
+
+    @property
+    def _maps_pdos_on_config(self) -> bool:
+        """True if the PDO maps are written when the network configures the PDO maps."""
+        return self.__map_pdos_on_config and self.slave is not None
+
+    def _premap_pdos(self) -> None:
+        """Map the PDOs before the network configures the PDO maps.
+
+        The mapping is then skipped when pysoem calls the configuration function of the slave,
+        which lets the network map several slaves concurrently.
+        """
+        self.map_pdos(self.slave_id)
+        self.__pdos_premapped = True
+
+    def _clear_premapped_pdos(self) -> None:
+        """Map the PDOs again the next time the network configures the PDO maps."""
+        self.__pdos_premapped = False
+
+    def __config_func(self, slave_index: int) -> None:
+        """Configuration function called by pysoem when the PDO maps are configured.
+
+        Args:
+            slave_index: slave index.
+        """
+        if self.__pdos_premapped:
+            self.__pdos_premapped = False
+            return
+        self.map_pdos(slave_index)
 
     def __resolve_missing_pdo_map_info(self, pdo_map: PDOMap) -> CanOpenObject:
         """Resolve missing PDO map information.
@@ -486,6 +593,9 @@ class EthercatServo(EthercatServoBase):
     ) -> bytes:
         """Read from the ESC EEPROM.
 
+        The data is read in blocks of ``ESC_EEPROM_READ_BLOCK_BYTES``, the largest block that
+        can be read in one operation.
+
         Args:
             address: EEPROM address to be read.
             length: Length of data to be read. By default, 2 bytes are read.
@@ -500,39 +610,66 @@ class EthercatServo(EthercatServoBase):
         """
         if length < 1:
             raise ValueError("The minimum length is 1 byte.")
-        data = b""
+        data = bytearray()
         while len(data) < length:
             data += self.slave.eeprom_read(address, timeout)
-            address += 2
-        if len(data) > length:
-            data = data[:length]
-        return data
+            address += self.ESC_EEPROM_READ_BLOCK_BYTES // self.ESC_EEPROM_WORD_BYTES
+        return bytes(data[:length])
 
     def _write_esc_eeprom(
-        self, address: int, data: bytes, timeout: int = DEFAULT_EEPROM_OPERATION_TIMEOUT_uS
-    ) -> None:
+        self,
+        address: int,
+        data: bytes,
+        timeout: int = DEFAULT_EEPROM_OPERATION_TIMEOUT_uS,
+        only_changed: bool = False,
+    ) -> int:
         """Write to the ESC EEPROM.
 
+        The cached SII image of the slave is discarded.
+
         Args:
             address: EEPROM address to be written.
             data: Data to be written. The data length must be a multiple of 2 bytes.
             timeout: Operation timeout (microseconds). By default, 200.000 us.
+            only_changed: True to read the EEPROM first and only write the words that are
+                different.
+
+        Returns:
+            Number of words written.
 
         Raises:
             ValueError: If the data has the wrong size.
 
         """
-        if len(data) % 2 != 0:
+        if len(data) % self.ESC_EEPROM_WORD_BYTES != 0:
             raise ValueError("The data length must be a multiple of 2 bytes.")
-        start_address = address
-        while data:
-            self.slave.eeprom_write(start_address, data[:2], timeout)
-            data = data[2:]
-            start_address += 1
+        if not data:
+            return 0
+        self.__discard_esc_eeprom_image(timeout)
+        current_data = (
+            self._read_esc_eeprom(address, len(data), timeout) if only_changed and data else None
+        )
+        words_written = 0
+        for offset in range(0, len(data), self.ESC_EEPROM_WORD_BYTES):
+            word = data[offset : offset + self.ESC_EEPROM_WORD_BYTES]
+            if current_data is not None and current_data[offset : offset + len(word)] == word:
+                continue
+            self.slave.eeprom_write(address + offset // self.ESC_EEPROM_WORD_BYTES, word, timeout)
+            words_written += 1
+        serial_number_words = range(
+            self.ESC_EEPROM_SERIAL_NUMBER_ADDRESS, self.ESC_EEPROM_SERIAL_NUMBER_ADDRESS + 2
+        )
+        written_words = range(address, address + len(data) // self.ESC_EEPROM_WORD_BYTES)
+        if words_written and set(serial_number_words) & set(written_words):
+            # The slave is cached with a new identity
+            self.__discard_esc_eeprom_image(timeout)
+        return words_written
 
     def _write_esc_eeprom_from_file(self, file_path: str) -> None:
         """Load a binary file to the ESC EEPROM.
 
+        Only the words that are different from the EEPROM content are written.
+
         Args:
             file_path: Path to the binary file to be loaded.
 
@@ -544,7 +681,102 @@ class EthercatServo(EthercatServoBase):
             raise FileNotFoundError(f"Could not find {file_path}.")
         with open(file_path, "rb") as file:
             data = file.read()
-        self._write_esc_eeprom(address=0, data=data)
+        words_written = self._write_esc_eeprom(address=0, data=data, only_changed=True)
+        logger.debug(
+            f"{words_written} of {len(data) // self.ESC_EEPROM_WORD_BYTES} EEPROM words "
+            f"written to slave {self.slave_id}."
+        )
+
+    def _read_esc_eeprom_image(
+        self, use_cache: bool = True, timeout: int = DEFAULT_EEPROM_OPERATION_TIMEOUT_uS
+    ) -> bytes:
+        """Read the whole SII image of the ESC EEPROM.
+
+        The image goes from the first word up to the end category marker. The images are
+        cached by vendor ID, product code, revision number and serial number, so that only
+        the serial number is read if the image of the slave was read before.
+
+        Args:
+            use_cache: False to read the image from the EEPROM even if it is cached.
+            timeout: Operation timeout (microseconds). By default, 200.000 us.
+
+        Returns:
+            SII image.
+
+        Raises:
+            ILError: If the end category marker is not found within the EEPROM size.
+
+        """
+        identity = self.__esc_eeprom_identity(timeout)
+        if use_cache:
+            with self.__esc_eeprom_images_lock:
+                cached_image = self.__esc_eeprom_images.get(identity)
+            if cached_image is not None:
+                return cached_image
+        image = bytearray(
+            self._read_esc_eeprom(
+                0, self.ESC_EEPROM_CATEGORIES_ADDRESS * self.ESC_EEPROM_WORD_BYTES, timeout
+            )
+        )
+        (eeprom_size,) = struct.unpack_from(
+            "<H", image, self.ESC_EEPROM_SIZE_ADDRESS * self.ESC_EEPROM_WORD_BYTES
+        )
+        # The size is stored in KiBit minus 1
+        eeprom_size_bytes = (eeprom_size + 1) * 1024 // 8
+        found_end = False
+        while len(image) < eeprom_size_bytes:
+            header = self._read_esc_eeprom(
+                len(image) // self.ESC_EEPROM_WORD_BYTES, self.ESC_EEPROM_READ_BLOCK_BYTES, timeout
+            )
+            category_type, category_words = struct.unpack("<HH", header)
+            if category_type == self.ESC_EEPROM_END_CATEGORY:
+                image += header[: self.ESC_EEPROM_WORD_BYTES]
+                found_end = True
+                break
+            image += header
+            if len(image) + category_words * self.ESC_EEPROM_WORD_BYTES > eeprom_size_bytes:
+                break
+            if category_words:
+                image += self._read_esc_eeprom(
+                    len(image) // self.ESC_EEPROM_WORD_BYTES,
+                    category_words * self.ESC_EEPROM_WORD_BYTES,
+                    timeout,
+                )
+        if not found_end:
+            raise ILError("The end category marker was not found in the EEPROM.")
+        with self.__esc_eeprom_images_lock:
+            self.__esc_eeprom_images[identity] = bytes(image)
+        return bytes(image)
+
+    @classmethod
+    def _clear_esc_eeprom_image_cache(cls) -> None:
+        """Remove all the cached SII images."""
+        with cls.__esc_eeprom_images_lock:
+            cls.__esc_eeprom_images.clear()
+
+    def __discard_esc_eeprom_image(self, timeout: int) -> None:
+        """Remove the cached SII image of the slave.
+
+        Args:
+            timeout: Operation timeout (microseconds).
+        """
+        identity = self.__esc_eeprom_identity(timeout)
+        with self.__esc_eeprom_images_lock:
+            self.__esc_eeprom_images.pop(identity, None)
+
+    def __esc_eeprom_identity(self, timeout: int) -> tuple[int, int, int, int]:
+        """Identity of the slave the SII images are cached by.
+
+        Args:
+            timeout: Operation timeout (microseconds).
+
+        Returns:
+            Vendor ID, product code, revision number and serial number.
+        """
+        serial_number = int.from_bytes(
+            self._read_esc_eeprom(self.ESC_EEPROM_SERIAL_NUMBER_ADDRESS, 4, timeout), "little"
+        )
+        return self.slave.man, self.slave.id, self.slave.rev, serial_number
 
     @property
     def slave(self) -> "CdefSlave":
@@ -581,14 +813,20 @@ class EthercatServo(EthercatServoBase):
         if subnode is not None and (not isinstance(subnode, int) or subnode < 0):
             raise ILError("Invalid subnode")
         csv_configuration_file = CSVConfigurationFile(config_file)
-        for configuration_registers in self._registers_to_save_in_configuration_file(
-            subnode
-        ).values():
+        configuration_registers_per_subnode = self._registers_to_save_in_configuration_file(subnode)
+        bulk_data = self._read_raw_in_bulk(
+            register
+            for configuration_registers in configuration_registers_per_subnode.values()
+            for register in configuration_registers
+        )
+        for configuration_registers in configuration_registers_per_subnode.values():
             for configuration_register in configuration_registers:
                 if not isinstance(configuration_register, EthercatRegister):
                     continue
                 try:
-                    storage = self._read_raw(configuration_register)
+                    storage = bulk_data.get(configuration_register)
+                    if storage is None:
+                        storage = self._read_raw(configuration_register)
                     csv_configuration_file.add_register(configuration_register, storage)
                 except (ILError, NotImplementedError) as e:
                     logger.error(
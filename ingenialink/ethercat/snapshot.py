@@ -0,0 +1,274 @@
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Optional, cast
+
+import ingenialogger
+
+from ingenialink.dictionary import CanOpenObject, CanOpenObjectType
+from ingenialink.enums.register import RegAccess
+from ingenialink.exceptions import ILError, ILRegisterAccessError
+from ingenialink.register import Register
+from ingenialink.utils._utils import dtype_length_bits
+
+try:
+    import pysoem
+except ImportError:
+    pysoem = None
+
+if TYPE_CHECKING:
+    from ingenialink.ethercat.register import EthercatRegister
+    from ingenialink.ethercat.servo import EthercatServo
+
+logger = ingenialogger.get_logger(__name__)
+
+
+class ObjectSnapshotEngine:
+    """Read and write the registers of an EtherCAT servo with one transfer per object.
+
+    The registers of records and arrays are grouped by CANopen object. Each group is read
+    or written with a single complete access SDO transfer and split or joined using the
+    subitem layout of the object. The objects that refuse complete access are remembered
+    and their registers are transferred one by one.
+
+    Args:
+        servo: Servo the registers belong to.
+    """
+
+    MIN_REGISTERS_PER_TRANSFER = 2
+    """Minimum number of registers of an object to transfer it with complete access."""
+
+    # Subindex 0 of records and arrays is followed by 8 padding bits in complete access
+    SUBINDEX_0_PADDING_BYTES = 1
+
+    def __init__(self, servo: "EthercatServo") -> None:
+        self.__servo = servo
+        self.__layouts: dict[CanOpenObject, Optional[dict[Register, slice]]] = {}
+        self.__refused_objects: set[CanOpenObject] = set()
+
+    def read(self, registers: Iterable[Register]) -> dict[Register, bytes]:
+        """Read registers grouping them by object.
+
+        Args:
+            registers: Registers to read.
+
+        Returns:
+            Raw data of the registers read with complete access. The registers that are
+            not in the result must be read one by one.
+        """
+        data: dict[Register, bytes] = {}
+        readable_registers = (register for register in registers if register.access != RegAccess.WO)
+        for obj, obj_registers in self.__group(readable_registers).items():
+            try:
+                object_data = self.__servo._read_raw(
+                    cast("EthercatRegister", obj.registers[0]),
+                    buffer_size=obj.byte_length,
+                    complete_access=True,
+                )
+            except ILError as e:
+                self.__on_object_error(obj, e)
+                continue
+            layout = self.__layout(obj)
+            if layout is None:
+                continue
+            for register in obj_registers:
+                position = layout[register]
+                # Some objects, like PDO maps, only return their used subindexes
+                if position.stop <= len(object_data):
+                    data[register] = object_data[position]
+        return data
+
+    def write(
+        self, values: Mapping[Register, bytes]
+    ) -> Iterator[tuple[Register, Optional[ILError]]]:
+        """Write registers grouping them by object.
+
+        The registers are written in the order of the values. An object is written with
+        complete access when its first register is reached, if the values of all its
+        subindexes (except subindex 0) are given. The registers are written lazily, so
+        that the caller can stop at the first error.
+
+        Args:
+            values: Raw data to write to each register.
+
+        Yields:
+            Each register and the error writing it, None if it was written.
+        """
+        objects_data: dict[CanOpenObject, tuple[Register, bytes]] = {}
+        for group_obj in self.__group(values):
+            joined_data = self.__join(group_obj, values)
+            if joined_data is not None:
+                objects_data[group_obj] = joined_data
+        written_objects: set[CanOpenObject] = set()
+        for register, data in values.items():
+            # The object may be refused after writing the first of its registers
+            obj: Optional[CanOpenObject] = getattr(register, "obj", None)
+            if obj is None or obj not in objects_data:
+                yield register, self.__write_register(register, data)
+                continue
+            if obj in written_objects:
+                continue
+            written_objects.add(obj)
+            first_register, object_data = objects_data[obj]
+            object_registers = [
+                obj_register for obj_register in obj.registers if obj_register in values
+            ]
+            try:
+                self.__servo._write_raw(
+                    cast("EthercatRegister", first_register), object_data, complete_access=True
+                )
+            except ILError as e:
+                self.__on_object_error(obj, e)
+                for obj_register in object_registers:
+                    yield obj_register, self.__write_register(obj_register, values[obj_register])
+                continue
+            for obj_register in object_registers:
+                yield obj_register, None
+
+    def __write_register(self, register: Register, data: bytes) -> Optional[ILError]:
+        """Write a single register.
+
+        Args:
+            register: Register to write.
+            data: Raw data to write.
+
+        Returns:
+            The error writing the register, None if it was written.
+        """
+        try:
+            self.__servo._write_raw(cast("EthercatRegister", register), data)
+        except ILError as e:
+            return e
+        return None
+
+    def __group(self, registers: Iterable[Register]) -> dict[CanOpenObject, list[Register]]:
+        """Group the registers by the objects that can be transferred with complete access.
+
+        Args:
+            registers: Registers to group.
+
+        Returns:
+            Registers of each object, only for objects with enough registers.
+        """
+        groups: dict[CanOpenObject, list[Register]] = defaultdict(list)
+        for register in registers:
+            obj = self.__object(register)
+            if obj is not None:
+                groups[obj].append(register)
+        return {
+            obj: obj_registers
+            for obj, obj_registers in groups.items()
+            if len(obj_registers) >= self.MIN_REGISTERS_PER_TRANSFER
+        }
+
+    def __object(self, register: Register) -> Optional[CanOpenObject]:
+        """Object of a register, if it can be transferred with complete access.
+
+        Args:
+            register: Register of the object.
+
+        Returns:
+            The object of the register, None if it can not be transferred with complete
+            access.
+        """
+        obj: Optional[CanOpenObject] = getattr(register, "obj", None)
+        if obj is None or obj in self.__refused_objects:
+            return None
+        layout = self.__layout(obj)
+        if layout is None or register not in layout:
+            return None
+        return obj
+
+    def __layout(self, obj: CanOpenObject) -> Optional[dict[Register, slice]]:
+        """Position of each register of an object in its complete access data.
+
+        Args:
+            obj: Object.
+
+        Returns:
+            Bytes of each register, None if the object can not be split into registers.
+        """
+        if obj not in self.__layouts:
+            self.__layouts[obj] = self.__build_layout(obj)
+        return self.__layouts[obj]
+
+    @classmethod
+    def __build_layout(cls, obj: CanOpenObject) -> Optional[dict[Register, slice]]:
+        """Compute the position of each register of an object in its complete access data.
+
+        Args:
+            obj: Object.
+
+        Returns:
+            Bytes of each register, None if the object is not a record or an array, its
+            subindexes are not consecutive or the size of a subitem is not a whole number
+            of bytes.
+        """
+        subindexes = [register.subidx for register in obj.registers]
+        if obj.object_type == CanOpenObjectType.VAR or subindexes != list(range(len(subindexes))):
+            return None
+        layout: dict[Register, slice] = {}
+        offset = 0
+        for register in obj.registers:
+            bit_length = dtype_length_bits.get(register.dtype)
+            if bit_length is None or bit_length % 8:
+                return None
+            layout[register] = slice(offset, offset + bit_length // 8)
+            offset += bit_length // 8
+            if register.subidx == 0:
+                offset += cls.SUBINDEX_0_PADDING_BYTES
+        return layout
+
+    def __join(
+        self, obj: CanOpenObject, values: Mapping[Register, bytes]
+    ) -> Optional[tuple[Register, bytes]]:
+        """Join the values of the registers of an object into its complete access data.
+
+        Args:
+            obj: Object.
+            values: Raw data of the registers.
+
+        Returns:
+            Register to start the complete access write and the data to write. None if the
+            values of some subindexes are missing or have a wrong size.
+        """
+        layout = self.__layout(obj)
+        if layout is None:
+            return None
+        registers = obj.registers
+        if registers[0] not in values:
+            # The complete access write starts at subindex 1
+            registers = registers[1:]
+        data = bytearray()
+        for register in registers:
+            position = layout[register]
+            register_data = values.get(register)
+            if (
+                register_data is None
+                or register.access == RegAccess.RO
+                or len(register_data) != position.stop - position.start
+            ):
+                return None
+            data += register_data
+            if register.subidx == 0:
+                data += bytes(self.SUBINDEX_0_PADDING_BYTES)
+        return registers[0], bytes(data)
+
+    def __on_object_error(self, obj: CanOpenObject, error: ILError) -> None:
+        """Remember the objects that refuse complete access.
+
+        Args:
+            obj: Object that could not be transferred.
+            error: Error of the complete access transfer.
+        """
+        if (
+            pysoem is not None
+            and isinstance(error, ILRegisterAccessError)
+            and isinstance(error.base_exception, pysoem.SdoError)
+        ):
+            self.__refused_objects.add(obj)
+        logger.debug(
+            "Object %s could not be transferred with complete access, its registers are "
+            "transferred one by one: %s",
+            obj.uid,
+            error,
+        )
@@ -4,7 +4,7 @@ import ipaddress
 import os
 import socket
 import time
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict
 from ftplib import FTP
 from threading import Thread
 from time import sleep
@@ -19,6 +19,7 @@ from ingenialink.ethernet.resources import BASIC_ETHERNET_V2_XDF
 from ingenialink.exceptions import ILError, ILFirmwareLoadError
 from ingenialink.network import NetDevEvt, NetProt, NetState, Network, SlaveInfo
 from ingenialink.servo import Servo
+from ingenialink.utils.event import CallbackList
 from ingenialink.utils.udp import UDP
 
 from .servo import EthernetServo
@@ -104,7 +105,7 @@ class EthernetNetworkBase(Network):
         else:
             self.__subnet = None
         self.__listener_net_status: Optional[NetStatusListener] = None
-        self.__observers_net_state: dict[str, list[Callable[[NetDevEvt], Any]]] = defaultdict(list)
+        self.__observers_net_state: dict[str, CallbackList[Callable[[NetDevEvt], Any]]] = {}
 
     @staticmethod
     def load_firmware(
@@ -286,6 +287,46 @@ class EthernetNetworkBase(Network):
         Returns:
             EthernetServo: Instance of the servo connected.
         """
+        servo = self._open_servo(
+            target,
+            dictionary,
+            port,
+            connection_timeout,
+            servo_status_listener,
+            is_eoe,
+            disconnect_callback,
+        )
+        self._add_servo(servo, net_status_listener)
+        return servo
+
+    def _open_servo(
+        self,
+        target: str,
+        dictionary: str,
+        port: int,
+        connection_timeout: float,
+        servo_status_listener: bool,
+        is_eoe: bool,
+        disconnect_callback: Optional[Callable[[Servo], None]],
+    ) -> EthernetServo:
+        """Create a servo and check that the drive answers, without adding it to the network.
+
+        Args:
+            target: IP of the target slave.
+            dictionary: Path to the target dictionary file.
+            port: Port to connect to the slave.
+            connection_timeout: Time in seconds of the connection timeout.
+            servo_status_listener: Toggle the listener of the servo for
+                its status, errors, faults, etc.
+            is_eoe: True if communication is EoE.
+            disconnect_callback: Callback function to be called when the servo is disconnected.
+
+        Raises:
+            ILError: If the drive is not found.
+
+        Returns:
+            EthernetServo: Instance of the servo.
+        """
         servo = EthernetServo(
             target,
             dictionary,
@@ -300,14 +341,23 @@ class EthernetNetworkBase(Network):
         except ILError as e:
             servo.stop_status_listener()
             raise ILError(f"Drive not found in IP {target}.") from e
+        return servo
+
+    def _add_servo(self, servo: EthernetServo, net_status_listener: bool) -> None:
+        """Add an opened servo to the network.
+
+        Args:
+            servo: Servo to add.
+            net_status_listener: Toggle the listener of the network
+                status, connection and disconnection.
+        """
         self.servos.append(servo)
-        self._set_servo_state(target, NetState.CONNECTED)
+        self._set_servo_state(servo.ip_address, NetState.CONNECTED)
 
         if net_status_listener:
             self.start_status_listener()
         else:
             self.stop_status_listener()
-        return servo
 
     def disconnect_from_slave(self, servo: EthernetServo) -> None:  # type: ignore [override]
         """Disconnects the slave from the network.
@@ -347,7 +397,7 @@ class EthernetNetworkBase(Network):
 
     def _notify_status(self, ip: str, status: NetDevEvt) -> None:
         """Notify subscribers of a network state change."""
-        for callback in self.__observers_net_state[ip]:
+        for callback in self.__observers_net_state.get(ip, ()):
             callback(status)
 
     @override
@@ -385,10 +435,9 @@ class EthernetNetworkBase(Network):
             callback: Callback function.
 
         """
-        if callback in self.__observers_net_state[ip]:
+        observers = self.__observers_net_state.setdefault(ip, CallbackList())
+        if not observers.add(callback):
             logger.info("Callback already subscribed.")
-            return
-        self.__observers_net_state[ip].append(callback)
 
     def unsubscribe_from_status(self, ip: str, callback: Callable[[NetDevEvt], Any]) -> None:  # type: ignore [override]
         """Unsubscribe from network state changes.
@@ -398,10 +447,9 @@ class EthernetNetworkBase(Network):
             callback: Callback function.
 
         """
-        if callback not in self.__observers_net_state[ip]:
+        observers = self.__observers_net_state.get(ip)
+        if observers is None or not observers.discard(callback):
             logger.info("Callback not subscribed.")
-            return
-        self.__observers_net_state[ip].remove(callback)
 
     def get_servo_state(self, servo_id: Union[int, str]) -> NetState:
         """Get the state of a servo that's a part of network.
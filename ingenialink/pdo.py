@@ -1,25 +1,39 @@
+import functools
+import itertools
+import struct
+import threading
+import time
 from abc import abstractmethod
 from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable, ClassVar, Literal, Optional, TypeVar, Union
 
 import bitarray
+import numpy as np
+import numpy.typing as npt
 from typing_extensions import override
 
 from ingenialink.bitfield import BitField
 from ingenialink.canopen.dictionary import CanopenDictionary
 from ingenialink.canopen.register import CanopenRegister
+from ingenialink.constants import DEFAULT_PDS_TIMEOUT
 from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.enums.servo import ServoState
 from ingenialink.ethercat.register import EthercatRegister
-from ingenialink.exceptions import ILError
+from ingenialink.exceptions import ILAccessError, ILError, ILTimeoutError
 from ingenialink.servo import Servo
 from ingenialink.utils._utils import (
     convert_bytes_to_dtype,
     convert_dtype_to_bytes,
     dtype_length_bits,
 )
+from ingenialink.utils.mailbox import Mailbox
 
 if TYPE_CHECKING:
     from ingenialink.dictionary import CanOpenObject, Dictionary
+    from ingenialink.pdo_player import RPDOTrajectoryPlayer
+    from ingenialink.register import Register
 
 BIT_ENDIAN: Literal["little"] = "little"
 
@@ -30,6 +44,22 @@ MAP_REGISTER_BYTES = 4
 
 PDO_MAP_ITEM_TYPE = TypeVar("PDO_MAP_ITEM_TYPE", bound="PDOMapItem")
 
+_STRUCT_FORMAT_CODES: dict[RegDtype, str] = {
+    RegDtype.U8: "B",
+    RegDtype.S8: "b",
+    RegDtype.U16: "H",
+    RegDtype.S16: "h",
+    RegDtype.U32: "I",
+    RegDtype.S32: "i",
+    RegDtype.U64: "Q",
+    RegDtype.S64: "q",
+    RegDtype.FLOAT: "f",
+}
+"""Little-endian struct format codes of the data types that can be packed as numbers."""
+
+_DATA_VERSIONS = itertools.count(1)
+"""Versions given to the data of the PDO map items, increasing with every change."""
+
 
 class PDOMapItem:
     """Abstract class to represent a register in the PDO mapping.
@@ -79,6 +109,11 @@ class PDOMapItem:
         self.register = register
         self.size_bits = dtype_length_bits[register.dtype] if size_bits is None else size_bits
         self._raw_data_bits: Optional[bitarray.bitarray] = None
+        # Representations filled by the byte-aligned codec, converted to bits on demand
+        self._raw_bytes: Optional[bytes] = None
+        self._value: Optional[Union[int, float]] = None
+        # Changes whenever the data changes, so the encoders can tell if it is up to date
+        self._data_version = next(_DATA_VERSIONS)
         self._check_if_mappable()
 
     def _check_if_mappable(self) -> None:
@@ -108,7 +143,9 @@ class PDOMapItem:
 
         """
         if self._raw_data_bits is None:
-            raise ILError("Raw data is empty.")
+            data_bits = bitarray.bitarray(endian=BIT_ENDIAN)
+            data_bits.frombytes(self.raw_data_bytes)
+            self._raw_data_bits = data_bits[: self.size_bits]
         return self._raw_data_bits
 
     @raw_data_bits.setter
@@ -118,6 +155,9 @@ class PDOMapItem:
         if data.endian != BIT_ENDIAN:
             raise ILError("Bitarray should be little endian.")
         self._raw_data_bits = data
+        self._raw_bytes = None
+        self._value = None
+        self._data_version = next(_DATA_VERSIONS)
 
     @property
     def raw_data_bytes(self) -> bytes:
@@ -130,9 +170,14 @@ class PDOMapItem:
             ILError: If the raw data is empty.
 
         """
-        if self._raw_data_bits is None:
-            raise ILError("Raw data is empty.")
-        return self._raw_data_bits.tobytes()
+        if self._raw_bytes is not None:
+            return self._raw_bytes
+        if self._raw_data_bits is not None:
+            return self._raw_data_bits.tobytes()
+        if self._value is not None:
+            self._raw_bytes = convert_dtype_to_bytes(self._value, self.register.dtype)
+            return self._raw_bytes
+        raise ILError("Raw data is empty.")
 
     @raw_data_bytes.setter
     def raw_data_bytes(self, data: bytes) -> None:
@@ -158,14 +203,39 @@ class PDOMapItem:
             raise NotImplementedError(
                 "The register value must be read by the raw_data_bytes attribute."
             )
+        if self._value is not None:
+            return self._value
         if self.register.dtype == RegDtype.BOOL:
             value = self.raw_data_bits.any()
         else:
             value = convert_bytes_to_dtype(self.raw_data_bytes, self.register.dtype)
         if not isinstance(value, (int, float, bool)):
             raise ILError("Wrong register value type")
+        self._value = value
         return value
 
+    def _set_decoded_value(self, value: Union[int, float]) -> None:
+        """Store a value decoded by the map codec.
+
+        Args:
+            value: Decoded register value.
+        """
+        self._value = value
+        self._raw_bytes = None
+        self._raw_data_bits = None
+        self._data_version = next(_DATA_VERSIONS)
+
+    def _set_decoded_bytes(self, data: bytes) -> None:
+        """Store raw data bytes extracted by the map codec.
+
+        Args:
+            data: Raw data bytes. Its length must match the item size.
+        """
+        self._raw_bytes = data
+        self._value = None
+        self._raw_data_bits = None
+        self._data_version = next(_DATA_VERSIONS)
+
     @property
     def register_mapping(self) -> int:
         """Arrange register information into PDO mapping format.
@@ -263,7 +333,11 @@ class RPDOMapItem(PDOMapItem):
             self.raw_data_bits = raw_data_bits
         else:
             raw_data_bytes = convert_dtype_to_bytes(value, self.register.dtype)
-            self.raw_data_bytes = raw_data_bytes
+            if len(raw_data_bytes) * 8 != self.size_bits:
+                # Custom sizes are validated by the bitarray setter
+                self.raw_data_bytes = raw_data_bytes
+                return
+            self._set_decoded_bytes(raw_data_bytes)
 
 
 class TPDOMapItem(PDOMapItem):
@@ -279,6 +353,283 @@ class TPDOMapItem(PDOMapItem):
 PDO_MAP_TYPE = TypeVar("PDO_MAP_TYPE", bound="PDOMap")
 
 
+class PDOMapCodec:
+    """Encoder/decoder of the raw data of a PDO map.
+
+    When every item of the map starts and ends on a byte boundary, the layout is compiled
+    into a single :class:`struct.Struct`, so the whole map is decoded with one
+    ``unpack_from`` and encoded with one ``pack_into``. Numeric items are converted to
+    their values directly, and the rest of the items (padding, strings, unknown
+    registers, custom sizes) are transferred as raw bytes. Maps containing sub-byte items
+    fall back to a bitarray-based codec.
+
+    The maps are packed directly into the process data buffer. The data of the items has a
+    version (:attr:`data_version`) that increases whenever it changes, so the owner of a
+    buffer does not write an unchanged map again (:meth:`update_into`), and :meth:`encode`
+    caches the bytes it returns.
+
+    Args:
+        items: Items of the PDO map, in mapping order.
+
+    """
+
+    def __init__(self, items: Sequence[PDOMapItem]) -> None:
+        self.__items = tuple(items)
+        self.__data_length_bits = sum(item.size_bits for item in self.__items)
+        self.__data_length_bytes = bitarray.bits2bytes(self.__data_length_bits)
+        self.__is_raw: tuple[bool, ...] = ()
+        self.__struct: Optional[struct.Struct] = None
+        # Data version and bytes returned by the last encode() call
+        self.__encoded: Optional[tuple[int, bytes]] = None
+        if all(item.size_bits % 8 == 0 for item in self.__items):
+            self.__compile()
+
+    def __compile(self) -> None:
+        """Compile the struct of a byte-aligned map."""
+        format_codes = []
+        is_raw = []
+        for item in self.__items:
+            format_code = _STRUCT_FORMAT_CODES.get(item.register.dtype)
+            if (
+                format_code is not None
+                and item.register.identifier != PADDING_REGISTER_IDENTIFIER
+                and item.size_bits == dtype_length_bits[item.register.dtype]
+            ):
+                format_codes.append(format_code)
+                is_raw.append(False)
+            else:
+                format_codes.append(f"{item.size_bits // 8}s")
+                is_raw.append(True)
+        self.__struct = struct.Struct("<" + "".join(format_codes))
+        self.__is_raw = tuple(is_raw)
+
+    @property
+    def items(self) -> tuple[PDOMapItem, ...]:
+        """Items the codec was compiled for."""
+        return self.__items
+
+    @property
+    def is_byte_aligned(self) -> bool:
+        """True if the map is encoded and decoded with the struct fast path."""
+        return self.__struct is not None
+
+    @property
+    def data_length_bits(self) -> int:
+        """Length of the map in bits."""
+        return self.__data_length_bits
+
+    @property
+    def data_length_bytes(self) -> int:
+        """Length of the map in bytes."""
+        return self.__data_length_bytes
+
+    def decode(self, data: Union[bytes, bytearray, memoryview], offset: int = 0) -> None:
+        """Set the items raw data from a buffer.
+
+        Args:
+            data: Buffer containing the map data.
+            offset: Position of the map data in the buffer, in bytes.
+        """
+        if self.__struct is None:
+            data_bits = bitarray.bitarray(endian=BIT_ENDIAN)
+            data_bits.frombytes(bytes(data[offset : offset + self.__data_length_bytes]))
+            position = 0
+            for item in self.__items:
+                item.raw_data_bits = data_bits[position : item.size_bits + position]
+                position += item.size_bits
+            return
+        values = self.__struct.unpack_from(data, offset)
+        for item, is_raw, value in zip(self.__items, self.__is_raw, values):
+            if is_raw:
+                item._set_decoded_bytes(value)
+            else:
+                item._set_decoded_value(value)
+
+    @property
+    def data_version(self) -> int:
+        """Version of the data of the items. It increases whenever the data of an item changes."""
+        return max((item._data_version for item in self.__items), default=0)
+
+    def encode_into(self, buffer: Union[bytearray, memoryview], offset: int = 0) -> int:
+        """Write the concatenated items raw data into a buffer.
+
+        Args:
+            buffer: Writable buffer.
+            offset: Position in the buffer where the map data is written, in bytes.
+
+        Returns:
+            Version of the written data.
+        """
+        # The version is read before the data, so a value set meanwhile is written again
+        data_version = self.data_version
+        if self.__struct is None:
+            buffer[offset : offset + self.__data_length_bytes] = self.__encode_bits().tobytes()
+        else:
+            self.__struct.pack_into(buffer, offset, *self.__values())
+        return data_version
+
+    def update_into(
+        self, buffer: Union[bytearray, memoryview], offset: int, data_version: int
+    ) -> int:
+        """Write the concatenated items raw data into a buffer only if it changed.
+
+        Args:
+            buffer: Writable buffer.
+            offset: Position in the buffer where the map data is written, in bytes.
+            data_version: Version of the data held by the buffer at the offset, returned
+                by the last :meth:`encode_into` or :meth:`update_into` call.
+
+        Returns:
+            Version of the data held by the buffer.
+        """
+        if self.data_version == data_version:
+            return data_version
+        return self.encode_into(buffer, offset)
+
+    def encode(self) -> bytes:
+        """Return the concatenated items raw data.
+
+        Returns:
+            Concatenated items raw data in bytes.
+        """
+        data_version = self.data_version
+        encoded = self.__encoded
+        if encoded is not None and encoded[0] == data_version:
+            return encoded[1]
+        if self.__struct is None:
+            data = self.__encode_bits().tobytes()
+        else:
+            data = self.__struct.pack(*self.__values())
+        self.__encoded = (data_version, data)
+        return data
+
+    def __values(self) -> list[Union[int, float, bytes]]:
+        """Collect the values to be packed with the compiled struct.
+
+        Returns:
+            Values or raw data bytes of each item.
+
+        Raises:
+            ILError: If an item does not have data stored.
+        """
+        values: list[Union[int, float, bytes]] = []
+        try:
+            for item, is_raw in zip(self.__items, self.__is_raw):
+                if is_raw:
+                    values.append(item.raw_data_bytes)
+                elif item._value is not None:
+                    values.append(item._value)
+                else:
+                    values.append(item.value)
+        except ILError:
+            raise ILError(f"PDO item {item.register.identifier} does not have data stored.")
+        return values
+
+    def __encode_bits(self) -> bitarray.bitarray:
+        """Concatenate the items raw data bits.
+
+        Returns:
+            Concatenated items raw data in bits.
+
+        Raises:
+            ILError: If an item does not have data stored.
+            ILError: If the length of the bit array is incorrect.
+        """
+        data_bits = bitarray.bitarray(endian=BIT_ENDIAN)
+        try:
+            for item in self.__items:
+                data_bits += item.raw_data_bits
+        except ILError:
+            raise ILError(f"PDO item {item.register.identifier} does not have data stored.")
+
+        if len(data_bits) != self.__data_length_bits:
+            raise ILError(
+                "The length in bits of the data array is incorrect. Expected"
+                f" {self.__data_length_bits}, obtained {len(data_bits)}"
+            )
+        return data_bits
+
+
+@dataclass(frozen=True)
+class PDOMapLayout:
+    """Frozen layout of a PDO map.
+
+    It is computed once and reused by the cyclic exchange until the items of the map change.
+
+    Attributes:
+        items: Items of the map, in mapping order.
+        offsets_bits: Position of each item in the map, in bits.
+        sizes_bits: Size of each item, in bits.
+        data_length_bits: Length of the map in bits.
+        data_length_bytes: Length of the map in bytes.
+        codec: Codec used to encode and decode the raw data of the items.
+    """
+
+    items: tuple[PDOMapItem, ...]
+    offsets_bits: tuple[int, ...]
+    sizes_bits: tuple[int, ...]
+    data_length_bits: int
+    data_length_bytes: int
+    codec: PDOMapCodec
+
+    @classmethod
+    def from_items(cls, items: Sequence[PDOMapItem]) -> "PDOMapLayout":
+        """Compute the layout of a list of items.
+
+        Args:
+            items: Items of the map, in mapping order.
+
+        Returns:
+            Layout of the items.
+        """
+        frozen_items = tuple(items)
+        sizes_bits = tuple(item.size_bits for item in frozen_items)
+        offsets_bits = tuple(itertools.accumulate(sizes_bits, initial=0))[:-1]
+        codec = PDOMapCodec(frozen_items)
+        return cls(
+            items=frozen_items,
+            offsets_bits=offsets_bits,
+            sizes_bits=sizes_bits,
+            data_length_bits=codec.data_length_bits,
+            data_length_bytes=codec.data_length_bytes,
+            codec=codec,
+        )
+
+    @functools.cached_property
+    def structured_dtype(self) -> "np.dtype[np.void]":
+        """NumPy structured data type of the map.
+
+        Each byte-aligned item, except the padding, is a field named after its register
+        identifier at its byte offset in the map. Items that are not byte aligned are not
+        included. Numeric items have their little-endian data type and the rest are bytes.
+
+        Raises:
+            ILError: If several items have the same identifier.
+        """
+        names: list[str] = []
+        formats: list[str] = []
+        offsets: list[int] = []
+        for item, offset_bits, size_bits in zip(self.items, self.offsets_bits, self.sizes_bits):
+            identifier = item.register.identifier
+            if identifier == PADDING_REGISTER_IDENTIFIER or offset_bits % 8 or size_bits % 8:
+                continue
+            if identifier is None or identifier in names:
+                raise ILError(f"The PDO map item {identifier} does not have a unique identifier.")
+            format_code = _STRUCT_FORMAT_CODES.get(item.register.dtype)
+            if format_code is None or size_bits != dtype_length_bits[item.register.dtype]:
+                formats.append(f"S{size_bits // 8}")
+            else:
+                formats.append(f"<{format_code}")
+            names.append(identifier)
+            offsets.append(offset_bits // 8)
+        return np.dtype({
+            "names": names,
+            "formats": formats,
+            "offsets": offsets,
+            "itemsize": self.data_length_bytes,
+        })
+
+
 class PDOMap:
     """Abstract class that contains PDO mapping information."""
 
@@ -290,6 +641,7 @@ class PDOMap:
         self.__map_object: Optional[CanOpenObject] = None
         self.__slave: Optional[PDOServo] = None
         self.__is_dirty = is_dirty
+        self.__layout: Optional[PDOMapLayout] = None
 
         # Observer callback
         self._observer_callback: Optional[Callable[[], None]] = None
@@ -403,6 +755,7 @@ class PDOMap:
                 "Cannot add item to the map."
             )
         self.__is_dirty = True
+        self.__layout = None
         self.__items.append(item)
 
     def add_registers(
@@ -432,6 +785,7 @@ class PDOMap:
         """Clear all items."""
         self.__check_servo_is_in_preoperational_state()
         self.__is_dirty = True
+        self.__layout = None
         self.__items.clear()
 
     def __getitem__(self, index: int) -> PDOMapItem:
@@ -466,7 +820,8 @@ class PDOMap:
                 "Cannot set item to the map."
             )
         self.__is_dirty = True
-        self.__setitem__(index, item)
+        self.__layout = None
+        self.__items[index] = item
 
     def __delitem__(self, index: int) -> None:
         """Delete item at the given index.
@@ -479,6 +834,7 @@ class PDOMap:
         """
         self.__check_servo_is_in_preoperational_state()
         self.__is_dirty = True
+        self.__layout = None
         self.__items.__delitem__(index)
 
     def __contains__(self, item: PDOMapItem) -> bool:
@@ -499,7 +855,39 @@ class PDOMap:
         Returns:
             Tuple of items.
         """
-        return tuple(self.__items)
+        return self.layout.items
+
+    @property
+    def layout(self) -> PDOMapLayout:
+        """Frozen layout of the map.
+
+        It is computed on first use, when the map is written to the slave or mapped for
+        the cyclic exchange, and again after the items of the map change.
+
+        Returns:
+            Layout of the map.
+        """
+        if self.__layout is None:
+            return self._freeze_layout()
+        return self.__layout
+
+    def _freeze_layout(self) -> PDOMapLayout:
+        """Compute the layout of the map. It is reused until the items of the map change.
+
+        Returns:
+            Layout of the map.
+        """
+        self.__layout = PDOMapLayout.from_items(self.__items)
+        return self.__layout
+
+    @property
+    def codec(self) -> PDOMapCodec:
+        """Codec used to encode and decode the raw data of the items.
+
+        Returns:
+            Codec of the map.
+        """
+        return self.layout.codec
 
     @property
     def map_register_index_bytes(self) -> bytes:
@@ -594,7 +982,7 @@ class PDOMap:
         Returns:
             Length of the map in bits.
         """
-        return sum(item.size_bits for item in self.items)
+        return self.layout.data_length_bits
 
     @property
     def data_length_bytes(self) -> int:
@@ -603,7 +991,7 @@ class PDOMap:
         Returns:
             Length of the map in bytes.
         """
-        return bitarray.bits2bytes(self.data_length_bits)
+        return self.layout.data_length_bytes
 
     @property
     def items_mapping(self) -> bytearray:
@@ -720,8 +1108,11 @@ class PDOMap:
         return self.__is_dirty
 
     def write_to_slave(
-        self, max_pdo_items_for_padding: Optional[int] = None, padding: bool = False
-    ) -> None:
+        self,
+        max_pdo_items_for_padding: Optional[int] = None,
+        padding: bool = False,
+        only_if_changed: bool = False,
+    ) -> bool:
         """Write the PDOMap to the slave.
 
         WARNING: This operation can not be done if the servo is not in pre-operational state.
@@ -730,6 +1121,11 @@ class PDOMap:
             max_pdo_items_for_padding: Maximum number of items for padding. If set, it will pad the
                 PDOMap with empty items to reach this number. If None, no padding is done.
             padding: If True, it will force to zero the unused items in the PDOMap.
+            only_if_changed: If True, the mapping object is read with a complete access and
+                it is only written if the slave holds a different mapping.
+
+        Returns:
+            True if the map was written, False if the slave already held it.
 
         Raises:
             ValueError: If the slave is not set or the map_register_index is None.
@@ -754,8 +1150,30 @@ class PDOMap:
         if max_pdo_items_for_padding:
             unused_items = max_pdo_items_for_padding - len(self.__items)
             value += b"\x00" * (unused_items * MAP_REGISTER_BYTES)
-        self.__slave.write_complete_access(reg, value)
+        written = not (only_if_changed and self.__slave_holds_value(value))
+        if written:
+            self.__slave.write_complete_access(reg, value)
         self.__is_dirty = False
+        # The mapping is final, freeze the layout before the cyclic exchange starts
+        self._freeze_layout()
+        return written
+
+    def __slave_holds_value(self, value: bytes) -> bool:
+        """Check if the mapping object of the slave already holds a value.
+
+        Args:
+            value: Value of the mapping object, as written with a complete access.
+
+        Returns:
+            True if the slave holds the value, False if it is different or can not be read.
+        """
+        if self.__slave is None or self.map_object is None:
+            return False
+        try:
+            current_value = self.__slave.read_complete_access(self.map_object)
+        except ILError:
+            return False
+        return current_value[: len(value)] == value
 
     def set_item_bytes(self, data_bytes: bytes) -> None:
         """Set the items raw data from a byte array.
@@ -766,18 +1184,13 @@ class PDOMap:
         Raises:
             ILError: If the length of the received data does not coincide.
         """
-        if len(data_bytes) != self.data_length_bytes:
+        layout = self.layout
+        if len(data_bytes) != layout.data_length_bytes:
             raise ILError(
-                f"The length of the data array is incorrect. Expected {self.data_length_bytes},"
+                f"The length of the data array is incorrect. Expected {layout.data_length_bytes},"
                 f" obtained {len(data_bytes)}"
             )
-        data_bits = bitarray.bitarray(endian=BIT_ENDIAN)
-        data_bits.frombytes(data_bytes)
-
-        offset = 0
-        for item in self.items:
-            item.raw_data_bits = data_bits[offset : item.size_bits + offset]
-            offset += item.size_bits
+        layout.codec.decode(data_bytes)
 
     def get_item_bits(self) -> bitarray.bitarray:
         """Return the concatenated items raw data (in bits).
@@ -809,8 +1222,7 @@ class PDOMap:
         Returns:
             Concatenated items raw data in bytes.
         """
-        item_bits = self.get_item_bits()
-        return item_bits.tobytes()
+        return self.codec.encode()
 
     def get_text_representation(self, item_space: int = 40) -> str:
         """Get a text representation of the map.
@@ -851,12 +1263,21 @@ class TPDOMap(PDOMap):
 class PDOServo(Servo):
     """Abstract class to implement PDOs in a Servo class."""
 
+    ETG_COMMS_RPDO_ASSIGN = "ETG_COMMS_RPDO_ASSIGN"
     ETG_COMMS_RPDO_ASSIGN_TOTAL = "ETG_COMMS_RPDO_ASSIGN_TOTAL"
     ETG_COMMS_RPDO_ASSIGN_1 = "ETG_COMMS_RPDO_ASSIGN_1"
 
+    ETG_COMMS_TPDO_ASSIGN = "ETG_COMMS_TPDO_ASSIGN"
     ETG_COMMS_TPDO_ASSIGN_TOTAL = "ETG_COMMS_TPDO_ASSIGN_TOTAL"
     ETG_COMMS_TPDO_ASSIGN_1 = "ETG_COMMS_TPDO_ASSIGN_1"
 
+    DEFAULT_MAX_STALE_CYCLES = 1
+    """Default number of cycles a routed TPDO value can be old before it is read again."""
+
+    DEFAULT_MAX_STALE_TIME = 0.1
+    """Default time in seconds since the last PDO cycle after which the accesses are not
+    routed to the process image anymore."""
+
     def __init__(
         self,
         target: Union[int, str],
@@ -872,6 +1293,44 @@ class PDOServo(Servo):
         # (_process_rpdo/_process_tpdo) iterate maps in the same order.
         self._rpdo_maps: OrderedDict[int, RPDOMap] = OrderedDict()
         self._tpdo_maps: OrderedDict[int, TPDOMap] = OrderedDict()
+        # Process image of the servo. The buffers are reused every cycle and only
+        # reallocated when the size of the mapped data changes.
+        self.__pdo_inputs = bytearray()
+        self.__pdo_inputs_view = memoryview(self.__pdo_inputs).toreadonly()
+        self.__pdo_outputs = bytearray()
+        self.__pdo_outputs_view = memoryview(self.__pdo_outputs).toreadonly()
+        # Off-cycle processing: the process data thread only hands over raw bytes
+        # through these mailboxes, the items are decoded and encoded by another thread.
+        self.__off_cycle_processing = False
+        # The TPDO data is posted with the cycle and the time it was received
+        self.__tpdo_mailbox: Mailbox[tuple[int, float, bytes]] = Mailbox()
+        self.__rpdo_mailbox: Mailbox[bytes] = Mailbox()
+        # Player whose rows are sent instead of the encoded RPDO items
+        self.__rpdo_player: Optional[RPDOTrajectoryPlayer] = None
+        # Layout, offset and data version of each map encoded in the RPDO process image
+        # in the last cycle, so only the maps whose items changed are written again
+        self.__encoded_rpdo_maps: list[tuple[PDOMapLayout, int, int]] = []
+        # Register access router: PDO cycles since the exchange started and cycle of the
+        # last TPDO data decoded into the items. None if no data was decoded since it
+        # started. The times are time.monotonic() values.
+        self.__pdo_register_routing = False
+        self.__max_stale_cycles = self.DEFAULT_MAX_STALE_CYCLES
+        self.__max_stale_time = self.DEFAULT_MAX_STALE_TIME
+        self.__pdo_cycles = 0
+        self.__last_rpdo_time = 0.0
+        self.__last_tpdo_cycle: Optional[int] = None
+        self.__last_tpdo_time = 0.0
+        self.__pdo_exchange_running = False
+        # Threads that exchange the process data and run the off-cycle callbacks. They
+        # can not wait for a PDO cycle.
+        self.__pdo_thread_id: Optional[int] = None
+        self.__callback_thread_id: Optional[int] = None
+        self.__routed_layouts: tuple[PDOMapLayout, ...] = ()
+        self.__routed_tpdo_items: dict[tuple[int, int], PDOMapItem] = {}
+        self.__routed_rpdo_items: dict[tuple[int, int], RPDOMapItem] = {}
+        # Notified every time TPDO data is received or decoded
+        self.__tpdo_condition = threading.Condition()
+        self.__tpdo_updates = 0
 
     @property  # type: ignore[misc]
     def dictionary(self) -> CanopenDictionary:  # type: ignore[override]
@@ -895,6 +1354,7 @@ class PDOServo(Servo):
         self.check_servo_is_in_preoperational_state()
         self.write(self.ETG_COMMS_RPDO_ASSIGN_TOTAL, 0, subnode=0)
         self._rpdo_maps.clear()
+        self.__encoded_rpdo_maps = []
 
     def reset_tpdo_mapping(self) -> None:
         """Delete the TPDO mapping stored in the servo slave.
@@ -911,17 +1371,17 @@ class PDOServo(Servo):
         It writes the RPDO maps into the slave,
         saves the RPDO maps in the _rpdo_maps attribute
         and adds them to the PDO Assign object.
+        The maps and the assignment that the slave already holds are not written.
 
         WARNING: This operation can not be done if the servo is not in pre-operational state.
         """
         self.check_servo_is_in_preoperational_state()
-        self.write(self.ETG_COMMS_RPDO_ASSIGN_TOTAL, len(self._rpdo_maps), subnode=0)
-        rpdo_assigns = b""
-        for rpdo_map in self._rpdo_maps.values():
-            if rpdo_map.is_editable and rpdo_map.is_dirty:
-                rpdo_map.write_to_slave()
-            rpdo_assigns += rpdo_map.map_register_index_bytes
-        self.write_complete_access(self.ETG_COMMS_RPDO_ASSIGN_1, rpdo_assigns, subnode=0)
+        self.__map_pdo_maps(
+            list(self._rpdo_maps.values()),
+            self.ETG_COMMS_RPDO_ASSIGN,
+            self.ETG_COMMS_RPDO_ASSIGN_TOTAL,
+            self.ETG_COMMS_RPDO_ASSIGN_1,
+        )
 
     def map_tpdos(self) -> None:
         """Map the TPDO registers into the servo slave.
@@ -929,17 +1389,61 @@ class PDOServo(Servo):
         It writes the TPDO maps into the slave,
         saves the TPDO maps in the _tpdo_maps attribute
         and adds them to the PDO Assign object
+        The maps and the assignment that the slave already holds are not written.
 
         WARNING: This operation can not be done if the servo is not in pre-operational state.
         """
         self.check_servo_is_in_preoperational_state()
-        self.write(self.ETG_COMMS_TPDO_ASSIGN_TOTAL, len(self._tpdo_maps), subnode=0)
-        tpdo_assigns = b""
-        for tpdo_map in self._tpdo_maps.values():
-            if tpdo_map.is_editable and tpdo_map.is_dirty:
-                tpdo_map.write_to_slave()
-            tpdo_assigns += tpdo_map.map_register_index_bytes
-        self.write_complete_access(self.ETG_COMMS_TPDO_ASSIGN_1, tpdo_assigns, subnode=0)
+        self.__map_pdo_maps(
+            list(self._tpdo_maps.values()),
+            self.ETG_COMMS_TPDO_ASSIGN,
+            self.ETG_COMMS_TPDO_ASSIGN_TOTAL,
+            self.ETG_COMMS_TPDO_ASSIGN_1,
+        )
+
+    def __map_pdo_maps(
+        self,
+        pdo_maps: Sequence[PDOMap],
+        assign_uid: str,
+        assign_total_uid: str,
+        assign_first_uid: str,
+    ) -> None:
+        """Write the PDO maps and their assignment, skipping what the slave already holds.
+
+        Args:
+            pdo_maps: PDO maps, in assignment order.
+            assign_uid: UID of the PDO assign object.
+            assign_total_uid: UID of the number of assigned maps.
+            assign_first_uid: UID of the first assigned map.
+        """
+        assigns = b"".join(pdo_map.map_register_index_bytes for pdo_map in pdo_maps)
+        # Number of maps (8 bits and 8 padding bits) followed by the map indexes
+        assign_value = len(pdo_maps).to_bytes(1, BIT_ENDIAN) + b"\x00" + assigns
+        assign_changed = self.__read_pdo_assign(assign_uid)[: len(assign_value)] != assign_value
+        if assign_changed:
+            self.write(assign_total_uid, len(pdo_maps), subnode=0)
+        for pdo_map in pdo_maps:
+            if pdo_map.is_editable and pdo_map.is_dirty:
+                pdo_map.write_to_slave(only_if_changed=True)
+            else:
+                pdo_map._freeze_layout()
+        if assign_changed:
+            self.write_complete_access(assign_first_uid, assigns, subnode=0)
+
+    def __read_pdo_assign(self, assign_uid: str) -> bytes:
+        """Read a PDO assign object with a complete access.
+
+        Args:
+            assign_uid: UID of the PDO assign object.
+
+        Returns:
+            Value of the object. Empty if it can not be read.
+        """
+        try:
+            assign_object = self.dictionary.get_object(assign_uid, subnode=0)
+            return self.read_complete_access(assign_object, subnode=0)
+        except (KeyError, ILError):
+            return b""
 
     def map_pdos(self, slave_index: int) -> None:  # noqa: ARG002
         """Map RPDO and TPDO register into the slave.
@@ -984,9 +1488,11 @@ class PDOServo(Servo):
             self._rpdo_maps = OrderedDict(
                 (idx, rmap) for idx, rmap in self._rpdo_maps.items() if rmap is not rpdo_map
             )
+            self.__encoded_rpdo_maps = []
             return
         if rpdo_map_index is not None:
             del self._rpdo_maps[rpdo_map_index]
+            self.__encoded_rpdo_maps = []
 
     def remove_tpdo_map(
         self, tpdo_map: Optional[TPDOMap] = None, tpdo_map_index: Optional[int] = None
@@ -1013,6 +1519,40 @@ class PDOServo(Servo):
         if tpdo_map_index is not None:
             self._tpdo_maps.pop(tpdo_map_index)
 
+    @property
+    def pdo_inputs(self) -> memoryview:
+        """Read-only view of the TPDO data received in the last cycle.
+
+        The view is updated in place every cycle. A new view is created when the
+        size of the mapped data changes.
+        """
+        return self.__pdo_inputs_view
+
+    @property
+    def pdo_outputs(self) -> memoryview:
+        """Read-only view of the RPDO data sent in the last cycle.
+
+        The view is updated in place every cycle. A new view is created when the
+        size of the mapped data changes.
+        """
+        return self.__pdo_outputs_view
+
+    def pdo_inputs_array(self) -> npt.NDArray[np.uint8]:
+        """Zero-copy NumPy view of the TPDO data received in the last cycle.
+
+        Returns:
+            Read-only array of bytes that is updated in place every cycle.
+        """
+        return np.frombuffer(self.__pdo_inputs_view, dtype=np.uint8)
+
+    def pdo_outputs_array(self) -> npt.NDArray[np.uint8]:
+        """Zero-copy NumPy view of the RPDO data sent in the last cycle.
+
+        Returns:
+            Read-only array of bytes that is updated in place every cycle.
+        """
+        return np.frombuffer(self.__pdo_outputs_view, dtype=np.uint8)
+
     def set_pdo_map_to_slave(self, rpdo_maps: list[RPDOMap], tpdo_maps: list[TPDOMap]) -> None:
         """Callback called by the slave to configure the map.
 
@@ -1036,27 +1576,511 @@ class PDOServo(Servo):
         """
         raise NotImplementedError
 
-    def _process_tpdo(self, input_data: bytes) -> None:
+    def _process_tpdo(self, input_data: Union[bytes, bytearray, memoryview]) -> None:
         """Convert the TPDO values from bytes to the registers data type.
 
+        The received data is copied into the process image of the servo and each map
+        is decoded in place at its offset. If the off-cycle processing is enabled, the
+        data is posted to the TPDO mailbox instead of being decoded.
+
+        Args:
+            input_data: Concatenated received data bytes.
+
+        Raises:
+            ILError: If the received data is shorter than the mapped data.
+
+        """
+        if len(self.__pdo_inputs) != len(input_data):
+            self.__pdo_inputs = bytearray(len(input_data))
+            self.__pdo_inputs_view = memoryview(self.__pdo_inputs).toreadonly()
+        self.__pdo_inputs[:] = input_data
+        if not self.__off_cycle_processing:
+            self.__decode_tpdo(self.__pdo_inputs)
+            self.__last_tpdo_cycle = self.__pdo_cycles
+            self.__last_tpdo_time = time.monotonic()
+            self.__notify_tpdo_update()
+            return
+        expected_bytes = sum(
+            tpdo_map.layout.data_length_bytes for tpdo_map in self._tpdo_maps.values()
+        )
+        if len(self.__pdo_inputs) < expected_bytes:
+            raise ILError(
+                "The length of the data array is incorrect. Expected"
+                f" {expected_bytes}, obtained {len(self.__pdo_inputs)}"
+            )
+        self.__tpdo_mailbox.post((self.__pdo_cycles, time.monotonic(), bytes(self.__pdo_inputs)))
+        self.__notify_tpdo_update()
+
+    def __notify_tpdo_update(self) -> None:
+        """Wake up the threads waiting for TPDO data."""
+        with self.__tpdo_condition:
+            self.__tpdo_updates += 1
+            self.__tpdo_condition.notify_all()
+
+    def __decode_tpdo(self, input_data: Union[bytes, bytearray]) -> None:
+        """Decode each TPDO map at its offset and notify the map subscribers.
+
         Args:
             input_data: Concatenated received data bytes.
 
+        Raises:
+            ILError: If the received data is shorter than the mapped data.
         """
+        offset = 0
         for tpdo_map in self._tpdo_maps.values():
-            map_bytes = input_data[: tpdo_map.data_length_bytes]
-            tpdo_map.set_item_bytes(map_bytes)
-            input_data = input_data[tpdo_map.data_length_bytes :]
+            layout = tpdo_map.layout
+            available_bytes = max(len(input_data) - offset, 0)
+            if available_bytes < layout.data_length_bytes:
+                raise ILError(
+                    "The length of the data array is incorrect. Expected"
+                    f" {layout.data_length_bytes}, obtained {available_bytes}"
+                )
+            layout.codec.decode(input_data, offset)
+            offset += layout.data_length_bytes
             tpdo_map._notify_process_data_event()
 
     def _process_rpdo(self) -> bytes:
         """Retrieve the RPDO raw data from each map.
 
+        Each map is encoded in place at its offset in the process image of the servo,
+        and only the maps whose items changed since the last cycle are rewritten.
+        If a trajectory player is attached, its next row is sent instead. Otherwise, if
+        the off-cycle processing is enabled, the latest data posted to the RPDO mailbox
+        is sent.
+
         Returns:
             Concatenated data bytes to be sent.
         """
-        output = bytearray()
+        self.__pdo_cycles += 1
+        self.__last_rpdo_time = time.monotonic()
+        if not self.__pdo_exchange_running:
+            # The process image may have been sent by another exchange meanwhile
+            self.__encoded_rpdo_maps = []
+        self.__pdo_exchange_running = True
+        self.__pdo_thread_id = threading.get_ident()
+        output_length = sum(
+            rpdo_map.layout.data_length_bytes for rpdo_map in self._rpdo_maps.values()
+        )
+        if len(self.__pdo_outputs) != output_length:
+            self.__pdo_outputs = bytearray(output_length)
+            self.__pdo_outputs_view = memoryview(self.__pdo_outputs).toreadonly()
+            self.__encoded_rpdo_maps = []
+        player = self.__rpdo_player
+        if player is not None:
+            row = player._next_row()
+            if row is not None and len(row) == output_length:
+                self.__pdo_outputs[:] = row
+                self.__encoded_rpdo_maps = []
+                return bytes(self.__pdo_outputs)
+        if self.__off_cycle_processing:
+            posted = self.__rpdo_mailbox.peek()
+            if posted is not None and len(posted[1]) == output_length:
+                self.__pdo_outputs[:] = posted[1]
+                self.__encoded_rpdo_maps = []
+            return bytes(self.__pdo_outputs)
+        self.__update_rpdo_outputs()
+        return bytes(self.__pdo_outputs)
+
+    def __update_rpdo_outputs(self) -> None:
+        """Notify the subscribers of each RPDO map and write the changed maps to the process image.
+
+        A map is only skipped if it was encoded at the same offset in the last cycle and
+        its data did not change since, so adding, removing or reordering the maps writes
+        them again.
+        """
+        encoded_maps = self.__encoded_rpdo_maps
+        offset = 0
+        for position, rpdo_map in enumerate(self._rpdo_maps.values()):
+            rpdo_map._notify_process_data_event()
+            layout = rpdo_map.layout
+            if position < len(encoded_maps):
+                encoded_layout, encoded_offset, encoded_version = encoded_maps[position]
+                if encoded_layout is layout and encoded_offset == offset:
+                    data_version = layout.codec.update_into(
+                        self.__pdo_outputs, offset, encoded_version
+                    )
+                    if data_version != encoded_version:
+                        encoded_maps[position] = (layout, offset, data_version)
+                else:
+                    data_version = layout.codec.encode_into(self.__pdo_outputs, offset)
+                    encoded_maps[position] = (layout, offset, data_version)
+            else:
+                data_version = layout.codec.encode_into(self.__pdo_outputs, offset)
+                encoded_maps.append((layout, offset, data_version))
+            offset += layout.data_length_bytes
+        del encoded_maps[len(self._rpdo_maps) :]
+
+    def __encode_rpdo(self, output_data: bytearray) -> None:
+        """Notify the subscribers of each RPDO map and encode it at its offset.
+
+        Args:
+            output_data: Buffer where the maps are encoded.
+        """
+        offset = 0
         for rpdo_map in self._rpdo_maps.values():
             rpdo_map._notify_process_data_event()
-            output += rpdo_map.get_item_bytes()
-        return bytes(output)
+            layout = rpdo_map.layout
+            layout.codec.encode_into(output_data, offset)
+            offset += layout.data_length_bytes
+
+    def _set_off_cycle_processing(self, enabled: bool) -> None:
+        """Enable or disable the off-cycle processing of the PDO items.
+
+        When it is enabled, the process data thread only exchanges raw bytes with the
+        TPDO and RPDO mailboxes. The items are decoded with
+        :meth:`_load_tpdo_snapshot` and encoded with :meth:`_publish_rpdo_snapshot`
+        from another thread.
+
+        Args:
+            enabled: True to enable the off-cycle processing, False to disable it.
+        """
+        self.__tpdo_mailbox.clear()
+        self.__rpdo_mailbox.clear()
+        if enabled:
+            # The current values are sent until the first snapshot is published
+            self._publish_rpdo_snapshot()
+        self.__off_cycle_processing = enabled
+
+    def _load_tpdo_snapshot(self) -> bool:
+        """Decode the latest TPDO data posted by the process data thread into the items.
+
+        Returns:
+            True if new data was decoded, False if no data was posted since the last call.
+        """
+        self.__callback_thread_id = threading.get_ident()
+        posted = self.__tpdo_mailbox.take()
+        if posted is None:
+            return False
+        cycle, received_time, data = posted[1]
+        self.__decode_tpdo(data)
+        # The routed reads use the items once they hold the data
+        self.__last_tpdo_cycle = cycle
+        self.__last_tpdo_time = received_time
+        self.__notify_tpdo_update()
+        return True
+
+    def _publish_rpdo_snapshot(self) -> None:
+        """Encode the RPDO items and post them to be sent by the process data thread."""
+        output_length = sum(
+            rpdo_map.layout.data_length_bytes for rpdo_map in self._rpdo_maps.values()
+        )
+        output_data = bytearray(output_length)
+        self.__encode_rpdo(output_data)
+        self.__rpdo_mailbox.post(bytes(output_data))
+
+    def _attach_rpdo_player(self, player: "RPDOTrajectoryPlayer") -> None:
+        """Send the rows of a trajectory player instead of the RPDO items.
+
+        Args:
+            player: Trajectory player.
+
+        Raises:
+            ILError: If another player is attached.
+        """
+        if self.__rpdo_player is not None and self.__rpdo_player is not player:
+            raise ILError("Another RPDO trajectory is being played.")
+        self.__rpdo_player = player
+
+    def _detach_rpdo_player(self, player: "RPDOTrajectoryPlayer") -> None:
+        """Send the RPDO items again if the player is attached.
+
+        Args:
+            player: Trajectory player.
+        """
+        if self.__rpdo_player is player:
+            self.__rpdo_player = None
+
+    @property
+    def pdo_register_routing(self) -> bool:
+        """True if the accesses to the PDO-mapped registers are served by the process image."""
+        return self.__pdo_register_routing
+
+    def enable_pdo_register_routing(
+        self,
+        max_stale_cycles: int = DEFAULT_MAX_STALE_CYCLES,
+        max_stale_time: float = DEFAULT_MAX_STALE_TIME,
+    ) -> None:
+        """Serve the accesses to the PDO-mapped registers from the process image.
+
+        While the PDO exchange is running, :meth:`read` returns the last received value of
+        the registers mapped in a TPDO map and :meth:`write` sets the value of the registers
+        mapped in an RPDO map, which is sent in the next cycle. The other registers, and
+        all the registers when the exchange is stopped, are accessed through the mailbox.
+        The registers mapped in an RPDO map can not be written while an RPDO trajectory
+        is played.
+
+        Args:
+            max_stale_cycles: A TPDO value is read through the mailbox if it was received
+                more than this number of cycles ago.
+            max_stale_time: The accesses are done through the mailbox if no PDO cycle was
+                run or no TPDO value was received for more than this time, in seconds.
+                It protects against a PDO exchange that hangs without stopping.
+
+        Raises:
+            ValueError: If max_stale_cycles is negative or max_stale_time is not positive.
+        """
+        if max_stale_cycles < 0:
+            raise ValueError("max_stale_cycles can not be negative.")
+        if max_stale_time <= 0:
+            raise ValueError("max_stale_time must be positive.")
+        self.__max_stale_cycles = max_stale_cycles
+        self.__max_stale_time = max_stale_time
+        self.__pdo_register_routing = True
+
+    def disable_pdo_register_routing(self) -> None:
+        """Access all the registers through the mailbox."""
+        self.__pdo_register_routing = False
+
+    @override
+    def read(
+        self,
+        reg: Union[str, "Register"],
+        subnode: int = 1,
+    ) -> Union[int, float, str, bytes]:
+        if self.__pdo_register_routing:
+            _reg = self.__routable_register(reg, subnode)
+            item = self.__routed_tpdo_item(_reg) if _reg is not None else None
+            if _reg is not None and item is not None:
+                value = item.value
+                self._notify_register_update(_reg, value)
+                return value
+        return super().read(reg, subnode)
+
+    @override
+    def write(
+        self,
+        reg: Union[str, "Register"],
+        data: Union[int, float, str, bytes],
+        subnode: int = 1,
+    ) -> None:
+        if self.__pdo_register_routing and isinstance(data, (int, float)):
+            _reg = self.__routable_register(reg, subnode)
+            item = self.__routed_rpdo_item(_reg) if _reg is not None else None
+            if _reg is not None and item is not None:
+                if _reg.access == RegAccess.RO:
+                    raise ILAccessError("Register is Read-only")
+                if self.__rpdo_player is not None:
+                    raise ILError(
+                        f"Register {_reg.identifier} is mapped in an RPDO map and can not be"
+                        " written while an RPDO trajectory is played."
+                    )
+                item.value = bool(data) if _reg.dtype == RegDtype.BOOL else data
+                self._notify_register_update(_reg, data)
+                return
+        super().write(reg, data, subnode)
+
+    def __routable_register(
+        self, reg: Union[str, "Register"], subnode: int
+    ) -> Optional[CanopenRegister]:
+        """Get a register that can be mapped in the PDO maps.
+
+        Args:
+            reg: Register.
+            subnode: Target axis of the drive.
+
+        Returns:
+            The register. None if it does not exist or can not be mapped.
+        """
+        try:
+            _reg = self._get_reg(reg, subnode)
+        except (ILError, ValueError, TypeError):
+            # The regular access raises the error
+            return None
+        return _reg if isinstance(_reg, CanopenRegister) else None
+
+    def __routed_tpdo_item(self, reg: CanopenRegister) -> Optional[PDOMapItem]:
+        """Get the TPDO item whose last received value can be read instead of the register.
+
+        Args:
+            reg: Register.
+
+        Returns:
+            The TPDO item. None if the register must be read through the mailbox.
+        """
+        last_tpdo_cycle = self.__last_tpdo_cycle
+        if (
+            not self.__pdo_exchange_running
+            or last_tpdo_cycle is None
+            or self.__pdo_cycles - last_tpdo_cycle > self.__max_stale_cycles
+            or time.monotonic() - self.__last_tpdo_time > self.__max_stale_time
+        ):
+            return None
+        self.__update_routing_index()
+        return self.__routed_tpdo_items.get((reg.idx, reg.subidx))
+
+    def __routed_rpdo_item(self, reg: CanopenRegister) -> Optional[RPDOMapItem]:
+        """Get the RPDO item that can be set instead of writing the register.
+
+        Args:
+            reg: Register.
+
+        Returns:
+            The RPDO item. None if the register must be written through the mailbox.
+        """
+        if (
+            not self.__pdo_exchange_running
+            or time.monotonic() - self.__last_rpdo_time > self.__max_stale_time
+        ):
+            return None
+        self.__update_routing_index()
+        return self.__routed_rpdo_items.get((reg.idx, reg.subidx))
+
+    def __update_routing_index(self) -> None:
+        """Index the items of the PDO maps again if their layouts changed."""
+        layouts = tuple(
+            pdo_map.layout
+            for pdo_map in itertools.chain(self._tpdo_maps.values(), self._rpdo_maps.values())
+        )
+        if len(layouts) == len(self.__routed_layouts) and all(
+            layout is routed for layout, routed in zip(layouts, self.__routed_layouts)
+        ):
+            return
+        tpdo_items: dict[tuple[int, int], PDOMapItem] = {}
+        rpdo_items: dict[tuple[int, int], RPDOMapItem] = {}
+        for tpdo_map in self._tpdo_maps.values():
+            for item in tpdo_map.layout.items:
+                if item.register.identifier != PADDING_REGISTER_IDENTIFIER:
+                    tpdo_items.setdefault((item.register.idx, item.register.subidx), item)
+        for rpdo_map in self._rpdo_maps.values():
+            for item in rpdo_map.layout.items:
+                if (
+                    isinstance(item, RPDOMapItem)
+                    and item.register.identifier != PADDING_REGISTER_IDENTIFIER
+                ):
+                    rpdo_items.setdefault((item.register.idx, item.register.subidx), item)
+        self.__routed_tpdo_items = tpdo_items
+        self.__routed_rpdo_items = rpdo_items
+        self.__routed_layouts = layouts
+
+    def _pdo_exchange_stopped(self) -> None:
+        """Access the registers through the mailbox until the PDO exchange starts again."""
+        self.__pdo_exchange_running = False
+        self.__last_tpdo_cycle = None
+        self.__encoded_rpdo_maps = []
+        self.__pdo_thread_id = None
+        self.__callback_thread_id = None
+        self.__notify_tpdo_update()
+
+    @override
+    def get_state(self, subnode: int = 1) -> ServoState:
+        pds_items = self.__pds_pdo_items(subnode)
+        if pds_items is None:
+            return super().get_state(subnode)
+        status_word_register, status_word_item = pds_items[0]
+        status_word = status_word_item.value
+        if status_word_register.bitfields is None or not isinstance(status_word, int):
+            return super().get_state(subnode)
+        return self.status_word_decode(
+            BitField.parse_bitfields(status_word_register.bitfields, status_word)
+        )
+
+    @override
+    def write_bitfields(
+        self,
+        reg: Union[str, "Register"],
+        values: dict[str, int],
+        subnode: int = 1,
+        bitfields: Optional[dict[str, BitField]] = None,
+    ) -> None:
+        pds_items = self.__pds_pdo_items(subnode)
+        if pds_items is None:
+            return super().write_bitfields(reg, values, subnode, bitfields)
+        control_word_register, control_word_item = pds_items[1]
+        if self.__routable_register(reg, subnode) is not control_word_register:
+            return super().write_bitfields(reg, values, subnode, bitfields)
+        bitfields = control_word_register.bitfields if bitfields is None else bitfields
+        previous_value = control_word_item.value
+        if bitfields is None or not isinstance(previous_value, int):
+            return super().write_bitfields(reg, values, subnode, bitfields)
+        new_value = BitField.set_bitfields(bitfields, values, previous_value)
+        # With the off-cycle processing, the items are encoded after the next cycle
+        sent_cycle = self.__pdo_cycles + (2 if self.__off_cycle_processing else 1)
+        control_word_item.value = new_value
+        self._notify_register_update(control_word_register, new_value)
+        # Return once the control word is exchanged, as a mailbox write does
+        if not self.__wait_tpdo_cycle(sent_cycle, DEFAULT_PDS_TIMEOUT / 1000):
+            raise ILTimeoutError("The control word could not be sent through the PDOs.")
+        return None
+
+    @override
+    def state_wait_change(self, state: ServoState, timeout: int, subnode: int = 1) -> ServoState:
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            if self.__pds_pdo_items(subnode) is None:
+                remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+                return super().state_wait_change(state, remaining_ms, subnode)
+            tpdo_updates = self.__tpdo_updates
+            actual_state = self.get_state(subnode)
+            if actual_state != state:
+                return actual_state
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ILTimeoutError
+            self.__wait_tpdo_update(tpdo_updates, remaining)
+
+    def __wait_tpdo_update(self, tpdo_updates: int, timeout: float) -> None:
+        """Wait until TPDO data is received or decoded.
+
+        Args:
+            tpdo_updates: Number of TPDO updates seen by the caller.
+            timeout: Maximum time to wait, in seconds.
+        """
+        with self.__tpdo_condition:
+            self.__tpdo_condition.wait_for(lambda: self.__tpdo_updates != tpdo_updates, timeout)
+
+    def __wait_tpdo_cycle(self, cycle: int, timeout: float) -> bool:
+        """Wait until the TPDO data of a PDO cycle is received.
+
+        Args:
+            cycle: PDO cycle.
+            timeout: Maximum time to wait, in seconds.
+
+        Returns:
+            True if the data of the cycle was received, False if the timeout expired or
+            the PDO exchange stopped.
+        """
+
+        def cycle_received_or_stopped() -> bool:
+            last_tpdo_cycle = self.__last_tpdo_cycle
+            return last_tpdo_cycle is None or last_tpdo_cycle >= cycle
+
+        with self.__tpdo_condition:
+            self.__tpdo_condition.wait_for(cycle_received_or_stopped, timeout)
+        last_tpdo_cycle = self.__last_tpdo_cycle
+        return last_tpdo_cycle is not None and last_tpdo_cycle >= cycle
+
+    def __pds_pdo_items(
+        self, subnode: int
+    ) -> Optional[tuple[tuple[CanopenRegister, PDOMapItem], tuple[CanopenRegister, RPDOMapItem]]]:
+        """Get the PDO items of the status and control words of an axis.
+
+        The power drive system state machine is run through them while the PDO exchange
+        is running, instead of through the mailbox. The mailbox is used from the threads
+        of the PDO exchange, which would wait for a cycle they have to run themselves,
+        and while an RPDO trajectory is played, which overwrites the control word.
+
+        Args:
+            subnode: Subnode of the axis.
+
+        Returns:
+            Status word register and TPDO item, and control word register and RPDO item.
+            None if any of them is not mapped, the TPDO data is stale, it is called from
+            the threads of the PDO exchange or a trajectory player is attached.
+        """
+        if self.__rpdo_player is not None or threading.get_ident() in (
+            self.__pdo_thread_id,
+            self.__callback_thread_id,
+        ):
+            return None
+        status_word_register = self.__routable_register(self.STATUS_WORD_REGISTERS, subnode)
+        control_word_register = self.__routable_register(self.CONTROL_WORD_REGISTERS, subnode)
+        if status_word_register is None or control_word_register is None:
+            return None
+        status_word_item = self.__routed_tpdo_item(status_word_register)
+        control_word_item = self.__routed_rpdo_item(control_word_register)
+        if status_word_item is None or control_word_item is None:
+            return None
+        return (status_word_register, status_word_item), (
+            control_word_register,
+            control_word_item,
+        )
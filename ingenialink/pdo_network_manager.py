@@ -5,10 +5,20 @@ from typing import TYPE_CHECKING, Callable, Optional
 import ingenialogger
 
 from ingenialink.exceptions import ILError, ILWrongWorkingCountError
-from ingenialink.utils.event import create_event
+from ingenialink.pdo_process import PDOProcessExchange
+from ingenialink.pdo_recorder import PDORecorder, PDORecorderMode
+from ingenialink.pdo_scheduler import (
+    PDOCycleScheduler,
+    PDOSchedulerConfig,
+    apply_scheduling_policy,
+)
+from ingenialink.pdo_statistics import PDOCycleStatistics, PDOStatistics
+from ingenialink.utils.event import CallbackList, create_event
+from ingenialink.utils.mailbox import Mailbox
 
 if TYPE_CHECKING:
     from ingenialink.ethercat.network import EthercatNetwork
+    from ingenialink.ethercat.servo import EthercatServo
 
 
 class PDONetworkManager:
@@ -21,6 +31,89 @@ class PDONetworkManager:
     __SAFE_RPDO_UID: str = "ETG_COMMS_RPDO_MAP256"
     __SAFE_TPDO_UID: str = "ETG_COMMS_TPDO_MAP256"
 
+    class CallbackThread(threading.Thread):
+        """Run the PDO callbacks outside the process data thread.
+
+        The process data thread posts each completed cycle to a single-slot mailbox and
+        continues with the next one. For the latest posted cycle, this thread decodes the
+        TPDO data of each servo, notifies the receive and send subscribers and publishes
+        the RPDO data to be sent in the following cycles. If the callbacks last longer
+        than a cycle, the intermediate cycles are skipped.
+
+        Args:
+            net: The EthercatNetwork instance where the PDOs are active.
+            notify_send_process_data: Callback to notify when process data is about to be sent.
+            notify_receive_process_data: Callback to notify when process data is received.
+            notify_exceptions: Callback to notify when an exception is raised.
+        """
+
+        WAIT_TIMEOUT = 0.1
+
+        def __init__(
+            self,
+            net: "EthercatNetwork",
+            notify_send_process_data: Callable[[], None],
+            notify_receive_process_data: Callable[[], None],
+            notify_exceptions: Callable[[ILError], None],
+        ) -> None:
+            super().__init__()
+            self._net = net
+            self._notify_send_process_data = notify_send_process_data
+            self._notify_receive_process_data = notify_receive_process_data
+            self._notify_exceptions = notify_exceptions
+            self.__cycles: Mailbox[float] = Mailbox()
+            self.__stop_event = threading.Event()
+            self.__processed_cycles = 0
+            self.__skipped_cycles = 0
+
+        @property
+        def processed_cycles(self) -> int:
+            """Number of cycles whose callbacks were run."""
+            return self.__processed_cycles
+
+        @property
+        def skipped_cycles(self) -> int:
+            """Number of cycles whose callbacks were skipped because they were too slow."""
+            return self.__skipped_cycles
+
+        def post_cycle(self, timestamp: float) -> None:
+            """Notify that a cycle was completed. It never blocks.
+
+            Args:
+                timestamp: Start of the cycle, in :func:`time.perf_counter` seconds.
+            """
+            self.__cycles.post(timestamp)
+
+        def run(self) -> None:
+            """Run the callbacks of the latest cycle until the thread is stopped."""
+            last_sequence = 0
+            while not self.__stop_event.is_set():
+                self.__cycles.wait(self.WAIT_TIMEOUT)
+                posted = self.__cycles.take()
+                if posted is None:
+                    continue
+                sequence, _ = posted
+                self.__skipped_cycles += sequence - last_sequence - 1
+                last_sequence = sequence
+                try:
+                    for servo in self._net.servos:
+                        servo._load_tpdo_snapshot()
+                    self._notify_receive_process_data()
+                    self._notify_send_process_data()
+                    for servo in self._net.servos:
+                        servo._publish_rpdo_snapshot()
+                except Exception as e:
+                    self.__stop_event.set()
+                    self._notify_exceptions(ILError(f"Exception in the PDO callbacks: {e}"))
+                    return
+                self.__processed_cycles += 1
+
+        def stop(self) -> None:
+            """Stop running the callbacks."""
+            self.__stop_event.set()
+            if threading.current_thread() != self:
+                self.join()
+
     class ProcessDataThread(threading.Thread):
         """Manage the PDO exchange.
 
@@ -32,6 +125,18 @@ class PDONetworkManager:
             notify_send_process_data: Callback to notify when process data is about to be sent.
             notify_receive_process_data: Callback to notify when process data is received.
             notify_exceptions: Callback to notify when an exception is raised.
+            scheduler_config: Configuration of the cycle scheduler. If not provided, the
+             default configuration is used.
+            statistics: Recorder of the cycle statistics. If not provided, the statistics
+             are not recorded.
+            off_cycle_callbacks: If True, the send and receive callbacks are run in a
+             separate thread (see :class:`PDONetworkManager.CallbackThread`), so the
+             duration of the callbacks does not affect the cycle timing.
+            separate_process: If True, the cyclic exchange is run in a child process
+             (see :class:`~ingenialink.pdo_process.PDOProcessExchange`) and this thread
+             synchronizes the PDO items with its process images.
+            recorder: Recorder of the TPDO data. If not provided, the TPDO data is not
+             recorded.
 
         Raises:
             ValueError: If the provided refresh rate is unfeasible.
@@ -41,9 +146,6 @@ class PDONetworkManager:
         MINIMUM_PDO_REFRESH_TIME = 0.001
         DEFAULT_WATCHDOG_TIMEOUT = 0.1
         PDO_WATCHDOG_INCREMENT_FACTOR = 2
-        # The time.sleep precision is 13 ms for Windows OS
-        # https://stackoverflow.com/questions/1133857/how-accurate-is-pythons-time-sleep
-        WINDOWS_TIME_SLEEP_PRECISION = 0.013
 
         def __init__(
             self,
@@ -53,6 +155,11 @@ class PDONetworkManager:
             notify_send_process_data: Callable[[], None],
             notify_receive_process_data: Callable[[], None],
             notify_exceptions: Callable[[ILError], None],
+            scheduler_config: Optional[PDOSchedulerConfig] = None,
+            statistics: Optional[PDOCycleStatistics] = None,
+            off_cycle_callbacks: bool = False,
+            separate_process: bool = False,
+            recorder: Optional[PDORecorder] = None,
         ) -> None:
             super().__init__()
 
@@ -68,7 +175,56 @@ class PDONetworkManager:
             self._notify_send_process_data = notify_send_process_data
             self._notify_receive_process_data = notify_receive_process_data
             self._notify_exceptions = notify_exceptions
+            self._scheduler_config = (
+                PDOSchedulerConfig() if scheduler_config is None else scheduler_config
+            )
             self._pd_thread_stop_event = threading.Event()
+            self.__statistics = statistics
+            self.__recorder = recorder
+            self.__process_exchange = (
+                PDOProcessExchange(net, self._refresh_rate, self._scheduler_config)
+                if separate_process
+                else None
+            )
+            self.__callback_thread = (
+                PDONetworkManager.CallbackThread(
+                    net=net,
+                    notify_send_process_data=notify_send_process_data,
+                    notify_receive_process_data=notify_receive_process_data,
+                    notify_exceptions=self.__notify_callback_exception,
+                )
+                if off_cycle_callbacks
+                else None
+            )
+
+        @property
+        def process_exchange(self) -> Optional[PDOProcessExchange]:
+            """Exchange in a child process. None if the process data is exchanged by this thread."""
+            return self.__process_exchange
+
+        @property
+        def callback_thread(self) -> Optional["PDONetworkManager.CallbackThread"]:
+            """Thread running the callbacks. None if they run in the process data thread."""
+            return self.__callback_thread
+
+        @property
+        def statistics(self) -> Optional[PDOCycleStatistics]:
+            """Recorder of the cycle statistics. None if the statistics are not recorded."""
+            return self.__statistics
+
+        @statistics.setter
+        def statistics(self, statistics: Optional[PDOCycleStatistics]) -> None:
+            self.__statistics = statistics
+            self.__configure_statistics()
+
+        @property
+        def recorder(self) -> Optional[PDORecorder]:
+            """Recorder of the TPDO data. None if the TPDO data is not recorded."""
+            return self.__recorder
+
+        @recorder.setter
+        def recorder(self, recorder: Optional[PDORecorder]) -> None:
+            self.__recorder = recorder
 
         def run(self) -> None:
             """Start the PDO exchange."""
@@ -77,19 +233,66 @@ class PDONetworkManager:
             except ILError as e:
                 self._notify_exceptions(e)
                 return
+            self.__configure_statistics()
+            if self.__process_exchange is None:
+                # Otherwise, the policy is applied to the child process
+                apply_scheduling_policy(self._scheduler_config)
+            callback_thread = self.__callback_thread
+            if callback_thread is not None:
+                try:
+                    self.__start_off_cycle_callbacks(callback_thread)
+                except ILError as e:
+                    self._notify_exceptions(e)
+                    return
+            try:
+                self.__exchange_process_data(callback_thread)
+            finally:
+                if callback_thread is not None:
+                    self.__stop_off_cycle_callbacks(callback_thread)
+                for servo in self._net.servos:
+                    servo._pdo_exchange_stopped()
+
+        def __exchange_process_data(
+            self, callback_thread: Optional["PDONetworkManager.CallbackThread"]
+        ) -> None:
+            """Run the PDO cycles until the exchange is stopped.
+
+            Args:
+                callback_thread: Thread running the callbacks. If None, the callbacks
+                    are run in each cycle.
+            """
+            scheduler = PDOCycleScheduler(self._refresh_rate, self._scheduler_config.spin_threshold)
+            scheduler.start()
             first_iteration = True
             iteration_duration: float = -1
+            previous_cycle_start: Optional[float] = None
             while not self._pd_thread_stop_event.is_set():
                 time_start = time.perf_counter()
-                self._notify_send_process_data()
+                cycle_time = (
+                    -1.0 if previous_cycle_start is None else time_start - previous_cycle_start
+                )
+                if callback_thread is None:
+                    self._notify_send_process_data()
+                time_send = time.perf_counter()
+                is_start_iteration = first_iteration
                 try:
                     if first_iteration:
-                        self._net.start_pdos()
+                        self.__start_exchange()
                         first_iteration = False
                     else:
-                        self._net.send_receive_processdata(self._refresh_rate)
+                        self.__send_receive()
                 except ILWrongWorkingCountError as il_error:
                     self._pd_thread_stop_event.set()
+                    statistics = self.__statistics
+                    if statistics is not None:
+                        statistics.record_cycle(
+                            timestamp=time_start,
+                            cycle_time=cycle_time,
+                            callback_time=time_send - time_start,
+                            send_receive_time=time.perf_counter() - time_send,
+                            sleep_time=0.0,
+                            wkc=self.__last_wkc(),
+                        )
                     duration_error = (
                         (
                             f"Last iteration took {iteration_duration * 1000:0.1f} ms which is "
@@ -103,11 +306,12 @@ class PDONetworkManager:
                         )
                         else ""
                     )
-                    self._notify_exceptions(
-                        ILError(
-                            f"PDO exchange error (wrong working count): {il_error} {duration_error}"
-                        )
+                    error_msg = (
+                        f"PDO exchange error (wrong working count): {il_error} {duration_error}"
                     )
+                    if statistics is not None:
+                        error_msg = f"{error_msg.rstrip()} {self.__statistics_report(statistics)}"
+                    self._notify_exceptions(ILError(error_msg))
                     # stop_pdos() will be indirectly called through _pdo_thread_exception_handler
                 except Exception as il_error:
                     self._pd_thread_stop_event.set()
@@ -120,35 +324,143 @@ class PDONetworkManager:
                             ILError(f"Exception during PDO exchange: {il_error}")
                         )
                 else:
-                    self._notify_receive_process_data()
-                    while (
-                        remaining_loop_time := self._refresh_rate
-                        - (time.perf_counter() - time_start)
-                    ) > 0:
-                        if remaining_loop_time > self.WINDOWS_TIME_SLEEP_PRECISION:
-                            time.sleep(self.WINDOWS_TIME_SLEEP_PRECISION)
-                        else:
-                            self.high_precision_sleep(remaining_loop_time)
-                    iteration_duration = time.perf_counter() - time_start
+                    time_received = time.perf_counter()
+                    recorder = self.__recorder
+                    if recorder is not None:
+                        recorder.record(time_start)
+                    if callback_thread is None:
+                        self._notify_receive_process_data()
+                    else:
+                        callback_thread.post_cycle(time_start)
+                    time_callbacks_end = time.perf_counter()
+                    missed_deadlines = scheduler.wait()
+                    time_end = time.perf_counter()
+                    iteration_duration = time_end - time_start
+                    statistics = self.__statistics
+                    if statistics is not None and not is_start_iteration:
+                        callback_time = (time_send - time_start) + (
+                            time_callbacks_end - time_received
+                        )
+                        statistics.record_cycle(
+                            timestamp=time_start,
+                            cycle_time=cycle_time,
+                            callback_time=callback_time,
+                            send_receive_time=time_received - time_send,
+                            sleep_time=time_end - time_callbacks_end,
+                            wkc=self.__last_wkc(),
+                            missed_deadlines=missed_deadlines,
+                        )
+                    # The start iteration includes the state transitions, it is not a cycle
+                    previous_cycle_start = None if is_start_iteration else time_start
+
+        def __start_off_cycle_callbacks(
+            self, callback_thread: "PDONetworkManager.CallbackThread"
+        ) -> None:
+            """Switch the servos to the off-cycle processing and start the callback thread.
+
+            The send callbacks are run once so that the first cycle sends their values.
+
+            Args:
+                callback_thread: Thread running the callbacks.
+
+            Raises:
+                ILError: If the send callbacks raise an exception.
+            """
+            try:
+                self._notify_send_process_data()
+            except Exception as e:
+                raise ILError(f"Exception in the PDO callbacks: {e}") from e
+            for servo in self._net.servos:
+                servo._set_off_cycle_processing(True)
+            callback_thread.start()
+
+        def __stop_off_cycle_callbacks(
+            self, callback_thread: "PDONetworkManager.CallbackThread"
+        ) -> None:
+            """Stop the callback thread and switch the servos back to in-cycle processing.
+
+            Args:
+                callback_thread: Thread running the callbacks.
+            """
+            if callback_thread.is_alive():
+                callback_thread.stop()
+            for servo in self._net.servos:
+                servo._set_off_cycle_processing(False)
+
+        def __notify_callback_exception(self, exc: ILError) -> None:
+            """Stop the PDO exchange when the callback thread raises an exception.
+
+            Args:
+                exc: Exception raised in the callback thread.
+            """
+            self._pd_thread_stop_event.set()
+            self._notify_exceptions(exc)
 
         def stop(self) -> None:
             """Stop the PDO exchange."""
             self._pd_thread_stop_event.set()
             # Only join if we're not trying to join the current thread
             # (e.g., when stopping from an exception handler running in this thread)
-            if threading.current_thread() != self:
+            # or the callback thread, which is stopped by this thread.
+            if threading.current_thread() not in (self, self.__callback_thread):
                 self.join()
-            self._net.stop_pdos()
+            if self.__process_exchange is not None:
+                self.__process_exchange.stop()
+            else:
+                self._net.stop_pdos()
+
+        def __start_exchange(self) -> None:
+            """Set the slaves to Op state, from this thread or from the child process."""
+            if self.__process_exchange is not None:
+                self.__process_exchange.start()
+            else:
+                self._net.start_pdos()
+
+        def __send_receive(self) -> None:
+            """Exchange the process data of a cycle."""
+            if self.__process_exchange is not None:
+                self.__process_exchange.send_receive()
+            else:
+                self._net.send_receive_processdata(self._refresh_rate)
+
+        def __last_wkc(self) -> Optional[int]:
+            """Working counter of the last process data exchange.
+
+            Returns:
+                Working counter. None if there was no exchange.
+            """
+            if self.__process_exchange is not None:
+                return self.__process_exchange.last_wkc
+            return self._net.last_processdata_wkc
+
+        def __configure_statistics(self) -> None:
+            """Set the parameters of the PDO exchange in the statistics recorder."""
+            if self.__statistics is None:
+                return
+            self.__statistics.configure(
+                refresh_rate=self._refresh_rate,
+                watchdog_timeout=self._watchdog_timeout,
+                expected_wkc=self._net.EXPECTED_WKC_PROCESS_DATA * len(self._net.servos),
+            )
 
         @staticmethod
-        def high_precision_sleep(duration: float) -> None:
-            """Replaces the time.sleep() method.
+        def __statistics_report(statistics: PDOCycleStatistics) -> str:
+            """Summarize the cycle statistics to be added to an error message.
+
+            Args:
+                statistics: Recorder of the cycle statistics.
 
-            This is done in order to obtain more precise sleeping times.
+            Returns:
+                Summary of the cycle statistics.
             """
-            start_time = time.perf_counter()
-            while duration - (time.perf_counter() - start_time) > 0:
-                pass
+            snapshot = statistics.snapshot()
+            return (
+                f"Cycle statistics: {snapshot.cycles} cycles, cycle time p99"
+                f" {snapshot.cycle_time.p99 * 1000:0.1f} ms (max"
+                f" {snapshot.cycle_time.max * 1000:0.1f} ms), {snapshot.overruns} overruns,"
+                f" {snapshot.watchdog_near_misses} watchdog near-misses, last working counters"
+                f" {list(snapshot.wkc_history[-5:])} (expected {snapshot.expected_wkc})."
+            )
 
         def __set_watchdog_timeout(self) -> None:
             if self._watchdog_timeout is None:
@@ -181,9 +493,24 @@ class PDONetworkManager:
         self._net = net
         self.logger = ingenialogger.get_logger(__name__)
         self._pdo_thread: Optional[PDONetworkManager.ProcessDataThread] = None
-        self._pdo_send_observers: list[Callable[[], None]] = []
-        self._pdo_receive_observers: list[Callable[[], None]] = []
+        self._pdo_send_observers: CallbackList[Callable[[], None]] = CallbackList()
+        self._pdo_receive_observers: CallbackList[Callable[[], None]] = CallbackList()
         self._pdo_exceptions_observers, self._pdo_exception_publisher = create_event(ILError)
+        self.__scheduler_config = PDOSchedulerConfig()
+        self.__statistics: Optional[PDOCycleStatistics] = None
+        self.__recorder: Optional[PDORecorder] = None
+
+    @property
+    def scheduler_config(self) -> PDOSchedulerConfig:
+        """Configuration of the PDO cycle scheduler.
+
+        It is applied the next time the PDO exchange is started.
+        """
+        return self.__scheduler_config
+
+    @scheduler_config.setter
+    def scheduler_config(self, config: PDOSchedulerConfig) -> None:
+        self.__scheduler_config = config
 
     def check_safe_pdo_configuration(self) -> bool:
         """Returns True if safe drives have their safe PDOs configured.
@@ -205,6 +532,8 @@ class PDONetworkManager:
         self,
         refresh_rate: Optional[float] = None,
         watchdog_timeout: Optional[float] = None,
+        off_cycle_callbacks: bool = False,
+        separate_process: bool = False,
     ) -> None:
         """Start the PDO exchange process.
 
@@ -212,6 +541,15 @@ class PDONetworkManager:
             refresh_rate: Determines how often (seconds) the PDO values will be updated.
             watchdog_timeout: The PDO watchdog time. If not provided it will be set proportional
              to the refresh rate.
+            off_cycle_callbacks: If True, the send and receive callbacks are run in a
+             separate thread with the latest received data, so slow callbacks do not delay
+             the PDO cycles. The cycles whose callbacks could not be run are counted in
+             :attr:`skipped_callbacks`.
+            separate_process: If True, the EtherCAT master is handed over to a child process
+             that runs the cyclic exchange, isolated from the garbage collector and the GIL
+             of this process. The PDO map items are synchronized with the child process
+             through shared memory, and the SDO access is not available until the PDOs are
+             stopped. See :class:`~ingenialink.pdo_process.PDOProcessExchange`.
 
         Raises:
             ILError: If the PDOs are already active.
@@ -226,6 +564,11 @@ class PDONetworkManager:
             notify_send_process_data=self._notify_send_process_data,
             notify_receive_process_data=self._notify_receive_process_data,
             notify_exceptions=self._notify_exceptions,
+            scheduler_config=self.__scheduler_config,
+            statistics=self.__statistics,
+            off_cycle_callbacks=off_cycle_callbacks,
+            separate_process=separate_process,
+            recorder=self.__recorder,
         )
         self._pdo_thread.start()
 
@@ -241,6 +584,126 @@ class PDONetworkManager:
         self._pdo_thread.stop()
         self._pdo_thread = None
 
+    def enable_statistics(
+        self,
+        ring_buffer_size: int = PDOCycleStatistics.DEFAULT_RING_BUFFER_SIZE,
+        watchdog_near_miss_ratio: float = PDOCycleStatistics.DEFAULT_WATCHDOG_NEAR_MISS_RATIO,
+    ) -> None:
+        """Start recording the PDO cycle statistics.
+
+        If the PDO exchange is active, the statistics are recorded from the next cycle.
+        Any previously recorded statistics are discarded.
+
+        Args:
+            ring_buffer_size: Number of cycles whose timings are kept.
+            watchdog_near_miss_ratio: Fraction of the watchdog timeout above which a cycle
+                is counted as a watchdog near-miss.
+        """
+        self.__statistics = PDOCycleStatistics(
+            ring_buffer_size=ring_buffer_size, watchdog_near_miss_ratio=watchdog_near_miss_ratio
+        )
+        if self._pdo_thread is not None:
+            self._pdo_thread.statistics = self.__statistics
+
+    def disable_statistics(self) -> None:
+        """Stop recording the PDO cycle statistics."""
+        self.__statistics = None
+        if self._pdo_thread is not None:
+            self._pdo_thread.statistics = None
+
+    def statistics(self) -> PDOStatistics:
+        """Get the PDO cycle statistics.
+
+        Returns:
+            Snapshot of the recorded statistics.
+
+        Raises:
+            ILError: If the statistics are not enabled.
+        """
+        if self.__statistics is None:
+            raise ILError("The PDO statistics are not enabled.")
+        return self.__statistics.snapshot()
+
+    def reset_statistics(self) -> None:
+        """Discard the recorded PDO cycle statistics.
+
+        Raises:
+            ILError: If the statistics are not enabled.
+        """
+        if self.__statistics is None:
+            raise ILError("The PDO statistics are not enabled.")
+        self.__statistics.reset()
+
+    def start_recording(
+        self,
+        servos: Optional[list["EthercatServo"]] = None,
+        capacity: int = PDORecorder.DEFAULT_CAPACITY,
+        mode: PDORecorderMode = PDORecorderMode.RING,
+        spill_path: Optional[str] = None,
+    ) -> PDORecorder:
+        """Start recording the TPDO data of some servos every PDO cycle.
+
+        If the PDO exchange is active, the data is recorded from the next cycle.
+        The TPDO maps of the servos must not change while recording.
+
+        Args:
+            servos: Servos whose TPDO data is recorded. If not provided, all the servos
+             of the network with TPDO maps are recorded.
+            capacity: Number of cycles kept in memory.
+            mode: Storage mode. In :attr:`PDORecorderMode.RING` mode only the last
+             ``capacity`` cycles are kept. In :attr:`PDORecorderMode.SPILL` mode every cycle
+             is kept, and the cycles that do not fit in memory are written to ``spill_path``.
+            spill_path: File where the cycles are written in spill mode.
+
+        Returns:
+            The TPDO recorder. Its rows can be read or decoded while recording.
+
+        Raises:
+            ILError: If a recording is already active.
+        """
+        if self.__recorder is not None:
+            raise ILError("A TPDO recording is already active.")
+        if servos is None:
+            servos = [servo for servo in self._net.servos if servo._tpdo_maps]
+        self.__recorder = PDORecorder(servos, capacity=capacity, mode=mode, spill_path=spill_path)
+        if self._pdo_thread is not None:
+            self._pdo_thread.recorder = self.__recorder
+        return self.__recorder
+
+    def stop_recording(self) -> PDORecorder:
+        """Stop recording the TPDO data.
+
+        Returns:
+            The TPDO recorder, with the recorded rows.
+
+        Raises:
+            ILError: If there is no active recording.
+        """
+        recorder = self.__recorder
+        if recorder is None:
+            raise ILError("There is no active TPDO recording.")
+        self.__recorder = None
+        if self._pdo_thread is not None:
+            self._pdo_thread.recorder = None
+        recorder.close()
+        return recorder
+
+    @property
+    def recorder(self) -> Optional[PDORecorder]:
+        """Active TPDO recorder. None if the TPDO data is not being recorded."""
+        return self.__recorder
+
+    @property
+    def skipped_callbacks(self) -> int:
+        """Number of cycles of the active PDO exchange whose callbacks were skipped.
+
+        It is only counted when the callbacks are run off-cycle, and a cycle is skipped
+        when the callbacks of the previous cycles are still running.
+        """
+        if self._pdo_thread is None or self._pdo_thread.callback_thread is None:
+            return 0
+        return self._pdo_thread.callback_thread.skipped_cycles
+
     @property
     def is_active(self) -> bool:
         """Check if the PDO thread is active.
@@ -258,9 +721,7 @@ class PDONetworkManager:
         Args:
             callback: Callback function.
         """
-        if callback in self._pdo_send_observers:
-            return
-        self._pdo_send_observers.append(callback)
+        self._pdo_send_observers.add(callback)
 
     def subscribe_to_receive_process_data(self, callback: Callable[[], None]) -> None:
         """Subscribe be notified when the TPDO values are received.
@@ -268,9 +729,7 @@ class PDONetworkManager:
         Args:
             callback: Callback function.
         """
-        if callback in self._pdo_receive_observers:
-            return
-        self._pdo_receive_observers.append(callback)
+        self._pdo_receive_observers.add(callback)
 
     def subscribe_to_exceptions(self, callback: Callable[[ILError], None]) -> None:
         """Subscribe be notified when there is an exception in the PDO process data thread.
@@ -289,9 +748,7 @@ class PDONetworkManager:
         Args:
             callback: Subscribed callback function.
         """
-        if callback not in self._pdo_send_observers:
-            return
-        self._pdo_send_observers.remove(callback)
+        self._pdo_send_observers.discard(callback)
 
     def unsubscribe_to_receive_process_data(self, callback: Callable[[], None]) -> None:
         """Unsubscribe from the receive process data notifications.
@@ -299,9 +756,7 @@ class PDONetworkManager:
         Args:
             callback: Subscribed callback function.
         """
-        if callback not in self._pdo_receive_observers:
-            return
-        self._pdo_receive_observers.remove(callback)
+        self._pdo_receive_observers.discard(callback)
 
     def unsubscribe_to_exceptions(self, callback: Callable[[ILError], None]) -> None:
         """Unsubscribe from the exceptions in the process data notifications.
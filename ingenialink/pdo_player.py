@@ -0,0 +1,353 @@
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from ingenialink.enums.register import RegDtype
+from ingenialink.exceptions import ILError, ILValueError
+from ingenialink.pdo import _STRUCT_FORMAT_CODES, RPDOMapItem
+
+if TYPE_CHECKING:
+    from ingenialink.pdo import PDOServo
+
+Trajectory = Union[Mapping[Union[str, RPDOMapItem], npt.ArrayLike], npt.NDArray[np.void]]
+"""Values of some RPDO items for each cycle: one array per item, keyed by the item or its
+register identifier, or a structured array whose fields are named after the identifiers."""
+
+
+class TrajectoryEndPolicy(Enum):
+    """What the trajectory player sends after the last row of the trajectory."""
+
+    UNDERRUN = "underrun"
+    """The current values of the RPDO items are sent again. Each cycle is counted as an
+    underrun."""
+    LOOP = "loop"
+    """The trajectory is played again from the first row."""
+    HOLD_LAST = "hold_last"
+    """The last row of the trajectory is sent every cycle."""
+
+
+@dataclass(frozen=True)
+class _ItemPosition:
+    """Position of an RPDO item in the RPDO process image of the servo."""
+
+    item: RPDOMapItem
+    offset_bits: int
+    size_bits: int
+
+
+class RPDOTrajectoryPlayer:
+    """Stream precomputed RPDO values to a servo, one row per PDO cycle.
+
+    The whole trajectory is encoded into rows of bytes with the layout of the RPDO
+    process image of the servo when the player is created. While it is playing, the
+    process data thread copies the next row into the process image every cycle instead
+    of encoding the RPDO items, so the PDO maps must not change until it is stopped.
+
+    The items that are not in the trajectory are sent with the values they have when the
+    player is created.
+
+    Args:
+        servo: Servo the trajectory is sent to.
+        trajectory: Values of the RPDO items for each cycle. All the items must have the
+            same number of values.
+        end_policy: What is sent after the last row of the trajectory.
+
+    Raises:
+        ILValueError: If the trajectory is empty, its items have a different number of
+            values, or a value can not be encoded with the data type of its item.
+        ILError: If an item of the trajectory is not mapped in the RPDO maps of the servo,
+            or the value of an item that is not in the trajectory is not set.
+    """
+
+    def __init__(
+        self,
+        servo: "PDOServo",
+        trajectory: Trajectory,
+        end_policy: TrajectoryEndPolicy = TrajectoryEndPolicy.HOLD_LAST,
+    ) -> None:
+        self.__servo = servo
+        self.__end_policy = end_policy
+        self.__rows = self.__encode(trajectory)
+        self.__rows.flags.writeable = False
+        self.__row_views = [memoryview(row) for row in self.__rows]
+        self.__cycles = 0
+        self.__underruns = 0
+        self.__finished = threading.Event()
+
+    @property
+    def end_policy(self) -> TrajectoryEndPolicy:
+        """What is sent after the last row of the trajectory."""
+        return self.__end_policy
+
+    @property
+    def rows(self) -> npt.NDArray[np.uint8]:
+        """Read-only encoded trajectory, one row of RPDO bytes per cycle."""
+        return self.__rows
+
+    def __len__(self) -> int:
+        """Number of rows of the trajectory.
+
+        Returns:
+            Number of rows.
+        """
+        return len(self.__rows)
+
+    @property
+    def cycles(self) -> int:
+        """Number of cycles played since the player was started or rewound."""
+        return self.__cycles
+
+    @property
+    def position(self) -> int:
+        """Index of the next row to be sent."""
+        if self.__cycles < len(self.__rows):
+            return self.__cycles
+        if self.__end_policy == TrajectoryEndPolicy.LOOP:
+            return self.__cycles % len(self.__rows)
+        return len(self.__rows)
+
+    @property
+    def underruns(self) -> int:
+        """Number of cycles without trajectory rows in :attr:`TrajectoryEndPolicy.UNDERRUN`."""
+        return self.__underruns
+
+    @property
+    def is_finished(self) -> bool:
+        """True once the last row is sent. It is never finished in loop mode."""
+        return self.__finished.is_set()
+
+    def wait_finished(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the last row of the trajectory is sent.
+
+        Args:
+            timeout: Maximum time to wait, in seconds. If None, wait indefinitely.
+
+        Returns:
+            True if the trajectory finished, False if the timeout expired.
+        """
+        return self.__finished.wait(timeout)
+
+    def start(self) -> None:
+        """Start sending the trajectory from the next PDO cycle.
+
+        Raises:
+            ILError: If another player is streaming to the servo.
+        """
+        self.__servo._attach_rpdo_player(self)
+
+    def stop(self) -> None:
+        """Stop sending the trajectory. The values of the RPDO items are sent again."""
+        self.__servo._detach_rpdo_player(self)
+
+    def rewind(self) -> None:
+        """Play the trajectory again from the first row."""
+        self.__cycles = 0
+        self.__underruns = 0
+        self.__finished.clear()
+
+    def _next_row(self) -> Optional[memoryview]:
+        """Get the row to be sent in this cycle. It is called by the process data thread.
+
+        Returns:
+            RPDO bytes. None if the values of the RPDO items must be sent.
+        """
+        length = len(self.__rows)
+        index = self.__cycles
+        if index >= length:
+            if self.__end_policy == TrajectoryEndPolicy.LOOP:
+                index %= length
+            elif self.__end_policy == TrajectoryEndPolicy.HOLD_LAST:
+                index = length - 1
+            else:
+                self.__underruns += 1
+                return None
+        self.__cycles += 1
+        if self.__cycles == length and self.__end_policy != TrajectoryEndPolicy.LOOP:
+            self.__finished.set()
+        return self.__row_views[index]
+
+    def __encode(self, trajectory: Trajectory) -> npt.NDArray[np.uint8]:
+        """Encode the trajectory into rows with the layout of the RPDO process image.
+
+        Args:
+            trajectory: Values of the RPDO items for each cycle.
+
+        Returns:
+            One row of RPDO bytes per cycle.
+
+        Raises:
+            ILValueError: If the trajectory is empty or its items have a different number
+                of values.
+        """
+        positions, base_row = self.__map_rpdo_items()
+        columns = self.__trajectory_columns(trajectory, positions)
+        lengths = {len(values) for _, values in columns}
+        if len(lengths) != 1 or 0 in lengths:
+            raise ILValueError(
+                "The trajectory must have the same number of values, at least one, for each item."
+            )
+        rows = np.tile(base_row, (lengths.pop(), 1))
+        for position, values in columns:
+            self.__encode_column(rows, position, values)
+        return rows
+
+    def __map_rpdo_items(self) -> tuple[dict[str, _ItemPosition], npt.NDArray[np.uint8]]:
+        """Locate the RPDO items in the process image and encode their current values.
+
+        Returns:
+            Position of each item by identifier and the encoded current values.
+        """
+        positions: dict[str, _ItemPosition] = {}
+        output_length = sum(
+            rpdo_map.layout.data_length_bytes for rpdo_map in self.__servo._rpdo_maps.values()
+        )
+        base_row = bytearray(output_length)
+        offset = 0
+        for rpdo_map in self.__servo._rpdo_maps.values():
+            layout = rpdo_map.layout
+            layout.codec.encode_into(base_row, offset)
+            for item, offset_bits, size_bits in zip(
+                layout.items, layout.offsets_bits, layout.sizes_bits
+            ):
+                identifier = item.register.identifier
+                if identifier is not None and isinstance(item, RPDOMapItem):
+                    positions.setdefault(
+                        identifier, _ItemPosition(item, offset * 8 + offset_bits, size_bits)
+                    )
+            offset += layout.data_length_bytes
+        return positions, np.frombuffer(base_row, dtype=np.uint8)
+
+    @staticmethod
+    def __trajectory_columns(
+        trajectory: Trajectory, positions: dict[str, _ItemPosition]
+    ) -> list[tuple[_ItemPosition, npt.NDArray[np.generic]]]:
+        """Pair the values of the trajectory with the position of their items.
+
+        Args:
+            trajectory: Values of the RPDO items for each cycle.
+            positions: Position of each RPDO item by identifier.
+
+        Returns:
+            Position and values of each item of the trajectory.
+
+        Raises:
+            ILError: If an item is not mapped in the RPDO maps of the servo.
+            ILValueError: If the values of an item are not one-dimensional.
+        """
+        if isinstance(trajectory, np.ndarray):
+            trajectory = {name: trajectory[name] for name in trajectory.dtype.names or ()}
+        columns: list[tuple[_ItemPosition, npt.NDArray[np.generic]]] = []
+        for key, values in trajectory.items():
+            identifier = key if isinstance(key, str) else key.register.identifier
+            position = positions.get(identifier) if identifier is not None else None
+            if position is None or (not isinstance(key, str) and position.item is not key):
+                raise ILError(f"The item {identifier} is not mapped in the RPDO maps of the servo.")
+            array = np.asarray(values)
+            if array.ndim != 1:
+                raise ILValueError(f"The values of the item {identifier} must be one-dimensional.")
+            columns.append((position, array))
+        return columns
+
+    @classmethod
+    def __encode_column(
+        cls,
+        rows: npt.NDArray[np.uint8],
+        position: _ItemPosition,
+        values: npt.NDArray[np.generic],
+    ) -> None:
+        """Encode the values of an item into its position of every row.
+
+        Args:
+            rows: Encoded trajectory.
+            position: Position of the item.
+            values: Value of the item for each row.
+
+        Raises:
+            ILValueError: If the values can not be encoded with the data type of the item.
+        """
+        dtype = position.item.register.dtype
+        identifier = position.item.register.identifier
+        if dtype == RegDtype.BOOL:
+            target = np.dtype(np.uint8)
+            values = values.astype(np.bool_)
+        else:
+            format_code = _STRUCT_FORMAT_CODES.get(dtype)
+            if format_code is None:
+                raise ILValueError(f"The item {identifier} of type {dtype} can not be streamed.")
+            target = np.dtype(f"<{format_code}")
+            if target.kind in "iu":
+                size_bits = min(position.size_bits, target.itemsize * 8)
+                cls.__check_integer_values(values, target, size_bits, identifier)
+        encoded = values.astype(target)
+        if position.offset_bits % 8 == 0 and position.size_bits == target.itemsize * 8:
+            first_byte = position.offset_bits // 8
+            rows[:, first_byte : first_byte + target.itemsize] = encoded.view(np.uint8).reshape(
+                len(encoded), target.itemsize
+            )
+            return
+        bits = encoded.view(f"<u{target.itemsize}").astype(np.uint64)
+        cls.__write_bits(rows, bits, position.offset_bits, position.size_bits)
+
+    @staticmethod
+    def __check_integer_values(
+        values: npt.NDArray[np.generic],
+        target: "np.dtype[np.generic]",
+        size_bits: int,
+        identifier: Optional[str],
+    ) -> None:
+        """Check that the values can be encoded with an integer data type.
+
+        Args:
+            values: Values of the item.
+            target: Integer data type of the item.
+            size_bits: Size of the item in the PDO map, in bits. It can be smaller than the
+                data type.
+            identifier: Identifier of the item.
+
+        Raises:
+            ILValueError: If the values are not integers or are out of range.
+        """
+        if values.dtype.kind not in "biuf":
+            raise ILValueError(f"The values of the item {identifier} must be numbers.")
+        if values.dtype.kind == "f" and not np.array_equal(values, np.trunc(values)):
+            raise ILValueError(f"The values of the item {identifier} must be integers.")
+        if target.kind == "i":
+            min_value, max_value = -(1 << (size_bits - 1)), (1 << (size_bits - 1)) - 1
+        else:
+            min_value, max_value = 0, (1 << size_bits) - 1
+        if len(values) and (values.min() < min_value or values.max() > max_value):
+            raise ILValueError(
+                f"The values of the item {identifier} are out of the [{min_value}, "
+                f"{max_value}] range."
+            )
+
+    @staticmethod
+    def __write_bits(
+        rows: npt.NDArray[np.uint8], bits: npt.NDArray[np.uint64], offset_bits: int, size_bits: int
+    ) -> None:
+        """Write the bits of an item that is not byte aligned into every row.
+
+        Args:
+            rows: Encoded trajectory.
+            bits: Raw value of the item for each row.
+            offset_bits: Position of the item in the row, in bits.
+            size_bits: Size of the item, in bits.
+        """
+        item_mask = (1 << size_bits) - 1
+        bits = bits & np.uint64(item_mask)
+        for byte in range(offset_bits // 8, (offset_bits + size_bits - 1) // 8 + 1):
+            shift = 8 * byte - offset_bits
+            if shift >= 0:
+                byte_bits = bits >> np.uint64(shift)
+                byte_mask = (item_mask >> shift) & 0xFF
+            else:
+                byte_bits = bits << np.uint64(-shift)
+                byte_mask = (item_mask << -shift) & 0xFF
+            rows[:, byte] = (rows[:, byte] & (~byte_mask & 0xFF)) | (
+                byte_bits & np.uint64(byte_mask)
+            ).astype(np.uint8)
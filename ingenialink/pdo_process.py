@@ -0,0 +1,667 @@
+import multiprocessing
+import multiprocessing.queues
+import queue
+import struct
+import time
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Optional, cast
+
+import ingenialogger
+
+from ingenialink.constants import ECAT_STATE_CHANGE_TIMEOUT_US
+from ingenialink.exceptions import ILError, ILStateError, ILWrongWorkingCountError
+from ingenialink.pdo_scheduler import PDOCycleScheduler, PDOSchedulerConfig, apply_scheduling_policy
+from ingenialink.utils.timeout import Timeout
+
+try:
+    import pysoem
+except ImportError as ex:
+    pysoem = None
+    pysoem_import_error = ex
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from pysoem import CdefMaster, CdefSlave
+
+    from ingenialink.ethercat.network import EthercatNetwork
+
+logger = ingenialogger.get_logger(__name__)
+
+_SEQUENCE = struct.Struct("<Q")
+_CONTROL = struct.Struct("<I")
+_INPUTS_HEADER = struct.Struct("<Qi")
+
+
+class SeqLock:
+    """Sequence lock protecting a data region of a shared buffer.
+
+    The region starts with a sequence counter followed by the data. The writer makes
+    the counter odd before writing the data and even again afterwards, so it never
+    waits for the readers. A reader copies the data and retries if the counter was odd
+    or changed during the copy, so it never gets a torn copy.
+
+    Only one process can write to a region.
+
+    Args:
+        buffer: Region of the shared buffer, of :meth:`required_size` bytes.
+    """
+
+    def __init__(self, buffer: memoryview) -> None:
+        self.__buffer = buffer
+        self.__data = buffer[_SEQUENCE.size :]
+
+    @staticmethod
+    def required_size(data_size: int) -> int:
+        """Size of the region needed to protect a given amount of data.
+
+        Args:
+            data_size: Size of the data in bytes.
+
+        Returns:
+            Size of the region in bytes.
+        """
+        return _SEQUENCE.size + data_size
+
+    @property
+    def sequence(self) -> int:
+        """Current value of the sequence counter."""
+        sequence: int = _SEQUENCE.unpack_from(self.__buffer)[0]
+        return sequence
+
+    def write(self, data: bytes, offset: int = 0) -> None:
+        """Write data to the region.
+
+        Args:
+            data: Data to be written.
+            offset: Offset of the data in the region, in bytes.
+        """
+        sequence = self.sequence
+        _SEQUENCE.pack_into(self.__buffer, 0, sequence + 1)
+        self.__data[offset : offset + len(data)] = data
+        _SEQUENCE.pack_into(self.__buffer, 0, sequence + 2)
+
+    def read(self) -> bytes:
+        """Read a consistent copy of the data of the region.
+
+        Returns:
+            Copy of the data.
+        """
+        while True:
+            sequence = self.sequence
+            if not sequence & 1:
+                data = bytes(self.__data)
+                if self.sequence == sequence:
+                    return data
+            # Let the writer finish
+            time.sleep(0)
+
+    def release(self) -> None:
+        """Release the views of the shared buffer."""
+        self.__data.release()
+        self.__buffer.release()
+
+
+class PDOProcessImage:
+    """RPDO and TPDO process images of a network in shared memory.
+
+    The shared memory block contains a control word, the RPDO image and the TPDO image.
+    Each image is protected by a :class:`SeqLock`. The RPDO image is written by the
+    application and read by the process data process. The TPDO image is written by the
+    process data process, together with the number of the cycle and its working counter.
+
+    Args:
+        shared_memory: Shared memory block.
+        outputs_size: Size of the RPDO image in bytes.
+        inputs_size: Size of the TPDO image in bytes.
+    """
+
+    __STOP_REQUESTED = 1
+
+    def __init__(self, shared_memory: SharedMemory, outputs_size: int, inputs_size: int) -> None:
+        self.__shared_memory = shared_memory
+        self.__outputs_size = outputs_size
+        self.__inputs_size = inputs_size
+        buffer = cast("memoryview", shared_memory.buf)
+        outputs_start = _CONTROL.size
+        inputs_start = outputs_start + SeqLock.required_size(outputs_size)
+        inputs_end = inputs_start + SeqLock.required_size(_INPUTS_HEADER.size + inputs_size)
+        self.__control = buffer[:outputs_start]
+        self.__outputs = SeqLock(buffer[outputs_start:inputs_start])
+        self.__inputs = SeqLock(buffer[inputs_start:inputs_end])
+
+    @classmethod
+    def required_size(cls, outputs_size: int, inputs_size: int) -> int:
+        """Size of the shared memory block for the given process images.
+
+        Args:
+            outputs_size: Size of the RPDO image in bytes.
+            inputs_size: Size of the TPDO image in bytes.
+
+        Returns:
+            Size in bytes.
+        """
+        return (
+            _CONTROL.size
+            + SeqLock.required_size(outputs_size)
+            + SeqLock.required_size(_INPUTS_HEADER.size + inputs_size)
+        )
+
+    @classmethod
+    def create(cls, outputs_size: int, inputs_size: int) -> "PDOProcessImage":
+        """Create the shared memory block of the process images.
+
+        Args:
+            outputs_size: Size of the RPDO image in bytes.
+            inputs_size: Size of the TPDO image in bytes.
+
+        Returns:
+            Process image.
+        """
+        shared_memory = SharedMemory(create=True, size=cls.required_size(outputs_size, inputs_size))
+        return cls(shared_memory, outputs_size, inputs_size)
+
+    @classmethod
+    def attach(cls, name: str, outputs_size: int, inputs_size: int) -> "PDOProcessImage":
+        """Attach to the shared memory block of existing process images.
+
+        Args:
+            name: Name of the shared memory block.
+            outputs_size: Size of the RPDO image in bytes.
+            inputs_size: Size of the TPDO image in bytes.
+
+        Returns:
+            Process image.
+        """
+        return cls(SharedMemory(name=name), outputs_size, inputs_size)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self.__shared_memory.name
+
+    @property
+    def outputs_size(self) -> int:
+        """Size of the RPDO image in bytes."""
+        return self.__outputs_size
+
+    @property
+    def inputs_size(self) -> int:
+        """Size of the TPDO image in bytes."""
+        return self.__inputs_size
+
+    @property
+    def stop_requested(self) -> bool:
+        """True if the process data process has been requested to stop."""
+        return bool(_CONTROL.unpack_from(self.__control)[0] == self.__STOP_REQUESTED)
+
+    def request_stop(self) -> None:
+        """Request the process data process to stop."""
+        _CONTROL.pack_into(self.__control, 0, self.__STOP_REQUESTED)
+
+    def write_outputs(self, data: bytes) -> None:
+        """Write the RPDO image.
+
+        Args:
+            data: RPDO data of all the slaves.
+
+        Raises:
+            ILError: If the size of the data does not match the RPDO image.
+        """
+        if len(data) != self.__outputs_size:
+            raise ILError(
+                f"Wrong RPDO image size. Expected {self.__outputs_size}, obtained {len(data)}"
+            )
+        self.__outputs.write(data)
+
+    def read_outputs(self) -> bytes:
+        """Read the RPDO image.
+
+        Returns:
+            RPDO data of all the slaves.
+        """
+        return self.__outputs.read()
+
+    def write_inputs(self, cycle: int, wkc: int, data: bytes) -> None:
+        """Write the TPDO image.
+
+        Args:
+            cycle: Number of the cycle in which the data was received.
+            wkc: Working counter of the cycle.
+            data: TPDO data of all the slaves.
+
+        Raises:
+            ILError: If the size of the data does not match the TPDO image.
+        """
+        if len(data) != self.__inputs_size:
+            raise ILError(
+                f"Wrong TPDO image size. Expected {self.__inputs_size}, obtained {len(data)}"
+            )
+        self.__inputs.write(_INPUTS_HEADER.pack(cycle, wkc) + data)
+
+    def read_inputs(self) -> tuple[int, int, bytes]:
+        """Read the TPDO image.
+
+        Returns:
+            Number of the cycle in which the data was received (0 if no data was received
+            yet), its working counter and the TPDO data of all the slaves.
+        """
+        data = self.__inputs.read()
+        cycle, wkc = _INPUTS_HEADER.unpack_from(data)
+        return cycle, wkc, data[_INPUTS_HEADER.size :]
+
+    def close(self) -> None:
+        """Close the access to the shared memory block."""
+        self.__control.release()
+        self.__outputs.release()
+        self.__inputs.release()
+        self.__shared_memory.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block. It must be called once, by its creator."""
+        self.__shared_memory.unlink()
+
+
+@dataclass(frozen=True)
+class PDOProcessConfig:
+    """Configuration of the process data process.
+
+    Attributes:
+        interface_name: Network interface of the EtherCAT master.
+        overlapping_io_map: True to use an overlapping IO map.
+        slave_ids: Slaves whose process data is in the process images, in image order.
+        op_slave_ids: Slaves with PDOs mapped, which are set to the Operational state.
+        outputs_sizes: Size of the RPDO data of each slave, in bytes.
+        inputs_sizes: Size of the TPDO data of each slave, in bytes.
+        expected_wkc: Expected process data working counter.
+        refresh_rate: PDO refresh rate in seconds.
+        processdata_timeout: Timeout to receive the process data, in seconds.
+        state_timeout: Timeout to reach the Operational state, in seconds.
+        scheduler_config: Configuration of the cycle scheduler.
+        shared_memory_name: Name of the shared memory block of the process images.
+    """
+
+    interface_name: str
+    overlapping_io_map: bool
+    slave_ids: tuple[int, ...]
+    op_slave_ids: tuple[int, ...]
+    outputs_sizes: tuple[int, ...]
+    inputs_sizes: tuple[int, ...]
+    expected_wkc: int
+    refresh_rate: float
+    processdata_timeout: float
+    state_timeout: float
+    scheduler_config: PDOSchedulerConfig
+    shared_memory_name: str
+
+
+class _ProcessStatus:
+    """Messages sent by the process data process to the application."""
+
+    STARTED = "started"
+    ERROR = "error"
+    WRONG_WKC = "wrong_wkc"
+
+
+def _send_receive(master: "CdefMaster", config: PDOProcessConfig) -> int:
+    """Exchange the process data once.
+
+    Args:
+        master: EtherCAT master.
+        config: Configuration of the process data process.
+
+    Returns:
+        Working counter.
+    """
+    if config.overlapping_io_map:
+        master.send_overlap_processdata()
+    else:
+        master.send_processdata()
+    wkc: int = master.receive_processdata(timeout=int(config.processdata_timeout * 1_000_000))
+    return wkc
+
+
+def _change_slaves_state(
+    master: "CdefMaster",
+    slaves: list["CdefSlave"],
+    state: int,
+    config: PDOProcessConfig,
+    image: Optional[PDOProcessImage] = None,
+) -> None:
+    """Set the slaves to a state and wait until they reach it.
+
+    Args:
+        master: EtherCAT master.
+        slaves: Slaves whose state is changed.
+        state: Target state.
+        config: Configuration of the process data process.
+        image: Process images. If provided, the process data is exchanged while waiting.
+
+    Raises:
+        ILStateError: If the slaves do not reach the state before the timeout.
+    """
+    for slave in slaves:
+        slave.state = state
+        slave.write_state()
+    with Timeout(config.state_timeout) as t:
+        while True:
+            master.read_state()
+            if all(
+                slave.state_check(state, ECAT_STATE_CHANGE_TIMEOUT_US) == state for slave in slaves
+            ):
+                return
+            if image is not None:
+                _write_slave_outputs(slaves, config, image)
+                _send_receive(master, config)
+            if t.has_expired:
+                raise ILStateError(f"Drives can not reach {_state_name(state)} state")
+
+
+def _state_name(state: int) -> str:
+    """Name of an EtherCAT state.
+
+    Args:
+        state: EtherCAT state.
+
+    Returns:
+        Name of the state.
+    """
+    names = {
+        pysoem.INIT_STATE: "Init",
+        pysoem.PREOP_STATE: "PreOp",
+        pysoem.SAFEOP_STATE: "SafeOp",
+        pysoem.OP_STATE: "Op",
+    }
+    return names.get(state, str(state))
+
+
+def _write_slave_outputs(
+    slaves: list["CdefSlave"], config: PDOProcessConfig, image: PDOProcessImage
+) -> None:
+    """Copy the RPDO image to the outputs of the slaves.
+
+    Args:
+        slaves: Slaves of the process images, in image order.
+        config: Configuration of the process data process.
+        image: Process images.
+    """
+    outputs = image.read_outputs()
+    offset = 0
+    for slave, size in zip(slaves, config.outputs_sizes):
+        if size:
+            slave.output = outputs[offset : offset + size]
+        offset += size
+
+
+def _wrong_wkc_message(
+    master: "CdefMaster", slaves: list["CdefSlave"], config: PDOProcessConfig, wkc: int
+) -> str:
+    """Describe a wrong working counter and the state of the slaves.
+
+    Args:
+        master: EtherCAT master.
+        slaves: Slaves of the process images, in image order.
+        config: Configuration of the process data process.
+        wkc: Working counter of the cycle.
+
+    Returns:
+        Error message.
+    """
+    master.read_state()
+    slaves_state_msg = ""
+    for slave_id, slave in zip(config.slave_ids, slaves):
+        slaves_state_msg += f"Slave {slave_id}: state {_state_name(slave.state)}"
+        if slave.al_status != 0:
+            slaves_state_msg += f", AL status {pysoem.al_status_code_to_string(slave.al_status)}."
+        else:
+            slaves_state_msg += ". "
+    return (
+        f"Processdata working count is wrong, expected: {master.expected_wkc}, real: {wkc}."
+        f" {slaves_state_msg}"
+    )
+
+
+def run_process_data_exchange(
+    config: PDOProcessConfig, status_queue: "multiprocessing.queues.Queue[tuple[str, str]]"
+) -> None:
+    """Entry point of the process data process.
+
+    It opens its own EtherCAT master, maps the PDOs, sets the slaves to the Operational
+    state and exchanges the process data cyclically with the process images until it
+    is requested to stop.
+
+    Args:
+        config: Configuration of the process data process.
+        status_queue: Queue to report that the exchange started or failed.
+    """  # noqa: DOC501
+    apply_scheduling_policy(config.scheduler_config)
+    image = PDOProcessImage.attach(
+        config.shared_memory_name, sum(config.outputs_sizes), sum(config.inputs_sizes)
+    )
+    master = pysoem.Master()
+    master.manual_state_change = 1
+    slaves: list[CdefSlave] = []
+    op_slaves: list[CdefSlave] = []
+    try:
+        master.open(config.interface_name)
+        master.config_init()
+        slaves = [master.slaves[slave_id - 1] for slave_id in config.slave_ids]
+        op_slaves = [master.slaves[slave_id - 1] for slave_id in config.op_slave_ids]
+        _change_slaves_state(master, slaves, pysoem.PREOP_STATE, config)
+        if config.overlapping_io_map:
+            master.config_overlap_map()
+        else:
+            master.config_map()
+        for slave_id, slave, outputs_size, inputs_size in zip(
+            config.slave_ids, slaves, config.outputs_sizes, config.inputs_sizes
+        ):
+            if len(slave.output) != outputs_size or len(slave.input) != inputs_size:
+                raise ILError(f"The PDO mapping of slave {slave_id} does not match its PDO maps.")
+        master.state = pysoem.SAFEOP_STATE
+        _change_slaves_state(master, op_slaves, pysoem.SAFEOP_STATE, config)
+        _change_slaves_state(master, op_slaves, pysoem.OP_STATE, config, image)
+        status_queue.put((_ProcessStatus.STARTED, ""))
+        scheduler = PDOCycleScheduler(config.refresh_rate, config.scheduler_config.spin_threshold)
+        scheduler.start()
+        cycle = 0
+        while not image.stop_requested:
+            _write_slave_outputs(slaves, config, image)
+            wkc = _send_receive(master, config)
+            cycle += 1
+            image.write_inputs(cycle, wkc, b"".join(slave.input for slave in slaves))
+            if wkc != config.expected_wkc:
+                status_queue.put((
+                    _ProcessStatus.WRONG_WKC,
+                    _wrong_wkc_message(master, slaves, config, wkc),
+                ))
+                break
+            scheduler.wait()
+    except Exception as e:
+        status_queue.put((_ProcessStatus.ERROR, str(e)))
+    finally:
+        try:
+            if op_slaves:
+                _change_slaves_state(master, op_slaves, pysoem.INIT_STATE, config)
+        except ILStateError:
+            logger.warning("Not all drives could reach the Init state")
+        finally:
+            master.close()
+            image.close()
+
+
+class PDOProcessExchange:
+    """Exchange the process data of a network in a separate process.
+
+    The EtherCAT master of the network is closed and a child process opens its own
+    master on the same interface to run the cyclic exchange, so it is not affected by
+    the garbage collector or the GIL contention of the application. The PDO maps are
+    written to the slaves before the master is closed.
+
+    The application exchanges the process data with the child process through
+    :class:`PDOProcessImage`: :meth:`send_receive` encodes the RPDO items of each servo
+    into the RPDO image and decodes the latest TPDO image into the TPDO items, so the
+    PDO map items keep working as usual. The SDO access is not available until the
+    exchange is stopped and the master of the network is reopened.
+
+    The child process is started with the ``spawn`` method, so the main module of the
+    application must be importable without side effects.
+
+    Args:
+        net: The EthercatNetwork instance where the PDOs will be active.
+        refresh_rate: PDO refresh rate in seconds.
+        scheduler_config: Configuration of the cycle scheduler of the child process.
+        start_timeout: Timeout to start the child process and reach the Operational
+            state, in seconds.
+
+    Raises:
+        ImportError: If pysoem is not installed.
+    """
+
+    DEFAULT_START_TIMEOUT = 10.0
+    STOP_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        net: "EthercatNetwork",
+        refresh_rate: float,
+        scheduler_config: PDOSchedulerConfig,
+        start_timeout: float = DEFAULT_START_TIMEOUT,
+    ) -> None:
+        if not pysoem:
+            raise pysoem_import_error
+        self.__net = net
+        self.__refresh_rate = refresh_rate
+        self.__scheduler_config = scheduler_config
+        self.__start_timeout = start_timeout
+        self.__context = multiprocessing.get_context("spawn")
+        self.__status_queue: multiprocessing.queues.Queue[tuple[str, str]] = self.__context.Queue()
+        self.__process: Optional[BaseProcess] = None
+        self.__image: Optional[PDOProcessImage] = None
+        self.__outputs_sizes: tuple[int, ...] = ()
+        self.__inputs_sizes: tuple[int, ...] = ()
+        self.__master_released = False
+        self.__last_wkc: Optional[int] = None
+        self.__last_cycle = 0
+
+    @property
+    def is_running(self) -> bool:
+        """True if the child process is running."""
+        return self.__process is not None and self.__process.is_alive()
+
+    @property
+    def last_wkc(self) -> Optional[int]:
+        """Working counter of the last cycle of the child process. None if there was none."""
+        return self.__last_wkc
+
+    @property
+    def cycles(self) -> int:
+        """Number of cycles completed by the child process."""
+        return self.__last_cycle
+
+    def start(self) -> None:
+        """Hand the bus over to the child process and wait until the slaves are in Op state.
+
+        Raises:
+            ILStateError: If the child process does not start in time.
+            ILError: If the child process could not start the exchange.
+        """
+        # The child process configures the process data with the maps held by the slaves
+        self.__net.config_pdo_maps()
+        servos = self.__net.servos
+        self.__outputs_sizes = tuple(
+            sum(rpdo_map.data_length_bytes for rpdo_map in servo._rpdo_maps.values())
+            for servo in servos
+        )
+        self.__inputs_sizes = tuple(
+            sum(tpdo_map.data_length_bytes for tpdo_map in servo._tpdo_maps.values())
+            for servo in servos
+        )
+        self.__image = PDOProcessImage.create(sum(self.__outputs_sizes), sum(self.__inputs_sizes))
+        self.__write_outputs()
+        config = PDOProcessConfig(
+            interface_name=self.__net.interface_name,
+            overlapping_io_map=self.__net._overlapping_io_map,
+            slave_ids=tuple(servo.slave_id for servo in servos),
+            op_slave_ids=tuple(
+                servo.slave_id for servo in servos if servo._rpdo_maps or servo._tpdo_maps
+            ),
+            outputs_sizes=self.__outputs_sizes,
+            inputs_sizes=self.__inputs_sizes,
+            expected_wkc=self.__net.EXPECTED_WKC_PROCESS_DATA * len(servos),
+            refresh_rate=self.__refresh_rate,
+            processdata_timeout=self.__refresh_rate,
+            state_timeout=self.__start_timeout / 2,
+            scheduler_config=self.__scheduler_config,
+            shared_memory_name=self.__image.name,
+        )
+        self.__net._release_master()
+        self.__master_released = True
+        self.__process = self.__context.Process(
+            target=run_process_data_exchange,
+            args=(config, self.__status_queue),
+            name="PDOProcess",
+            daemon=True,
+        )
+        self.__process.start()
+        try:
+            status, message = self.__status_queue.get(timeout=self.__start_timeout)
+        except queue.Empty as e:
+            raise ILStateError("The process data process did not start in time.") from e
+        if status != _ProcessStatus.STARTED:
+            raise ILError(f"The process data process could not start the PDOs: {message}")
+
+    def send_receive(self) -> None:
+        """Write the RPDO items to the RPDO image and read the TPDO items from the TPDO image.
+
+        Raises:
+            ILWrongWorkingCountError: If the child process got a wrong working counter.
+            ILError: If the child process stopped.
+        """
+        if self.__image is None or self.__process is None:
+            raise ILError("The process data process has not been started.")
+        self.__write_outputs()
+        cycle, wkc, inputs = self.__image.read_inputs()
+        if cycle:
+            self.__last_cycle = cycle
+            self.__last_wkc = wkc
+            offset = 0
+            for servo, size in zip(self.__net.servos, self.__inputs_sizes):
+                servo._process_tpdo(inputs[offset : offset + size])
+                offset += size
+        try:
+            status, message = self.__status_queue.get_nowait()
+        except queue.Empty:
+            if self.__process.is_alive():
+                return
+            raise ILError("The process data process stopped unexpectedly.") from None
+        if status == _ProcessStatus.WRONG_WKC:
+            raise ILWrongWorkingCountError(message)
+        raise ILError(f"Exception in the process data process: {message}")
+
+    def stop(self) -> None:
+        """Stop the child process and reopen the EtherCAT master of the network."""
+        for servo in self.__net.servos:
+            servo._pdo_exchange_stopped()
+        if self.__image is not None:
+            self.__image.request_stop()
+        if self.__process is not None:
+            self.__process.join(self.STOP_TIMEOUT)
+            if self.__process.is_alive():
+                logger.warning("The process data process did not stop in time, terminating it.")
+                self.__process.terminate()
+                self.__process.join()
+            self.__process = None
+        if self.__image is not None:
+            self.__image.close()
+            self.__image.unlink()
+            self.__image = None
+        if self.__master_released:
+            self.__master_released = False
+            self.__net._reclaim_master()
+
+    def __write_outputs(self) -> None:
+        """Encode the RPDO items of each servo into the RPDO image."""
+        if self.__image is None:
+            return
+        self.__image.write_outputs(b"".join(servo._process_rpdo() for servo in self.__net.servos))
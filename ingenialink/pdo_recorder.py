@@ -0,0 +1,626 @@
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ingenialink.enums.register import RegDtype
+from ingenialink.exceptions import ILError
+from ingenialink.pdo import _STRUCT_FORMAT_CODES, PADDING_REGISTER_IDENTIFIER
+from ingenialink.utils._utils import dtype_length_bits
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from ingenialink.pdo import PDOServo
+
+_TIMESTAMP_SIZE = 8
+# Attempts to copy the rows without holding the lock before blocking the recording
+_MAX_LOCK_FREE_READS = 3
+
+
+class PDORecorderMode(Enum):
+    """Storage mode of the PDO recorder."""
+
+    RING = "ring"
+    """The last ``capacity`` cycles are kept in memory. Older cycles are overwritten."""
+    SPILL = "spill"
+    """Every ``capacity`` cycles, the recorded rows are appended to a file, which is
+    read back when the rows are read."""
+
+
+@dataclass(frozen=True)
+class _BitField:
+    """Item that is not byte aligned in the recorded rows."""
+
+    name: str
+    offset_bits: int
+    size_bits: int
+    dtype: RegDtype
+
+
+@dataclass(frozen=True)
+class _RowsSnapshot:
+    """Rows that could be read at a given moment, without copying them."""
+
+    generation: int
+    cycles: int
+    count: int
+    written_rows: int
+    pending_buffers: tuple[npt.NDArray[np.uint8], ...]
+    buffer: npt.NDArray[np.uint8]
+
+
+@dataclass(frozen=True)
+class _SpillRequest:
+    """Request to the spill thread.
+
+    Attributes:
+        recording: Recording the request belongs to. It changes when the recorder is
+            cleared, so that the buffers of the discarded rows are not written.
+        buffer: Full buffer to append to the spill file. None to truncate the file.
+    """
+
+    recording: int
+    buffer: Optional[npt.NDArray[np.uint8]] = None
+
+
+class PDORecorder:
+    """Record the TPDO data of some servos every PDO cycle.
+
+    Each cycle is stored as a row of a preallocated 2-D byte buffer: the cycle timestamp
+    followed by the TPDO process image of each servo, so recording a cycle is one copy per
+    servo. The rows are only decoded into typed columns when they are read with
+    :meth:`decode`. The rows are copied out of the buffers and read from the spill file
+    without blocking the recording. In ring mode, the rows that keep being overwritten
+    while they are copied are left out.
+
+    The columns are named after the register identifiers of the TPDO items. If several
+    servos are recorded, the identifiers are prefixed with the servo target, e.g.
+    ``"1.CL_POS_FBK_VALUE"``.
+
+    Args:
+        servos: Servos whose TPDO data is recorded. Their TPDO maps must not change
+            while recording.
+        capacity: Number of rows kept in memory.
+        mode: Storage mode.
+        spill_path: File where the rows are spilled in :attr:`PDORecorderMode.SPILL`
+            mode. It is overwritten.
+
+    Raises:
+        ValueError: If the capacity is not positive.
+        ValueError: If the spill path is missing in spill mode.
+        ILError: If two recorded items have the same name.
+    """
+
+    DEFAULT_CAPACITY = 10_000
+
+    def __init__(
+        self,
+        servos: "Sequence[PDOServo]",
+        capacity: int = DEFAULT_CAPACITY,
+        mode: PDORecorderMode = PDORecorderMode.RING,
+        spill_path: Optional[str] = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("The capacity must be positive.")
+        if mode == PDORecorderMode.SPILL and spill_path is None:
+            raise ValueError("A spill path is required in spill mode.")
+        self.__servos = list(servos)
+        self.__capacity = capacity
+        self.__mode = mode
+        self.__spill_path = spill_path
+        self.__inputs_sizes: list[int] = [
+            sum(tpdo_map.layout.data_length_bytes for tpdo_map in servo._tpdo_maps.values())
+            for servo in self.__servos
+        ]
+        self.__row_size = _TIMESTAMP_SIZE + sum(self.__inputs_sizes)
+        self.__row_dtype, self.__bit_fields = self.__build_row_layout()
+        self.__lock = threading.Lock()
+        self.__use_buffer(self.__allocate_buffer())
+        self.__count = 0
+        self.__cycles = 0
+        self.__missed_cycles = 0
+        self.__spilled_rows = 0
+        # Rows already written to the spill file and full buffers waiting to be written
+        self.__spill_lock = threading.Lock()
+        self.__written_rows = 0
+        self.__pending_buffers: deque[npt.NDArray[np.uint8]] = deque()
+        # Buffer that replaces the full one, so that it is not allocated in the PDO cycle
+        self.__spare_buffer: Optional[npt.NDArray[np.uint8]] = (
+            self.__allocate_buffer() if mode == PDORecorderMode.SPILL else None
+        )
+        # Incremented when the rows of a buffer are discarded or a buffer is reused
+        self.__generation = 0
+        # Reads that keep the full buffers from being reused while they copy them
+        self.__pinned_reads = 0
+        # Incremented when the recorded rows are discarded
+        self.__recording = 0
+        self.__spill_file: Optional[BinaryIO] = None
+        self.__spill_queue: queue.Queue[Optional[_SpillRequest]] = queue.Queue()
+        self.__spill_thread: Optional[threading.Thread] = None
+        self.__spill_error: Optional[OSError] = None
+        if mode == PDORecorderMode.SPILL and spill_path is not None:
+            self.__spill_file = open(spill_path, "wb")  # noqa: SIM115
+            self.__spill_thread = threading.Thread(target=self.__spill, daemon=True)
+            self.__spill_thread.start()
+
+    @property
+    def mode(self) -> PDORecorderMode:
+        """Storage mode."""
+        return self.__mode
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows kept in memory."""
+        return self.__capacity
+
+    @property
+    def row_size(self) -> int:
+        """Size of each row in bytes, including the 8-byte timestamp."""
+        return self.__row_size
+
+    @property
+    def dtype(self) -> "np.dtype[np.void]":
+        """Data type of the decoded rows: the timestamp and one field per TPDO item."""
+        row_fields: Mapping[str, tuple[Any, ...]] = self.__row_dtype.fields or {}
+        fields: list[tuple[str, npt.DTypeLike]] = [
+            (name, row_fields[name][0]) for name in self.__row_dtype.names or ()
+        ]
+        fields.extend((field.name, self.__bit_field_dtype(field)) for field in self.__bit_fields)
+        return np.dtype(fields)
+
+    @property
+    def cycles(self) -> int:
+        """Number of recorded cycles, including the overwritten ones."""
+        return self.__cycles
+
+    @property
+    def missed_cycles(self) -> int:
+        """Number of cycles that could not be recorded because the TPDO data was incomplete."""
+        return self.__missed_cycles
+
+    def __len__(self) -> int:
+        """Number of rows that can be read.
+
+        Returns:
+            Number of rows.
+        """
+        return self.__spilled_rows + self.__count
+
+    def record(self, timestamp: float) -> None:
+        """Record the current TPDO process image of the servos.
+
+        It is called by the process data thread after each cycle.
+
+        Args:
+            timestamp: Timestamp of the cycle, in seconds.
+        """
+        with self.__lock:
+            if self.__mode == PDORecorderMode.RING:
+                index = self.__cycles % self.__capacity
+            else:
+                index = self.__count
+            row = self.__buffer[index]
+            offset = _TIMESTAMP_SIZE
+            for servo, size in zip(self.__servos, self.__inputs_sizes):
+                inputs = servo.pdo_inputs
+                if len(inputs) < size:
+                    self.__missed_cycles += 1
+                    return
+                row[offset : offset + size] = inputs[:size]
+                offset += size
+            self.__timestamps_view[index] = timestamp
+            self.__cycles += 1
+            if self.__mode == PDORecorderMode.RING:
+                self.__count = min(self.__count + 1, self.__capacity)
+                return
+            self.__count += 1
+            if self.__count == self.__capacity:
+                with self.__spill_lock:
+                    self.__pending_buffers.append(self.__buffer)
+                    spare_buffer, self.__spare_buffer = self.__spare_buffer, None
+                self.__spill_queue.put(_SpillRequest(self.__recording, self.__buffer))
+                self.__spilled_rows += self.__count
+                # The buffer is only allocated here if the spill file cannot keep up
+                self.__use_buffer(
+                    spare_buffer if spare_buffer is not None else self.__allocate_buffer()
+                )
+                self.__count = 0
+
+    def raw(self, start: int = 0, stop: Optional[int] = None) -> npt.NDArray[np.uint8]:
+        """Get a copy of the recorded rows, oldest first.
+
+        Args:
+            start: First row.
+            stop: Row after the last one. If None, up to the last recorded row.
+
+        Returns:
+            2-D array of bytes with one row per cycle. In ring mode, it can start after
+            ``start`` if the oldest rows keep being overwritten while they are copied.
+
+        Raises:
+            ILError: If the spilled rows could not be written to the file.
+        """
+        self.__check_spill_error()
+        for _ in range(_MAX_LOCK_FREE_READS):
+            with self.__lock, self.__spill_lock:
+                snapshot = self.__snapshot()
+            rows_range = self.__rows_range(snapshot, start, stop)
+            rows = self.__copy_rows(snapshot, *rows_range)
+            with self.__lock, self.__spill_lock:
+                if self.__overwritten_rows(snapshot, rows_range[0], len(rows)) == 0:
+                    return rows
+        # The rows kept being overwritten while they were copied. The full buffers are not
+        # reused until they are copied, and the rows overwritten in the ring are left out.
+        with self.__lock, self.__spill_lock:
+            snapshot = self.__snapshot()
+            self.__pinned_reads += 1
+        try:
+            rows_range = self.__rows_range(snapshot, start, stop)
+            rows = self.__copy_rows(snapshot, *rows_range)
+        finally:
+            with self.__spill_lock:
+                self.__pinned_reads -= 1
+        with self.__lock, self.__spill_lock:
+            return rows[self.__overwritten_rows(snapshot, rows_range[0], len(rows)) :]
+
+    def timestamps(self, start: int = 0, stop: Optional[int] = None) -> npt.NDArray[np.float64]:
+        """Get the timestamps of the recorded rows, oldest first.
+
+        Args:
+            start: First row.
+            stop: Row after the last one. If None, up to the last recorded row.
+
+        Returns:
+            Timestamps in seconds.
+        """
+        raw = self.raw(start, stop)
+        timestamps: npt.NDArray[np.float64] = (
+            raw[:, :_TIMESTAMP_SIZE].copy().view(np.float64).reshape(-1)
+        )
+        return timestamps
+
+    def decode(self, start: int = 0, stop: Optional[int] = None) -> npt.NDArray[np.void]:
+        """Decode the recorded rows into typed columns, oldest first.
+
+        Args:
+            start: First row.
+            stop: Row after the last one. If None, up to the last recorded row.
+
+        Returns:
+            Structured array with the :attr:`dtype` data type.
+        """
+        raw = self.raw(start, stop)
+        rows = raw.view(self.__row_dtype).reshape(-1)
+        decoded: npt.NDArray[np.void] = np.empty(len(rows), dtype=self.dtype)
+        for name in self.__row_dtype.names or ():
+            decoded[name] = rows[name]
+        for field in self.__bit_fields:
+            decoded[field.name] = self.__decode_bit_field(raw, field)
+        return decoded
+
+    def clear(self) -> None:
+        """Discard the recorded rows.
+
+        The spill file is truncated by the spill thread, after the full buffers that were
+        waiting to be written are discarded.
+
+        Raises:
+            ILError: If the spilled rows could not be written to the file.
+        """
+        self.__check_spill_error()
+        with self.__lock:
+            self.__count = 0
+            self.__cycles = 0
+            self.__missed_cycles = 0
+            self.__spilled_rows = 0
+            with self.__spill_lock:
+                self.__written_rows = 0
+                self.__pending_buffers.clear()
+                self.__generation += 1
+                self.__recording += 1
+            if self.__spill_thread is not None:
+                self.__spill_queue.put(_SpillRequest(self.__recording))
+
+    def close(self) -> None:
+        """Stop spilling rows and close the spill file. The recorded rows can still be read.
+
+        Raises:
+            ILError: If the spilled rows could not be written to the file.
+        """
+        if self.__spill_thread is None:
+            return
+        self.__spill_queue.put(None)
+        self.__spill_thread.join()
+        self.__spill_thread = None
+        if self.__spill_file is not None:
+            self.__spill_file.close()
+        self.__check_spill_error()
+
+    def __allocate_buffer(self) -> npt.NDArray[np.uint8]:
+        """Allocate the in-memory rows.
+
+        Returns:
+            Buffer of ``capacity`` rows.
+        """
+        return np.zeros((self.__capacity, self.__row_size), dtype=np.uint8)
+
+    def __use_buffer(self, buffer: npt.NDArray[np.uint8]) -> None:
+        """Record the next cycles in a buffer.
+
+        Args:
+            buffer: Buffer of ``capacity`` rows.
+        """
+        self.__buffer = buffer
+        self.__timestamps_view: npt.NDArray[np.float64] = (
+            buffer[:, :_TIMESTAMP_SIZE].view(np.float64).reshape(-1)
+        )
+
+    def __snapshot(self) -> _RowsSnapshot:
+        """Get the rows that can be read. The lock and the spill lock must be held.
+
+        Returns:
+            References to the rows.
+        """
+        return _RowsSnapshot(
+            generation=self.__generation,
+            cycles=self.__cycles,
+            count=self.__count,
+            written_rows=self.__written_rows,
+            pending_buffers=tuple(self.__pending_buffers),
+            buffer=self.__buffer,
+        )
+
+    @staticmethod
+    def __rows_range(snapshot: _RowsSnapshot, start: int, stop: Optional[int]) -> tuple[int, int]:
+        """Resolve the rows to read.
+
+        Args:
+            snapshot: Rows that can be read.
+            start: First row.
+            stop: Row after the last one. If None, up to the last recorded row.
+
+        Returns:
+            First row and row after the last one.
+        """
+        total = snapshot.written_rows + sum(map(len, snapshot.pending_buffers)) + snapshot.count
+        start, stop, _ = slice(start, stop).indices(total)
+        return start, max(start, stop)
+
+    def __copy_rows(self, snapshot: _RowsSnapshot, start: int, stop: int) -> npt.NDArray[np.uint8]:
+        """Copy some rows of a snapshot.
+
+        Args:
+            snapshot: Rows that can be read.
+            start: First row.
+            stop: Row after the last one.
+
+        Returns:
+            2-D array of bytes with one row per cycle.
+        """
+        parts: list[npt.NDArray[np.uint8]] = []
+        # Rows in the spill file
+        if start < snapshot.written_rows and self.__spill_path is not None:
+            parts.append(self.__read_spilled_rows(start, min(stop, snapshot.written_rows)))
+        # Rows waiting to be written and rows in the active buffer, oldest first
+        buffers: list[npt.NDArray[np.uint8]] = list(snapshot.pending_buffers)
+        if self.__mode == PDORecorderMode.RING and snapshot.cycles > self.__capacity:
+            oldest = snapshot.cycles % self.__capacity
+            buffers.extend((snapshot.buffer[oldest:], snapshot.buffer[:oldest]))
+        else:
+            buffers.append(snapshot.buffer[: snapshot.count])
+        buffers_start = snapshot.written_rows
+        for buffer in buffers:
+            buffer_start = max(start - buffers_start, 0)
+            buffer_stop = min(stop - buffers_start, len(buffer))
+            if buffer_stop > buffer_start:
+                parts.append(buffer[buffer_start:buffer_stop].copy())
+            buffers_start += len(buffer)
+        if not parts:
+            return np.empty((0, self.__row_size), dtype=np.uint8)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def __read_spilled_rows(self, start: int, stop: int) -> npt.NDArray[np.uint8]:
+        """Read some rows of the spill file.
+
+        Args:
+            start: First row.
+            stop: Row after the last one.
+
+        Returns:
+            Rows. Fewer rows if the file has been truncated meanwhile.
+        """
+        data = bytearray((stop - start) * self.__row_size)
+        with open(self.__spill_path or "", "rb") as spill_file:
+            spill_file.seek(start * self.__row_size)
+            read_bytes = spill_file.readinto(data)
+        rows = read_bytes // self.__row_size
+        return np.frombuffer(data, dtype=np.uint8)[: rows * self.__row_size].reshape(
+            rows, self.__row_size
+        )
+
+    def __overwritten_rows(self, snapshot: _RowsSnapshot, start: int, num_rows: int) -> int:
+        """Count the copied rows of a snapshot that were overwritten while they were copied.
+
+        The lock and the spill lock must be held.
+
+        Args:
+            snapshot: Rows that were copied.
+            start: First copied row.
+            num_rows: Number of copied rows.
+
+        Returns:
+            Number of overwritten rows, at the beginning of the copy.
+        """
+        if num_rows == 0:
+            return 0
+        if self.__generation != snapshot.generation:
+            return num_rows
+        if self.__mode == PDORecorderMode.SPILL:
+            # The full buffers and the recorded rows of the active buffer do not change
+            return 0
+        # The ring buffer overwrites the oldest rows first
+        new_cycles = self.__cycles - snapshot.cycles
+        overwritten_rows = snapshot.count + new_cycles - self.__capacity
+        return min(max(overwritten_rows - start, 0), num_rows)
+
+    def __spill(self) -> None:
+        """Write the full buffers to the spill file until the recorder is closed."""
+        while True:
+            request = self.__spill_queue.get()
+            try:
+                if request is None:
+                    return
+                if request.buffer is None:
+                    self.__truncate_spill_file()
+                else:
+                    self.__spill_buffer(request.recording, request.buffer)
+            except OSError as e:
+                self.__spill_error = e
+            finally:
+                self.__spill_queue.task_done()
+
+    def __spill_buffer(self, recording: int, buffer: npt.NDArray[np.uint8]) -> None:
+        """Append a full buffer to the spill file and reuse it if possible.
+
+        Args:
+            recording: Recording the rows of the buffer belong to.
+            buffer: Full buffer.
+        """
+        with self.__spill_lock:
+            discarded = recording != self.__recording
+        if not discarded and self.__spill_file is not None and self.__spill_error is None:
+            self.__spill_file.write(buffer.tobytes())
+            self.__spill_file.flush()
+        with self.__spill_lock:
+            # The rows may have been discarded while they were written
+            if recording == self.__recording:
+                self.__pending_buffers.popleft()
+                self.__written_rows += len(buffer)
+            if self.__spare_buffer is None and self.__pinned_reads == 0:
+                # The buffer can be reused, but its rows may still be being copied
+                self.__spare_buffer = buffer
+                self.__generation += 1
+
+    def __truncate_spill_file(self) -> None:
+        """Discard the rows written to the spill file."""
+        if self.__spill_file is not None and self.__spill_error is None:
+            self.__spill_file.seek(0)
+            self.__spill_file.truncate()
+
+    def __check_spill_error(self) -> None:
+        """Check that the rows could be written to the spill file.
+
+        Raises:
+            ILError: If the spilled rows could not be written to the file.
+        """
+        if self.__spill_error is not None:
+            raise ILError(f"Could not spill the PDO records: {self.__spill_error}")
+
+    def __build_row_layout(self) -> tuple["np.dtype[np.void]", list[_BitField]]:
+        """Describe the items of the recorded rows.
+
+        Returns:
+            Structured data type of the byte-aligned items and the items that are not byte
+            aligned.
+
+        Raises:
+            ILError: If two recorded items have the same name.
+        """
+        names: list[str] = []
+        formats: list[npt.DTypeLike] = []
+        offsets: list[int] = []
+        bit_fields: list[_BitField] = []
+        offset = _TIMESTAMP_SIZE
+        prefix_names = len(self.__servos) > 1
+        for servo, size in zip(self.__servos, self.__inputs_sizes):
+            servo_offset = offset
+            prefix = f"{servo.target}." if prefix_names else ""
+            for tpdo_map in servo._tpdo_maps.values():
+                layout = tpdo_map.layout
+                map_fields: Mapping[str, tuple[Any, ...]] = layout.structured_dtype.fields or {}
+                for name, (field_dtype, field_offset, *_) in map_fields.items():
+                    names.append(f"{prefix}{name}")
+                    formats.append(field_dtype)
+                    offsets.append(offset + field_offset)
+                for item, offset_bits, size_bits in zip(
+                    layout.items, layout.offsets_bits, layout.sizes_bits
+                ):
+                    identifier = item.register.identifier
+                    if identifier == PADDING_REGISTER_IDENTIFIER or identifier in map_fields:
+                        continue
+                    bit_fields.append(
+                        _BitField(
+                            name=f"{prefix}{identifier}",
+                            offset_bits=offset * 8 + offset_bits,
+                            size_bits=size_bits,
+                            dtype=item.register.dtype,
+                        )
+                    )
+                offset += layout.data_length_bytes
+            offset = servo_offset + size
+        all_names = ["timestamp", *names, *(field.name for field in bit_fields)]
+        duplicated = {name for name in all_names if all_names.count(name) > 1}
+        if duplicated:
+            raise ILError(f"The recorded PDO items {sorted(duplicated)} have the same name.")
+        row_dtype: np.dtype[np.void] = np.dtype({
+            "names": ["timestamp", *names],
+            "formats": [np.float64, *formats],
+            "offsets": [0, *offsets],
+            "itemsize": self.__row_size,
+        })
+        return row_dtype, bit_fields
+
+    @staticmethod
+    def __bit_field_dtype(field: _BitField) -> "np.dtype[np.generic]":
+        """Data type of the decoded values of an item that is not byte aligned.
+
+        Args:
+            field: Item.
+
+        Returns:
+            Data type.
+        """
+        if field.dtype == RegDtype.BOOL or field.size_bits == 1:
+            return np.dtype(np.bool_)
+        format_code = _STRUCT_FORMAT_CODES.get(field.dtype)
+        if format_code is None or field.size_bits != dtype_length_bits[field.dtype]:
+            format_code = "Q"
+        dtype: np.dtype[np.generic] = np.dtype(f"<{format_code}")
+        return dtype
+
+    @classmethod
+    def __decode_bit_field(
+        cls, raw: npt.NDArray[np.uint8], field: _BitField
+    ) -> npt.NDArray[np.generic]:
+        """Decode an item that is not byte aligned.
+
+        Args:
+            raw: Recorded rows.
+            field: Item.
+
+        Returns:
+            Decoded values.
+        """
+        first_byte = field.offset_bits // 8
+        shift = field.offset_bits % 8
+        n_bytes = min(-(-(shift + field.size_bits) // 8), 8)
+        bits = np.zeros(len(raw), dtype=np.uint64)
+        for byte in range(n_bytes):
+            bits |= raw[:, first_byte + byte].astype(np.uint64) << np.uint64(8 * byte)
+        bits >>= np.uint64(shift)
+        if field.size_bits < 64:
+            bits &= np.uint64((1 << field.size_bits) - 1)
+        dtype = cls.__bit_field_dtype(field)
+        if dtype == np.bool_:
+            return bits.astype(np.bool_)
+        if dtype == np.uint64:
+            return bits
+        # Reinterpret the bits with the item data type (signed integers and floats)
+        unsigned: npt.NDArray[np.generic] = bits.astype(f"<u{dtype.itemsize}").view(dtype)
+        return unsigned
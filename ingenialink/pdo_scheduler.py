@@ -0,0 +1,129 @@
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import ingenialogger
+
+logger = ingenialogger.get_logger(__name__)
+
+
+def _default_spin_threshold() -> float:
+    """Default time that the PDO cycle scheduler busy-waits before each deadline.
+
+    Returns:
+        Spin threshold in seconds.
+    """
+    if sys.platform == "win32":
+        # Before Python 3.11 time.sleep has the resolution of the system timer (~15 ms)
+        return 0.013 if sys.version_info < (3, 11) else 0.002
+    return 0.0005
+
+
+@dataclass(frozen=True)
+class PDOSchedulerConfig:
+    """Configuration of the PDO cycle scheduler.
+
+    Attributes:
+        spin_threshold: Time before each cycle deadline (s) at which the scheduler stops
+            sleeping and busy-waits. 0 disables the busy-wait.
+        realtime_priority: SCHED_FIFO priority (1-99) of the process data thread. If None,
+            the default scheduling policy is kept. Only supported on Linux.
+        cpu_affinity: CPUs the process data thread is pinned to. If None, the default
+            affinity is kept. Only supported on Linux.
+    """
+
+    spin_threshold: float = field(default_factory=_default_spin_threshold)
+    realtime_priority: Optional[int] = None
+    cpu_affinity: Optional[frozenset[int]] = None
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        Raises:
+            ValueError: If the spin threshold is negative.
+            ValueError: If the realtime priority is out of range.
+        """
+        if self.spin_threshold < 0:
+            raise ValueError("The spin threshold cannot be negative.")
+        if self.realtime_priority is not None and not 1 <= self.realtime_priority <= 99:
+            raise ValueError("The realtime priority must be between 1 and 99.")
+
+
+class PDOCycleScheduler:
+    """Wait for the PDO cycles using absolute monotonic deadlines.
+
+    The deadline of each cycle is a multiple of the period since the start of the
+    exchange, so the time spent in each cycle does not accumulate as drift. The
+    scheduler sleeps until ``spin_threshold`` seconds before the deadline and busy-waits
+    the rest. If a deadline is missed, the next cycle starts right away and the
+    following deadlines stay aligned with the original schedule.
+
+    Args:
+        period: Cycle period in seconds.
+        spin_threshold: Time before each deadline (s) at which the scheduler busy-waits.
+    """
+
+    def __init__(self, period: float, spin_threshold: float) -> None:
+        self.__period = period
+        self.__spin_threshold = spin_threshold
+        self.__next_deadline = 0.0
+
+    @property
+    def next_deadline(self) -> float:
+        """Deadline of the next cycle, in :func:`time.perf_counter` seconds."""
+        return self.__next_deadline
+
+    def start(self) -> None:
+        """Start the schedule. The first deadline is one period from now."""
+        self.__next_deadline = time.perf_counter() + self.__period
+
+    def wait(self) -> int:
+        """Wait until the deadline of the next cycle.
+
+        Returns:
+            Number of deadlines that were missed. 0 if the deadline was met.
+        """
+        deadline = self.__next_deadline
+        now = time.perf_counter()
+        if now >= deadline:
+            missed_deadlines = int((now - deadline) // self.__period) + 1
+            self.__next_deadline = deadline + missed_deadlines * self.__period
+            return missed_deadlines
+        sleep_time = deadline - now - self.__spin_threshold
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+        while time.perf_counter() < deadline:
+            pass
+        self.__next_deadline = deadline + self.__period
+        return 0
+
+
+def apply_scheduling_policy(config: PDOSchedulerConfig) -> None:
+    """Apply the CPU affinity and realtime priority of a configuration to the calling thread.
+
+    Failures are logged and the calling thread keeps the default policy.
+
+    Args:
+        config: Configuration of the PDO cycle scheduler.
+    """
+    if config.cpu_affinity is None and config.realtime_priority is None:
+        return
+    if sys.platform != "linux":
+        logger.warning(
+            "The CPU affinity and the realtime priority of the PDO thread are only "
+            "supported on Linux."
+        )
+        return
+    # On Linux, pid 0 refers to the calling thread
+    if config.cpu_affinity is not None:
+        try:
+            os.sched_setaffinity(0, config.cpu_affinity)
+        except OSError as e:
+            logger.warning(f"Could not set the CPU affinity of the PDO thread: {e}")
+    if config.realtime_priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(config.realtime_priority))
+        except OSError as e:
+            logger.warning(f"Could not set the realtime priority of the PDO thread: {e}")
@@ -0,0 +1,332 @@
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+PDO_CYCLE_DTYPE: "np.dtype[np.void]" = np.dtype([
+    ("timestamp", np.float64),
+    ("cycle_time", np.float64),
+    ("callback_time", np.float64),
+    ("send_receive_time", np.float64),
+    ("sleep_time", np.float64),
+    ("wkc", np.int32),
+])
+"""Data type of the records stored for each PDO cycle. Times are in seconds."""
+
+
+@dataclass(frozen=True)
+class HistogramSummary:
+    """Summary of a latency histogram. Values are in seconds.
+
+    Attributes:
+        count: Number of recorded values.
+        min: Minimum recorded value.
+        max: Maximum recorded value.
+        mean: Mean of the recorded values.
+        p50: 50th percentile.
+        p90: 90th percentile.
+        p99: 99th percentile.
+        p999: 99.9th percentile.
+    """
+
+    count: int
+    min: float
+    max: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    p999: float
+
+
+class LatencyHistogram:
+    """HDR-style latency histogram.
+
+    The values are stored in microseconds in log-linear buckets: each power of two is
+    split in ``2 ** (significant_bits - 1)`` linear sub-buckets. The relative error of
+    the reported percentiles is below ``2 ** -(significant_bits - 1)`` for any value,
+    and recording a value is a constant-time operation.
+
+    Args:
+        max_value: Highest value (s) that can be tracked. Higher values are recorded in
+            the last bucket.
+        significant_bits: Number of bits used to resolve each power of two.
+    """
+
+    DEFAULT_MAX_VALUE = 60.0
+    DEFAULT_SIGNIFICANT_BITS = 7
+
+    def __init__(
+        self,
+        max_value: float = DEFAULT_MAX_VALUE,
+        significant_bits: int = DEFAULT_SIGNIFICANT_BITS,
+    ) -> None:
+        self.__significant_bits = significant_bits
+        self.__sub_bucket_count = 1 << significant_bits
+        self.__max_value_us = int(max_value * 1_000_000)
+        self.__counts = [0] * (self.__bucket_index(self.__max_value_us) + 1)
+        self.__count = 0
+        self.__total_us = 0
+        self.__min_us = 0
+        self.__max_us = 0
+
+    def __bucket_index(self, value_us: int) -> int:
+        if value_us < self.__sub_bucket_count:
+            return value_us
+        shift = value_us.bit_length() - self.__significant_bits
+        return (shift << (self.__significant_bits - 1)) + (value_us >> shift)
+
+    def __bucket_highest_value(self, index: int) -> int:
+        if index < self.__sub_bucket_count:
+            return index
+        half_bits = self.__significant_bits - 1
+        shift = (index >> half_bits) - 1
+        lowest_value = (index - (shift << half_bits)) << shift
+        return lowest_value + (1 << shift) - 1
+
+    def record(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value: Value in seconds. Negative values are recorded as 0.
+        """
+        value_us = min(max(round(value * 1_000_000), 0), self.__max_value_us)
+        self.__counts[self.__bucket_index(value_us)] += 1
+        if self.__count == 0 or value_us < self.__min_us:
+            self.__min_us = value_us
+        if value_us > self.__max_us:
+            self.__max_us = value_us
+        self.__count += 1
+        self.__total_us += value_us
+
+    def reset(self) -> None:
+        """Discard the recorded values."""
+        self.__counts = [0] * len(self.__counts)
+        self.__count = 0
+        self.__total_us = 0
+        self.__min_us = 0
+        self.__max_us = 0
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self.__count
+
+    def percentile(self, percentile: float) -> float:
+        """Value below which the given percentage of the recorded values fall.
+
+        Args:
+            percentile: Percentile, from 0 to 100.
+
+        Returns:
+            Highest value equivalent to the percentile, in seconds. 0 if there are no values.
+        """
+        if self.__count == 0:
+            return 0.0
+        target = max(1, math.ceil(self.__count * percentile / 100))
+        accumulated = 0
+        for index, bucket_count in enumerate(self.__counts):
+            accumulated += bucket_count
+            if accumulated >= target:
+                return min(self.__bucket_highest_value(index), self.__max_us) / 1_000_000
+        return self.__max_us / 1_000_000
+
+    def summary(self) -> HistogramSummary:
+        """Summarize the recorded values.
+
+        Returns:
+            Summary of the histogram.
+        """
+        return HistogramSummary(
+            count=self.__count,
+            min=self.__min_us / 1_000_000,
+            max=self.__max_us / 1_000_000,
+            mean=self.__total_us / self.__count / 1_000_000 if self.__count else 0.0,
+            p50=self.percentile(50),
+            p90=self.percentile(90),
+            p99=self.percentile(99),
+            p999=self.percentile(99.9),
+        )
+
+
+@dataclass(frozen=True)
+class PDOStatistics:
+    """Snapshot of the PDO cycle statistics.
+
+    Attributes:
+        cycles: Number of recorded cycles.
+        overruns: Number of cycle deadlines that were missed.
+        watchdog_near_misses: Number of cycles that lasted longer than the near-miss ratio
+            of the watchdog timeout.
+        expected_wkc: Expected process data working counter.
+        wkc_history: Working counters of the last cycles, oldest first.
+        cycle_time: Time between the start of consecutive cycles.
+        jitter: Absolute deviation of the cycle time from the refresh rate.
+        callback_time: Time spent in the send and receive callbacks.
+        send_receive_time: Time spent sending and receiving the process data.
+        last_cycles: Records of the last cycles, oldest first. See :data:`PDO_CYCLE_DTYPE`.
+            The working counter is -1 when it was not available.
+    """
+
+    cycles: int
+    overruns: int
+    watchdog_near_misses: int
+    expected_wkc: Optional[int]
+    wkc_history: tuple[int, ...]
+    cycle_time: HistogramSummary
+    jitter: HistogramSummary
+    callback_time: HistogramSummary
+    send_receive_time: HistogramSummary
+    last_cycles: npt.NDArray[np.void]
+
+
+class PDOCycleStatistics:
+    """Recorder of the PDO cycle statistics.
+
+    The records of the last cycles are stored in a preallocated ring buffer, so
+    recording a cycle does not allocate memory.
+
+    Args:
+        ring_buffer_size: Number of cycles whose records are kept.
+        wkc_history_size: Number of working counters kept in the WKC history.
+        watchdog_near_miss_ratio: Fraction of the watchdog timeout above which a cycle
+            is counted as a watchdog near-miss.
+
+    Raises:
+        ValueError: If the ring buffer size is not positive.
+    """
+
+    DEFAULT_RING_BUFFER_SIZE = 1000
+    DEFAULT_WKC_HISTORY_SIZE = 32
+    DEFAULT_WATCHDOG_NEAR_MISS_RATIO = 0.8
+
+    def __init__(
+        self,
+        ring_buffer_size: int = DEFAULT_RING_BUFFER_SIZE,
+        wkc_history_size: int = DEFAULT_WKC_HISTORY_SIZE,
+        watchdog_near_miss_ratio: float = DEFAULT_WATCHDOG_NEAR_MISS_RATIO,
+    ) -> None:
+        if ring_buffer_size <= 0:
+            raise ValueError("The ring buffer size must be positive.")
+        self.__lock = threading.Lock()
+        self.__ring: npt.NDArray[np.void] = np.zeros(ring_buffer_size, dtype=PDO_CYCLE_DTYPE)
+        self.__wkc_history: deque[int] = deque(maxlen=wkc_history_size)
+        self.__watchdog_near_miss_ratio = watchdog_near_miss_ratio
+        self.__cycle_time = LatencyHistogram()
+        self.__jitter = LatencyHistogram()
+        self.__callback_time = LatencyHistogram()
+        self.__send_receive_time = LatencyHistogram()
+        self.__cycles = 0
+        self.__overruns = 0
+        self.__watchdog_near_misses = 0
+        self.__refresh_rate = 0.0
+        self.__watchdog_timeout: Optional[float] = None
+        self.__expected_wkc: Optional[int] = None
+
+    def configure(
+        self, refresh_rate: float, watchdog_timeout: Optional[float], expected_wkc: Optional[int]
+    ) -> None:
+        """Set the parameters of the PDO exchange being recorded.
+
+        Args:
+            refresh_rate: PDO refresh rate in seconds.
+            watchdog_timeout: PDO watchdog timeout in seconds.
+            expected_wkc: Expected process data working counter.
+        """
+        with self.__lock:
+            self.__refresh_rate = refresh_rate
+            self.__watchdog_timeout = watchdog_timeout
+            self.__expected_wkc = expected_wkc
+
+    def record_cycle(
+        self,
+        timestamp: float,
+        cycle_time: float,
+        callback_time: float,
+        send_receive_time: float,
+        sleep_time: float,
+        wkc: Optional[int],
+        missed_deadlines: int = 0,
+    ) -> None:
+        """Record the timings of a PDO cycle.
+
+        Args:
+            timestamp: Start of the cycle, in :func:`time.perf_counter` seconds.
+            cycle_time: Time since the start of the previous cycle, in seconds.
+                Negative if there is no previous cycle.
+            callback_time: Time spent in the send and receive callbacks, in seconds.
+            send_receive_time: Time spent sending and receiving the process data, in seconds.
+            sleep_time: Time spent waiting for the next cycle, in seconds.
+            wkc: Process data working counter. None if it is not available.
+            missed_deadlines: Number of cycle deadlines missed by this cycle.
+        """
+        with self.__lock:
+            self.__ring[self.__cycles % len(self.__ring)] = (
+                timestamp,
+                cycle_time,
+                callback_time,
+                send_receive_time,
+                sleep_time,
+                -1 if wkc is None else wkc,
+            )
+            self.__cycles += 1
+            self.__overruns += missed_deadlines
+            if wkc is not None:
+                self.__wkc_history.append(wkc)
+            self.__callback_time.record(callback_time)
+            self.__send_receive_time.record(send_receive_time)
+            if cycle_time < 0:
+                return
+            self.__cycle_time.record(cycle_time)
+            self.__jitter.record(abs(cycle_time - self.__refresh_rate))
+            if (
+                self.__watchdog_timeout is not None
+                and cycle_time > self.__watchdog_near_miss_ratio * self.__watchdog_timeout
+            ):
+                self.__watchdog_near_misses += 1
+
+    def reset(self) -> None:
+        """Discard the recorded statistics."""
+        with self.__lock:
+            self.__ring[:] = 0
+            self.__wkc_history.clear()
+            for histogram in (
+                self.__cycle_time,
+                self.__jitter,
+                self.__callback_time,
+                self.__send_receive_time,
+            ):
+                histogram.reset()
+            self.__cycles = 0
+            self.__overruns = 0
+            self.__watchdog_near_misses = 0
+
+    def snapshot(self) -> PDOStatistics:
+        """Take a snapshot of the recorded statistics.
+
+        Returns:
+            PDO statistics.
+        """
+        with self.__lock:
+            ring_size = len(self.__ring)
+            if self.__cycles <= ring_size:
+                last_cycles = self.__ring[: self.__cycles].copy()
+            else:
+                oldest = self.__cycles % ring_size
+                last_cycles = np.concatenate((self.__ring[oldest:], self.__ring[:oldest]))
+            return PDOStatistics(
+                cycles=self.__cycles,
+                overruns=self.__overruns,
+                watchdog_near_misses=self.__watchdog_near_misses,
+                expected_wkc=self.__expected_wkc,
+                wkc_history=tuple(self.__wkc_history),
+                cycle_time=self.__cycle_time.summary(),
+                jitter=self.__jitter.summary(),
+                callback_time=self.__callback_time.summary(),
+                send_receive_time=self.__send_receive_time.summary(),
+                last_cycles=last_cycles,
+            )
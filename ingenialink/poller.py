@@ -1,6 +1,6 @@
 import time
 from threading import Lock, Thread
-from typing import Union
+from typing import Optional, Union
 
 import ingenialogger
 
@@ -11,9 +11,38 @@ from ingenialink.servo import Servo
 logger = ingenialogger.get_logger(__name__)
 
 
+class _PollerBuffer:
+    """Sample buffer filled by the poller thread and drained by the consumer.
+
+    Each acquired sample is stored as a single row (timestamp + values of the
+    enabled channels), so publishing a sample is a single slot assignment.
+
+    Args:
+        size: Maximum number of samples that can be stored.
+
+    """
+
+    def __init__(self, size: int) -> None:
+        self.times: list[float] = [0.0] * size
+        self.rows: list[Optional[list[Union[int, float]]]] = [None] * size
+        self.count = 0
+        self.lost = False
+
+    def reset(self) -> None:
+        """Discard the stored samples."""
+        self.count = 0
+        self.lost = False
+
+
 class Poller(Thread):
     """Register poller for CANOpen/Ethernet communications.
 
+    The registers are read outside any lock into a staging row. The row is
+    then published into the active buffer while holding the lock only for a
+    slot assignment. Reading :attr:`data` swaps the active and retired
+    buffers, so the consumer never waits for the bus and the poller never
+    waits for the consumer to copy the acquired data.
+
     Args:
         servo: Servo.
         num_channels: Number of channels.
@@ -26,15 +55,16 @@ class Poller(Thread):
         self.__num_channels = num_channels
         self.__sz = 0
         self.__refresh_time = 0.0
-        self.__samples_count = 0
-        self.__samples_lost = False
         self.__running = False
         self.__mappings: dict[int, Register] = {}
         self.__mappings_enabled: list[bool] = []
+        # Protects the active buffer index and the sample publication
         self.__lock = Lock()
-        self.__acq_time: list[float] = []
-        self.__acq_data: list[Union[list[float], list[int]]] = []
-        self._reset_acq()
+        # Serializes consumers so that a retired buffer is drained by one reader at a time
+        self.__read_lock = Lock()
+        self.__buffers = (_PollerBuffer(0), _PollerBuffer(0))
+        self.__write_idx = 0
+        self.__enabled_channels: list[int] = []
 
     def run(self) -> None:
         """Start the poller."""
@@ -69,16 +99,12 @@ class Poller(Thread):
         if self.__running:
             raise ILStateError("Poller is running")
         # Configure data and sizes with empty data
-        self._reset_acq()
         self.__sz = sz
         self.__refresh_time = t_s
-        self.__acq_time = [0.0] * sz
+        self._reset_acq()
         self.__mappings = {}
-        self.__mappings_enabled = []
-        for _ in range(self.num_channels):
-            data_channel = [0.0] * sz
-            self.__acq_data.append(data_channel)
-            self.__mappings_enabled.append(False)
+        self.__mappings_enabled = [False] * self.num_channels
+        self.__update_enabled_channels()
 
         return 0
 
@@ -111,6 +137,7 @@ class Poller(Thread):
         # Reg identifier obtained and set enabled
         self.__mappings[channel] = _reg
         self.__mappings_enabled[channel] = True
+        self.__update_enabled_channels()
 
         return 0
 
@@ -136,6 +163,7 @@ class Poller(Thread):
 
         # Set channel required as disabled
         self.__mappings_enabled[channel] = False
+        self.__update_enabled_channels()
 
         return 0
 
@@ -150,68 +178,74 @@ class Poller(Thread):
             self.ch_disable(channel)
         return 0
 
+    def __update_enabled_channels(self) -> None:
+        """Update the list of enabled channels, in the order they are acquired."""
+        self.__enabled_channels = [
+            channel for channel, is_enabled in enumerate(self.__mappings_enabled) if is_enabled
+        ]
+
     def _reset_acq(self) -> None:
         """Resets the acquired channels."""
-        self.__acq_time = [0.0]
-        self.__acq_data = []
+        with self.__lock:
+            self.__buffers = (_PollerBuffer(self.__sz), _PollerBuffer(self.__sz))
+            self.__write_idx = 0
 
     def _acquire_callback_poller_data(self) -> None:
-        """Acquire callback for poller data."""
-        time_diff = time.time()
+        """Acquire callback for poller data.
 
+        The registers are read into a staging row without holding the lock. Only the
+        publication of the complete row into the active buffer is done under the lock.
+        """
         # Obtain current time
-        t = time_diff - self.__time_start
-
-        self.__lock.acquire()
-        # Acquire all configured channels
-        if self.__samples_count >= self.__sz:
-            self.__samples_lost = True
-        else:
-            self.__acq_time[self.__samples_count] = t
-
-            # Acquire enabled channels, comprehension list indexes obtained
-            enabled_channel_indexes = [
-                channel_idx
-                for channel_idx, is_enabled in enumerate(self.__mappings_enabled)
-                if is_enabled
-            ]
-
-            reading_error = False
-            for channel in enabled_channel_indexes:
-                register = self.__mappings[channel]
-                try:
-                    self.__acq_data[channel][self.__samples_count] = self.servo.read(register)  # type: ignore[assignment]
-                except (ILTimeoutError, ILIOError):
-                    reading_error = True
-                    logger.warning(
-                        f"Could not read {register.identifier} register. This sample is lost for"
-                        " all channels."
-                    )
-
-            if not reading_error:
-                # Increment samples count
-                self.__samples_count += 1
-
-        self.__lock.release()
+        t = time.time() - self.__time_start
+
+        staged_row: list[Union[int, float]] = []
+        for channel in self.__enabled_channels:
+            register = self.__mappings[channel]
+            try:
+                staged_row.append(self.servo.read(register))  # type: ignore[arg-type]
+            except (ILTimeoutError, ILIOError):
+                logger.warning(
+                    f"Could not read {register.identifier} register. This sample is lost for"
+                    " all channels."
+                )
+                return
+
+        with self.__lock:
+            buffer = self.__buffers[self.__write_idx]
+            if buffer.count >= self.__sz:
+                buffer.lost = True
+                return
+            buffer.times[buffer.count] = t
+            buffer.rows[buffer.count] = staged_row
+            buffer.count += 1
 
     @property
     def data(self) -> tuple[list[float], list[list[float]], bool]:
         """Time vector, array of data vectors and a flag indicating if data was lost."""
-        self.__lock.acquire()
-        t = list(self.__acq_time[0 : self.__samples_count])
-        d = []
-
+        with self.__read_lock:
+            with self.__lock:
+                buffer = self.__buffers[self.__write_idx]
+                self.__write_idx ^= 1
+            # The retired buffer is no longer written by the poller thread
+            n_samples = buffer.count
+            rows = buffer.rows[:n_samples]
+            t = buffer.times[:n_samples]
+            samples_lost = buffer.lost
+            buffer.reset()
+
+        d: list[list[float]] = []
+        enabled_position = {
+            channel: position for position, channel in enumerate(self.__enabled_channels)
+        }
         for channel in range(self.num_channels):
-            if self.__mappings_enabled[channel]:
-                d.append(list(self.__acq_data[channel][0 : self.__samples_count]))
+            if channel in enabled_position:
+                position = enabled_position[channel]
+                d.append([row[position] for row in rows])  # type: ignore[index]
             else:
                 d.append([0.0])
 
-        self.__samples_count = 0
-        self.__samples_lost = False
-        self.__lock.release()
-
-        return t, d, self.__samples_lost
+        return t, d, samples_lost
 
     @property
     def servo(self) -> Servo:
@@ -2,9 +2,10 @@ import re
 import threading
 import time
 from abc import abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, replace
 from enum import Enum, auto
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 from xml.etree import ElementTree
 
 import ingenialogger
@@ -59,13 +60,15 @@ from ingenialink.exceptions import (
 from ingenialink.register import Register
 from ingenialink.table import Table
 from ingenialink.utils._utils import convert_bytes_to_dtype, convert_dtype_to_bytes, weak_lru
-from ingenialink.utils.event import create_event
+from ingenialink.utils.event import CallbackList, create_event
 from ingenialink.utils.timeout import Timeout
 
 logger = ingenialogger.get_logger(__name__)
 
 OPERATION_TIME_OUT = -3
 
+_StatusT = TypeVar("_StatusT")
+
 
 class RegisterAccessOperation(Enum):
     """Register operation."""
@@ -74,6 +77,62 @@ class RegisterAccessOperation(Enum):
     WRITE = auto()
 
 
+@dataclass(frozen=True)
+class StatusWaitConfig:
+    """Polling of the status word while waiting for a state or status word change.
+
+    The status word is read again after a polling interval that grows exponentially
+    up to a maximum. A status event (a state notified by the status listener, an
+    emergency message or received PDO data) ends the interval early.
+
+    Attributes:
+        initial_interval: Time between the first reads (s).
+        max_interval: Maximum time between reads (s).
+        backoff_factor: Factor applied to the interval after each read.
+    """
+
+    initial_interval: float = 0.001
+    max_interval: float = 0.05
+    backoff_factor: float = 2.0
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        Raises:
+            ValueError: If an interval is not positive or the maximum is lower than the
+                initial one.
+            ValueError: If the backoff factor is lower than 1.
+        """
+        if self.initial_interval <= 0 or self.max_interval < self.initial_interval:
+            raise ValueError(
+                "The intervals must be positive and the maximum can not be lower than the "
+                "initial one."
+            )
+        if self.backoff_factor < 1:
+            raise ValueError("The backoff factor can not be lower than 1.")
+
+
+@dataclass(frozen=True)
+class StatusWaitStatistics:
+    """Status word reads of the state and status word waits of a servo.
+
+    Attributes:
+        waits: Number of waits.
+        reads: Status word reads done by the waits.
+        reads_saved: Estimation of the reads avoided compared to reading the status word
+            continuously, from the duration of the reads and of the waits.
+    """
+
+    waits: int = 0
+    reads: int = 0
+    reads_saved: int = 0
+
+    @property
+    def reads_saved_per_wait(self) -> float:
+        """Average number of reads avoided in each wait."""
+        return self.reads_saved / self.waits if self.waits else 0.0
+
+
 class DictionaryFactory:
     """Dictionary factory.
 
@@ -215,15 +274,17 @@ class ServoStatusListener(threading.Thread):
 
     """
 
+    REFRESH_TIME_S = 1.5
+
     def __init__(self, servo: "Servo") -> None:
         super().__init__()
         self.__servo = servo
-        self.__stop = False
+        self.__stop = threading.Event()
 
     def run(self) -> None:
         """Checks if the drive is alive by reading the status word register."""
         previous_states: dict[int, ServoState] = {}
-        while not self.__stop:
+        while not self.__stop.is_set():
             for subnode in self.__servo.subnodes:
                 if self.__servo.subnodes[subnode] != SubnodeType.MOTION:
                     continue
@@ -234,11 +295,11 @@ class ServoStatusListener(threading.Thread):
                         self.__servo._notify_state(current_state, subnode)
                 except ILError as e:
                     logger.error("Error getting drive status. Exception : %s", e)
-            time.sleep(1.5)
+            self.__stop.wait(self.REFRESH_TIME_S)
 
     def stop(self) -> None:
         """Stops the loop that reads the status word register."""
-        self.__stop = True
+        self.__stop.set()
 
 
 class StoreRestoreManager:
@@ -465,18 +526,30 @@ class Servo:
         self.units_acc = None
         """ServoUnitsAcc: Acceleration units."""
         self._lock = threading.Lock()
-        self.__observers_servo_state: list[Callable[[ServoState, int], Any]] = []
+        self.status_wait_config = StatusWaitConfig()
+        """Polling of the status word in :meth:`state_wait_change` and
+        :meth:`status_word_wait_change`."""
+        self.__status_event = threading.Condition()
+        self.__status_events = 0
+        self.__status_wait_statistics = StatusWaitStatistics()
+        self.__observers_servo_state: CallbackList[Callable[[ServoState, int], Any]] = (
+            CallbackList()
+        )
         self.__listener_servo_status: Optional[ServoStatusListener] = None
+        self.__listener_lock = threading.Lock()
+        # The monitoring dictionaries are replaced, never modified, so that they can be
+        # read without a lock while another thread configures or reads the monitoring
+        self.__monitoring_lock = threading.Lock()
         self.__monitoring_data: dict[int, list[Union[int, float]]] = {}
         self.__monitoring_size: dict[int, int] = {}
         self.__monitoring_dtype: dict[int, RegDtype] = {}
         self.__disturbance_data = b""
         self.__disturbance_size: dict[int, int] = {}
         self.__disturbance_dtype: dict[int, str] = {}
-        self.__register_update_observers: list[
+        self.__register_update_observers: CallbackList[
             Callable[[Servo, Register, Union[int, float, str, bytes]], None]
-        ] = []
-        self.__register_update_complete_access_observers: list[
+        ] = CallbackList()
+        self.__register_update_complete_access_observers: CallbackList[
             Callable[
                 [
                     Servo,
@@ -486,7 +559,7 @@ class Servo:
                 ],
                 None,
             ]
-        ] = []
+        ] = CallbackList()
         # Event and publisher for disconnection events, emitted after the servo is disconnected
         self.disconnect_event, self._disconnect_event_publisher = create_event(Servo)  # type: ignore[type-abstract]
         if servo_status_listener:
@@ -503,19 +576,21 @@ class Servo:
 
     def start_status_listener(self) -> None:
         """Start listening for servo status events (ServoState)."""
-        if self.__listener_servo_status is not None:
-            return
-        self.__listener_servo_status = ServoStatusListener(self)
-        self.__listener_servo_status.start()
+        with self.__listener_lock:
+            if self.__listener_servo_status is not None:
+                return
+            self.__listener_servo_status = ServoStatusListener(self)
+            self.__listener_servo_status.start()
 
     def stop_status_listener(self) -> None:
         """Stop listening for servo status events (ServoState)."""
-        if self.__listener_servo_status is None:
-            return
-        if self.__listener_servo_status.is_alive():
-            self.__listener_servo_status.stop()
-            self.__listener_servo_status.join()
-        self.__listener_servo_status = None
+        with self.__listener_lock:
+            listener = self.__listener_servo_status
+            self.__listener_servo_status = None
+        # The listener is joined outside the lock, its callbacks may use the servo
+        if listener is not None and listener.is_alive():
+            listener.stop()
+            listener.join()
 
     def is_listener_started(self) -> bool:
         """Check if servo listener is started.
@@ -672,15 +747,15 @@ class Servo:
 
         if subnode == 0 and not xcf_instance.contains_node(subnode):
             raise ValueError(f"Cannot load {config_file} to subnode {subnode}")
+        registers_data: dict[Register, bytes] = {}
         for config_register in xcf_instance.registers:
             try:
                 target_register = self._get_reg(
                     config_register.uid, subnode=config_register.subnode
                 )
-                data = self._adapt_configuration_file_storage_value(
+                registers_data[target_register] = self._adapt_configuration_file_storage_value(
                     xcf_instance, config_register, target_register
                 )
-                self._write_raw(target_register, data)
             except ILError as e:  # noqa: PERF203
                 exception_message = (
                     f"Exception during load_configuration, register {config_register.uid}: {e}"
@@ -688,6 +763,16 @@ class Servo:
                 if strict:
                     raise ILError(exception_message)
                 logger.error(exception_message)
+        for target_register, error in self._write_raw_in_bulk(registers_data):
+            if error is None:
+                continue
+            exception_message = (
+                f"Exception during load_configuration, register {target_register.identifier}: "
+                f"{error}"
+            )
+            if strict:
+                raise ILError(exception_message)
+            logger.error(exception_message)
 
         for config_table in xcf_instance.tables:
             # Get table from dictionary
@@ -752,12 +837,18 @@ class Servo:
             firmware_version,
             node_id,
         )
-        for configuration_registers in self._registers_to_save_in_configuration_file(
-            subnode
-        ).values():
+        configuration_registers_per_subnode = self._registers_to_save_in_configuration_file(subnode)
+        bulk_values = self._read_in_bulk(
+            register
+            for configuration_registers in configuration_registers_per_subnode.values()
+            for register in configuration_registers
+        )
+        for configuration_registers in configuration_registers_per_subnode.values():
             for configuration_register in configuration_registers:
                 try:
-                    storage = self.read(configuration_register)
+                    storage = bulk_values.get(configuration_register)
+                    if storage is None:
+                        storage = self.read(configuration_register)
                     if isinstance(storage, bytes):
                         raise NotImplementedError("bytes data not supported")
                     configuration_register.storage = storage
@@ -1046,15 +1137,13 @@ class Servo:
             ILTimeoutError: If status word does not change in the given time.
 
         """
-        start_time = int(round(time.time() * 1000))
-        actual_status_word = self.read(self.STATUS_WORD_REGISTERS, subnode=subnode)
-
-        while actual_status_word == status_word:
-            current_time = int(round(time.time() * 1000))
-            time_diff = current_time - start_time
-            if time_diff > timeout:
-                raise ILTimeoutError
-            actual_status_word = self.read(self.STATUS_WORD_REGISTERS, subnode=subnode)
+        previous_status_word: Union[int, float, str, bytes] = status_word
+        self.__wait_status_change(
+            lambda: self.read(self.STATUS_WORD_REGISTERS, subnode=subnode),
+            previous_status_word,
+            timeout,
+            retry_timeouts=False,
+        )
 
     def state_wait_change(self, state: ServoState, timeout: int, subnode: int = 1) -> ServoState:
         """Waits for a state change.
@@ -1071,20 +1160,115 @@ class Servo:
             ILTimeoutError: If state does not change in the given time.
 
         """
-        start_time = int(round(time.time() * 1000))
-        actual_state = self.get_state(subnode)
+        return self.__wait_status_change(
+            lambda: self.get_state(subnode), state, timeout, retry_timeouts=True
+        )
 
-        while actual_state == state:
-            current_time = int(round(time.time() * 1000))
-            time_diff = current_time - start_time
-            if time_diff > timeout:
-                raise ILTimeoutError
-            try:
-                actual_state = self.get_state(subnode)
-            except ILTimeoutError:
-                continue
+    def __wait_status_change(
+        self,
+        read_status: Callable[[], _StatusT],
+        status: _StatusT,
+        timeout: int,
+        retry_timeouts: bool,
+    ) -> _StatusT:
+        """Read the status until it changes, following :attr:`status_wait_config`.
+
+        Args:
+            read_status: Function that reads the status.
+            status: Status before the change.
+            timeout: Maximum time to wait for the change, in milliseconds.
+            retry_timeouts: If True, the reads that time out are retried, except the first
+                one.
+
+        Returns:
+            The last read status.
+
+        Raises:
+            ILTimeoutError: If the status does not change in the given time.
+        """
+        config = self.status_wait_config
+        start_time = time.monotonic()
+        deadline = start_time + timeout / 1000
+        interval = config.initial_interval
+        reads = 0
+        read_time = 0.0
+        actual_status = status
+        try:
+            while True:
+                status_events = self.__status_events
+                read_start = time.monotonic()
+                try:
+                    reads += 1
+                    actual_status = read_status()
+                except ILTimeoutError:
+                    if not retry_timeouts or reads == 1:
+                        raise
+                finally:
+                    read_time += time.monotonic() - read_start
+                if actual_status != status:
+                    return actual_status
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ILTimeoutError
+                self.__wait_status_event(status_events, min(interval, remaining))
+                interval = min(interval * config.backoff_factor, config.max_interval)
+        finally:
+            self.__record_status_wait(reads, read_time, time.monotonic() - start_time)
+
+    def __wait_status_event(self, status_events: int, timeout: float) -> None:
+        """Wait until a status event is signaled.
+
+        Args:
+            status_events: Number of status events seen by the caller.
+            timeout: Maximum time to wait, in seconds.
+        """
+        with self.__status_event:
+            self.__status_event.wait_for(lambda: self.__status_events != status_events, timeout)
+
+    def __record_status_wait(self, reads: int, read_time: float, wait_time: float) -> None:
+        """Add a wait to the status wait statistics.
 
-        return actual_state
+        Args:
+            reads: Status reads done during the wait.
+            read_time: Time spent reading the status, in seconds.
+            wait_time: Duration of the wait, in seconds.
+        """
+        continuous_reads = int(wait_time * reads / read_time) if read_time > 0 else reads
+        reads_saved = max(continuous_reads - reads, 0)
+        with self.__status_event:
+            statistics = self.__status_wait_statistics
+            self.__status_wait_statistics = StatusWaitStatistics(
+                waits=statistics.waits + 1,
+                reads=statistics.reads + reads,
+                reads_saved=statistics.reads_saved + reads_saved,
+            )
+        logger.debug(
+            "Status wait of %.1f ms: %d status reads, %d reads saved",
+            wait_time * 1000,
+            reads,
+            reads_saved,
+        )
+
+    @property
+    def status_wait_statistics(self) -> StatusWaitStatistics:
+        """Status word reads of the state and status word waits."""
+        with self.__status_event:
+            return replace(self.__status_wait_statistics)
+
+    def reset_status_wait_statistics(self) -> None:
+        """Reset the status wait statistics."""
+        with self.__status_event:
+            self.__status_wait_statistics = StatusWaitStatistics()
+
+    def _signal_status_event(self) -> None:
+        """Signal that the status of the servo may have changed.
+
+        The state and status word waits read the status word without waiting for the
+        end of the polling interval.
+        """
+        with self.__status_event:
+            self.__status_events += 1
+            self.__status_event.notify_all()
 
     def get_state(self, subnode: int = 1) -> ServoState:
         """Get the current drive state.
@@ -1163,9 +1347,10 @@ class Servo:
         if register.monitoring is None:
             raise RuntimeError(f"Register {uid} is not monitoreable.")
 
-        self.__monitoring_data[channel] = []
-        self.__monitoring_dtype[channel] = register.dtype
-        self.__monitoring_size[channel] = size
+        with self.__monitoring_lock:
+            self.__monitoring_data = {**self.__monitoring_data, channel: []}
+            self.__monitoring_dtype = {**self.__monitoring_dtype, channel: register.dtype}
+            self.__monitoring_size = {**self.__monitoring_size, channel: size}
         data = self._monitoring_disturbance_data_to_map_register(
             register.monitoring.subnode, register.monitoring.address, register.dtype.value, size
         )
@@ -1201,9 +1386,10 @@ class Servo:
             self.write(self.MONITORING_NUMBER_MAPPED_REGISTERS, data=0, subnode=0)
         except ILAccessError:
             self.write(self.MONITORING_REMOVE_REGISTERS_OLD, data=1, subnode=0)
-        self.__monitoring_data = {}
-        self.__monitoring_size = {}
-        self.__monitoring_dtype = {}
+        with self.__monitoring_lock:
+            self.__monitoring_data = {}
+            self.__monitoring_size = {}
+            self.__monitoring_dtype = {}
 
     def monitoring_actual_number_bytes(self) -> int:
         """Get the number of monitoring bytes left to be read.
@@ -1215,7 +1401,7 @@ class Servo:
             return int(self.read(self.MONITORING_ACTUAL_NUMBER_BYTES, subnode=0))
         except ILRegisterNotFoundError:
             num_samples = int(self.read(self.MONITORING_ACTUAL_NUMBER_SAMPLES, subnode=0))
-            sample_size = sum(self.__monitoring_size[reg] for reg in self.__monitoring_size)
+            sample_size = sum(self.__monitoring_size.values())
             return num_samples * sample_size
 
     def monitoring_read_data(self) -> None:
@@ -1316,10 +1502,8 @@ class Servo:
         Args:
             callback: Callback function.
         """
-        if callback in self.__observers_servo_state:
+        if not self.__observers_servo_state.add(callback):
             logger.info("Callback already subscribed.")
-            return
-        self.__observers_servo_state.append(callback)
 
     def unsubscribe_from_status(self, callback: Callable[[ServoState, int], Any]) -> None:
         """Unsubscribe from state changes.
@@ -1328,10 +1512,8 @@ class Servo:
             callback: Callback function.
 
         """
-        if callback not in self.__observers_servo_state:
+        if not self.__observers_servo_state.discard(callback):
             logger.info("Callback not subscribed.")
-            return
-        self.__observers_servo_state.remove(callback)
 
     def is_alive(self, attemps: int = 1) -> bool:
         """Checks if the servo responds to a reading a register.
@@ -1404,6 +1586,7 @@ class Servo:
             subnode: Subnode of the drive.
 
         """
+        self._signal_status_event()
         for callback in self.__observers_servo_state:
             callback(state, subnode)
 
@@ -1482,21 +1665,27 @@ class Servo:
         bytes_per_block = self.monitoring_get_bytes_per_block()
         number_of_blocks = len(data_bytes) // bytes_per_block
         number_of_channels = self.monitoring_get_num_mapped_registers()
-        for channel in range(number_of_channels):
-            self.__monitoring_data[channel] = []
+        monitoring_size = self.__monitoring_size
+        monitoring_dtype = self.__monitoring_dtype
+        # The data is published when all the blocks are processed
+        channels_data: dict[int, list[Union[int, float]]] = {
+            channel: [] for channel in range(number_of_channels)
+        }
         for block in range(number_of_blocks):
             block_data = data_bytes[
                 block * bytes_per_block : block * bytes_per_block + bytes_per_block
             ]
             for channel in range(number_of_channels):
-                channel_data_size = self.__monitoring_size[channel]
+                channel_data_size = monitoring_size[channel]
                 val = convert_bytes_to_dtype(
-                    block_data[:channel_data_size], self.__monitoring_dtype[channel]
+                    block_data[:channel_data_size], monitoring_dtype[channel]
                 )
                 if not isinstance(val, (int, float)):
                     continue
-                self.__monitoring_data[channel].append(val)
+                channels_data[channel].append(val)
                 block_data = block_data[channel_data_size:]
+        with self.__monitoring_lock:
+            self.__monitoring_data = {**self.__monitoring_data, **channels_data}
 
     def __disturbance_map_register(self) -> str:
         """Get the first available Disturbance Mapped Register slot.
@@ -1607,6 +1796,62 @@ class Servo:
         self._notify_register_update(_reg, value)
         return value
 
+    def _read_raw_in_bulk(
+        self,
+        registers: Iterable[Register],  # noqa: ARG002
+    ) -> dict[Register, bytes]:
+        """Read several registers with fewer transfers than one per register.
+
+        Args:
+            registers: Registers to read.
+
+        Returns:
+            Raw data of the registers that could be read together. The registers that are
+            not in the result must be read one by one.
+        """
+        return {}
+
+    def _read_in_bulk(
+        self, registers: Iterable[Register]
+    ) -> dict[Register, Union[int, float, str, bytes]]:
+        """Read the values of several registers with fewer transfers than one per register.
+
+        Args:
+            registers: Registers to read.
+
+        Returns:
+            Value of the registers that could be read together. The registers that are
+            not in the result must be read one by one.
+        """
+        values: dict[Register, Union[int, float, str, bytes]] = {}
+        for register, data in self._read_raw_in_bulk(registers).items():
+            value = convert_bytes_to_dtype(data, register.dtype)
+            self._notify_register_update(register, value)
+            values[register] = value
+        return values
+
+    def _write_raw_in_bulk(
+        self, values: Mapping[Register, bytes]
+    ) -> Iterator[tuple[Register, Optional[ILError]]]:
+        """Write several registers with fewer transfers than one per register.
+
+        The registers are written in order and lazily, so that the caller can stop at the
+        first error.
+
+        Args:
+            values: Raw data to write to each register.
+
+        Yields:
+            Each register and the error writing it, None if it was written.
+        """
+        for register, data in values.items():
+            try:
+                self._write_raw(register, data)
+            except ILError as e:  # noqa: PERF203
+                yield register, e
+            else:
+                yield register, None
+
     def write_complete_access(
         self,
         reg: Union[str, CanopenRegister, EthercatRegister, CanOpenObject],
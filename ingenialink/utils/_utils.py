@@ -88,6 +88,9 @@ def weak_lru(
 ) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
     """Decorator that allows safe use of lru_cache in class methods.
 
+    The cache can be used from several threads. Threads that miss the cache at the same
+    time may call the method more than once, so it must be free of side effects.
+
     Args:
         maxsize: maximum size. Defaults to 128.
         typed: typed. Defaults to False.
@@ -1,4 +1,6 @@
 import logging
+import threading
+from collections.abc import Iterable, Iterator
 from typing import Any, Callable, Generic, TypeVar
 
 logger = logging.getLogger(__name__)
@@ -7,6 +9,108 @@ CallbackT = TypeVar("CallbackT", bound=Callable[..., Any])
 T = TypeVar("T")
 
 
+class CallbackList(Generic[CallbackT]):
+    """List of callbacks that can be notified while other threads modify it.
+
+    The callbacks are kept in an immutable tuple that is replaced, under a lock, each time
+    a callback is added or removed. Iterating the list uses the current tuple without
+    taking the lock, so the notifying thread never waits for a subscriber and never sees
+    a partially modified list, also in free-threaded Python builds.
+
+    Args:
+        callbacks: Initial callbacks.
+    """
+
+    def __init__(self, callbacks: Iterable[CallbackT] = ()) -> None:
+        self.__lock = threading.Lock()
+        self.__callbacks: tuple[CallbackT, ...] = tuple(callbacks)
+
+    def append(self, callback: CallbackT) -> None:
+        """Add a callback at the end of the list, even if it is already in it.
+
+        Args:
+            callback: Callback to add.
+        """
+        with self.__lock:
+            self.__callbacks = (*self.__callbacks, callback)
+
+    def add(self, callback: CallbackT) -> bool:
+        """Add a callback at the end of the list if it is not in it.
+
+        Args:
+            callback: Callback to add.
+
+        Returns:
+            True if the callback was added, False if it was already in the list.
+        """
+        with self.__lock:
+            if callback in self.__callbacks:
+                return False
+            self.__callbacks = (*self.__callbacks, callback)
+            return True
+
+    def remove(self, callback: CallbackT) -> None:
+        """Remove the first occurrence of a callback.
+
+        Args:
+            callback: Callback to remove.
+
+        Raises:
+            ValueError: If the callback is not in the list.
+        """
+        if not self.discard(callback):
+            raise ValueError(f"{callback} is not in the list.")
+
+    def discard(self, callback: CallbackT) -> bool:
+        """Remove the first occurrence of a callback, if it is in the list.
+
+        Args:
+            callback: Callback to remove.
+
+        Returns:
+            True if the callback was removed, False if it was not in the list.
+        """
+        with self.__lock:
+            callbacks = list(self.__callbacks)
+            if callback not in callbacks:
+                return False
+            callbacks.remove(callback)
+            self.__callbacks = tuple(callbacks)
+            return True
+
+    def clear(self) -> None:
+        """Remove all the callbacks."""
+        with self.__lock:
+            self.__callbacks = ()
+
+    def __iter__(self) -> Iterator[CallbackT]:
+        """Iterate the callbacks of the list when the iteration starts.
+
+        Returns:
+            Iterator over the callbacks.
+        """
+        return iter(self.__callbacks)
+
+    def __contains__(self, callback: object) -> bool:
+        """Check if a callback is in the list.
+
+        Args:
+            callback: Callback to look for.
+
+        Returns:
+            True if the callback is in the list.
+        """
+        return callback in self.__callbacks
+
+    def __len__(self) -> int:
+        """Number of callbacks in the list.
+
+        Returns:
+            Number of callbacks.
+        """
+        return len(self.__callbacks)
+
+
 class _Observers(Generic[CallbackT]):
     """Generic publish/subscribe manager.
 
@@ -17,7 +121,7 @@ class _Observers(Generic[CallbackT]):
         CallbackT: The callable type of the subscribers.
     """
 
-    def __init__(self, subscribers: list[CallbackT]) -> None:
+    def __init__(self, subscribers: CallbackList[CallbackT]) -> None:
         self.__subscribers = subscribers
 
     def subscribe(self, callback: CallbackT) -> None:
@@ -27,9 +131,7 @@ class _Observers(Generic[CallbackT]):
             callback: Callable to register. If it is already subscribed the
                 call is a no-op.
         """
-        if callback in self.__subscribers:
-            return
-        self.__subscribers.append(callback)
+        self.__subscribers.add(callback)
 
     def unsubscribe(self, callback: CallbackT) -> None:
         """Unsubscribe a previously registered callback.
@@ -38,15 +140,13 @@ class _Observers(Generic[CallbackT]):
             callback: Callable to remove. If it was not subscribed the call
                 is a no-op.
         """
-        if callback not in self.__subscribers:
-            return
-        self.__subscribers.remove(callback)
+        self.__subscribers.discard(callback)
 
 
 class _Publisher(Generic[CallbackT]):
     """Publisher for an event, linked to an Observers instance."""
 
-    def __init__(self, subscribers: list[CallbackT]) -> None:
+    def __init__(self, subscribers: CallbackList[CallbackT]) -> None:
         self.__subscribers = subscribers
 
     def notify(self, *args: object, **kwargs: object) -> None:
@@ -56,7 +156,7 @@ class _Publisher(Generic[CallbackT]):
             *args: Positional arguments forwarded to every callback.
             **kwargs: Keyword arguments forwarded to every callback.
         """
-        for callback in list(self.__subscribers):
+        for callback in self.__subscribers:
             try:
                 callback(*args, **kwargs)
             except Exception as e:  # noqa: PERF203
@@ -86,7 +186,7 @@ def create_event(
         publisher.notify(42)  # prints 42
     """
     _ = callback_type  # used only for typing
-    subscribers: list[Any] = []
+    subscribers: CallbackList[Any] = CallbackList()
     observers = _Observers(subscribers)
     publisher = _Publisher(subscribers)
     return observers, publisher
@@ -0,0 +1,78 @@
+import threading
+from collections import deque
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Mailbox(Generic[T]):
+    """Single-slot mailbox to hand over the latest value between two threads.
+
+    Posting a value replaces the previous one if it was not taken, so the producer
+    never waits for the consumer. The slot is a ``deque`` with a maximum length of one,
+    whose append and pop operations are atomic, so posting and taking a value do not
+    acquire any lock.
+
+    Each posted value is tagged with a sequence number. The consumer can compare the
+    sequence numbers of the taken values to know how many values were overwritten.
+    """
+
+    def __init__(self) -> None:
+        self.__slot: deque[tuple[int, T]] = deque(maxlen=1)
+        self.__sequence = 0
+        self.__posted = threading.Event()
+
+    def post(self, value: T) -> int:
+        """Post a value, replacing the previous one if it was not taken.
+
+        Only one thread can post values to a mailbox.
+
+        Args:
+            value: Value to post.
+
+        Returns:
+            Sequence number of the posted value.
+        """
+        self.__sequence += 1
+        self.__slot.append((self.__sequence, value))
+        self.__posted.set()
+        return self.__sequence
+
+    def take(self) -> Optional[tuple[int, T]]:
+        """Take the latest posted value, leaving the mailbox empty.
+
+        Returns:
+            Sequence number and value. None if the mailbox is empty.
+        """
+        try:
+            return self.__slot.popleft()
+        except IndexError:
+            return None
+
+    def peek(self) -> Optional[tuple[int, T]]:
+        """Get the latest posted value without taking it.
+
+        Returns:
+            Sequence number and value. None if the mailbox is empty.
+        """
+        try:
+            return self.__slot[-1]
+        except IndexError:
+            return None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until a value is posted.
+
+        Args:
+            timeout: Maximum time to wait, in seconds. If None, wait indefinitely.
+
+        Returns:
+            True if a value was posted since the last wait, False if the timeout expired.
+        """
+        posted = self.__posted.wait(timeout)
+        self.__posted.clear()
+        return posted
+
+    def clear(self) -> None:
+        """Discard the posted value."""
+        self.__slot.clear()
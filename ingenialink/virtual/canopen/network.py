@@ -1,6 +1,6 @@
 import socket
 import time
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict
 from threading import Thread
 from typing import Any, Callable, Optional, Union
 
@@ -12,6 +12,7 @@ from ingenialink.constants import DEFAULT_ETH_CONNECTION_TIMEOUT
 from ingenialink.exceptions import ILError
 from ingenialink.network import NetDevEvt, NetProt, NetState, SlaveInfo
 from ingenialink.servo import Servo
+from ingenialink.utils.event import CallbackList
 from ingenialink.virtual.base_network import VirtualNetworkBase
 from ingenialink.virtual.canopen.servo import VirtualCanopenServo
 
@@ -70,9 +71,9 @@ class VirtualCanopenNetwork(CanopenNetworkBase):
         super().__init__()
         self._virtual_base = VirtualNetworkBase()
         self.__listener_net_status: Optional[VirtualCanopenNetStatusListener] = None
-        self._observers_net_state: dict[Union[int, str], list[Callable[[NetDevEvt], None]]] = (
-            defaultdict(list)
-        )
+        self._observers_net_state: dict[
+            Union[int, str], CallbackList[Callable[[NetDevEvt], None]]
+        ] = {}
 
     def subscribe_to_status(
         self, target: Union[int, str], callback: Callable[[NetDevEvt], None]
@@ -84,10 +85,9 @@ class VirtualCanopenNetwork(CanopenNetworkBase):
             callback: Callback function to execute on state changes.
 
         """
-        if callback in self._observers_net_state[target]:
+        observers = self._observers_net_state.setdefault(target, CallbackList())
+        if not observers.add(callback):
             logger.info("Callback already subscribed.")
-            return
-        self._observers_net_state[target].append(callback)
 
     def unsubscribe_from_status(
         self, target: Union[int, str], callback: Callable[[NetDevEvt], None]
@@ -99,10 +99,9 @@ class VirtualCanopenNetwork(CanopenNetworkBase):
             callback: Callback function previously subscribed.
 
         """
-        if callback not in self._observers_net_state[target]:
+        observers = self._observers_net_state.get(target)
+        if observers is None or not observers.discard(callback):
             logger.info("Callback not subscribed.")
-            return
-        self._observers_net_state[target].remove(callback)
 
     def get_servo_state(self, servo_id: Union[int, str]) -> NetState:
         """Get the state of a servo in the network.
@@ -128,7 +127,7 @@ class VirtualCanopenNetwork(CanopenNetworkBase):
 
     def _notify_status(self, target: Union[int, str], status: NetDevEvt) -> None:
         """Notify subscribers of a network state change."""
-        for callback in self._observers_net_state[target]:
+        for callback in self._observers_net_state.get(target, ()):
             callback(status)
 
     @property
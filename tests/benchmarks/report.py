@@ -0,0 +1,89 @@
+import json
+import os
+import platform
+import sys
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+import ingenialink
+
+DEFAULT_OUTPUT_DIR = "tests/outputs"
+
+
+def summarize(values_s: Sequence[float]) -> dict[str, float]:
+    """Summarize a series of durations.
+
+    Args:
+        values_s: Durations in seconds.
+
+    Returns:
+        Mean, percentiles and maximum, in microseconds. Empty if there are no values.
+    """
+    if not values_s:
+        return {}
+    values_us = np.asarray(values_s) * 1_000_000
+    p50, p90, p99, p999 = np.percentile(values_us, [50, 90, 99, 99.9])
+    return {
+        "mean_us": float(values_us.mean()),
+        "p50_us": float(p50),
+        "p90_us": float(p90),
+        "p99_us": float(p99),
+        "p999_us": float(p999),
+        "max_us": float(values_us.max()),
+    }
+
+
+def summarize_counts(values: Sequence[float]) -> dict[str, float]:
+    """Summarize a series of counts, like the bytes allocated in each cycle.
+
+    Args:
+        values: Counts.
+
+    Returns:
+        Mean, percentiles and maximum. Empty if there are no values.
+    """
+    if not values:
+        return {}
+    array = np.asarray(values)
+    p50, p99 = np.percentile(array, [50, 99])
+    return {
+        "mean": float(array.mean()),
+        "p50": float(p50),
+        "p99": float(p99),
+        "max": float(array.max()),
+    }
+
+
+def write_report(name: str, results: Any) -> Path:
+    """Store the results of a benchmark as JSON, so they can be compared between releases.
+
+    The report is written to ``$TESTS_OUTPUT_DIR/benchmarks/<name>.json`` with the
+    versions of ingenialink and Python it was measured with.
+
+    Args:
+        name: Name of the benchmark.
+        results: JSON serializable results.
+
+    Returns:
+        Path of the report.
+    """
+    output_dir = Path(os.environ.get("TESTS_OUTPUT_DIR", DEFAULT_OUTPUT_DIR)) / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report = {
+        "benchmark": name,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "ingenialink": ingenialink.__version__,
+        "python": sys.version,
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    report_path = output_dir / f"{name}.json"
+    report_path.write_text(json.dumps(report, indent=2))
+    return report_path
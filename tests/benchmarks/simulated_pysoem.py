@@ -0,0 +1,383 @@
+"""Simulated pysoem master and slaves used by the benchmarks.
+
+The simulated pysoem calls last as long as the EtherCAT transfers they stand for. Like
+pysoem, they only release the GIL meanwhile if it is requested, so the effect of the
+GIL release configuration can be measured without an EtherCAT network.
+"""
+
+import contextlib
+import ctypes
+import ctypes.util
+import itertools
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Callable, Optional
+from unittest import mock
+
+import pysoem
+
+from ingenialink.ethercat.network import EthercatNetwork, GilReleaseConfig
+from ingenialink.ethercat.servo import EthercatServo
+from ingenialink.pdo import RPDOMap, TPDOMap
+
+RPDO_ASSIGN_INDEX = 0x1C12
+TPDO_ASSIGN_INDEX = 0x1C13
+# The working counter of a slave in SafeOp or Op is incremented by the read and the write
+WKC_PER_SLAVE = EthercatNetwork.EXPECTED_WKC_PROCESS_DATA
+
+
+@dataclass(frozen=True)
+class SimulatedLatency:
+    """Duration of the simulated EtherCAT transfers, in seconds.
+
+    Attributes:
+        sdo_transfer: Duration of an SDO read or write.
+        processdata: Round trip of the process data frame.
+        config_init: Duration of the slave enumeration.
+    """
+
+    sdo_transfer: float = 0.0005
+    processdata: float = 0.00005
+    config_init: float = 0.01
+
+
+def _load_sleep_holding_gil() -> Optional[Callable[[int], int]]:
+    """Load a C sleep function that is called without releasing the GIL.
+
+    Returns:
+        The ``usleep`` function of the C library, None if it is not available.
+    """
+    library = ctypes.util.find_library("c")
+    if library is None:
+        return None
+    try:
+        usleep = ctypes.PyDLL(library).usleep
+    except (OSError, AttributeError):
+        return None
+    usleep.argtypes = [ctypes.c_uint]
+    return usleep  # type: ignore[no-any-return]
+
+
+_sleep_holding_gil = _load_sleep_holding_gil()
+
+
+def simulate_transfer(duration: float, release_gil: bool) -> None:
+    """Block the calling thread as a pysoem call that waits for a frame.
+
+    Args:
+        duration: Duration of the transfer in seconds.
+        release_gil: True to release the GIL during the transfer.
+    """
+    if duration <= 0:
+        return
+    if release_gil:
+        time.sleep(duration)
+    elif _sleep_holding_gil is not None:
+        _sleep_holding_gil(int(duration * 1_000_000))
+    else:
+        # Without the GIL being requested, the interpreter does not switch threads
+        end = time.perf_counter() + duration
+        while time.perf_counter() < end:
+            pass
+
+
+class SimulatedSlave:
+    """Simulated pysoem slave.
+
+    The object dictionary only keeps the written values. The size of the process data
+    is computed from the PDO maps and the PDO assignment written to it.
+
+    Args:
+        master: Master the slave belongs to.
+        slave_id: Position of the slave in the network, starting at 1.
+    """
+
+    def __init__(self, master: "SimulatedMaster", slave_id: int) -> None:
+        self.__master = master
+        self.id = slave_id
+        self.man = 0x0000029C
+        self.rev = 0x00020000
+        self.name = f"Simulated slave {slave_id}"
+        self.state = pysoem.INIT_STATE
+        self.al_status = 0
+        self.config_func: Optional[Callable[[int], None]] = None
+        self._emcy_callbacks: list[Callable[[object], None]] = []
+        self.object_dictionary: dict[tuple[int, int], bytes] = {}
+        self.__watchdogs: dict[str, float] = {}
+        self.__inputs: Iterator[bytes] = itertools.repeat(b"")
+        self.__input = b""
+        self.__output = b""
+
+    def add_emergency_callback(self, callback: Callable[[object], None]) -> None:
+        self._emcy_callbacks.append(callback)
+
+    def write_state(self) -> None:
+        pass
+
+    def state_check(self, expected_state: int, timeout: int = 50000) -> int:  # noqa: ARG002
+        return self.state
+
+    def recover(self, timeout: int = 50000) -> int:  # noqa: ARG002
+        return 1
+
+    def reconfig(self, timeout: int = 50000) -> int:  # noqa: ARG002
+        self.state = pysoem.PREOP_STATE
+        return self.state
+
+    def set_watchdog(self, wd_type: str, wd_time_ms: float) -> None:
+        self.__watchdogs[wd_type] = wd_time_ms
+
+    def get_watchdog(self, wd_type: str) -> float:
+        return self.__watchdogs.get(wd_type, 100.0)
+
+    def get_max_watchdog_time(self) -> float:
+        return 6553.5
+
+    @staticmethod
+    def __entry_size(index: int) -> int:
+        """Size of the subindexes of an object, except subindex 0.
+
+        Args:
+            index: Index of the object.
+
+        Returns:
+            Size in bytes. The PDO assign objects hold map indexes, the other objects
+            hold PDO mapping entries.
+        """
+        return 2 if index in (RPDO_ASSIGN_INDEX, TPDO_ASSIGN_INDEX) else 4
+
+    def sdo_read(
+        self,
+        index: int,
+        subindex: int,
+        size: int = 0,
+        ca: bool = False,
+        *,
+        release_gil: Optional[bool] = None,
+    ) -> bytes:
+        self.__transfer(release_gil)
+        if not ca:
+            return self.object_dictionary.get((index, subindex), bytes(size or 8))
+        data = bytearray()
+        for entry in itertools.count(subindex):
+            if (index, entry) not in self.object_dictionary:
+                break
+            data += self.object_dictionary[index, entry] + (b"\x00" if entry == 0 else b"")
+        return bytes(data)
+
+    def sdo_write(
+        self,
+        index: int,
+        subindex: int,
+        data: bytes,
+        ca: bool = False,
+        *,
+        release_gil: Optional[bool] = None,
+    ) -> None:
+        self.__transfer(release_gil)
+        if not ca:
+            self.object_dictionary[index, subindex] = bytes(data)
+            return
+        offset = 0
+        for entry in itertools.count(subindex):
+            if offset >= len(data):
+                break
+            # Subindex 0 is followed by 8 padding bits
+            size = 1 if entry == 0 else self.__entry_size(index)
+            self.object_dictionary[index, entry] = bytes(data[offset : offset + size])
+            offset += size + (1 if entry == 0 else 0)
+
+    def __transfer(self, release_gil: Optional[bool]) -> None:
+        simulate_transfer(
+            self.__master.latency.sdo_transfer,
+            self.__master.always_release_gil if release_gil is None else release_gil,
+        )
+
+    def __assigned_bytes(self, assign_index: int) -> int:
+        """Size of the PDOs assigned to a sync manager.
+
+        Args:
+            assign_index: Index of the PDO assign object.
+
+        Returns:
+            Size of the process data in bytes.
+        """
+        bits = 0
+        maps = self.object_dictionary.get((assign_index, 0), b"\x00")[0]
+        for assign_subindex in range(1, maps + 1):
+            map_index = int.from_bytes(
+                self.object_dictionary[assign_index, assign_subindex], "little"
+            )
+            items = self.object_dictionary.get((map_index, 0), b"\x00")[0]
+            for map_subindex in range(1, items + 1):
+                bits += self.object_dictionary[map_index, map_subindex][0]
+        return (bits + 7) // 8
+
+    def _config_map(self) -> None:
+        """Size the process data, as pysoem does when the IO map is configured."""
+        if self.config_func is not None:
+            self.config_func(self.id)
+        input_size = self.__assigned_bytes(TPDO_ASSIGN_INDEX)
+        # The inputs change in every cycle, so that all the TPDO items are decoded
+        self.__inputs = itertools.cycle([bytes(input_size), bytes(range(input_size % 256))])
+        self.__input = bytes(input_size)
+        self.__output = bytes(self.__assigned_bytes(RPDO_ASSIGN_INDEX))
+
+    def _exchange(self) -> int:
+        """Exchange the process data of a cycle.
+
+        Returns:
+            Working counter of the slave.
+        """
+        if self.state not in (pysoem.SAFEOP_STATE, pysoem.OP_STATE):
+            return 0
+        self.__input = next(self.__inputs)
+        return WKC_PER_SLAVE
+
+    @property
+    def input(self) -> bytes:
+        return self.__input
+
+    @property
+    def output(self) -> bytes:
+        return self.__output
+
+    @output.setter
+    def output(self, data: bytes) -> None:
+        if len(data) != len(self.__output):
+            raise AttributeError(f"Wrong output size {len(data)}, expected {len(self.__output)}")
+        self.__output = bytes(data)
+
+
+class SimulatedMaster:
+    """Simulated pysoem master.
+
+    Args:
+        num_slaves: Number of slaves found when the network is initialized.
+        latency: Duration of the simulated transfers.
+    """
+
+    def __init__(self, num_slaves: int, latency: SimulatedLatency) -> None:
+        self.num_slaves = num_slaves
+        self.latency = latency
+        self.slaves: list[SimulatedSlave] = []
+        self.state = pysoem.INIT_STATE
+        self.always_release_gil = False
+        self.manual_state_change = 0
+        self.sdo_read_timeout = 0
+        self.sdo_write_timeout = 0
+        self.expected_wkc = 0
+        self.__wkc = 0
+
+    def open(self, ifname: str, ifname_red: Optional[str] = None) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __release_gil(self, release_gil: Optional[bool]) -> bool:
+        return self.always_release_gil if release_gil is None else release_gil
+
+    def config_init(self, usetable: bool = False, *, release_gil: Optional[bool] = None) -> int:  # noqa: ARG002
+        simulate_transfer(self.latency.config_init, self.__release_gil(release_gil))
+        # As in pysoem, the slaves are new objects after each initialization. The slaves
+        # keep the values of their object dictionaries.
+        object_dictionaries = {slave.id: slave.object_dictionary for slave in self.slaves}
+        self.slaves = [SimulatedSlave(self, slave_id) for slave_id in range(1, self.num_slaves + 1)]
+        for slave in self.slaves:
+            slave.object_dictionary = object_dictionaries.get(slave.id, {})
+        return self.num_slaves
+
+    def config_map(self) -> int:
+        for slave in self.slaves:
+            slave._config_map()
+        self.expected_wkc = WKC_PER_SLAVE * len(self.slaves)
+        return sum(len(slave.input) + len(slave.output) for slave in self.slaves)
+
+    def config_overlap_map(self) -> int:
+        return self.config_map()
+
+    def read_state(self) -> int:
+        return min((slave.state for slave in self.slaves), default=pysoem.NONE_STATE)
+
+    def write_state(self) -> None:
+        # Broadcast the state of the master to all the slaves
+        for slave in self.slaves:
+            slave.state = self.state
+
+    def state_check(self, expected_state: int, timeout: int = 50000) -> int:  # noqa: ARG002
+        return self.read_state()
+
+    def send_processdata(self, *, release_gil: Optional[bool] = None) -> None:  # noqa: ARG002
+        self.__wkc = sum(slave._exchange() for slave in self.slaves)
+
+    def send_overlap_processdata(self, *, release_gil: Optional[bool] = None) -> None:
+        self.send_processdata(release_gil=release_gil)
+
+    def receive_processdata(
+        self,
+        timeout: int = 2000,  # noqa: ARG002
+        *,
+        release_gil: Optional[bool] = None,
+    ) -> int:
+        simulate_transfer(self.latency.processdata, self.__release_gil(release_gil))
+        return self.__wkc
+
+
+@contextlib.contextmanager
+def simulated_network(
+    dictionary: str,
+    num_slaves: int = 1,
+    latency: SimulatedLatency = SimulatedLatency(),
+    gil_release_config: GilReleaseConfig = GilReleaseConfig(),
+) -> Iterator[tuple[EthercatNetwork, list[EthercatServo]]]:
+    """Network of simulated slaves, all of them connected.
+
+    Args:
+        dictionary: Dictionary of the slaves.
+        num_slaves: Number of slaves.
+        latency: Duration of the simulated transfers.
+        gil_release_config: GIL release configuration of the network.
+
+    Yields:
+        The network and its servos.
+    """
+    with mock.patch("pysoem.Master", lambda: SimulatedMaster(num_slaves, latency)):
+        net = EthercatNetwork("simulated", gil_release_config=gil_release_config)
+    try:
+        servos = [
+            net.connect_to_slave(slave_id, dictionary) for slave_id in range(1, num_slaves + 1)
+        ]
+        yield net, servos
+    finally:
+        if net.pdo_manager.is_active:
+            net.pdo_manager.stop_pdos()
+        net.close_ecat_master()
+
+
+def map_pdos(
+    servo: EthercatServo, rpdo_uids: Sequence[str], tpdo_uids: Sequence[str]
+) -> tuple[RPDOMap, TPDOMap]:
+    """Map an RPDO and a TPDO with registers of the first subnode to a servo.
+
+    The RPDO items are set to 0, so that the PDOs can be exchanged right away.
+
+    Args:
+        servo: Servo.
+        rpdo_uids: Registers of the RPDO map.
+        tpdo_uids: Registers of the TPDO map.
+
+    Returns:
+        The RPDO and TPDO maps.
+    """
+    rpdo_map = RPDOMap()
+    tpdo_map = TPDOMap()
+    for uid in rpdo_uids:
+        rpdo_map.add_registers(servo.dictionary.registers(1)[uid])
+    for uid in tpdo_uids:
+        tpdo_map.add_registers(servo.dictionary.registers(1)[uid])
+    for item in rpdo_map.items:
+        item.value = 0
+    servo.set_pdo_map_to_slave([rpdo_map], [tpdo_map])
+    return rpdo_map, tpdo_map
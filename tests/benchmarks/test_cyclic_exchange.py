@@ -0,0 +1,198 @@
+import threading
+import time
+import tracemalloc
+from typing import Any
+
+import numpy as np
+import pytest
+
+import tests.resources
+from ingenialink.pdo_network_manager import PDONetworkManager
+from tests.benchmarks.report import summarize, summarize_counts, write_report
+from tests.benchmarks.simulated_pysoem import SimulatedLatency, map_pdos, simulated_network
+
+NUM_SLAVES = [1, 8, 64]
+REFRESH_RATES_S = {"1kHz": 0.001, "4kHz": 0.00025}
+MEASUREMENT_TIME_S = 1.0
+ALLOCATION_CYCLES = 200
+WARM_UP_CYCLES = 50
+
+# Cyclic synchronous position/velocity/torque maps of a CiA 402 drive
+RPDO_REGISTERS = [
+    "DS402_DRV_STATE_CONTROL",
+    "DS402_DRV_OP_CMD",
+    "DS402_CL_POS_SET_POINTVALUE",
+    "DS402_CL_VEL_SET_POINTVALUE",
+    "DS402_CL_TOR_SET_POINT_VALUE",
+    "DS402_CL_VEL_CMD_OFFSET",
+    "DS402_CL_TOR_CMD_OFFSET",
+    "IO_OUT_SET_POINT",
+]
+TPDO_REGISTERS = [
+    "DS402_DRV_STATE_STATUS",
+    "DS402_DRV_OP_VALUE",
+    "DS402_CL_POS_FBK_VALUE",
+    "DS402_CL_VEL_FBK_VALUE",
+    "DS402_CL_TOR_FBK_VALUE",
+    "DS402_CL_POS_ERROR_FOLLOWING",
+    "DS402_DRV_DIAG_ERROR_LAST",
+    "IO_IN_VALUE",
+]
+
+# The SDO transfers only configure the network, they are not measured
+LATENCY = SimulatedLatency(sdo_transfer=0.0, processdata=0.00005, config_init=0.0)
+
+
+class _CycleProbe:
+    """Measure the work of the PDO thread in each cycle.
+
+    The send callbacks run at the start of the cycle and the receive callbacks once the
+    received process data has been processed, so the probe measures the RPDO encoding,
+    the exchange and the TPDO decoding of all the slaves. The memory allocated by the
+    simulated master, which stands for the copies pysoem makes of the process image, is
+    included.
+
+    Args:
+        cycles: Number of cycles to measure.
+        trace_allocations: True to measure the memory allocated in each cycle. Requires
+            tracemalloc to be tracing.
+    """
+
+    def __init__(self, cycles: int, trace_allocations: bool = False) -> None:
+        self.__trace_allocations = trace_allocations
+        # Preallocated, so that the probe does not allocate memory in the cycle
+        self.cpu_time = np.zeros(cycles)
+        self.allocated_bytes = np.zeros(cycles, dtype=np.int64)
+        self.cycles = 0
+        self.done = threading.Event()
+        self.__cycle_cpu_start = 0.0
+        self.__cycle_memory_start = 0
+
+    def on_send(self) -> None:
+        if self.__trace_allocations:
+            self.__cycle_memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self.__cycle_cpu_start = time.thread_time()
+
+    def on_receive(self) -> None:
+        cpu_time = time.thread_time() - self.__cycle_cpu_start
+        if self.cycles >= len(self.cpu_time):
+            self.done.set()
+            return
+        self.cpu_time[self.cycles] = cpu_time
+        if self.__trace_allocations:
+            self.allocated_bytes[self.cycles] = (
+                tracemalloc.get_traced_memory()[1] - self.__cycle_memory_start
+            )
+        self.cycles += 1
+
+
+def _run_cycles(net, refresh_rate: float, probe: _CycleProbe, timeout: float) -> None:
+    """Run the PDO exchange until the probe has measured all its cycles.
+
+    Args:
+        net: Network.
+        refresh_rate: PDO refresh rate in seconds.
+        probe: Probe of the cycles.
+        timeout: Maximum time to wait for the cycles, in seconds.
+    """
+    pdo_manager = net.pdo_manager
+    pdo_manager.subscribe_to_send_process_data(probe.on_send)
+    pdo_manager.subscribe_to_receive_process_data(probe.on_receive)
+    try:
+        pdo_manager.start_pdos(refresh_rate)
+        probe.done.wait(timeout)
+    finally:
+        pdo_manager.stop_pdos()
+        pdo_manager.unsubscribe_to_send_process_data(probe.on_send)
+        pdo_manager.unsubscribe_to_receive_process_data(probe.on_receive)
+
+
+def _measure(net, refresh_rate: float) -> dict[str, Any]:
+    """Measure the cyclic exchange of the network at a refresh rate.
+
+    The CPU time and the jitter are measured first. The allocations are measured in a
+    second run, because tracing them slows down the cycles.
+
+    Args:
+        net: Network with the PDOs mapped.
+        refresh_rate: PDO refresh rate in seconds.
+
+    Returns:
+        CPU time, allocated memory and jitter of the cycles.
+    """
+    cycles = int(MEASUREMENT_TIME_S / refresh_rate)
+    timeout = 10 * MEASUREMENT_TIME_S
+    net.pdo_manager.enable_statistics(ring_buffer_size=WARM_UP_CYCLES + cycles)
+    timing_probe = _CycleProbe(WARM_UP_CYCLES + cycles)
+    _run_cycles(net, refresh_rate, timing_probe, timeout)
+    statistics = net.pdo_manager.statistics()
+    net.pdo_manager.disable_statistics()
+
+    allocation_probe = _CycleProbe(WARM_UP_CYCLES + ALLOCATION_CYCLES, trace_allocations=True)
+    tracemalloc.start()
+    try:
+        _run_cycles(net, refresh_rate, allocation_probe, timeout)
+    finally:
+        tracemalloc.stop()
+
+    cpu_time = timing_probe.cpu_time[WARM_UP_CYCLES : timing_probe.cycles]
+    allocated_bytes = allocation_probe.allocated_bytes[WARM_UP_CYCLES : allocation_probe.cycles]
+    return {
+        "cycles": statistics.cycles,
+        "overruns": statistics.overruns,
+        "cpu_time_per_cycle": summarize(cpu_time.tolist()),
+        "cpu_load": float(cpu_time.mean() / refresh_rate) if len(cpu_time) else None,
+        "allocated_bytes_per_cycle": summarize_counts(allocated_bytes.tolist()),
+        "jitter": {
+            "mean_us": statistics.jitter.mean * 1_000_000,
+            "p50_us": statistics.jitter.p50 * 1_000_000,
+            "p90_us": statistics.jitter.p90 * 1_000_000,
+            "p99_us": statistics.jitter.p99 * 1_000_000,
+            "p999_us": statistics.jitter.p999 * 1_000_000,
+            "max_us": statistics.jitter.max * 1_000_000,
+        },
+        "send_receive_time": {
+            "p50_us": statistics.send_receive_time.p50 * 1_000_000,
+            "p99_us": statistics.send_receive_time.p99 * 1_000_000,
+            "max_us": statistics.send_receive_time.max * 1_000_000,
+        },
+    }
+
+
+@pytest.fixture(scope="module", params=NUM_SLAVES, ids=lambda num_slaves: f"{num_slaves}_slaves")
+def mapped_network(request):
+    with simulated_network(
+        tests.resources.DEN_NET_E_2_8_0_xdf_v3, num_slaves=request.param, latency=LATENCY
+    ) as (net, servos):
+        for servo in servos:
+            map_pdos(servo, RPDO_REGISTERS, TPDO_REGISTERS)
+        yield net, servos
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("rate_name", REFRESH_RATES_S)
+def test_cyclic_exchange(mapped_network, rate_name, mocker):
+    net, servos = mapped_network
+    refresh_rate = REFRESH_RATES_S[rate_name]
+    # Measure if the exchange could keep up with refresh rates above the supported ones
+    mocker.patch.object(
+        PDONetworkManager.ProcessDataThread, "MINIMUM_PDO_REFRESH_TIME", refresh_rate
+    )
+
+    result = _measure(net, refresh_rate)
+    write_report(
+        f"cyclic_exchange_{len(servos)}_slaves_{rate_name}",
+        {
+            "num_slaves": len(servos),
+            "refresh_rate_s": refresh_rate,
+            "rpdo_registers": RPDO_REGISTERS,
+            "tpdo_registers": TPDO_REGISTERS,
+            "simulated_processdata_latency_s": LATENCY.processdata,
+            **result,
+        },
+    )
+
+    assert result["cycles"] > 0
+    assert result["cpu_time_per_cycle"]
+    assert result["allocated_bytes_per_cycle"]
@@ -0,0 +1,152 @@
+import threading
+import time
+from dataclasses import asdict
+from typing import Any
+
+import pytest
+
+import tests.resources
+from ingenialink.ethercat.network import GilReleaseConfig, GilWorkloadProfile
+from tests.benchmarks.report import summarize, write_report
+from tests.benchmarks.simulated_pysoem import map_pdos, simulated_network
+
+MEASUREMENT_TIME_S = 1.0
+PDO_WARM_UP_TIME_S = 0.1
+# Period of the thread whose wake-up latency measures the responsiveness
+PROBE_PERIOD_S = 0.001
+PYTHON_WORK_ITERATION = 1000
+
+SDO_REGISTER = "DRV_OP_CMD"
+RPDO_REGISTERS = ["CL_POS_SET_POINT_VALUE", "CL_VEL_SET_POINT_VALUE", "DRV_STATE_CONTROL"]
+TPDO_REGISTERS = ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE", "DRV_STATE_STATUS", "CL_CUR_Q_VALUE"]
+
+PROFILES = {
+    "sdo_threads": GilWorkloadProfile(sdo_threads=4),
+    "sdo_and_python": GilWorkloadProfile(sdo_threads=1, python_threads=1),
+    "pdo_and_sdo": GilWorkloadProfile(sdo_threads=1, pdo_refresh_rate=0.001),
+    "pdo_and_python": GilWorkloadProfile(sdo_threads=0, pdo_refresh_rate=0.001, python_threads=1),
+}
+
+CANDIDATE_CONFIGS = {
+    "default": GilReleaseConfig(),
+    "always": GilReleaseConfig.always(),
+    "sdo_read_write": GilReleaseConfig(sdo_read_write=True),
+    "send_receive_processdata": GilReleaseConfig(send_receive_processdata=True),
+}
+
+
+def _measure(profile: GilWorkloadProfile, gil_release_config: GilReleaseConfig) -> dict[str, Any]:
+    """Run the threads of a workload profile and measure how they perform.
+
+    Each SDO thread reads a register of its own slave in a loop, each Python thread
+    runs pure Python code and a probe thread measures how late it wakes up from a sleep.
+
+    Args:
+        profile: Threads of the workload.
+        gil_release_config: GIL release configuration of the network.
+
+    Returns:
+        SDO throughput, Python throughput, wake-up latency of the probe thread and
+        jitter of the PDO cycles.
+    """
+    with simulated_network(
+        tests.resources.DEN_NET_E_2_8_0_xdf_v3,
+        num_slaves=max(profile.sdo_threads, 1),
+        gil_release_config=gil_release_config,
+    ) as (net, servos):
+        if profile.pdo_refresh_rate is not None:
+            for servo in servos:
+                map_pdos(servo, RPDO_REGISTERS, TPDO_REGISTERS)
+            net.pdo_manager.enable_statistics()
+            net.pdo_manager.start_pdos(profile.pdo_refresh_rate)
+            time.sleep(PDO_WARM_UP_TIME_S)
+            net.pdo_manager.reset_statistics()
+
+        stop = threading.Event()
+        sdo_transfers = [0] * profile.sdo_threads
+        python_iterations = [0] * profile.python_threads
+        wake_up_latencies: list[float] = []
+
+        def do_sdo_transfers(index: int) -> None:
+            while not stop.is_set():
+                servos[index].read(SDO_REGISTER)
+                sdo_transfers[index] += 1
+
+        def run_python_code(index: int) -> None:
+            while not stop.is_set():
+                sum(range(PYTHON_WORK_ITERATION))
+                python_iterations[index] += 1
+
+        def probe_wake_up_latency() -> None:
+            while not stop.is_set():
+                start = time.perf_counter()
+                time.sleep(PROBE_PERIOD_S)
+                wake_up_latencies.append(time.perf_counter() - start - PROBE_PERIOD_S)
+
+        threads = [
+            *(
+                threading.Thread(target=do_sdo_transfers, args=(i,))
+                for i in range(profile.sdo_threads)
+            ),
+            *(
+                threading.Thread(target=run_python_code, args=(i,))
+                for i in range(profile.python_threads)
+            ),
+            threading.Thread(target=probe_wake_up_latency),
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(MEASUREMENT_TIME_S)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        result: dict[str, Any] = {
+            "sdo_transfers_per_s": sum(sdo_transfers) / MEASUREMENT_TIME_S,
+            "python_iterations_per_s": sum(python_iterations) / MEASUREMENT_TIME_S,
+            "wake_up_latency": summarize(wake_up_latencies),
+        }
+        if profile.pdo_refresh_rate is not None:
+            statistics = net.pdo_manager.statistics()
+            result["pdo_cycles"] = statistics.cycles
+            result["pdo_overruns"] = statistics.overruns
+            result["pdo_jitter"] = {
+                "p50_us": statistics.jitter.p50 * 1_000_000,
+                "p99_us": statistics.jitter.p99 * 1_000_000,
+                "max_us": statistics.jitter.max * 1_000_000,
+            }
+        return result
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("profile_name", PROFILES)
+def test_gil_release_config(profile_name):
+    profile = PROFILES[profile_name]
+    recommended = GilReleaseConfig.for_workload(profile)
+    configs = {**CANDIDATE_CONFIGS, "recommended": recommended}
+
+    results = {name: _measure(profile, config) for name, config in configs.items()}
+    write_report(
+        f"gil_release_{profile_name}",
+        {
+            "profile": asdict(profile),
+            "recommended": asdict(recommended),
+            "configs": {
+                name: {"config": asdict(configs[name]), **result}
+                for name, result in results.items()
+            },
+        },
+    )
+
+    for result in results.values():
+        assert result["wake_up_latency"]
+        if profile.sdo_threads:
+            assert result["sdo_transfers_per_s"] > 0
+        if profile.pdo_refresh_rate is not None:
+            assert result["pdo_cycles"] > 0
+    if profile.sdo_threads > 1:
+        # Holding the GIL serializes the SDO transfers of the different slaves
+        assert (
+            results["recommended"]["sdo_transfers_per_s"]
+            > 2 * results["default"]["sdo_transfers_per_s"]
+        )
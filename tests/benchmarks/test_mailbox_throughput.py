@@ -0,0 +1,60 @@
+import time
+from typing import Optional
+
+import pytest
+
+import tests.resources
+from tests.benchmarks.report import write_report
+from tests.benchmarks.simulated_pysoem import SimulatedLatency, simulated_network
+
+NUM_SLAVES = [1, 4, 8, 16]
+REGISTERS = ["DRV_STATE_STATUS", "CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE", "DRV_OP_CMD"]
+READS_PER_MEASUREMENT = 5
+
+LATENCY = SimulatedLatency(sdo_transfer=0.001, processdata=0.0, config_init=0.0)
+
+
+def _measure_read_many(net, max_workers: Optional[int]) -> float:
+    """Measure the SDO reads per second of ``read_many()``.
+
+    Args:
+        net: Network.
+        max_workers: maximum number of servos read at the same time.
+
+    Returns:
+        Register reads per second, of all the servos.
+    """
+    start_time = time.perf_counter()
+    for _ in range(READS_PER_MEASUREMENT):
+        net.read_many(REGISTERS, max_workers=max_workers)
+    elapsed_time = time.perf_counter() - start_time
+    return READS_PER_MEASUREMENT * len(REGISTERS) * len(net.servos) / elapsed_time
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_slaves", NUM_SLAVES)
+def test_read_many_throughput(num_slaves):
+    with simulated_network(
+        tests.resources.DEN_NET_E_2_8_0_xdf_v3, num_slaves=num_slaves, latency=LATENCY
+    ) as (net, _):
+        sequential = _measure_read_many(net, max_workers=1)
+        concurrent = _measure_read_many(net, max_workers=None)
+        max_workers = net.MAX_CONCURRENT_MAILBOX_TRANSFERS
+
+    write_report(
+        f"read_many_{num_slaves}_slaves",
+        {
+            "num_slaves": num_slaves,
+            "registers": REGISTERS,
+            "simulated_sdo_transfer_s": LATENCY.sdo_transfer,
+            "max_workers": max_workers,
+            "sequential_reads_per_s": sequential,
+            "concurrent_reads_per_s": concurrent,
+            "speedup": concurrent / sequential,
+        },
+    )
+
+    assert sequential > 0
+    if num_slaves > 1:
+        # Only a sanity bound, the speedup depends on the load of the machine
+        assert concurrent > sequential
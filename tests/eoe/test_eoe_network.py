@@ -1,10 +1,12 @@
 import socket
+import threading
 
 import pytest
 
 from ingenialink.eoe.network import EoECommand, EoENetwork
 from ingenialink.ethernet.network import NetProt
 from ingenialink.ethernet.servo import EthernetServo
+from ingenialink.exceptions import ILError
 
 
 @pytest.mark.eoe
@@ -80,3 +82,78 @@ def test_eoe_command_msg(cmd, data):
     assert len(msg) == EoENetwork.EOE_MSG_FRAME_SIZE
     assert int.from_bytes(cmd_field, "little") == cmd.value
     assert data_field == data_bytes + data_filling
+
+
+@pytest.fixture
+def eoe_service_net(mocker):
+    commands = []
+
+    def send_command(net, msg):
+        command = EoECommand(int.from_bytes(msg[: EoENetwork.EOE_MSG_CMD_SIZE], "little"))
+        commands.append(command)
+        if command == EoECommand.GET_STATUS and getattr(net, "_eoe_service_started", False):
+            return EoENetwork.STATUS_INIT_BIT | EoENetwork.STATUS_EOE_BIT
+        return 0
+
+    mocker.patch.object(EoENetwork, "_send_command", autospec=True, side_effect=send_command)
+    net = EoENetwork("dummy_ifname")
+    return net, commands
+
+
+def test_eoe_connect_to_slaves_configures_the_service_once(eoe_service_net, mocker):
+    net, commands = eoe_service_net
+    slaves = [(slave_id, f"192.168.3.{20 + slave_id}", "dummy.xdf") for slave_id in (1, 2, 3)]
+    # The connections are opened in parallel
+    barrier = threading.Barrier(len(slaves), timeout=5)
+
+    def open_servo(ip_address, *_):
+        barrier.wait()
+        servo = mocker.MagicMock()
+        servo.ip_address = ip_address
+        return servo
+
+    mocker.patch.object(net, "_open_servo", side_effect=open_servo)
+    servos = net.connect_to_slaves(slaves)
+
+    assert [servo.ip_address for servo in servos] == [ip for _, ip, _ in slaves]
+    assert net.servos == servos
+    assert commands.count(EoECommand.EOE_START) == 1
+    assert commands.count(EoECommand.CONFIG) == len(slaves)
+
+    commands.clear()
+    net._open_servo.side_effect = lambda ip_address, *_: mocker.MagicMock(ip_address=ip_address)
+    net.connect_to_slave(4, "192.168.3.24", "dummy.xdf")
+    # The slaves already connected are configured again in the same cycle
+    assert commands.count(EoECommand.EOE_STOP) == 1
+    assert commands.count(EoECommand.EOE_START) == 1
+    assert commands.count(EoECommand.CONFIG) == len(slaves) + 1
+
+
+def test_eoe_connect_to_slaves_drive_not_found(eoe_service_net, mocker):
+    net, _ = eoe_service_net
+    slaves = [(slave_id, f"192.168.3.{20 + slave_id}", "dummy.xdf") for slave_id in (1, 2, 3)]
+
+    def open_servo(ip_address, *_):
+        if ip_address != "192.168.3.21":
+            raise ILError(f"Drive not found in IP {ip_address}.")
+        return mocker.MagicMock(ip_address=ip_address)
+
+    mocker.patch.object(net, "_open_servo", side_effect=open_servo)
+    with pytest.raises(ILError, match="2 drives were not found"):
+        net.connect_to_slaves(slaves)
+    assert [servo.ip_address for servo in net.servos] == ["192.168.3.21"]
+
+
+@pytest.mark.parametrize(
+    "slaves",
+    [
+        [(1, "192.168.2.22", "dummy.xdf")],
+        [(1, "192.168.3.22", "dummy.xdf"), (2, "192.168.3.22", "dummy.xdf")],
+    ],
+)
+def test_eoe_connect_to_slaves_wrong_ip_addresses(eoe_service_net, slaves):
+    net, commands = eoe_service_net
+    commands.clear()
+    with pytest.raises(ValueError):
+        net.connect_to_slaves(slaves)
+    assert commands == []
@@ -35,6 +35,7 @@ class MockSoemSlave:
         self.id = id
         self._emcy_callbacks = []
         self.state: int = 1  # INIT_STATE
+        self.al_status: int = 0
 
     def write_state(self):
         pass
@@ -48,6 +49,13 @@ class MockSoemSlave:
     def state_check(self, expected_state: int, timeout: int = 50000):  # noqa: ARG002
         return expected_state if self.state == expected_state else self.state
 
+    def recover(self, timeout: int = 50000):  # noqa: ARG002
+        return 1
+
+    def reconfig(self, timeout: int = 50000):  # noqa: ARG002
+        self.state = 2  # PREOP_STATE
+        return self.state
+
     def sdo_write(
         self, index: int, subindex: int, data: bytes, ca: bool = False, *, release_gil=None
     ):
@@ -75,6 +83,11 @@ class MockSoemMaster:
     def read_state(self):
         pass
 
+    def write_state(self):
+        # Broadcast the state of the master to all the slaves
+        for slave in self.slaves:
+            slave.state = self.state
+
     def state_check(self, expected_state: int, timeout: int = 50000):
         pass
 
@@ -1,5 +1,10 @@
 import pytest
 
+import tests.resources
+from ingenialink.ethercat.network import EthercatNetwork
+from ingenialink.ethercat.servo import EthercatServo
+from ingenialink.exceptions import ILError
+
 
 @pytest.mark.ethercat
 def test_eeprom_read(servo):
@@ -36,3 +41,108 @@ def test_eeprom_wrong_size(servo):
     serial_number_address = 14
     with pytest.raises(ValueError):
         servo._write_esc_eeprom(serial_number_address, (0).to_bytes(3, "little"))
+
+
+class _FakeEeprom:
+    """ESC EEPROM with a SII image: header, a 4 words category and the end marker."""
+
+    SIZE_BYTES = 256
+
+    def __init__(self, serial_number: int = 7):
+        header = bytearray(128)
+        header[0x0E * 2 : 0x0E * 2 + 4] = serial_number.to_bytes(4, "little")
+        # 2 KiBit EEPROM
+        header[0x3E * 2 : 0x3E * 2 + 2] = (1).to_bytes(2, "little")
+        category = (10).to_bytes(2, "little") + (4).to_bytes(2, "little") + bytes(range(1, 9))
+        self.image = bytes(header) + category + b"\xff\xff"
+        self.data = bytearray(self.image + b"\xaa" * (self.SIZE_BYTES - len(self.image)))
+        self.reads = 0
+        self.written_addresses = []
+
+    def eeprom_read(self, word_address: int, timeout: int = 20000) -> bytes:  # noqa: ARG002
+        self.reads += 1
+        return bytes(self.data[word_address * 2 : word_address * 2 + 4])
+
+    def eeprom_write(self, word_address: int, data: bytes, timeout: int = 20000) -> None:  # noqa: ARG002
+        self.written_addresses.append(word_address)
+        self.data[word_address * 2 : word_address * 2 + 2] = data
+
+
+@pytest.fixture
+def eeprom_servo(pysoem_mock_network, mocker):  # noqa: ARG001
+    net = EthercatNetwork("dummy_ifname")
+    servo = net.connect_to_slave(1, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+    eeprom = _FakeEeprom()
+    mocker.patch.object(servo.slave, "man", 0x3B, create=True)
+    mocker.patch.object(servo.slave, "rev", 0x10, create=True)
+    mocker.patch.object(servo.slave, "eeprom_read", eeprom.eeprom_read, create=True)
+    mocker.patch.object(servo.slave, "eeprom_write", eeprom.eeprom_write, create=True)
+    EthercatServo._clear_esc_eeprom_image_cache()
+    yield servo, eeprom
+    EthercatServo._clear_esc_eeprom_image_cache()
+    net.close_ecat_master()
+
+
+@pytest.mark.pcap
+def test_eeprom_read_image(eeprom_servo):
+    servo, eeprom = eeprom_servo
+    assert servo._read_esc_eeprom_image() == eeprom.image
+    # Header and category in 4 bytes blocks, plus the serial number
+    assert eeprom.reads == 1 + 32 + 1 + 2 + 1
+
+    # The cached image is used, only the serial number is read
+    eeprom.reads = 0
+    assert servo._read_esc_eeprom_image() == eeprom.image
+    assert eeprom.reads == 1
+    eeprom.reads = 0
+    assert servo._read_esc_eeprom_image(use_cache=False) == eeprom.image
+    assert eeprom.reads > 1
+
+
+@pytest.mark.pcap
+def test_eeprom_read_image_without_end_marker(eeprom_servo):
+    servo, eeprom = eeprom_servo
+    eeprom.data[-2:] = b"\x00\x00"
+    eeprom.data[len(eeprom.image) - 2 :] = b"\x0a\x00\x00\x00" * (
+        (eeprom.SIZE_BYTES - len(eeprom.image) + 2) // 4
+    )
+    with pytest.raises(ILError):
+        servo._read_esc_eeprom_image()
+
+
+@pytest.mark.pcap
+def test_eeprom_write_discards_the_cached_image(eeprom_servo):
+    servo, eeprom = eeprom_servo
+    servo._read_esc_eeprom_image()
+    servo._write_esc_eeprom(0x42, b"\x12\x34")
+    new_image = bytearray(eeprom.image)
+    new_image[0x42 * 2 : 0x42 * 2 + 2] = b"\x12\x34"
+    assert servo._read_esc_eeprom_image() == bytes(new_image)
+
+    # The image is cached again, also after the serial number is changed
+    servo._write_esc_eeprom(0x0E, (8).to_bytes(2, "little"))
+    new_image[0x0E * 2] = 8
+    eeprom.reads = 0
+    assert servo._read_esc_eeprom_image() == bytes(new_image)
+    assert eeprom.reads > 1
+    eeprom.reads = 0
+    assert servo._read_esc_eeprom_image() == bytes(new_image)
+    assert eeprom.reads == 1
+
+
+@pytest.mark.pcap
+def test_eeprom_write_from_file_only_changed_words(eeprom_servo, tmp_path):
+    servo, eeprom = eeprom_servo
+    servo._read_esc_eeprom_image()
+    new_image = bytearray(eeprom.image)
+    new_image[0x0E * 2] = 8
+    new_image[133] = 0
+    file_path = tmp_path / "eeprom.bin"
+    file_path.write_bytes(new_image)
+
+    servo._write_esc_eeprom_from_file(str(file_path))
+
+    assert eeprom.written_addresses == [0x0E, 66]
+    assert eeprom.data[: len(new_image)] == new_image
+    # The cached image of the slave is not used anymore
+    assert servo._read_esc_eeprom_image() == bytes(new_image)
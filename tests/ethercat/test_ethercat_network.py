@@ -5,6 +5,7 @@ import tests.resources
 
 with contextlib.suppress(ImportError):
     import pysoem
+import functools
 import random
 import threading
 import time
@@ -22,7 +23,11 @@ import ingenialink.ethercat.network
 from ingenialink.ethercat.network import (
     ETHERCAT_NETWORK_REFERENCES,
     EthercatNetwork,
+    FirmwareLoadStage,
     GilReleaseConfig,
+    GilWorkloadProfile,
+    NetStatusListener,
+    NetStatusListenerConfig,
     release_network_reference,
     set_network_reference,
 )
@@ -149,6 +154,124 @@ def test_load_firmware_success_after_retry(
     net.load_firmware("dummy_file.sfu", False, slave_id=1)
 
 
+@pytest.fixture
+def mocked_network_for_firmware_loading_many(mocker, tmp_path):
+    net = EthercatNetwork("fake_interface")
+    mocker.patch.object(net, "_start_master")
+    mocker.patch.object(net, "_EthercatNetwork__init_nodes")
+    mocker.patch("time.sleep", return_value=None)
+    # The slaves reach the requested states, except their unreachable states
+    slaves = [
+        mocker.Mock(state=pysoem.INIT_STATE, al_status=0, unreachable_states=()) for _ in range(3)
+    ]
+
+    def write_slave_state(slave):
+        if slave.state in slave.unreachable_states:
+            slave.state = pysoem.INIT_STATE
+
+    def write_master_state():
+        for slave in slaves:
+            slave.state = master.state
+            write_slave_state(slave)
+
+    for slave in slaves:
+        slave.write_state.side_effect = functools.partial(write_slave_state, slave)
+        slave.foe_write.return_value = 1
+    master = mocker.patch.object(net, "_ecat_master", slaves=slaves)
+    master.write_state.side_effect = write_master_state
+    net._EthercatNetwork__last_init_nodes = [1, 2, 3]
+    fw_file = tmp_path / "firmware.sfu"
+    fw_file.write_bytes(b"firmware")
+    with net.running():
+        yield net, slaves, str(fw_file)
+
+
+@pytest.mark.pcap
+def test_load_firmware_many(mocked_network_for_firmware_loading_many):
+    net, slaves, fw_file = mocked_network_for_firmware_loading_many
+    # Every transfer waits for the others, so the barrier is only passed if they run concurrently
+    barrier = threading.Barrier(len(slaves), timeout=5)
+    network_locked = []
+
+    def foe_write(*_, **__):
+        network_locked.append(net._lock.locked())
+        barrier.wait()
+        return 1
+
+    for slave in slaves:
+        slave.foe_write.side_effect = foe_write
+    progress = []
+    results = net.load_firmware_many(
+        dict.fromkeys((1, 2, 3), fw_file),
+        boot_in_app=True,
+        progress_callback=lambda slave_id, stage: progress.append((slave_id, stage)),
+    )
+
+    assert network_locked == [True] * len(slaves)
+    for slave_id, slave in enumerate(slaves, start=1):
+        assert slave.foe_write.call_args.args[2] == b"firmware"
+        assert slave.foe_write.call_args.kwargs["release_gil"] is True
+        assert [stage for progress_id, stage in progress if progress_id == slave_id] == [
+            FirmwareLoadStage.BOOT_STATE,
+            FirmwareLoadStage.TRANSFERRING,
+            FirmwareLoadStage.TRANSFERRED,
+            FirmwareLoadStage.RECOVERED,
+        ]
+        result = results[slave_id]
+        assert result.success
+        assert result.attempts == 1
+        assert result.transfer_time is not None
+        assert result.errors == ()
+
+
+@pytest.mark.pcap
+def test_load_firmware_many_retries_the_failed_slaves(mocked_network_for_firmware_loading_many):
+    net, slaves, fw_file = mocked_network_for_firmware_loading_many
+    slaves[1].foe_write.side_effect = [-5, 1]
+    slaves[2].unreachable_states = (pysoem.BOOT_STATE,)
+    results = net.load_firmware_many(dict.fromkeys((1, 2, 3), fw_file), boot_in_app=True)
+
+    assert [slave.foe_write.call_count for slave in slaves] == [1, 2, 0]
+    assert results[1].success
+    assert results[2].success
+    assert results[2].attempts == 2
+    assert results[2].errors == ("Attempt 1: FoE error.",)
+    assert not results[3].success
+    assert results[3].stage == FirmwareLoadStage.FAILED
+    assert results[3].attempts == 0
+    assert results[3].errors == (
+        "Attempt 1: The slave cannot reach the Boot state.",
+        "Attempt 2: The slave cannot reach the Boot state.",
+    )
+
+
+@pytest.mark.pcap
+def test_load_firmware_many_boot_mode_register_error(mocked_network_for_firmware_loading_many):
+    net, slaves, fw_file = mocked_network_for_firmware_loading_many
+    slaves[0].sdo_write.side_effect = pysoem.WkcError()
+    results = net.load_firmware_many(dict.fromkeys((1, 2), fw_file), boot_in_app=False)
+
+    assert [slave.sdo_write.call_count for slave in slaves] == [2, 1, 0]
+    assert [slave.foe_write.call_count for slave in slaves] == [0, 1, 0]
+    assert results[2].success
+    assert results[1].stage == FirmwareLoadStage.FAILED
+    assert results[1].errors == (
+        "Attempt 1: Error writing to the Boot mode register.",
+        "Attempt 2: Error writing to the Boot mode register.",
+    )
+
+
+@pytest.mark.pcap
+def test_load_firmware_many_slave_not_found(mocked_network_for_firmware_loading_many):
+    net, _, fw_file = mocked_network_for_firmware_loading_many
+    with pytest.raises(ILError, match="Slave 4 was not found."):
+        net.load_firmware_many({1: fw_file, 4: fw_file}, boot_in_app=True)
+    with pytest.raises(FileNotFoundError):
+        net.load_firmware_many({1: "not_found.sfu"}, boot_in_app=True)
+    with pytest.raises(ValueError):
+        net.load_firmware_many({1: fw_file}, boot_in_app=True, max_workers=0)
+
+
 @pytest.mark.pcap
 def test_wrong_interface_name_error():
     net = EthercatNetwork("fake_interface")
@@ -326,10 +449,11 @@ def test_check_node_state_with_non_existent_slave(pysoem_mock_network):
 
     # _check_node_state should handle a list containing a non-existent slave
     # It should return False because servo2 doesn't exist (can't check its state)
-    assert not net._check_node_state([servo1, servo2], pysoem.INIT_STATE)
+    assert not net._check_node_state([servo1, servo2], pysoem.PREOP_STATE)
 
-    # With only the existing servo, it should work normally (mock defaults to INIT_STATE)
-    assert net._check_node_state([servo1], pysoem.INIT_STATE)
+    # With only the existing servo, it should work normally (the PreOp state is broadcast
+    # when the nodes are initialized)
+    assert net._check_node_state([servo1], pysoem.PREOP_STATE)
 
     net.close_ecat_master()
 
@@ -405,6 +529,60 @@ def test_change_nodes_state_with_non_existent_slave(pysoem_mock_network):
     net.close_ecat_master()
 
 
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+@pytest.mark.parametrize("group_size, broadcast", [(3, True), (2, False)])
+def test_transition_nodes_state(mocker, group_size, broadcast):
+    net = EthercatNetwork("dummy_ifname")
+    servos = [
+        net.connect_to_slave(slave_id, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+        for slave_id in (1, 2, 3)
+    ]
+    master_write_state = mocker.spy(net._ecat_master, "write_state")
+    slave_write_states = [mocker.spy(servo.slave, "write_state") for servo in servos]
+
+    transitions = net._transition_nodes_state(servos[:group_size], pysoem.SAFEOP_STATE, 0.1)
+
+    assert master_write_state.call_count == int(broadcast)
+    assert [spy.call_count for spy in slave_write_states[:group_size]] == [
+        int(not broadcast)
+    ] * group_size
+    assert [transition.slave_id for transition in transitions] == list(range(1, group_size + 1))
+    assert all(transition.reached for transition in transitions)
+    assert all(transition.state == pysoem.SAFEOP_STATE for transition in transitions)
+    assert net.last_state_transitions == transitions
+    net.close_ecat_master()
+
+
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_transition_nodes_state_report_failures(mocker):
+    net = EthercatNetwork("dummy_ifname")
+    servos = [
+        net.connect_to_slave(slave_id, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+        for slave_id in (1, 2, 3)
+    ]
+
+    def refuse_safeop():
+        for slave in net._ecat_master.slaves:
+            slave.state = (
+                pysoem.PREOP_STATE + pysoem.STATE_ERROR if slave.id == 2 else pysoem.SAFEOP_STATE
+            )
+            slave.al_status = 0x001E if slave.id == 2 else 0
+
+    mocker.patch.object(net._ecat_master, "write_state", refuse_safeop)
+    transitions = net._transition_nodes_state(servos, pysoem.SAFEOP_STATE, 0.05)
+
+    assert [transition.reached for transition in transitions] == [True, False, True]
+    assert transitions[0].time_to_state is not None
+    assert transitions[1].time_to_state is None
+    assert transitions[1].state == pysoem.PREOP_STATE + pysoem.STATE_ERROR
+    assert transitions[1].al_status == 0x001E
+    assert transitions[1].al_status_description == pysoem.al_status_code_to_string(0x001E)
+    assert not net._change_nodes_state(servos, pysoem.SAFEOP_STATE)
+    net.close_ecat_master()
+
+
 @pytest.mark.pcap
 def test_disconnect_from_slave_with_non_existent_slave(pysoem_mock_network):
     """Test that disconnect_from_slave works when the slave doesn't exist.
@@ -493,6 +671,17 @@ def test_stop_pdos_skips_disconnected_slaves(pysoem_mock_network, mocker):  # no
     net.close_ecat_master()
 
 
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_stop_pdos_stops_the_register_routing(mocker):
+    net = EthercatNetwork("dummy_ifname")
+    servo = net.connect_to_slave(1, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+    exchange_stopped = mocker.spy(servo, "_pdo_exchange_stopped")
+    net.stop_pdos()
+    exchange_stopped.assert_called_once()
+    net.close_ecat_master()
+
+
 @pytest.mark.pcap
 @pytest.mark.usefixtures(pysoem_mock_network.__name__)
 def test_recover_from_disconnection_does_not_shortcut_when_slave_ref_cleared():
@@ -580,6 +769,56 @@ def test_gil_configuration():
     assert gil_config_3.always_release is False
 
 
+@pytest.mark.parametrize(
+    "profile, expected_config",
+    [
+        (GilWorkloadProfile(), GilReleaseConfig()),
+        (GilWorkloadProfile(sdo_threads=0, pdo_refresh_rate=0.001), GilReleaseConfig()),
+        (
+            GilWorkloadProfile(sdo_threads=4),
+            GilReleaseConfig(config_init=True, sdo_read_write=True, foe_read_write=True),
+        ),
+        (
+            GilWorkloadProfile(sdo_threads=1, pdo_refresh_rate=0.001),
+            GilReleaseConfig(config_init=True, sdo_read_write=True, foe_read_write=True),
+        ),
+        (
+            GilWorkloadProfile(sdo_threads=1, python_threads=1),
+            GilReleaseConfig(config_init=True, sdo_read_write=True, foe_read_write=True),
+        ),
+    ],
+)
+def test_gil_configuration_for_workload(profile, expected_config):
+    assert GilReleaseConfig.for_workload(profile) == expected_config
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"sdo_threads": -1}, {"python_threads": -1}, {"pdo_refresh_rate": 0}]
+)
+def test_gil_workload_profile_wrong_values(kwargs):
+    with pytest.raises(ValueError):
+        GilWorkloadProfile(**kwargs)
+
+
+@pytest.mark.pcap
+def test_set_gil_configuration(pysoem_mock_network):  # noqa: ARG001
+    net = EthercatNetwork("dummy_ifname")
+    servo = net.connect_to_slave(1, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+    assert servo.sdo_read_write_release_gil is None
+
+    net.gil_release_config = GilReleaseConfig.always()
+
+    assert net.gil_release_config == GilReleaseConfig.always()
+    assert net._ecat_master.always_release_gil is True
+    assert servo.sdo_read_write_release_gil is True
+
+    net.gil_release_config = GilReleaseConfig(sdo_read_write=False)
+
+    assert net._ecat_master.always_release_gil is False
+    assert servo.sdo_read_write_release_gil is False
+    net.close_ecat_master()
+
+
 def test_release_network_reference_raises_error_if_wrong_network():
     class DummyEthercatNetwork:
         pass
@@ -1369,6 +1608,114 @@ def test_net_status_listener_threaded_disconnect_reconnect_cycle(pysoem_mock_net
     net.close_ecat_master()
 
 
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_net_status_listener_fixed_refresh_time():
+    net = EthercatNetwork("dummy_ifname")
+    net.connect_to_slave(1, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+    assert NetStatusListener(net, refresh_time=0.5).config == NetStatusListenerConfig(
+        refresh_time=0.5
+    )
+    listener = NetStatusListener(net, config=NetStatusListenerConfig(0.01, stable_time=0))
+    listener.start()
+    try:
+        # The polling does not slow down unless a maximum refresh time is set
+        time.sleep(0.1)
+        assert listener.metrics.polls > 5
+        assert listener.refresh_time == 0.01
+    finally:
+        listener.stop()
+        listener.join()
+        net.close_ecat_master()
+
+
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_net_status_listener_adaptive_refresh_time(mocker):
+    net = EthercatNetwork("dummy_ifname")
+    servo = net.connect_to_slave(1, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+    mocker.patch.object(EthercatNetwork, "recover_from_disconnection", return_value=False)
+    assert net.status_listener_metrics is None
+    net.start_status_listener(
+        NetStatusListenerConfig(refresh_time=0.01, max_refresh_time=0.04, stable_time=0.05)
+    )
+    try:
+        # The polling slows down while the network is stable
+        time.sleep(0.3)
+        metrics = net.status_listener_metrics
+        assert metrics.refresh_time == 0.04
+        assert metrics.detections == 0
+
+        # And speeds up after a disconnection
+        servo.update_slave_reference(None)
+        time.sleep(0.2)
+        metrics = net.status_listener_metrics
+        assert metrics.refresh_time == 0.01
+        assert metrics.detections == 1
+        assert 0 < metrics.last_detection_latency <= metrics.max_detection_latency < 0.2
+        assert metrics.recoveries >= 1
+        assert metrics.failed_recoveries == metrics.recoveries
+        assert metrics.last_recovery_time is not None
+    finally:
+        net.stop_status_listener()
+        net.close_ecat_master()
+
+
+@pytest.mark.pcap
+@pytest.mark.parametrize("slave_recovered", [True, False])
+def test_net_status_listener_incremental_recovery(pysoem_mock_network, mocker, slave_recovered):
+    pysoem_mock_network.set_num_slaves(2)
+    net = EthercatNetwork("dummy_ifname")
+    servo, other_servo = (
+        net.connect_to_slave(slave_id, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+        for slave_id in (1, 2)
+    )
+    events = []
+    net.subscribe_to_status(1, events.append)
+
+    def recover_from_disconnection():
+        servo.slave.state = pysoem.PREOP_STATE
+        return True
+
+    recover_mock = mocker.patch.object(
+        EthercatNetwork, "recover_from_disconnection", side_effect=recover_from_disconnection
+    )
+    mocker.patch.object(servo.slave, "recover", return_value=int(slave_recovered))
+    reconfig_spy = mocker.spy(other_servo.slave, "reconfig")
+    net.start_status_listener(NetStatusListenerConfig(incremental_recovery=True))
+    listener = net._EthercatNetwork__listener_net_status
+    try:
+        servo.slave.state = pysoem.NONE_STATE
+        listener.process()
+
+        assert events == [NetDevEvt.REMOVED, NetDevEvt.ADDED]
+        assert net.get_servo_state(1) == NetState.CONNECTED
+        # Only the disconnected slave is recovered if possible
+        reconfig_spy.assert_not_called()
+        assert recover_mock.call_count == int(not slave_recovered)
+        assert servo.slave.state == pysoem.PREOP_STATE
+        metrics = listener.metrics
+        assert metrics.recoveries == 1
+        assert metrics.incremental_recoveries == int(slave_recovered)
+    finally:
+        net.stop_status_listener()
+        net.close_ecat_master()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"refresh_time": 0},
+        {"refresh_time": 1, "max_refresh_time": 0.5},
+        {"stable_time": -1},
+        {"backoff_factor": 0.5},
+    ],
+)
+def test_net_status_listener_config_invalid(config):
+    with pytest.raises(ValueError):
+        NetStatusListenerConfig(**config)
+
+
 class TestEthercatNetworkContextManager:
     """Tests for the EthercatNetwork context manager functionality."""
 
@@ -1493,3 +1840,149 @@ class TestEthercatNetworkContextManager:
         assert net._EthercatNetwork__is_master_running is False
         assert net not in ETHERCAT_NETWORK_REFERENCES
         assert len(ETHERCAT_NETWORK_REFERENCES) == n_networks
+
+
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_config_pdo_maps_maps_the_slaves_concurrently(mocker):
+    net = EthercatNetwork("dummy_ifname")
+    servos = [
+        net.connect_to_slave(slave_id, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+        for slave_id in (1, 2, 3)
+    ]
+    # Every slave waits for the others, so the barrier is only passed if they run concurrently
+    barrier = threading.Barrier(len(servos), timeout=5)
+    map_pdos_mocks = []
+    for servo in servos:
+        servo.set_pdo_map_to_slave([], [])
+        map_pdos_mocks.append(
+            mocker.patch.object(servo, "map_pdos", side_effect=lambda _: barrier.wait())
+        )
+
+    def config_map():
+        for slave_index, slave in enumerate(net._ecat_master.slaves, start=1):
+            slave.config_func(slave_index)
+
+    config_map_name = "config_overlap_map" if net._overlapping_io_map else "config_map"
+    mocker.patch.object(net._ecat_master, config_map_name, side_effect=config_map, create=True)
+    net.config_pdo_maps()
+    # The slaves are not mapped again when pysoem configures the process data image
+    for map_pdos_mock in map_pdos_mocks:
+        map_pdos_mock.assert_called_once()
+
+    # The mapping is done by the pysoem configuration if the slaves are mapped one by one
+    barrier = threading.Barrier(1)
+    net.config_pdo_maps(max_workers=1)
+    for map_pdos_mock in map_pdos_mocks:
+        assert map_pdos_mock.call_count == 2
+    net.close_ecat_master()
+
+
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_config_pdo_maps_raises_the_mapping_errors(mocker):
+    net = EthercatNetwork("dummy_ifname")
+    servos = [
+        net.connect_to_slave(slave_id, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+        for slave_id in (1, 2)
+    ]
+    for servo in servos:
+        servo.set_pdo_map_to_slave([], [])
+    mocker.patch.object(servos[1], "map_pdos", side_effect=ILError("Mapping failed"))
+    config_map_name = "config_overlap_map" if net._overlapping_io_map else "config_map"
+    config_map = mocker.patch.object(net._ecat_master, config_map_name, create=True)
+    with pytest.raises(ILError, match="Mapping failed"):
+        net.config_pdo_maps()
+    config_map.assert_not_called()
+    with pytest.raises(ValueError):
+        net.config_pdo_maps(max_workers=0)
+    net.close_ecat_master()
+
+
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_reset_pdo_mapping_resets_the_slaves_concurrently(mocker):
+    net = EthercatNetwork("dummy_ifname")
+    servos = [
+        net.connect_to_slave(slave_id, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+        for slave_id in (1, 2, 3)
+    ]
+    # Every slave waits for the others, so the barrier is only passed if they run concurrently
+    barrier = threading.Barrier(len(servos), timeout=5)
+    thread_names = []
+
+    def reset_pdo_mapping():
+        thread_names.append(threading.current_thread().name)
+        barrier.wait()
+
+    reset_mocks = [
+        mocker.patch.object(servo, "reset_pdo_mapping", side_effect=reset_pdo_mapping)
+        for servo in servos
+    ]
+    net.reset_pdo_mapping()
+    for reset_mock in reset_mocks:
+        reset_mock.assert_called_once()
+    assert all(name.startswith("PDOMapping") for name in thread_names)
+
+    barrier = threading.Barrier(1)
+    net.reset_pdo_mapping(servos[:1])
+    assert [reset_mock.call_count for reset_mock in reset_mocks] == [2, 1, 1]
+    with pytest.raises(ValueError):
+        net.reset_pdo_mapping(max_workers=0)
+    net.close_ecat_master()
+
+
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_map_servos_accesses_the_slaves_concurrently(mocker):
+    net = EthercatNetwork("dummy_ifname")
+    servos = [
+        net.connect_to_slave(slave_id, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+        for slave_id in (1, 2, 3)
+    ]
+    # Every slave waits for the others, so the barrier is only passed if they run concurrently
+    barrier = threading.Barrier(len(servos), timeout=5)
+    sdo_reads = []
+    for servo in servos:
+
+        def sdo_read(*_, release_gil=None, slave_id=servo.slave_id):
+            barrier.wait()
+            sdo_reads.append(release_gil)
+            return slave_id.to_bytes(2, "little")
+
+        mocker.patch.object(servo.slave, "sdo_read", sdo_read, create=True)
+
+    assert net.read_many(["DRV_STATE_STATUS"]) == [[1], [2], [3]]
+    # The GIL is released in the mailbox transfers of the worker threads
+    assert sdo_reads == [True] * len(servos)
+    assert net.map_servos(lambda servo: servo.slave_id, servos[1:]) == [2, 3]
+
+    # The servos are accessed one by one
+    barrier = threading.Barrier(1)
+    assert net.read_many(["DRV_STATE_STATUS"], max_workers=1) == [[1], [2], [3]]
+    with pytest.raises(ValueError):
+        net.map_servos(lambda servo: servo.slave_id, max_workers=0)
+    net.close_ecat_master()
+
+
+@pytest.mark.pcap
+@pytest.mark.usefixtures(pysoem_mock_network.__name__)
+def test_map_servos_raises_the_errors():
+    net = EthercatNetwork("dummy_ifname")
+    servos = [
+        net.connect_to_slave(slave_id, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+        for slave_id in (1, 2)
+    ]
+    calls = []
+
+    def fn(servo):
+        calls.append(servo.slave_id)
+        if servo.slave_id == 1:
+            raise ILError("Read failed")
+        return servo.slave_id
+
+    with pytest.raises(ILError, match="Read failed"):
+        net.map_servos(fn, servos)
+    # The other servos are still accessed
+    assert sorted(calls) == [1, 2]
+    net.close_ecat_master()
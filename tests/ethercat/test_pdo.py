@@ -1,6 +1,7 @@
 import contextlib
+import threading
 import time
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, ClassVar, Optional
 
 from bitarray import bitarray
 
@@ -10,12 +11,15 @@ with contextlib.suppress(ImportError):
     import pysoem
 import pytest
 
+from ingenialink.bitfield import BitField
 from ingenialink.dictionary import CanOpenObject, CanOpenObjectType, Interface
 from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.enums.servo import ServoState
 from ingenialink.ethercat.register import EthercatRegister
 from ingenialink.ethercat.servo import EthercatServo
 from ingenialink.exceptions import ILEcatStateError, ILError
 from ingenialink.pdo import BIT_ENDIAN, PDOMap, RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
+from ingenialink.pdo_player import RPDOTrajectoryPlayer
 from ingenialink.register import Register
 from ingenialink.servo import DictionaryFactory
 from ingenialink.utils._utils import convert_dtype_to_bytes, dtype_length_bits
@@ -936,3 +940,605 @@ def test_create_empty_tpdo_map():
     tpdo_map = TPDOMap()
     assert isinstance(tpdo_map, TPDOMap)
     assert len(tpdo_map.items) == 0
+
+
+def _create_byte_aligned_tpdo_map() -> TPDOMap:
+    tpdo_map = TPDOMap()
+    for subidx, dtype in enumerate([RegDtype.U16, RegDtype.S32, RegDtype.FLOAT], start=1):
+        register = EthercatRegister(
+            0x2000, subidx, dtype, RegAccess.RO, pdo_access=RegCyclicType.TX, identifier="MOCK"
+        )
+        tpdo_map.add_item(TPDOMapItem(register))
+    tpdo_map.add_item(TPDOMapItem(size_bits=8))
+    return tpdo_map
+
+
+def test_pdo_map_codec_byte_aligned():
+    tpdo_map = _create_byte_aligned_tpdo_map()
+    assert tpdo_map.codec.is_byte_aligned
+    assert tpdo_map.codec.data_length_bytes == tpdo_map.data_length_bytes == 11
+
+    data_bytes = (
+        convert_dtype_to_bytes(1234, RegDtype.U16)
+        + convert_dtype_to_bytes(-5678, RegDtype.S32)
+        + convert_dtype_to_bytes(1.5, RegDtype.FLOAT)
+        + b"\xaa"
+    )
+    tpdo_map.set_item_bytes(data_bytes)
+
+    u16_item, s32_item, float_item, padding_item = tpdo_map.items
+    assert u16_item.value == 1234
+    assert s32_item.value == -5678
+    assert float_item.value == 1.5
+    assert padding_item.raw_data_bytes == b"\xaa"
+    # The bit representation matches the one of the bitarray codec
+    expected_bits = bitarray(endian=BIT_ENDIAN)
+    expected_bits.frombytes(data_bytes)
+    assert tpdo_map.get_item_bits() == expected_bits
+    assert tpdo_map.get_item_bytes() == data_bytes
+
+
+def test_pdo_map_codec_sub_byte_items_fallback(open_dictionary):
+    ethercat_dictionary = open_dictionary
+    register = ethercat_dictionary.registers(SUBNODE)[TPDO_REGISTERS[0]]
+    tpdo_map = TPDOMap()
+    tpdo_map.add_item(TPDOMapItem(register))
+    tpdo_map.add_item(TPDOMapItem(register, size_bits=4))
+    tpdo_map.add_item(TPDOMapItem(size_bits=4))
+    assert not tpdo_map.codec.is_byte_aligned
+
+    tpdo_map.set_item_bytes(b"\x01\x00\x00\x00\x59")
+
+    item1, item2, padding_item = tpdo_map.items
+    assert item1.value == 1
+    assert item2.raw_data_bits.to01() == "1001"
+    assert padding_item.raw_data_bits.to01() == "1010"
+    assert tpdo_map.get_item_bytes() == b"\x01\x00\x00\x00\x59"
+
+
+def test_pdo_map_layout(open_dictionary):
+    ethercat_dictionary = open_dictionary
+    register = ethercat_dictionary.registers(SUBNODE)[TPDO_REGISTERS[0]]
+    tpdo_map = TPDOMap()
+    tpdo_map.add_item(TPDOMapItem(register))
+    tpdo_map.add_item(TPDOMapItem(register, size_bits=4))
+    tpdo_map.add_item(TPDOMapItem(size_bits=12))
+
+    layout = tpdo_map.layout
+    assert layout.items == tpdo_map.items
+    assert layout.offsets_bits == (0, 32, 36)
+    assert layout.sizes_bits == (32, 4, 12)
+    assert layout.data_length_bits == tpdo_map.data_length_bits == 48
+    assert layout.data_length_bytes == tpdo_map.data_length_bytes == 6
+    assert layout.codec is tpdo_map.codec
+    # The layout is reused while the map does not change
+    assert tpdo_map.layout is layout
+    assert tpdo_map.items is layout.items
+
+
+def test_pdo_map_layout_invalidated_on_map_change(open_dictionary):
+    ethercat_dictionary = open_dictionary
+    register = ethercat_dictionary.registers(SUBNODE)[RPDO_REGISTERS[0]]
+    rpdo_map = RPDOMap()
+    rpdo_map.add_item(RPDOMapItem(register))
+    layout = rpdo_map.layout
+    assert layout.data_length_bytes == 4
+
+    rpdo_map.add_item(RPDOMapItem(size_bits=8))
+    assert rpdo_map.layout is not layout
+    assert rpdo_map.layout.data_length_bytes == 5
+
+    layout = rpdo_map.layout
+    rpdo_map[1] = RPDOMapItem(size_bits=16)
+    assert rpdo_map.layout is not layout
+    assert rpdo_map.layout.data_length_bytes == 6
+
+    layout = rpdo_map.layout
+    del rpdo_map[1]
+    assert rpdo_map.layout is not layout
+    assert rpdo_map.layout.data_length_bytes == 4
+
+    layout = rpdo_map.layout
+    rpdo_map.clear()
+    assert rpdo_map.layout is not layout
+    assert rpdo_map.layout.data_length_bytes == 0
+    assert rpdo_map.items == ()
+
+
+def test_rpdo_map_codec_value_not_set(create_pdo_map):
+    _, rpdo_map = create_pdo_map
+    rpdo_map.items[0].value = 1
+    with pytest.raises(ILError) as exc_info:
+        rpdo_map.get_item_bytes()
+    assert (
+        str(exc_info.value)
+        == f"PDO item {rpdo_map.items[1].register.identifier} does not have data stored."
+    )
+
+
+def test_servo_process_image(virtual_drive_ethercat):
+    _, servo = virtual_drive_ethercat
+    tpdo_map = _create_byte_aligned_tpdo_map()
+    rpdo_map = RPDOMap()
+    for subidx, value in enumerate([7, -8], start=1):
+        register = EthercatRegister(
+            0x2001,
+            subidx,
+            RegDtype.S16,
+            RegAccess.RW,
+            pdo_access=RegCyclicType.RX,
+            identifier="MOCK",
+        )
+        item = RPDOMapItem(register)
+        item.value = value
+        rpdo_map.add_item(item)
+    servo._tpdo_maps[0x1A00] = tpdo_map
+    servo._rpdo_maps[0x1600] = rpdo_map
+
+    first_data = bytes(range(tpdo_map.data_length_bytes))
+    servo._process_tpdo(first_data)
+    inputs_view = servo.pdo_inputs
+    inputs_array = servo.pdo_inputs_array()
+    assert bytes(inputs_view) == first_data
+    with pytest.raises(TypeError):
+        inputs_view[0] = 0
+
+    # The process image is updated in place
+    second_data = bytes(reversed(first_data))
+    servo._process_tpdo(second_data)
+    assert servo.pdo_inputs is inputs_view
+    assert bytes(inputs_view) == second_data
+    assert inputs_array.tobytes() == second_data
+    assert tpdo_map.get_item_bytes() == second_data
+
+    output_data = servo._process_rpdo()
+    assert output_data == b"\x07\x00\xf8\xff"
+    assert bytes(servo.pdo_outputs) == output_data
+    outputs_array = servo.pdo_outputs_array()
+    rpdo_map.items[0].value = 9
+    servo._process_rpdo()
+    assert outputs_array.tobytes() == b"\x09\x00\xf8\xff"
+
+
+def test_servo_off_cycle_processing(virtual_drive_ethercat):
+    _, servo = virtual_drive_ethercat
+    tpdo_map = _create_byte_aligned_tpdo_map()
+    rpdo_map = RPDOMap()
+    register = EthercatRegister(
+        0x2001, 1, RegDtype.S16, RegAccess.RW, pdo_access=RegCyclicType.RX, identifier="MOCK"
+    )
+    rpdo_item = RPDOMapItem(register)
+    rpdo_item.value = 7
+    rpdo_map.add_item(rpdo_item)
+    servo._tpdo_maps[0x1A00] = tpdo_map
+    servo._rpdo_maps[0x1600] = rpdo_map
+
+    servo._set_off_cycle_processing(True)
+    try:
+        assert not servo._load_tpdo_snapshot()
+        data = bytes(range(tpdo_map.data_length_bytes))
+        servo._process_tpdo(data)
+        assert bytes(servo.pdo_inputs) == data
+        # The items are only decoded when the snapshot is loaded
+        with pytest.raises(ILError):
+            tpdo_map.items[0].raw_data_bytes  # noqa: B018
+        assert servo._load_tpdo_snapshot()
+        assert tpdo_map.get_item_bytes() == data
+        assert not servo._load_tpdo_snapshot()
+
+        with pytest.raises(ILError):
+            servo._process_tpdo(data[:-1])
+
+        # The values are sent once they are published
+        assert servo._process_rpdo() == b"\x07\x00"
+        rpdo_item.value = 9
+        assert servo._process_rpdo() == b"\x07\x00"
+        servo._publish_rpdo_snapshot()
+        assert servo._process_rpdo() == b"\x09\x00"
+    finally:
+        servo._set_off_cycle_processing(False)
+
+    rpdo_item.value = 10
+    assert servo._process_rpdo() == b"\x0a\x00"
+
+
+def test_pdo_map_codec_caches_encoded_data():
+    tpdo_map = _create_byte_aligned_tpdo_map()
+    tpdo_map.set_item_bytes(bytes(range(11)))
+    codec = tpdo_map.codec
+    encoded = codec.encode()
+    assert codec.encode() is encoded
+
+    buffer = bytearray(11)
+    data_version = codec.encode_into(buffer)
+    assert data_version == codec.data_version
+    buffer[:] = bytes(11)
+    assert codec.update_into(buffer, 0, data_version) == data_version
+    assert buffer == bytearray(11)
+    tpdo_map.items[0]._set_decoded_value(0xFFFF)
+    assert codec.data_version > data_version
+    assert codec.update_into(buffer, 0, data_version) == codec.data_version
+    assert buffer == b"\xff\xff" + bytes(range(2, 11))
+    assert codec.encode() == bytes(buffer)
+
+
+def test_pdo_map_codec_encodes_into_the_buffer(mocker):
+    tpdo_map = _create_byte_aligned_tpdo_map()
+    tpdo_map.set_item_bytes(bytes(range(11)))
+    codec = tpdo_map.codec
+    encode = mocker.spy(codec, "encode")
+    buffer = bytearray(15)
+    assert codec.encode_into(memoryview(buffer), 2) == codec.data_version
+    assert buffer == b"\x00\x00" + bytes(range(11)) + b"\x00\x00"
+    assert encode.call_count == 0
+
+
+def _create_rpdo_maps(servo, values) -> list[RPDOMap]:
+    rpdo_maps = []
+    for map_index, value in enumerate(values, start=0x1600):
+        rpdo_map = RPDOMap()
+        register = EthercatRegister(
+            0x2001, 1, RegDtype.S16, RegAccess.RW, pdo_access=RegCyclicType.RX, identifier="MOCK"
+        )
+        item = RPDOMapItem(register)
+        item.value = value
+        rpdo_map.add_item(item)
+        servo._rpdo_maps[map_index] = rpdo_map
+        rpdo_maps.append(rpdo_map)
+    return rpdo_maps
+
+
+def test_servo_rewrites_only_changed_rpdo_maps(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    rpdo_maps = _create_rpdo_maps(servo, [0, 1])
+    assert servo._process_rpdo() == b"\x00\x00\x01\x00"
+
+    first_encode = mocker.spy(rpdo_maps[0].codec, "encode_into")
+    second_encode = mocker.spy(rpdo_maps[1].codec, "encode_into")
+    assert servo._process_rpdo() == b"\x00\x00\x01\x00"
+    rpdo_maps[1].items[0].value = 2
+    assert servo._process_rpdo() == b"\x00\x00\x02\x00"
+    assert first_encode.call_count == 0
+    assert second_encode.call_count == 1
+
+
+def test_servo_rewrites_the_reordered_rpdo_maps(virtual_drive_ethercat):
+    _, servo = virtual_drive_ethercat
+    first_map, second_map = _create_rpdo_maps(servo, [1, 2])
+    assert servo._process_rpdo() == b"\x01\x00\x02\x00"
+
+    servo._rpdo_maps.clear()
+    servo._rpdo_maps[0x1600] = second_map
+    servo._rpdo_maps[0x1601] = first_map
+    assert servo._process_rpdo() == b"\x02\x00\x01\x00"
+
+    # Removed and added again, the total size does not change
+    servo.remove_rpdo_map(rpdo_map=second_map)
+    servo._rpdo_maps[0x1602] = second_map
+    assert servo._process_rpdo() == b"\x01\x00\x02\x00"
+
+
+def test_servo_sends_the_rpdo_values_encoded_for_the_caller(virtual_drive_ethercat):
+    _, servo = virtual_drive_ethercat
+    first_map, _ = _create_rpdo_maps(servo, [1, 2])
+    assert servo._process_rpdo() == b"\x01\x00\x02\x00"
+
+    first_map.items[0].value = 9
+    assert first_map.get_item_bytes() == b"\x09\x00"
+    assert servo._process_rpdo() == b"\x09\x00\x02\x00"
+
+
+def test_servo_sends_the_rpdo_values_encoded_by_a_player(virtual_drive_ethercat):
+    _, servo = virtual_drive_ethercat
+    _, second_map = _create_rpdo_maps(servo, [1, 2])
+    assert servo._process_rpdo() == b"\x01\x00\x02\x00"
+
+    second_map.items[0].value = 7
+    # Building a player encodes the current values into its rows
+    RPDOTrajectoryPlayer(servo, {"MOCK": [5]})
+    assert servo._process_rpdo() == b"\x01\x00\x07\x00"
+
+
+def _create_mapped_rpdo_map(servo) -> RPDOMap:
+    rpdo_map = RPDOMap()
+    rpdo_map.map_object = servo.dictionary.get_object("ETG_COMMS_RPDO_MAP1", 0)
+    rpdo_map.slave = servo
+    register = EthercatRegister(
+        0x2001, 1, RegDtype.S16, RegAccess.RW, pdo_access=RegCyclicType.RX, identifier="MOCK"
+    )
+    rpdo_map.add_item(RPDOMapItem(register))
+    servo._rpdo_maps[rpdo_map.map_register_index] = rpdo_map
+    return rpdo_map
+
+
+def test_map_rpdos_skips_the_mapping_held_by_the_slave(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    rpdo_map = _create_mapped_rpdo_map(servo)
+    slave_values = {
+        "ETG_COMMS_RPDO_MAP1": rpdo_map.to_pdo_value(),
+        "ETG_COMMS_RPDO_ASSIGN": b"\x01\x00" + rpdo_map.map_register_index_bytes,
+    }
+    mocker.patch.object(
+        servo, "read_complete_access", side_effect=lambda obj, **_: slave_values[obj.uid]
+    )
+    write_complete_access = mocker.spy(servo, "write_complete_access")
+    write = mocker.spy(servo, "write")
+
+    servo.map_rpdos()
+    assert write_complete_access.call_count == 0
+    assert write.call_count == 0
+    assert not rpdo_map.is_dirty
+
+    # Only the map that is different is written
+    rpdo_map.add_registers(
+        EthercatRegister(
+            0x2001, 2, RegDtype.U8, RegAccess.RW, pdo_access=RegCyclicType.RX, identifier="MOCK2"
+        )
+    )
+    servo.map_rpdos()
+    write_complete_access.assert_called_once_with(
+        rpdo_map.map_object.registers[0], rpdo_map.to_pdo_value()
+    )
+    assert write.call_count == 0
+
+
+def test_map_rpdos_writes_the_mapping_if_it_can_not_be_read(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    rpdo_map = _create_mapped_rpdo_map(servo)
+    mocker.patch.object(servo, "read_complete_access", side_effect=ILError("Read failed"))
+    write_complete_access = mocker.patch.object(servo, "write_complete_access")
+    write = mocker.patch.object(servo, "write")
+
+    servo.map_rpdos()
+    write.assert_called_once_with(servo.ETG_COMMS_RPDO_ASSIGN_TOTAL, 1, subnode=0)
+    assert write_complete_access.call_args_list == [
+        mocker.call(rpdo_map.map_object.registers[0], rpdo_map.to_pdo_value()),
+        mocker.call(servo.ETG_COMMS_RPDO_ASSIGN_1, rpdo_map.map_register_index_bytes, subnode=0),
+    ]
+
+
+def test_pdo_register_routing(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    tpdo_map = TPDOMap()
+    tpdo_map.add_registers(servo.dictionary.registers(SUBNODE)[TPDO_REGISTERS[0]])
+    rpdo_map = RPDOMap()
+    rpdo_map.add_registers(servo.dictionary.registers(SUBNODE)[RPDO_REGISTERS[0]])
+    rpdo_map.items[0].value = 0
+    servo._tpdo_maps[0x1A00] = tpdo_map
+    servo._rpdo_maps[0x1600] = rpdo_map
+    tpdo_register = tpdo_map.items[0].register
+    read_raw = mocker.spy(servo, "_read_raw")
+    write_raw = mocker.spy(servo, "_write_raw")
+    servo.enable_pdo_register_routing()
+    assert servo.pdo_register_routing
+
+    # The PDO exchange is not running
+    servo.read(TPDO_REGISTERS[0])
+    assert read_raw.call_count == 1
+
+    servo._process_rpdo()
+    servo._process_tpdo(convert_dtype_to_bytes(1234, tpdo_register.dtype))
+    assert servo.read(TPDO_REGISTERS[0]) == 1234
+    servo.write(RPDO_REGISTERS[0], 55)
+    assert read_raw.call_count == 1
+    assert write_raw.call_count == 0
+    assert servo._process_rpdo() == convert_dtype_to_bytes(55, rpdo_map.items[0].register.dtype)
+
+    # The registers that are not mapped are accessed through the mailbox
+    servo.read(RPDO_REGISTERS[1])
+    assert read_raw.call_count == 2
+
+    # The TPDO value is stale
+    servo._process_rpdo()
+    servo.read(TPDO_REGISTERS[0])
+    assert read_raw.call_count == 3
+
+    servo._pdo_exchange_stopped()
+    servo.write(RPDO_REGISTERS[0], 56)
+    assert write_raw.call_count == 1
+
+    servo._process_rpdo()
+    servo._process_tpdo(convert_dtype_to_bytes(1234, tpdo_register.dtype))
+    servo.disable_pdo_register_routing()
+    servo.read(TPDO_REGISTERS[0])
+    assert read_raw.call_count == 4
+
+
+@pytest.fixture
+def routed_servo(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    tpdo_map = TPDOMap()
+    tpdo_map.add_registers(servo.dictionary.registers(SUBNODE)[TPDO_REGISTERS[0]])
+    rpdo_map = RPDOMap()
+    rpdo_map.add_registers(servo.dictionary.registers(SUBNODE)[RPDO_REGISTERS[0]])
+    rpdo_map.items[0].value = 0
+    servo._tpdo_maps[0x1A00] = tpdo_map
+    servo._rpdo_maps[0x1600] = rpdo_map
+    tpdo_data = convert_dtype_to_bytes(1234, tpdo_map.items[0].register.dtype)
+    read_raw = mocker.spy(servo, "_read_raw")
+    write_raw = mocker.spy(servo, "_write_raw")
+    return servo, tpdo_data, read_raw, write_raw
+
+
+def test_pdo_register_routing_stale_time(routed_servo):
+    servo, tpdo_data, read_raw, write_raw = routed_servo
+    servo.enable_pdo_register_routing(max_stale_time=0.05)
+    servo._process_rpdo()
+    servo._process_tpdo(tpdo_data)
+    assert servo.read(TPDO_REGISTERS[0]) == 1234
+    assert read_raw.call_count == 0
+
+    # The PDO exchange hangs without being stopped
+    time.sleep(0.1)
+    servo.read(TPDO_REGISTERS[0])
+    servo.write(RPDO_REGISTERS[0], 55)
+    assert read_raw.call_count == 1
+    assert write_raw.call_count == 1
+
+    with pytest.raises(ValueError):
+        servo.enable_pdo_register_routing(max_stale_time=0)
+
+
+def test_pdo_register_routing_off_cycle(routed_servo):
+    servo, tpdo_data, read_raw, _ = routed_servo
+    servo.enable_pdo_register_routing()
+    servo._set_off_cycle_processing(True)
+    try:
+        servo._process_rpdo()
+        servo._process_tpdo(tpdo_data)
+        # The TPDO data is not decoded into the items yet
+        servo.read(TPDO_REGISTERS[0])
+        assert read_raw.call_count == 1
+        assert servo._load_tpdo_snapshot()
+        assert servo.read(TPDO_REGISTERS[0]) == 1234
+        assert read_raw.call_count == 1
+    finally:
+        servo._set_off_cycle_processing(False)
+
+
+def test_pdo_register_routing_with_trajectory_player(routed_servo):
+    servo, _, _, write_raw = routed_servo
+    servo.enable_pdo_register_routing()
+    servo._process_rpdo()
+    player = RPDOTrajectoryPlayer(servo, {RPDO_REGISTERS[0]: [1, 2]})
+    player.start()
+    try:
+        with pytest.raises(ILError):
+            servo.write(RPDO_REGISTERS[0], 55)
+    finally:
+        player.stop()
+    servo.write(RPDO_REGISTERS[0], 55)
+    assert write_raw.call_count == 0
+
+
+class _FakePDSDrive(threading.Thread):
+    """Run the PDO cycles of a servo, answering the control word like a CiA-402 drive."""
+
+    STATUS_WORDS: ClassVar[dict[ServoState, dict[str, int]]] = {
+        ServoState.DISABLED: {"SWITCH_ON_DISABLED": 1},
+        ServoState.RDY: {"READY_TO_SWITCH_ON": 1, "QUICK_STOP": 1},
+        ServoState.ENABLED: {
+            "READY_TO_SWITCH_ON": 1,
+            "SWITCHED_ON": 1,
+            "OPERATION_ENABLED": 1,
+            "QUICK_STOP": 1,
+        },
+        ServoState.FAULT: {"FAULT": 1},
+    }
+
+    def __init__(self, servo, state):
+        super().__init__(daemon=True)
+        self.servo = servo
+        self.state = state
+        self.cycles = 0
+        self.stop_event = threading.Event()
+        # Called in the cycles, as the synchronous PDO callbacks
+        self.on_cycle: Optional[Callable[[], None]] = None
+        self.status_word = servo.dictionary.registers(SUBNODE)[servo.STATUS_WORD_REGISTERS]
+        self.control_word = servo.dictionary.registers(SUBNODE)[servo.CONTROL_WORD_REGISTERS]
+
+    def run(self):
+        previous_fault_reset = 0
+        while not self.stop_event.is_set():
+            output = self.servo._process_rpdo()
+            control_word = BitField.parse_bitfields(
+                self.control_word.bitfields, int.from_bytes(output[:2], "little")
+            )
+            if self.state == ServoState.FAULT:
+                if control_word["FAULT_RESET"] and not previous_fault_reset:
+                    self.state = ServoState.DISABLED
+            elif not control_word["VOLTAGE_ENABLE"]:
+                self.state = ServoState.DISABLED
+            elif control_word["SWITCH_ON"] and control_word["ENABLE_OPERATION"]:
+                self.state = ServoState.ENABLED
+            elif control_word["QUICK_STOP"]:
+                self.state = ServoState.RDY
+            previous_fault_reset = control_word["FAULT_RESET"]
+            status_word = BitField.set_bitfields(
+                self.status_word.bitfields, self.STATUS_WORDS[self.state]
+            )
+            self.servo._process_tpdo(status_word.to_bytes(2, "little"))
+            if self.on_cycle is not None:
+                self.on_cycle()
+            self.cycles += 1
+            time.sleep(0.001)
+
+
+@pytest.fixture
+def pds_pdo_servo(virtual_drive_ethercat):
+    _, servo = virtual_drive_ethercat
+    tpdo_map = TPDOMap()
+    tpdo_map.add_registers(servo.dictionary.registers(SUBNODE)[servo.STATUS_WORD_REGISTERS])
+    rpdo_map = RPDOMap()
+    rpdo_map.add_registers(servo.dictionary.registers(SUBNODE)[servo.CONTROL_WORD_REGISTERS])
+    rpdo_map.items[0].value = 0
+    servo._tpdo_maps[0x1A00] = tpdo_map
+    servo._rpdo_maps[0x1600] = rpdo_map
+    drive = _FakePDSDrive(servo, ServoState.FAULT)
+    drive.start()
+    yield servo, drive
+    drive.stop_event.set()
+    drive.join()
+
+
+def test_pds_through_pdos(pds_pdo_servo, mocker):
+    servo, drive = pds_pdo_servo
+    read_raw = mocker.spy(servo, "_read_raw")
+    write_raw = mocker.spy(servo, "_write_raw")
+    while drive.cycles == 0:
+        time.sleep(0.001)
+
+    servo.enable()
+    assert servo.get_state() == ServoState.ENABLED
+    servo.disable()
+    assert servo.get_state() == ServoState.DISABLED
+    assert read_raw.call_count == 0
+    assert write_raw.call_count == 0
+
+    # The state machine goes through the mailbox once the exchange stops
+    drive.stop_event.set()
+    drive.join()
+    servo._pdo_exchange_stopped()
+    servo.get_state()
+    assert read_raw.call_count == 1
+
+
+def test_pds_from_the_pdo_thread(pds_pdo_servo, mocker):
+    servo, drive = pds_pdo_servo
+    write_raw = mocker.spy(servo, "_write_raw")
+    errors: list[Optional[Exception]] = []
+
+    def fault_reset() -> None:
+        drive.on_cycle = None
+        try:
+            servo.write_bitfields(servo.CONTROL_WORD_REGISTERS, {"FAULT_RESET": 1}, SUBNODE)
+            errors.append(None)
+        except Exception as e:
+            errors.append(e)
+
+    drive.on_cycle = fault_reset
+    while not errors:
+        time.sleep(0.001)
+
+    # The PDO cycle can not be waited for, the control word is written through the mailbox
+    assert errors == [None]
+    assert write_raw.call_count == 1
+
+
+def test_pds_with_trajectory_player(pds_pdo_servo, mocker):
+    servo, drive = pds_pdo_servo
+    read_raw = mocker.spy(servo, "_read_raw")
+    write_raw = mocker.spy(servo, "_write_raw")
+    while drive.cycles == 0:
+        time.sleep(0.001)
+    player = RPDOTrajectoryPlayer(servo, {servo.CONTROL_WORD_REGISTERS: [0]})
+    player.start()
+    try:
+        # The player would overwrite the control word set in the RPDO item
+        servo.write_bitfields(servo.CONTROL_WORD_REGISTERS, {"FAULT_RESET": 1}, SUBNODE)
+        assert write_raw.call_count == 1
+        read_raw.reset_mock()
+        servo.get_state(SUBNODE)
+        assert read_raw.call_count == 1
+    finally:
+        player.stop()
@@ -1,7 +1,9 @@
 import random
+import threading
 import time
 from functools import partial
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, call
 
 import pytest
 from summit_testing_framework.setups.descriptors import EthercatMultiSlaveSetup
@@ -9,7 +11,11 @@ from summit_testing_framework.setups.descriptors import EthercatMultiSlaveSetup
 from ingenialink.ethercat.network import EthercatNetwork
 from ingenialink.exceptions import ILError, ILWrongWorkingCountError
 from ingenialink.pdo import PDOMap, RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
-from ingenialink.pdo_network_manager import PDONetworkManager
+from ingenialink.pdo_network_manager import (
+    PDOCycleScheduler,
+    PDONetworkManager,
+    PDOSchedulerConfig,
+)
 from ingenialink.utils.timeout import Timeout
 
 if TYPE_CHECKING:
@@ -329,3 +335,152 @@ def test_notify_exceptions_calls_all_subscribers_even_if_one_raises() -> None:
 
     assert second_called == [error]
     net.close_ecat_master()
+
+
+def test_cycle_scheduler_absolute_deadlines() -> None:
+    period = 0.02
+    n_cycles = 20
+    scheduler = PDOCycleScheduler(period, spin_threshold=0.001)
+    scheduler.start()
+    first_deadline = scheduler.next_deadline
+    deadline = first_deadline
+    late_cycles = 0
+    for cycle in range(n_cycles):
+        # Simulate a variable cycle workload
+        time.sleep(period * (cycle % 3) / 20)
+        missed_deadlines = scheduler.wait()
+        wake_up_time = time.perf_counter()
+        # The cycles never start early, and on time unless the test machine is loaded
+        assert wake_up_time >= deadline
+        if missed_deadlines:
+            late_cycles += 1
+        else:
+            assert wake_up_time < deadline + period / 2
+        deadline += max(missed_deadlines, 1) * period
+
+    assert late_cycles <= n_cycles // 4
+    # The workload does not accumulate as drift
+    assert scheduler.next_deadline == pytest.approx(deadline)
+
+
+def test_cycle_scheduler_missed_deadlines() -> None:
+    period = 0.02
+    scheduler = PDOCycleScheduler(period, spin_threshold=0.001)
+    scheduler.start()
+    first_deadline = scheduler.next_deadline
+    time.sleep(2.5 * period)
+
+    start = time.perf_counter()
+    assert scheduler.wait() == 2
+    # The next cycle starts right away and the schedule keeps its phase
+    assert time.perf_counter() - start < period / 2
+    assert scheduler.next_deadline == pytest.approx(first_deadline + 2 * period)
+    assert scheduler.wait() == 0
+    assert time.perf_counter() >= first_deadline + 2 * period
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    [
+        ({"spin_threshold": -0.001}, "The spin threshold cannot be negative."),
+        ({"realtime_priority": 0}, "The realtime priority must be between 1 and 99."),
+        ({"realtime_priority": 100}, "The realtime priority must be between 1 and 99."),
+    ],
+)
+def test_scheduler_config_validation(kwargs, error) -> None:
+    with pytest.raises(ValueError) as exc_info:
+        PDOSchedulerConfig(**kwargs)
+    assert str(exc_info.value) == error
+
+
+@pytest.mark.pcap
+def test_scheduler_config_is_passed_to_the_pdo_thread(mocker) -> None:
+    net = EthercatNetwork("fake_interface")
+    config = PDOSchedulerConfig(
+        spin_threshold=0.0, realtime_priority=10, cpu_affinity=frozenset([0])
+    )
+    thread_mock = mocker.patch.object(PDONetworkManager, "ProcessDataThread")
+
+    assert net.pdo_manager.scheduler_config == PDOSchedulerConfig()
+    net.pdo_manager.scheduler_config = config
+    net.pdo_manager.start_pdos()
+
+    assert thread_mock.call_args.kwargs["scheduler_config"] is config
+    net.close_ecat_master()
+
+
+def test_off_cycle_callbacks_do_not_delay_the_cycles() -> None:
+    servo = MagicMock()
+    net = MagicMock()
+    net.servos = [servo]
+    callback_duration = 0.05
+    exchange_duration = 0.5
+    manager = PDONetworkManager(net)
+    manager.subscribe_to_receive_process_data(lambda: time.sleep(callback_duration))
+    manager.start_pdos(refresh_rate=0.005, off_cycle_callbacks=True)
+    callback_thread = manager._pdo_thread.callback_thread
+    time.sleep(exchange_duration)
+    skipped_callbacks = manager.skipped_callbacks
+    manager.stop_pdos()
+
+    cycles = net.send_receive_processdata.call_count
+    assert cycles > 2 * exchange_duration / callback_duration
+    assert 0 < callback_thread.processed_cycles <= exchange_duration / callback_duration + 1
+    assert skipped_callbacks > 0
+    # The start iteration is also posted to the callback thread
+    assert callback_thread.processed_cycles + callback_thread.skipped_cycles <= cycles + 1
+    assert servo._load_tpdo_snapshot.call_count == callback_thread.processed_cycles
+    assert servo._publish_rpdo_snapshot.call_count == callback_thread.processed_cycles
+    assert servo._set_off_cycle_processing.call_args_list == [call(True), call(False)]
+    assert not callback_thread.is_alive()
+    assert manager.skipped_callbacks == 0
+
+
+def test_off_cycle_callbacks_exception() -> None:
+    net = MagicMock()
+    net.servos = []
+    manager = PDONetworkManager(net)
+    exceptions: list[ILError] = []
+    manager.subscribe_to_exceptions(exceptions.append)
+
+    thread_captured = threading.Event()
+
+    def failing_callback() -> None:
+        thread_captured.wait(timeout=1)
+        raise ValueError("Callback error")
+
+    manager.subscribe_to_receive_process_data(failing_callback)
+    manager.start_pdos(refresh_rate=0.005, off_cycle_callbacks=True)
+    # The PDOs are stopped once the exception is notified
+    pdo_thread = manager._pdo_thread
+    thread_captured.set()
+    pdo_thread.join(timeout=1)
+
+    assert not pdo_thread.is_alive()
+    assert not pdo_thread.callback_thread.is_alive()
+    assert not manager.is_active
+    assert [str(exception) for exception in exceptions] == [
+        "Exception in the PDO callbacks: Callback error"
+    ]
+
+
+def test_separate_process_exchange(mocker) -> None:
+    exchange_class = mocker.patch("ingenialink.pdo_network_manager.PDOProcessExchange")
+    exchange = exchange_class.return_value
+    exchange.last_wkc = 3
+    net = MagicMock()
+    net.servos = []
+    manager = PDONetworkManager(net)
+    manager.enable_statistics()
+    manager.start_pdos(refresh_rate=0.005, separate_process=True)
+    time.sleep(0.1)
+    manager.stop_pdos()
+
+    exchange_class.assert_called_once_with(net, 0.005, manager.scheduler_config)
+    exchange.start.assert_called_once()
+    assert exchange.send_receive.call_count > 0
+    exchange.stop.assert_called_once()
+    net.start_pdos.assert_not_called()
+    net.send_receive_processdata.assert_not_called()
+    net.stop_pdos.assert_not_called()
+    assert set(manager.statistics().wkc_history) == {3}
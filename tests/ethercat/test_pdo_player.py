@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+from bitarray import bitarray
+
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.exceptions import ILError, ILValueError
+from ingenialink.pdo import BIT_ENDIAN, RPDOMap, RPDOMapItem
+from ingenialink.pdo_player import RPDOTrajectoryPlayer, TrajectoryEndPolicy
+
+
+@pytest.fixture
+def rpdo_servo(virtual_drive_ethercat):
+    # POS is byte aligned, FLAG, CODE and VEL are not
+    _, servo = virtual_drive_ethercat
+    rpdo_map = RPDOMap()
+    for subidx, (dtype, identifier) in enumerate(
+        [
+            (RegDtype.S16, "POS"),
+            (RegDtype.BOOL, "FLAG"),
+            (RegDtype.U8, "CODE"),
+            (RegDtype.FLOAT, "VEL"),
+        ],
+        start=1,
+    ):
+        register = EthercatRegister(
+            0x2001,
+            subidx,
+            dtype,
+            RegAccess.RW,
+            pdo_access=RegCyclicType.RX,
+            identifier=identifier,
+        )
+        item = RPDOMapItem(register)
+        item.value = False if dtype == RegDtype.BOOL else 0
+        rpdo_map.add_item(item)
+    servo._rpdo_maps[0x1600] = rpdo_map
+    return servo, rpdo_map
+
+
+def _encoded_with_items(servo, rpdo_map, position, flag, code, velocity) -> bytes:
+    for item, value in zip(rpdo_map.items, (position, flag, code, velocity)):
+        item.value = value
+    return servo._process_rpdo()
+
+
+def test_player_rows_match_item_encoding(rpdo_servo):
+    servo, rpdo_map = rpdo_servo
+    positions = np.array([-2, 0, 300])
+    flags = np.array([True, False, True])
+    codes = np.array([255, 1, 7])
+    velocities = np.array([1.5, -2.25, 1e3])
+    player = RPDOTrajectoryPlayer(
+        servo, {"POS": positions, "FLAG": flags, "CODE": codes, rpdo_map.items[3]: velocities}
+    )
+    assert len(player) == 3
+    expected = [
+        _encoded_with_items(servo, rpdo_map, *values)
+        for values in zip(positions.tolist(), flags.tolist(), codes.tolist(), velocities.tolist())
+    ]
+    assert [row.tobytes() for row in player.rows] == expected
+
+
+def test_player_structured_trajectory(rpdo_servo):
+    servo, rpdo_map = rpdo_servo
+    rpdo_map.items[2].value = 9
+    trajectory = np.zeros(2, dtype=[("POS", np.int32), ("VEL", np.float64)])
+    trajectory["POS"] = [10, 20]
+    trajectory["VEL"] = [0.5, 1.0]
+    player = RPDOTrajectoryPlayer(servo, trajectory)
+    # The items that are not in the trajectory keep their values
+    assert player.rows[1].tobytes() == _encoded_with_items(servo, rpdo_map, 20, False, 9, 1.0)
+
+
+@pytest.mark.parametrize(
+    "end_policy, expected_positions, expected_underruns",
+    [
+        (TrajectoryEndPolicy.HOLD_LAST, [1, 2, 3, 3, 3], 0),
+        (TrajectoryEndPolicy.LOOP, [1, 2, 3, 1, 2], 0),
+        (TrajectoryEndPolicy.UNDERRUN, [1, 2, 3, 7, 7], 2),
+    ],
+)
+def test_player_end_policies(rpdo_servo, end_policy, expected_positions, expected_underruns):
+    servo, rpdo_map = rpdo_servo
+    rpdo_map.items[0].value = 7
+    player = RPDOTrajectoryPlayer(servo, {"POS": [1, 2, 3]}, end_policy=end_policy)
+    player.start()
+    try:
+        sent_positions = [
+            int.from_bytes(servo._process_rpdo()[:2], "little", signed=True) for _ in range(5)
+        ]
+    finally:
+        player.stop()
+    assert sent_positions == expected_positions
+    assert player.underruns == expected_underruns
+    assert player.cycles == 5 - expected_underruns
+    assert player.is_finished == (end_policy != TrajectoryEndPolicy.LOOP)
+
+    # The items are sent again once the player is stopped
+    assert int.from_bytes(servo._process_rpdo()[:2], "little", signed=True) == 7
+    player.rewind()
+    assert player.position == 0
+    assert not player.is_finished
+
+
+def test_player_only_one_per_servo(rpdo_servo):
+    servo, _ = rpdo_servo
+    player = RPDOTrajectoryPlayer(servo, {"POS": [1]})
+    other_player = RPDOTrajectoryPlayer(servo, {"POS": [2]})
+    player.start()
+    try:
+        with pytest.raises(ILError):
+            other_player.start()
+        other_player.stop()
+        assert servo._process_rpdo()[:2] == b"\x01\x00"
+    finally:
+        player.stop()
+
+
+@pytest.mark.parametrize(
+    "trajectory",
+    [
+        {"POS": [1, 2], "CODE": [1]},
+        {"POS": []},
+        {"POS": [[1, 2]]},
+        {"POS": [40000]},
+        {"CODE": [-1]},
+        {"POS": [1.5]},
+    ],
+)
+def test_player_invalid_trajectory(rpdo_servo, trajectory):
+    servo, _ = rpdo_servo
+    with pytest.raises(ILValueError):
+        RPDOTrajectoryPlayer(servo, trajectory)
+
+
+def test_player_item_not_mapped(rpdo_servo):
+    servo, _ = rpdo_servo
+    with pytest.raises(ILError):
+        RPDOTrajectoryPlayer(servo, {"NOT_MAPPED": [1]})
+
+
+@pytest.mark.parametrize(
+    ("dtype", "valid_values", "invalid_value"),
+    [
+        (RegDtype.U16, [0, 4095], 4096),
+        (RegDtype.S16, [-2048, 2047], 2048),
+        (RegDtype.S16, [-2048, 2047], -2049),
+    ],
+)
+def test_player_values_fit_the_item_size(
+    virtual_drive_ethercat, dtype, valid_values, invalid_value
+):
+    _, servo = virtual_drive_ethercat
+    register = EthercatRegister(
+        0x2002, 1, dtype, RegAccess.RW, pdo_access=RegCyclicType.RX, identifier="CURRENT"
+    )
+    # A 12-bit item, padded to 16 bits
+    item = RPDOMapItem(register, size_bits=12)
+    item.raw_data_bits = bitarray("0" * 12, endian=BIT_ENDIAN)
+    padding = RPDOMapItem(size_bits=4)
+    padding.raw_data_bits = bitarray("0" * 4, endian=BIT_ENDIAN)
+    rpdo_map = RPDOMap()
+    rpdo_map.add_item(item)
+    rpdo_map.add_item(padding)
+    servo._rpdo_maps[0x1600] = rpdo_map
+    player = RPDOTrajectoryPlayer(servo, {"CURRENT": valid_values})
+    assert [int.from_bytes(row.tobytes(), "little") & 0xFFF for row in player.rows] == [
+        value & 0xFFF for value in valid_values
+    ]
+    with pytest.raises(ILValueError, match="out of the"):
+        RPDOTrajectoryPlayer(servo, {"CURRENT": [invalid_value]})
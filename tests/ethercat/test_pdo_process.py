@@ -0,0 +1,260 @@
+import multiprocessing
+import queue
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pysoem
+import pytest
+
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.exceptions import ILError, ILWrongWorkingCountError
+from ingenialink.pdo import RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
+from ingenialink.pdo_process import (
+    PDOProcessConfig,
+    PDOProcessExchange,
+    PDOProcessImage,
+    _ProcessStatus,
+    run_process_data_exchange,
+)
+from ingenialink.pdo_scheduler import PDOSchedulerConfig
+from tests.benchmarks.simulated_pysoem import SimulatedLatency, SimulatedMaster
+
+IMAGE_SIZE = 4096
+WRITES = 2000
+
+
+def _write_uniform_images(name: str) -> None:
+    image = PDOProcessImage.attach(name, IMAGE_SIZE, 0)
+    for value in range(1, WRITES + 1):
+        image.write_outputs(bytes([value % 256]) * IMAGE_SIZE)
+    image.request_stop()
+    image.close()
+
+
+def test_process_image():
+    image = PDOProcessImage.create(outputs_size=4, inputs_size=2)
+    other_side = PDOProcessImage.attach(image.name, outputs_size=4, inputs_size=2)
+    try:
+        assert other_side.read_inputs() == (0, 0, b"\x00\x00")
+        image.write_outputs(b"\x01\x02\x03\x04")
+        assert other_side.read_outputs() == b"\x01\x02\x03\x04"
+        other_side.write_inputs(cycle=7, wkc=3, data=b"\x05\x06")
+        assert image.read_inputs() == (7, 3, b"\x05\x06")
+
+        with pytest.raises(ILError):
+            image.write_outputs(b"\x01")
+        with pytest.raises(ILError):
+            other_side.write_inputs(cycle=8, wkc=3, data=b"\x05")
+
+        assert not other_side.stop_requested
+        image.request_stop()
+        assert other_side.stop_requested
+    finally:
+        other_side.close()
+        image.close()
+        image.unlink()
+
+
+def test_process_image_reads_are_not_torn():
+    image = PDOProcessImage.create(outputs_size=IMAGE_SIZE, inputs_size=0)
+    writer = multiprocessing.get_context("spawn").Process(
+        target=_write_uniform_images, args=(image.name,)
+    )
+    writer.start()
+    reads = 0
+    try:
+        while not image.stop_requested:
+            data = image.read_outputs()
+            assert data == data[:1] * IMAGE_SIZE
+            reads += 1
+        writer.join(timeout=10)
+        assert writer.exitcode == 0
+        assert image.read_outputs() == bytes([WRITES % 256]) * IMAGE_SIZE
+        assert reads > 0
+    finally:
+        if writer.is_alive():
+            writer.terminate()
+        image.close()
+        image.unlink()
+
+
+class _FakeChildProcess(threading.Thread):
+    def terminate(self) -> None:
+        pass
+
+
+def _fake_process_data_exchange(config, status_queue, wrong_wkc_after=None) -> None:
+    image = PDOProcessImage.attach(
+        config.shared_memory_name, sum(config.outputs_sizes), sum(config.inputs_sizes)
+    )
+    status_queue.put((_ProcessStatus.STARTED, ""))
+    cycle = 0
+    inputs = bytes(range(sum(config.inputs_sizes)))
+    while not image.stop_requested:
+        cycle += 1
+        _fake_process_data_exchange.outputs = image.read_outputs()
+        image.write_inputs(cycle, config.expected_wkc, inputs)
+        if wrong_wkc_after is not None and cycle == wrong_wkc_after:
+            status_queue.put((_ProcessStatus.WRONG_WKC, "Wrong WKC"))
+            break
+        time.sleep(config.refresh_rate)
+    image.close()
+
+
+@pytest.fixture
+def process_exchange_servo(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    tpdo_map = TPDOMap()
+    for subidx in (1, 2):
+        register = EthercatRegister(
+            0x2000, subidx, RegDtype.U16, RegAccess.RO, pdo_access=RegCyclicType.TX, identifier="M"
+        )
+        tpdo_map.add_item(TPDOMapItem(register))
+    rpdo_map = RPDOMap()
+    register = EthercatRegister(
+        0x2001, 1, RegDtype.S16, RegAccess.RW, pdo_access=RegCyclicType.RX, identifier="M"
+    )
+    rpdo_item = RPDOMapItem(register)
+    rpdo_item.value = 7
+    rpdo_map.add_item(rpdo_item)
+    servo._tpdo_maps[0x1A00] = tpdo_map
+    servo._rpdo_maps[0x1600] = rpdo_map
+    mocker.patch.object(multiprocessing.get_context("spawn"), "Process", _FakeChildProcess)
+    net = MagicMock()
+    net.servos = [servo]
+    net.interface_name = "fake_interface"
+    net._overlapping_io_map = False
+    net.EXPECTED_WKC_PROCESS_DATA = 3
+    return net, servo, tpdo_map, rpdo_item
+
+
+def test_process_exchange(process_exchange_servo, mocker):
+    net, servo, tpdo_map, rpdo_item = process_exchange_servo
+    mocker.patch("ingenialink.pdo_process.run_process_data_exchange", _fake_process_data_exchange)
+    exchange = PDOProcessExchange(net, 0.005, PDOSchedulerConfig())
+    exchange.start()
+    try:
+        # The PDO maps are written while the network still owns the master
+        assert [name for name, *_ in net.mock_calls][:2] == ["config_pdo_maps", "_release_master"]
+        assert exchange.is_running
+        rpdo_item.value = -2
+        time.sleep(0.05)
+        exchange.send_receive()
+        assert exchange.cycles > 0
+        assert exchange.last_wkc == 3
+        assert [item.value for item in tpdo_map.items] == [0x0100, 0x0302]
+        assert bytes(servo.pdo_inputs) == b"\x00\x01\x02\x03"
+        time.sleep(0.05)
+        assert _fake_process_data_exchange.outputs == b"\xfe\xff"
+    finally:
+        exchange_stopped = mocker.spy(servo, "_pdo_exchange_stopped")
+        exchange.stop()
+    assert not exchange.is_running
+    net._reclaim_master.assert_called_once()
+    exchange_stopped.assert_called_once()
+
+
+def test_process_exchange_wrong_wkc(process_exchange_servo, mocker):
+    net, _, _, _ = process_exchange_servo
+
+    def wrong_wkc_process(config, status_queue):
+        _fake_process_data_exchange(config, status_queue, wrong_wkc_after=2)
+
+    mocker.patch("ingenialink.pdo_process.run_process_data_exchange", wrong_wkc_process)
+    exchange = PDOProcessExchange(net, 0.005, PDOSchedulerConfig())
+    exchange.start()
+    try:
+        time.sleep(0.1)
+        with pytest.raises(ILWrongWorkingCountError) as exc_info:
+            exchange.send_receive()
+        assert str(exc_info.value) == "Wrong WKC"
+        with pytest.raises(ILError) as exc_info:
+            exchange.send_receive()
+        assert str(exc_info.value) == "The process data process stopped unexpectedly."
+    finally:
+        exchange.stop()
+    net._reclaim_master.assert_called_once()
+
+
+@pytest.fixture
+def simulated_master(mocker):
+    master = SimulatedMaster(num_slaves=1, latency=SimulatedLatency(0.0, 0.0, 0.0))
+    master.config_init()
+    # RPDO map with a 16-bit item and TPDO map with two 16-bit items
+    master.slaves[0].object_dictionary.update({
+        (0x1C12, 0): b"\x01",
+        (0x1C12, 1): (0x1600).to_bytes(2, "little"),
+        (0x1600, 0): b"\x01",
+        (0x1600, 1): (0x20010110).to_bytes(4, "little"),
+        (0x1C13, 0): b"\x01",
+        (0x1C13, 1): (0x1A00).to_bytes(2, "little"),
+        (0x1A00, 0): b"\x02",
+        (0x1A00, 1): (0x20000110).to_bytes(4, "little"),
+        (0x1A00, 2): (0x20000210).to_bytes(4, "little"),
+    })
+    mocker.patch("pysoem.Master", lambda: master)
+    return master
+
+
+def _process_config(image: PDOProcessImage, outputs_size: int, inputs_size: int):
+    return PDOProcessConfig(
+        interface_name="fake_interface",
+        overlapping_io_map=False,
+        slave_ids=(1,),
+        op_slave_ids=(1,),
+        outputs_sizes=(outputs_size,),
+        inputs_sizes=(inputs_size,),
+        expected_wkc=3,
+        refresh_rate=0.001,
+        processdata_timeout=0.001,
+        state_timeout=1.0,
+        scheduler_config=PDOSchedulerConfig(),
+        shared_memory_name=image.name,
+    )
+
+
+@pytest.mark.pcap
+def test_run_process_data_exchange(simulated_master):
+    image = PDOProcessImage.create(outputs_size=2, inputs_size=4)
+    image.write_outputs(b"\x07\x00")
+    status_queue = queue.Queue()
+    exchange = threading.Thread(
+        target=run_process_data_exchange, args=(_process_config(image, 2, 4), status_queue)
+    )
+    exchange.start()
+    try:
+        assert status_queue.get(timeout=5) == (_ProcessStatus.STARTED, "")
+        slave = simulated_master.slaves[0]
+        assert slave.state == pysoem.OP_STATE
+        time.sleep(0.05)
+        cycle, wkc, inputs = image.read_inputs()
+        assert cycle > 0
+        assert wkc == 3
+        assert inputs in (bytes(4), bytes(range(4)))
+        assert slave.output == b"\x07\x00"
+    finally:
+        image.request_stop()
+        exchange.join(timeout=5)
+        image.close()
+        image.unlink()
+    assert not exchange.is_alive()
+    assert status_queue.empty()
+    assert simulated_master.slaves[0].state == pysoem.INIT_STATE
+
+
+@pytest.mark.pcap
+def test_run_process_data_exchange_wrong_mapping(simulated_master):
+    image = PDOProcessImage.create(outputs_size=4, inputs_size=4)
+    status_queue = queue.Queue()
+    try:
+        run_process_data_exchange(_process_config(image, 4, 4), status_queue)
+    finally:
+        image.close()
+        image.unlink()
+    assert status_queue.get_nowait() == (
+        _ProcessStatus.ERROR,
+        "The PDO mapping of slave 1 does not match its PDO maps.",
+    )
+    assert simulated_master.slaves[0].state == pysoem.INIT_STATE
@@ -0,0 +1,254 @@
+import struct
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.exceptions import ILError
+from ingenialink.pdo import TPDOMap, TPDOMapItem
+from ingenialink.pdo_network_manager import PDONetworkManager
+from ingenialink.pdo_recorder import PDORecorder, PDORecorderMode
+
+
+def _create_tpdo_map() -> TPDOMap:
+    # POS is byte aligned, FLAG, CODE and VEL are not
+    tpdo_map = TPDOMap()
+    for subidx, (dtype, identifier) in enumerate(
+        [
+            (RegDtype.S16, "POS"),
+            (RegDtype.BOOL, "FLAG"),
+            (RegDtype.U8, "CODE"),
+            (RegDtype.FLOAT, "VEL"),
+        ],
+        start=1,
+    ):
+        register = EthercatRegister(
+            0x2000,
+            subidx,
+            dtype,
+            RegAccess.RO,
+            pdo_access=RegCyclicType.TX,
+            identifier=identifier,
+        )
+        tpdo_map.add_item(TPDOMapItem(register))
+    return tpdo_map
+
+
+def _encode(position: int, flag: bool, code: int, velocity: float) -> bytes:
+    velocity_bits = struct.unpack("<I", struct.pack("<f", velocity))[0]
+    bits = (position & 0xFFFF) | (int(flag) << 16) | (code << 17) | (velocity_bits << 25)
+    return bits.to_bytes(8, "little")
+
+
+@pytest.fixture
+def recorded_servo(virtual_drive_ethercat):
+    _, servo = virtual_drive_ethercat
+    servo._tpdo_maps[0x1A00] = _create_tpdo_map()
+    return servo
+
+
+def _record_cycles(recorder, servo, cycles) -> None:
+    for cycle in cycles:
+        servo._process_tpdo(_encode(-cycle, cycle % 2 == 1, cycle, cycle / 2))
+        recorder.record(float(cycle))
+
+
+def test_recorder_decode(recorded_servo):
+    recorder = PDORecorder([recorded_servo], capacity=8)
+    assert recorder.row_size == 16
+    assert recorder.dtype.names == ("timestamp", "POS", "FLAG", "CODE", "VEL")
+    _record_cycles(recorder, recorded_servo, range(5))
+
+    assert len(recorder) == 5
+    assert recorder.cycles == 5
+    decoded = recorder.decode()
+    assert decoded["timestamp"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert decoded["POS"].tolist() == [0, -1, -2, -3, -4]
+    assert decoded["FLAG"].tolist() == [False, True, False, True, False]
+    assert decoded["CODE"].tolist() == [0, 1, 2, 3, 4]
+    assert decoded["VEL"].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert decoded["VEL"].dtype == np.float32
+    assert recorder.decode(1, 3)["POS"].tolist() == [-1, -2]
+    assert recorder.timestamps(-2).tolist() == [3.0, 4.0]
+
+    recorder.clear()
+    assert len(recorder) == 0
+    assert recorder.decode().shape == (0,)
+
+
+def test_recorder_ring_wraparound(recorded_servo):
+    recorder = PDORecorder([recorded_servo], capacity=4)
+    _record_cycles(recorder, recorded_servo, range(10))
+
+    assert len(recorder) == 4
+    assert recorder.cycles == 10
+    assert recorder.timestamps().tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert recorder.decode()["CODE"].tolist() == [6, 7, 8, 9]
+
+
+def test_recorder_spill(recorded_servo, tmp_path):
+    spill_path = tmp_path / "tpdo.bin"
+    recorder = PDORecorder(
+        [recorded_servo], capacity=4, mode=PDORecorderMode.SPILL, spill_path=str(spill_path)
+    )
+    try:
+        _record_cycles(recorder, recorded_servo, range(10))
+        assert len(recorder) == 10
+        assert recorder.decode()["CODE"].tolist() == list(range(10))
+        assert recorder.timestamps(3, 9).tolist() == [3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+    finally:
+        recorder.close()
+    assert spill_path.stat().st_size == 8 * recorder.row_size
+    assert recorder.decode()["POS"].tolist() == [-cycle for cycle in range(10)]
+
+
+def test_recorder_spill_reuses_the_buffers(recorded_servo, tmp_path, mocker):
+    recorder = PDORecorder(
+        [recorded_servo],
+        capacity=4,
+        mode=PDORecorderMode.SPILL,
+        spill_path=str(tmp_path / "tpdo.bin"),
+    )
+    allocate_buffer = mocker.spy(recorder, "_PDORecorder__allocate_buffer")
+    try:
+        for first_cycle in range(0, 16, 4):
+            _record_cycles(recorder, recorded_servo, range(first_cycle, first_cycle + 4))
+            # Wait until the full buffer is written to the file and can be reused
+            recorder._PDORecorder__spill_queue.join()
+        assert allocate_buffer.call_count == 0
+        assert recorder.decode()["CODE"].tolist() == list(range(16))
+    finally:
+        recorder.close()
+
+
+def test_recorder_rows_overwritten_while_copied(recorded_servo, mocker):
+    recorder = PDORecorder([recorded_servo], capacity=4)
+    _record_cycles(recorder, recorded_servo, range(4))
+    copy_rows = recorder._PDORecorder__copy_rows
+
+    def copy_rows_while_recording(*args):
+        rows = copy_rows(*args)
+        # The oldest row is overwritten during the first two copies
+        if recorder.cycles < 6:
+            _record_cycles(recorder, recorded_servo, [recorder.cycles])
+        return rows
+
+    def copy_rows_and_record(*args):
+        rows = copy_rows(*args)
+        _record_cycles(recorder, recorded_servo, [recorder.cycles])
+        return rows
+
+    copy_rows_mock = mocker.patch.object(
+        recorder, "_PDORecorder__copy_rows", side_effect=copy_rows_while_recording
+    )
+    assert recorder.timestamps().tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert copy_rows_mock.call_count == 3
+    # The newest rows are not overwritten
+    copy_rows_mock.reset_mock()
+    copy_rows_mock.side_effect = copy_rows_and_record
+    assert recorder.timestamps(-1).tolist() == [5.0]
+    assert copy_rows_mock.call_count == 1
+
+
+def test_recorder_rows_kept_being_overwritten(recorded_servo, mocker):
+    recorder = PDORecorder([recorded_servo], capacity=4)
+    _record_cycles(recorder, recorded_servo, range(4))
+    copy_rows = recorder._PDORecorder__copy_rows
+    lock = recorder._PDORecorder__lock
+
+    def copy_rows_and_record(*args):
+        # The recording is not blocked while the rows are copied
+        assert not lock.locked()
+        rows = copy_rows(*args)
+        _record_cycles(recorder, recorded_servo, [recorder.cycles])
+        return rows
+
+    copy_rows_mock = mocker.patch.object(
+        recorder, "_PDORecorder__copy_rows", side_effect=copy_rows_and_record
+    )
+    # The oldest row of the last copy is left out
+    assert recorder.timestamps().tolist() == [4.0, 5.0, 6.0]
+    assert copy_rows_mock.call_count == 4
+
+
+def test_recorder_clear_does_not_wait_for_the_spill_file(recorded_servo, tmp_path, mocker):
+    spill_path = tmp_path / "tpdo.bin"
+    recorder = PDORecorder(
+        [recorded_servo], capacity=4, mode=PDORecorderMode.SPILL, spill_path=str(spill_path)
+    )
+    spill_file = recorder._PDORecorder__spill_file
+    writing = threading.Event()
+    written = threading.Event()
+    release = threading.Event()
+
+    def blocking_write(data):
+        writing.set()
+        release.wait(timeout=5)
+        written.set()
+        return spill_file.write(data)
+
+    recorder._PDORecorder__spill_file = mocker.MagicMock(wraps=spill_file)
+    recorder._PDORecorder__spill_file.write.side_effect = blocking_write
+    try:
+        _record_cycles(recorder, recorded_servo, range(4))
+        assert writing.wait(timeout=1)
+        recorder.clear()
+        _record_cycles(recorder, recorded_servo, [100, 101])
+        # Neither the clear nor the recording waited for the file write
+        assert not written.is_set()
+        assert recorder.decode()["CODE"].tolist() == [100, 101]
+    finally:
+        release.set()
+        recorder.close()
+    assert spill_path.stat().st_size == 0
+    assert recorder.decode()["CODE"].tolist() == [100, 101]
+
+
+def test_recorder_missed_cycles(recorded_servo):
+    # The TPDO data has not been received yet
+    recorder = PDORecorder([recorded_servo], capacity=4)
+    recorder.record(0.0)
+    assert recorder.missed_cycles == 1
+    assert len(recorder) == 0
+
+
+def test_recorder_invalid_arguments(recorded_servo):
+    with pytest.raises(ValueError):
+        PDORecorder([recorded_servo], capacity=0)
+    with pytest.raises(ValueError):
+        PDORecorder([recorded_servo], mode=PDORecorderMode.SPILL)
+    recorded_servo._tpdo_maps[0x1A01] = _create_tpdo_map()
+    with pytest.raises(ILError):
+        PDORecorder([recorded_servo])
+
+
+def test_manager_recording(recorded_servo):
+    net = MagicMock()
+    net.servos = []
+    net.EXPECTED_WKC_PROCESS_DATA = 3
+    net.last_processdata_wkc = 3
+    recorded_servo._process_tpdo(_encode(5, True, 6, 7.0))
+    manager = PDONetworkManager(net)
+    recorder = manager.start_recording([recorded_servo], capacity=100)
+    assert manager.recorder is recorder
+    with pytest.raises(ILError):
+        manager.start_recording()
+    manager.start_pdos(refresh_rate=0.005)
+    try:
+        time.sleep(0.1)
+    finally:
+        manager.stop_pdos()
+    assert manager.stop_recording() is recorder
+    assert manager.recorder is None
+    with pytest.raises(ILError):
+        manager.stop_recording()
+
+    decoded = recorder.decode()
+    assert len(decoded) > 0
+    assert np.all(np.diff(decoded["timestamp"]) > 0)
+    assert set(decoded["CODE"].tolist()) == {6}
+    assert set(decoded["VEL"].tolist()) == {7.0}
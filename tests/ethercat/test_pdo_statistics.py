@@ -0,0 +1,152 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from ingenialink.exceptions import ILError, ILWrongWorkingCountError
+from ingenialink.pdo_network_manager import PDONetworkManager
+from ingenialink.pdo_statistics import LatencyHistogram, PDOCycleStatistics
+
+
+def _create_fake_network(wkc: int = 3) -> MagicMock:
+    net = MagicMock()
+    net.servos = []
+    net.EXPECTED_WKC_PROCESS_DATA = 3
+    net.last_processdata_wkc = wkc
+    return net
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    for value_us in range(1, 1001):
+        histogram.record(value_us / 1_000_000)
+
+    summary = histogram.summary()
+    assert summary.count == 1000
+    assert summary.min == pytest.approx(1e-6)
+    assert summary.max == pytest.approx(1e-3)
+    assert summary.mean == pytest.approx(500.5e-6)
+    assert summary.p50 == pytest.approx(500e-6, rel=0.02)
+    assert summary.p90 == pytest.approx(900e-6, rel=0.02)
+    assert summary.p99 == pytest.approx(990e-6, rel=0.02)
+    assert summary.p999 == pytest.approx(1e-3, rel=0.02)
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.percentile(99) == 0.0
+
+
+def test_latency_histogram_clamps_values():
+    histogram = LatencyHistogram(max_value=1.0)
+    histogram.record(5.0)
+    histogram.record(-1.0)
+    assert histogram.summary().max == 1.0
+    assert histogram.summary().min == 0.0
+    assert histogram.percentile(100) == 1.0
+
+
+def test_cycle_statistics_ring_buffer():
+    statistics = PDOCycleStatistics(ring_buffer_size=4, wkc_history_size=3)
+    statistics.configure(refresh_rate=0.01, watchdog_timeout=0.1, expected_wkc=3)
+    for cycle in range(6):
+        statistics.record_cycle(
+            timestamp=float(cycle),
+            cycle_time=0.09 if cycle == 5 else 0.01,
+            callback_time=0.001,
+            send_receive_time=0.002,
+            sleep_time=0.007,
+            wkc=3 if cycle < 5 else 0,
+            missed_deadlines=1 if cycle == 5 else 0,
+        )
+
+    snapshot = statistics.snapshot()
+    assert snapshot.cycles == 6
+    assert snapshot.overruns == 1
+    assert snapshot.watchdog_near_misses == 1
+    assert snapshot.expected_wkc == 3
+    assert snapshot.wkc_history == (3, 3, 0)
+    assert list(snapshot.last_cycles["timestamp"]) == [2.0, 3.0, 4.0, 5.0]
+    assert list(snapshot.last_cycles["wkc"]) == [3, 3, 3, 0]
+    assert snapshot.cycle_time.max == pytest.approx(0.09)
+    assert snapshot.jitter.max == pytest.approx(0.08)
+    assert snapshot.send_receive_time.mean == pytest.approx(0.002)
+
+    statistics.reset()
+    snapshot = statistics.snapshot()
+    assert snapshot.cycles == 0
+    assert snapshot.wkc_history == ()
+    assert len(snapshot.last_cycles) == 0
+
+
+def test_pdo_thread_records_statistics():
+    net = _create_fake_network()
+    statistics = PDOCycleStatistics()
+    refresh_rate = 0.005
+    pdo_thread = PDONetworkManager.ProcessDataThread(
+        net=net,
+        refresh_rate=refresh_rate,
+        watchdog_timeout=None,
+        notify_send_process_data=lambda: None,
+        notify_receive_process_data=lambda: time.sleep(0.001),
+        notify_exceptions=MagicMock(),
+        statistics=statistics,
+    )
+    pdo_thread.start()
+    time.sleep(0.2)
+    pdo_thread.stop()
+
+    snapshot = statistics.snapshot()
+    assert snapshot.cycles > 0
+    # The start iteration is not recorded
+    assert snapshot.cycles == net.send_receive_processdata.call_count
+    assert snapshot.expected_wkc == 0
+    assert set(snapshot.wkc_history) == {3}
+    assert snapshot.callback_time.min >= 0.001
+    assert snapshot.cycle_time.p50 == pytest.approx(refresh_rate, rel=0.2)
+    assert (snapshot.last_cycles["sleep_time"] > 0).any()
+
+
+def test_pdo_thread_wrong_wkc_error_reports_statistics():
+    net = _create_fake_network(wkc=1)
+    net.send_receive_processdata.side_effect = ILWrongWorkingCountError("Wrong WKC")
+    exceptions: list[ILError] = []
+    statistics = PDOCycleStatistics()
+    pdo_thread = PDONetworkManager.ProcessDataThread(
+        net=net,
+        refresh_rate=0.005,
+        watchdog_timeout=None,
+        notify_send_process_data=lambda: None,
+        notify_receive_process_data=lambda: None,
+        notify_exceptions=exceptions.append,
+        statistics=statistics,
+    )
+    pdo_thread.start()
+    pdo_thread.join(timeout=1)
+
+    assert len(exceptions) == 1
+    assert str(exceptions[0]).startswith(
+        "PDO exchange error (wrong working count): Wrong WKC Cycle statistics: 1 cycles"
+    )
+    assert "last working counters [1] (expected 0)" in str(exceptions[0])
+    assert statistics.snapshot().wkc_history == (1,)
+
+
+def test_pdo_manager_statistics():
+    manager = PDONetworkManager(_create_fake_network())
+    with pytest.raises(ILError) as exc_info:
+        manager.statistics()
+    assert str(exc_info.value) == "The PDO statistics are not enabled."
+
+    manager.enable_statistics(ring_buffer_size=10)
+    assert manager.statistics().cycles == 0
+    manager.start_pdos(refresh_rate=0.005)
+    time.sleep(0.1)
+    manager.stop_pdos()
+    assert manager.statistics().cycles > 0
+    assert len(manager.statistics().last_cycles) <= 10
+
+    manager.reset_statistics()
+    assert manager.statistics().cycles == 0
+    manager.disable_statistics()
+    with pytest.raises(ILError):
+        manager.statistics()
@@ -0,0 +1,138 @@
+import contextlib
+import itertools
+
+with contextlib.suppress(ImportError):
+    import pysoem
+import pytest
+
+import tests.resources
+from ingenialink.drive_context_manager import DriveRegistersValue
+from ingenialink.enums.register import RegDtype
+from ingenialink.ethercat.network import EthercatNetwork
+from ingenialink.utils._utils import dtype_length_bits
+
+
+class _FakeObjectDictionary:
+    """SDO server of a slave that supports complete access, except for some objects."""
+
+    def __init__(self, dictionary, refused_objects=()):
+        self.values = {
+            (register.idx, register.subidx): bytes(max(register.bit_length // 8, 1))
+            for register in dictionary.all_registers()
+            if register.dtype in dtype_length_bits and register.dtype != RegDtype.BYTE_ARRAY_512
+        }
+        self.refused_objects = set(refused_objects)
+        self.transfers = []
+
+    def __check_complete_access(self, index: int, subindex: int) -> None:
+        if index in self.refused_objects:
+            raise pysoem.SdoError(1, index, subindex, 0x06010000, "Unsupported access")
+
+    def sdo_read(self, index, subindex, size=0, ca=False, *, release_gil=None):  # noqa: ARG002
+        self.transfers.append(("read", index, subindex, ca))
+        if not ca:
+            return self.values.get((index, subindex), bytes(4))
+        self.__check_complete_access(index, subindex)
+        data = bytearray()
+        for entry in itertools.count(subindex):
+            if (index, entry) not in self.values:
+                break
+            data += self.values[index, entry] + (b"\x00" if entry == 0 else b"")
+        return bytes(data)
+
+    def sdo_write(self, index, subindex, data, ca=False, *, release_gil=None):  # noqa: ARG002
+        self.transfers.append(("write", index, subindex, ca))
+        if not ca:
+            self.values[index, subindex] = data
+            return
+        self.__check_complete_access(index, subindex)
+        offset = 0
+        for entry in itertools.count(subindex):
+            if offset >= len(data):
+                break
+            size = len(self.values[index, entry])
+            self.values[index, entry] = data[offset : offset + size]
+            offset += size + (1 if entry == 0 else 0)
+
+
+@pytest.fixture
+def snapshot_servo(pysoem_mock_network, mocker):  # noqa: ARG001
+    net = EthercatNetwork("dummy_ifname")
+    servo = net.connect_to_slave(1, tests.resources.DEN_NET_E_2_8_0_xdf_v3)
+    sdo_server = _FakeObjectDictionary(servo.dictionary)
+    mocker.patch.object(servo.slave, "sdo_read", sdo_server.sdo_read, create=True)
+    mocker.patch.object(servo.slave, "sdo_write", sdo_server.sdo_write)
+    yield servo, sdo_server
+    net.close_ecat_master()
+
+
+@pytest.mark.pcap
+def test_snapshot_read_groups_registers_by_object(snapshot_servo):
+    servo, sdo_server = snapshot_servo
+    obj = servo.dictionary.get_object("DS402_CL_POS_LIMIT_RANGE", 1)
+    sdo_server.values[obj.idx, 1] = (-5).to_bytes(4, "little", signed=True)
+    sdo_server.values[obj.idx, 2] = (7).to_bytes(4, "little", signed=True)
+    var_register = servo.dictionary.registers(1)["DRV_OP_CMD"]
+
+    values = servo._read_in_bulk([*obj.registers[1:], var_register])
+
+    assert values == {obj.registers[1]: -5, obj.registers[2]: 7}
+    assert sdo_server.transfers == [("read", obj.idx, 0, True)]
+
+
+@pytest.mark.pcap
+def test_snapshot_read_object_refusing_complete_access(snapshot_servo):
+    servo, sdo_server = snapshot_servo
+    obj = servo.dictionary.get_object("DS402_CL_POS_LIMIT_RANGE", 1)
+    sdo_server.refused_objects.add(obj.idx)
+
+    assert servo._read_in_bulk(obj.registers) == {}
+    # The object is not read with complete access anymore
+    assert servo._read_in_bulk(obj.registers) == {}
+    assert sdo_server.transfers == [("read", obj.idx, 0, True)]
+
+
+@pytest.mark.pcap
+def test_snapshot_from_hardware_matches_register_reads(snapshot_servo):
+    servo, sdo_server = snapshot_servo
+    for (index, subindex), data in list(sdo_server.values.items()):
+        sdo_server.values[index, subindex] = bytes(
+            (index + subindex + position) % 100 for position in range(len(data))
+        )
+    sdo_server.refused_objects.add(servo.dictionary.get_object("DS402_HOM_SPEED", 1).idx)
+
+    snapshot = DriveRegistersValue.from_hardware(servo, axis=1)
+    transfers = len(sdo_server.transfers)
+
+    assert len(snapshot._values) > transfers
+    for register, value in snapshot._values.items():
+        assert servo.read(register) == value
+
+
+@pytest.mark.pcap
+@pytest.mark.parametrize("refused", [False, True])
+def test_snapshot_write_keeps_the_order_of_the_registers(snapshot_servo, refused):
+    servo, sdo_server = snapshot_servo
+    obj = servo.dictionary.get_object("DS402_PROF_IP_TIME_PERIOD", 1)
+    if refused:
+        sdo_server.refused_objects.add(obj.idx)
+    var_register = servo.dictionary.registers(1)["DRV_OP_CMD"]
+    values = {
+        var_register: b"\x01\x00",
+        obj.registers[2]: b"\xfd",
+        obj.registers[1]: b"\x02",
+    }
+
+    results = list(servo._write_raw_in_bulk(values))
+
+    assert results == [(var_register, None), (obj.registers[1], None), (obj.registers[2], None)]
+    assert sdo_server.values[obj.idx, 1] == b"\x02"
+    assert sdo_server.values[obj.idx, 2] == b"\xfd"
+    if refused:
+        assert sdo_server.transfers[1:] == [
+            ("write", obj.idx, 1, True),
+            ("write", obj.idx, 1, False),
+            ("write", obj.idx, 2, False),
+        ]
+    else:
+        assert sdo_server.transfers[1:] == [("write", obj.idx, 1, True)]
@@ -0,0 +1,119 @@
+import sys
+import threading
+import time
+
+import pytest
+
+import tests.resources
+from ingenialink.ethercat.network import GilReleaseConfig
+from ingenialink.poller import Poller
+from tests.benchmarks.simulated_pysoem import map_pdos, simulated_network
+
+STRESS_TIME_S = 1.0
+# Switch threads as often as possible to interleave them also when the GIL is enabled
+SWITCH_INTERVAL_S = 1e-6
+
+SDO_REGISTER = "DRV_OP_CMD"
+RPDO_REGISTERS = ["CL_POS_SET_POINT_VALUE", "DRV_STATE_CONTROL"]
+TPDO_REGISTERS = ["CL_POS_FBK_VALUE", "DRV_STATE_STATUS"]
+POLLER_REGISTERS = ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"]
+
+
+@pytest.fixture
+def switch_interval():
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(SWITCH_INTERVAL_S)
+    yield
+    sys.setswitchinterval(previous_interval)
+
+
+@pytest.mark.pcap
+@pytest.mark.usefixtures("switch_interval")
+def test_concurrent_use_of_the_network(mocker):
+    mocker.patch("ingenialink.servo.ServoStatusListener.REFRESH_TIME_S", 0.001)
+    errors: list[BaseException] = []
+    stop = threading.Event()
+
+    def in_loop(function):
+        def run():
+            try:
+                while not stop.is_set():
+                    function()
+            except BaseException as e:
+                errors.append(e)
+
+        return run
+
+    with simulated_network(
+        tests.resources.DEN_NET_E_2_8_0_xdf_v3,
+        num_slaves=2,
+        gil_release_config=GilReleaseConfig.always(),
+    ) as (net, servos):
+        pdo_maps = [map_pdos(servo, RPDO_REGISTERS, TPDO_REGISTERS) for servo in servos]
+        net.pdo_manager.subscribe_to_exceptions(errors.append)
+        first_cycle = threading.Event()
+        net.pdo_manager.subscribe_to_receive_process_data(first_cycle.set)
+        net.pdo_manager.start_pdos(0.001)
+        # The TPDO items have no value until the first cycle is received
+        assert first_cycle.wait(timeout=1)
+        net.pdo_manager.unsubscribe_to_receive_process_data(first_cycle.set)
+        poller = Poller(servos[0], len(POLLER_REGISTERS))
+        poller.configure(0.001, 100)
+        for channel, uid in enumerate(POLLER_REGISTERS):
+            poller.ch_configure(channel, servos[0].dictionary.registers(1)[uid])
+        poller.start()
+
+        notifications = []
+
+        def read_sdo(servo):
+            return lambda: servo.read(SDO_REGISTER)
+
+        def churn_subscriptions():
+            def on_status(*_):
+                notifications.append("status")
+
+            def on_cycle():
+                notifications.append("cycle")
+
+            def on_register_update(*_):
+                notifications.append("register")
+
+            servos[0].subscribe_to_status(on_status)
+            net.subscribe_to_status(1, on_status)
+            net.pdo_manager.subscribe_to_receive_process_data(on_cycle)
+            servos[1].register_update_subscribe(on_register_update)
+            servos[0].unsubscribe_from_status(on_status)
+            net.unsubscribe_from_status(1, on_status)
+            net.pdo_manager.unsubscribe_to_receive_process_data(on_cycle)
+            servos[1].register_update_unsubscribe(on_register_update)
+
+        def restart_status_listener():
+            servos[1].start_status_listener()
+            servos[1].stop_status_listener()
+
+        def access_pdo_items():
+            for rpdo_map, tpdo_map in pdo_maps:
+                rpdo_map.items[0].value = 1
+                _ = [item.value for item in tpdo_map.items]
+
+        threads = [
+            *(threading.Thread(target=in_loop(read_sdo(servo))) for servo in servos),
+            threading.Thread(target=in_loop(churn_subscriptions)),
+            threading.Thread(target=in_loop(churn_subscriptions)),
+            threading.Thread(target=in_loop(restart_status_listener)),
+            threading.Thread(target=in_loop(access_pdo_items)),
+            threading.Thread(target=in_loop(lambda: poller.data)),
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(STRESS_TIME_S)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        poller.stop()
+
+        assert errors == []
+        assert net.pdo_manager.is_active
+        assert "cycle" in notifications
+        for servo in servos:
+            assert not servo.is_listener_started()
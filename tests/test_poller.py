@@ -0,0 +1,110 @@
+import time
+
+import pytest
+
+from ingenialink.exceptions import ILStateError
+from ingenialink.poller import Poller
+
+POLLER_REGISTERS = ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE", "DRV_STATE_STATUS"]
+
+
+def _configure_poller(servo, refresh_time: float, buffer_size: int) -> Poller:
+    poller = Poller(servo, len(POLLER_REGISTERS))
+    poller.configure(refresh_time, buffer_size)
+    for channel, uid in enumerate(POLLER_REGISTERS):
+        poller.ch_configure(channel, servo.dictionary.registers(1)[uid])
+    return poller
+
+
+def test_poller_data(virtual_drive):
+    _, servo = virtual_drive
+    poller = _configure_poller(servo, refresh_time=0.01, buffer_size=100)
+    poller.start()
+    time.sleep(0.3)
+    poller.stop()
+
+    t, d, lost = poller.data
+    assert len(t) > 0
+    assert not lost
+    assert len(d) == len(POLLER_REGISTERS)
+    assert all(len(channel_data) == len(t) for channel_data in d)
+    assert t == sorted(t)
+
+    # Data is drained after being read
+    t, d, lost = poller.data
+    assert t == []
+    assert all(channel_data == [] for channel_data in d)
+
+
+def test_poller_disabled_channel(virtual_drive):
+    _, servo = virtual_drive
+    poller = _configure_poller(servo, refresh_time=0.01, buffer_size=100)
+    poller.ch_disable(1)
+    poller.start()
+    time.sleep(0.2)
+    poller.stop()
+
+    t, d, _ = poller.data
+    assert len(t) > 0
+    assert d[1] == [0.0]
+    assert len(d[0]) == len(d[2]) == len(t)
+
+
+def test_poller_samples_lost(virtual_drive):
+    _, servo = virtual_drive
+    buffer_size = 3
+    poller = _configure_poller(servo, refresh_time=0.005, buffer_size=buffer_size)
+    poller.start()
+    time.sleep(0.2)
+    poller.stop()
+
+    t, _, lost = poller.data
+    assert len(t) == buffer_size
+    assert lost
+
+
+def test_poller_configure_while_running(virtual_drive):
+    _, servo = virtual_drive
+    poller = _configure_poller(servo, refresh_time=0.01, buffer_size=10)
+    poller.start()
+    try:
+        with pytest.raises(ILStateError):
+            poller.configure(0.01, 10)
+    finally:
+        poller.stop()
+
+
+def test_poller_consumer_latency_with_slow_drive(virtual_drive, mocker):
+    """Stress test: the consumer must not wait for the bus I/O of the poller thread.
+
+    Each register read takes READ_DELAY_S, so a tick lasts
+    len(POLLER_REGISTERS) * READ_DELAY_S. The latency of ``Poller.data`` must stay
+    well below the duration of a single read.
+    """
+    read_delay_s = 0.02
+    _, servo = virtual_drive
+    original_read_raw = servo._read_raw
+
+    def slow_read_raw(*args, **kwargs):
+        time.sleep(read_delay_s)
+        return original_read_raw(*args, **kwargs)
+
+    mocker.patch.object(servo, "_read_raw", side_effect=slow_read_raw)
+
+    poller = _configure_poller(servo, refresh_time=0.0, buffer_size=1000)
+    poller.start()
+    latencies = []
+    n_samples = 0
+    try:
+        deadline = time.perf_counter() + 1.0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            t, _, _ = poller.data
+            latencies.append(time.perf_counter() - start)
+            n_samples += len(t)
+            time.sleep(0.001)
+    finally:
+        poller.stop()
+
+    assert n_samples > 0
+    assert max(latencies) < read_delay_s / 2
@@ -1,5 +1,6 @@
 import re
 import shutil
+import threading
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -27,7 +28,13 @@ from ingenialink.exceptions import (
     ILValueError,
 )
 from ingenialink.register import RegAddressType
-from ingenialink.servo import Servo, ServoState, StoreRestoreManager
+from ingenialink.servo import (
+    Servo,
+    ServoState,
+    StatusWaitConfig,
+    StatusWaitStatistics,
+    StoreRestoreManager,
+)
 from ingenialink.utils._utils import convert_bytes_to_dtype
 
 if TYPE_CHECKING:
@@ -901,3 +908,66 @@ def test__adapt_configuration_file_storage_value(servo, uid, subnode, value, nod
         assert adapted_register == (value - node_id + servo.target)
     else:
         assert adapted_register == value
+
+
+def test_status_word_wait_change_backoff(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    servo.status_wait_config = StatusWaitConfig(initial_interval=0.001, max_interval=0.004)
+    read = mocker.patch.object(servo, "read", return_value=0x40)
+    with pytest.raises(ILTimeoutError):
+        servo.status_word_wait_change(0x40, timeout=50)
+    # 1 + 2 + 4 ms and then every 4 ms, instead of reading continuously
+    assert 5 <= read.call_count <= 20
+    statistics = servo.status_wait_statistics
+    assert statistics.waits == 1
+    assert statistics.reads == read.call_count
+
+    servo.reset_status_wait_statistics()
+    assert servo.status_wait_statistics == StatusWaitStatistics()
+
+
+def test_state_wait_change_status_event(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    # The polling interval is longer than the timeout, only a status event ends the wait
+    servo.status_wait_config = StatusWaitConfig(initial_interval=5, max_interval=5)
+    state = ServoState.DISABLED
+    mocker.patch.object(servo, "get_state", side_effect=lambda _: state)
+
+    def change_state():
+        nonlocal state
+        time.sleep(0.05)
+        state = ServoState.RDY
+        servo._notify_state(state, 1)
+
+    thread = threading.Thread(target=change_state)
+    thread.start()
+    assert servo.state_wait_change(ServoState.DISABLED, timeout=2000) == ServoState.RDY
+    thread.join()
+    assert servo.status_wait_statistics.reads == 2
+
+
+def test_state_wait_change_read_timeouts(virtual_drive_ethercat, mocker):
+    _, servo = virtual_drive_ethercat
+    servo.status_wait_config = StatusWaitConfig(initial_interval=0.001, max_interval=0.001)
+    # The first read is not retried
+    get_state = mocker.patch.object(servo, "get_state", side_effect=ILTimeoutError)
+    with pytest.raises(ILTimeoutError):
+        servo.state_wait_change(ServoState.DISABLED, timeout=2000)
+    assert get_state.call_count == 1
+
+    # The next ones are
+    get_state.side_effect = [ServoState.DISABLED, ILTimeoutError, ServoState.RDY]
+    assert servo.state_wait_change(ServoState.DISABLED, timeout=2000) == ServoState.RDY
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"initial_interval": 0},
+        {"initial_interval": 0.1, "max_interval": 0.01},
+        {"backoff_factor": 0.5},
+    ],
+)
+def test_status_wait_config_invalid(config):
+    with pytest.raises(ValueError):
+        StatusWaitConfig(**config)
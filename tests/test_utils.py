@@ -1,3 +1,4 @@
+import threading
 import time
 
 import pytest
@@ -5,7 +6,8 @@ import pytest
 from ingenialink.enums.register import RegDtype
 from ingenialink.exceptions import ILValueError
 from ingenialink.utils._utils import convert_bytes_to_dtype, convert_dtype_to_bytes, weak_lru
-from ingenialink.utils.event import create_event
+from ingenialink.utils.event import CallbackList, create_event
+from ingenialink.utils.mailbox import Mailbox
 from ingenialink.utils.timeout import Timeout
 
 
@@ -155,3 +157,105 @@ def test_create_event_callback_exception_handling():
     publisher.notify(42)
 
     assert calls == [("bad", 42), ("good", 42)]
+
+
+def test_callback_list():
+    def callback1() -> None:
+        pass
+
+    def callback2() -> None:
+        pass
+
+    callbacks = CallbackList([callback1])
+    assert callbacks.add(callback2)
+    assert not callbacks.add(callback2)
+    callbacks.append(callback1)
+    assert list(callbacks) == [callback1, callback2, callback1]
+    assert callback2 in callbacks
+    assert len(callbacks) == 3
+
+    callbacks.remove(callback1)
+    assert list(callbacks) == [callback2, callback1]
+    assert callbacks.discard(callback2)
+    assert not callbacks.discard(callback2)
+    with pytest.raises(ValueError):
+        callbacks.remove(callback2)
+    callbacks.clear()
+    assert len(callbacks) == 0
+
+
+def test_callback_list_modified_while_notifying():
+    callbacks: CallbackList = CallbackList()
+    calls = []
+
+    def unsubscribe() -> None:
+        calls.append("unsubscribe")
+        callbacks.discard(unsubscribe)
+        callbacks.add(other)
+
+    def other() -> None:
+        calls.append("other")
+
+    callbacks.add(unsubscribe)
+    # The callbacks added or removed while notifying take effect in the next notification
+    for callback in callbacks:
+        callback()
+    assert calls == ["unsubscribe"]
+    for callback in callbacks:
+        callback()
+    assert calls == ["unsubscribe", "other"]
+
+
+def test_callback_list_concurrent_subscriptions():
+    num_threads = 8
+    subscriptions = 200
+    callbacks: CallbackList = CallbackList()
+    barrier = threading.Barrier(num_threads + 1)
+    stop = threading.Event()
+    notifications = []
+
+    def subscribe() -> None:
+        thread_callbacks = [lambda: None for _ in range(subscriptions)]
+        barrier.wait()
+        for callback in thread_callbacks:
+            callbacks.add(callback)
+        # Half of the callbacks of each thread are removed again
+        for callback in thread_callbacks[::2]:
+            callbacks.remove(callback)
+
+    def notify() -> None:
+        barrier.wait()
+        while not stop.is_set():
+            notifications.append(sum(1 for _ in callbacks))
+
+    threads = [threading.Thread(target=subscribe) for _ in range(num_threads)]
+    notifier = threading.Thread(target=notify)
+    for thread in [*threads, notifier]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop.set()
+    notifier.join()
+
+    assert len(callbacks) == num_threads * subscriptions // 2
+    assert notifications
+
+
+def test_mailbox():
+    mailbox = Mailbox()
+    assert mailbox.take() is None
+    assert mailbox.peek() is None
+    assert not mailbox.wait(timeout=0)
+
+    assert mailbox.post("first") == 1
+    assert mailbox.post("second") == 2
+    assert mailbox.wait(timeout=0)
+    assert mailbox.peek() == (2, "second")
+    # The first value was overwritten
+    assert mailbox.take() == (2, "second")
+    assert mailbox.take() is None
+
+    mailbox.post("third")
+    mailbox.clear()
+    assert mailbox.peek() is None
+    assert mailbox.post("fourth") == 4